@@ -49,6 +49,7 @@ from vistrails.core.db.locator import BaseLocator, FileLocator, DBLocator, \
 import vistrails.core.db.io
 import vistrails.core.interpreter.cached
 import vistrails.core.interpreter.default
+from vistrails.core.interpreter.profiler import ExecutionProfiler
 from vistrails.core.modules.module_registry import ModuleRegistry
 from vistrails.core.packagemanager import PackageManager
 from vistrails.core.startup import VistrailsStartup
@@ -303,6 +304,9 @@ class VistrailsApplicationInterface(object):
 
     def finishSession(self):
         vistrails.core.interpreter.cached.CachedInterpreter.cleanup()
+        if self.temp_configuration.check('executionProfile'):
+            ExecutionProfiler.getInstance().write(
+                    self.temp_configuration.executionProfile)
         
     def save_configuration(self):
         """ save_configuration() -> None
@@ -0,0 +1,433 @@
+###############################################################################
+##
+## Copyright (C) 2011-2014, NYU-Poly.
+## Copyright (C) 2006-2011, University of Utah. 
+## All rights reserved.
+## Contact: contact@vistrails.org
+##
+## This file is part of VisTrails.
+##
+## "Redistribution and use in source and binary forms, with or without 
+## modification, are permitted provided that the following conditions are met:
+##
+##  - Redistributions of source code must retain the above copyright notice, 
+##    this list of conditions and the following disclaimer.
+##  - Redistributions in binary form must reproduce the above copyright 
+##    notice, this list of conditions and the following disclaimer in the 
+##    documentation and/or other materials provided with the distribution.
+##  - Neither the name of the University of Utah nor the names of its 
+##    contributors may be used to endorse or promote products derived from 
+##    this software without specific prior written permission.
+##
+## THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" 
+## AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, 
+## THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR 
+## PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR 
+## CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, 
+## EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, 
+## PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; 
+## OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, 
+## WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR 
+## OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF 
+## ADVISED OF THE POSSIBILITY OF SUCH DAMAGE."
+##
+###############################################################################
+"""On-disk store for module results, keyed by subpipeline signature.
+
+The CachedInterpreter only reuses results that live in its in-memory
+persistent pipeline. PersistentResultCache keeps the outputs of computed
+modules on disk so that a new process executing the same subpipeline can
+reuse them instead of recomputing everything from scratch.
+
+Results are converted to strings by a ResultSerializer. The default one
+pickles plain Python values and relies on the Serializable hooks
+(serialize()/deserialize()) for outputs that are themselves modules;
+packages can register their own serializer for a module type with
+PersistentResultCache.register_serializer().
+
+"""
+
+import cPickle as pickle
+import os
+import shutil
+import tempfile
+
+from vistrails.core import debug, system
+from vistrails.core.configuration import get_vistrails_configuration
+from vistrails.core.modules.basic_modules import PathObject
+from vistrails.core.modules.vistrails_module import Module
+
+##############################################################################
+
+class ResultSerializer(object):
+    """ResultSerializer converts the outputs of a computed module to a
+    picklable dictionary and back.
+
+    serialize() returns None when the outputs cannot be stored, in
+    which case the module is simply not cached on disk.
+
+    """
+
+    def serialize(self, obj):
+        """serialize(obj: Module) -> dict or None"""
+        from vistrails.core.modules.module_registry import \
+            get_module_registry
+        reg = get_module_registry()
+        ports = {}
+        for port_name, value in obj.outputPorts.iteritems():
+            if port_name == 'self':
+                continue
+            if isinstance(value, Module):
+                try:
+                    descriptor = reg.get_descriptor(value.__class__)
+                    ports[port_name] = ('module', descriptor.sigstring,
+                                        value.serialize())
+                except Exception:
+                    return None
+            else:
+                try:
+                    ports[port_name] = ('python', pickle.dumps(
+                            value, pickle.HIGHEST_PROTOCOL))
+                except Exception:
+                    return None
+        return ports
+
+    def deserialize(self, obj, ports):
+        """deserialize(obj: Module, ports: dict) -> bool
+
+        Sets the outputs of obj from the stored ports, returns False if
+        they are no longer valid.
+
+        """
+        from vistrails.core.modules.module_registry import \
+            get_module_registry
+        from vistrails.core.modules.utils import parse_descriptor_string
+        outputs = {}
+        for port_name, entry in ports.iteritems():
+            if entry[0] == 'module':
+                reg = get_module_registry()
+                descriptor = reg.get_descriptor_by_name(
+                        *parse_descriptor_string(entry[1]))
+                value = descriptor.module().deserialize(entry[2])
+            else:
+                value = pickle.loads(entry[1])
+            if (isinstance(value, PathObject) and
+                    not os.path.exists(value.name)):
+                # File was removed (e.g. temporary file from a FilePool)
+                return False
+            outputs[port_name] = value
+        for port_name, value in outputs.iteritems():
+            obj.set_output(port_name, value)
+        return True
+
+class CacheEntry(object):
+    def __init__(self, abs_name, name, time, size):
+        self.abs_name = abs_name
+        self.name = name
+        self.time = time
+        self.size = size
+
+class PersistentResultCache(object):
+    """PersistentResultCache stores one file per subpipeline signature
+    in the 'persistentCacheDir' directory, and evicts the least recently
+    used entries once the total size exceeds 'persistentCacheSize' (MB).
+
+    """
+    _instance = None
+    FORMAT_VERSION = 1
+    EXTENSION = '.vtresult'
+
+    _serializers = {}
+    _default_serializer = ResultSerializer()
+
+    @staticmethod
+    def getInstance(*args, **kwargs):
+        if PersistentResultCache._instance is None:
+            obj = PersistentResultCache(*args, **kwargs)
+            PersistentResultCache._instance = obj
+        return PersistentResultCache._instance
+
+    @staticmethod
+    def clearInstance():
+        if PersistentResultCache._instance is not None:
+            PersistentResultCache._instance.destroy()
+            PersistentResultCache._instance = None
+
+    @staticmethod
+    def register_serializer(module_class, serializer):
+        """register_serializer(module_class: type,
+                               serializer: ResultSerializer) -> None
+        Uses serializer for modules of type module_class and its
+        subclasses. A serializer of None prevents these modules from
+        being stored.
+
+        """
+        PersistentResultCache._serializers[module_class] = serializer
+
+    @staticmethod
+    def unregister_serializer(module_class):
+        PersistentResultCache._serializers.pop(module_class, None)
+
+    def __init__(self, directory=None, max_size=None):
+        self._directory = directory
+        self._temp_directory = None
+        self._max_size = max_size
+        self.elements = {}
+        self.hits = 0
+        self.misses = 0
+        self.init_cache()
+
+    def destroy(self):
+        if self._temp_directory is not None:
+            shutil.rmtree(self._temp_directory, ignore_errors=True)
+            self._temp_directory = None
+
+    def get_directory(self):
+        if self._directory is None:
+            self._directory = system.get_vistrails_directory(
+                    'persistentCacheDir')
+        if self._directory is not None:
+            if not os.path.exists(self._directory):
+                os.makedirs(self._directory)
+            return self._directory
+        if self._temp_directory is None:
+            self._temp_directory = tempfile.mkdtemp(prefix='vt_results_')
+        return self._temp_directory
+
+    def get_max_size(self):
+        """get_max_size() -> int
+        Returns the disk budget in bytes.
+
+        """
+        if self._max_size is not None:
+            return self._max_size
+        conf = get_vistrails_configuration()
+        return conf.persistentCacheSize * 1024 * 1024
+
+    def init_cache(self):
+        directory = self.get_directory()
+        for f in os.listdir(directory):
+            if f.endswith(self.EXTENSION):
+                self._add_entry(os.path.join(directory, f))
+
+    def _add_entry(self, abs_name):
+        statinfo = os.stat(abs_name)
+        name = os.path.basename(abs_name)[:-len(self.EXTENSION)]
+        entry = CacheEntry(abs_name, name, statinfo.st_mtime,
+                           statinfo.st_size)
+        self.elements[name] = entry
+        return entry
+
+    def _get_entry(self, signature):
+        if signature in self.elements:
+            return self.elements[signature]
+        # Might have been written by another process sharing the directory
+        abs_name = os.path.join(self.get_directory(),
+                                signature + self.EXTENSION)
+        if os.path.exists(abs_name):
+            try:
+                return self._add_entry(abs_name)
+            except OSError:
+                pass
+        return None
+
+    def size(self):
+        return sum(entry.size for entry in self.elements.itervalues())
+
+    def get_serializer(self, obj):
+        for klass in obj.__class__.__mro__:
+            if klass in self._serializers:
+                return self._serializers[klass]
+        return self._default_serializer
+
+    def has_signature(self, signature):
+        return self._get_entry(signature) is not None
+
+    def load(self, obj):
+        """load(obj: Module) -> bool
+        Sets the outputs of obj from the results stored for its
+        signature. Returns True if the module was found and restored.
+
+        """
+        serializer = self.get_serializer(obj)
+        entry = self._get_entry(obj.signature)
+        if serializer is None or entry is None:
+            self.misses += 1
+            return False
+        try:
+            f = open(entry.abs_name, 'rb')
+            try:
+                version, ports = pickle.load(f)
+            finally:
+                f.close()
+            if (version != self.FORMAT_VERSION or
+                    not set(obj.outputPorts).issubset(set(ports) |
+                                                      set(['self']))):
+                self.misses += 1
+                return False
+            if not serializer.deserialize(obj, ports):
+                self.remove(obj.signature)
+                self.misses += 1
+                return False
+        except Exception, e:
+            debug.warning("Could not load cached results for %s" %
+                          obj.signature, e)
+            self.remove(obj.signature)
+            self.misses += 1
+            return False
+        # Mark as recently used
+        try:
+            os.utime(entry.abs_name, None)
+            entry.time = os.stat(entry.abs_name).st_mtime
+        except OSError:
+            pass
+        self.hits += 1
+        return True
+
+    def store(self, obj):
+        """store(obj: Module) -> bool
+        Writes the outputs of a computed module to disk. Returns False if
+        they could not be serialized.
+
+        """
+        serializer = self.get_serializer(obj)
+        if serializer is None or obj.signature is None:
+            return False
+        ports = serializer.serialize(obj)
+        if ports is None:
+            return False
+        directory = self.get_directory()
+        abs_name = os.path.join(directory, obj.signature + self.EXTENSION)
+        try:
+            # Write to a temporary file then rename it, so that other
+            # processes never read partial results
+            fd, tmp_name = tempfile.mkstemp(prefix='.tmp', dir=directory)
+            f = os.fdopen(fd, 'wb')
+            try:
+                pickle.dump((self.FORMAT_VERSION, ports), f,
+                            pickle.HIGHEST_PROTOCOL)
+            finally:
+                f.close()
+            size = os.stat(tmp_name).st_size
+            if size > self.get_max_size():
+                os.unlink(tmp_name)
+                return False
+            self.remove(obj.signature)
+            self.make_room(size)
+            os.rename(tmp_name, abs_name)
+            self._add_entry(abs_name)
+        except (IOError, OSError), e:
+            debug.warning("Could not store results for %s" % obj.signature,
+                          e)
+            return False
+        return True
+
+    def make_room(self, size):
+        """make_room(size: int) -> None
+        Removes least recently used entries until size more bytes fit in
+        the disk budget.
+
+        """
+        max_size = self.get_max_size()
+        total = self.size()
+        if total + size <= max_size:
+            return
+        elements = sorted(self.elements.itervalues(),
+                          key=lambda entry: entry.time)
+        for entry in elements:
+            if total + size <= max_size:
+                break
+            total -= entry.size
+            self.remove(entry.name)
+
+    def remove(self, signature):
+        entry = self.elements.pop(signature, None)
+        if entry is not None:
+            try:
+                os.unlink(entry.abs_name)
+            except OSError:
+                pass
+
+    def clear(self):
+        for signature in self.elements.keys():
+            self.remove(signature)
+        self.hits = 0
+        self.misses = 0
+
+##############################################################################
+
+import unittest
+
+class TestPersistentResultCache(unittest.TestCase):
+    class Dummy(Module):
+        def compute(self):
+            pass
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp(prefix='vt_test_results_')
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def make_module(self, signature, **outputs):
+        obj = self.Dummy()
+        obj.signature = signature
+        for k, v in outputs.iteritems():
+            obj.set_output(k, v)
+        return obj
+
+    def test_roundtrip(self):
+        cache = PersistentResultCache(self.directory, 1024 * 1024)
+        self.assertTrue(cache.store(self.make_module('abcd', value=[1, 2])))
+        # A new cache reads existing entries from disk
+        cache = PersistentResultCache(self.directory, 1024 * 1024)
+        obj = self.make_module('abcd')
+        obj.enable_output_port('value')
+        self.assertTrue(cache.load(obj))
+        self.assertEqual(obj.get_output('value'), [1, 2])
+        self.assertEqual((cache.hits, cache.misses), (1, 0))
+        self.assertFalse(cache.load(self.make_module('ef01')))
+        self.assertEqual(cache.misses, 1)
+
+    def test_missing_port(self):
+        cache = PersistentResultCache(self.directory, 1024 * 1024)
+        cache.store(self.make_module('abcd', value=1))
+        obj = self.make_module('abcd')
+        obj.enable_output_port('other')
+        self.assertFalse(cache.load(obj))
+
+    def test_unpicklable(self):
+        cache = PersistentResultCache(self.directory, 1024 * 1024)
+        obj = self.make_module('abcd', value=(i for i in xrange(3)))
+        self.assertFalse(cache.store(obj))
+        self.assertFalse(cache.has_signature('abcd'))
+
+    def test_eviction(self):
+        cache = PersistentResultCache(self.directory, 3000)
+        cache.store(self.make_module('aa', value='x' * 1000))
+        cache.store(self.make_module('bb', value='x' * 1000))
+        os.utime(cache.elements['aa'].abs_name, (0, 0))
+        cache.elements['aa'].time = 0
+        cache.store(self.make_module('cc', value='x' * 1000))
+        self.assertFalse(cache.has_signature('aa'))
+        self.assertTrue(cache.has_signature('bb'))
+        self.assertTrue(cache.has_signature('cc'))
+        self.assertTrue(cache.size() <= 3000)
+
+    def test_serializer(self):
+        cache = PersistentResultCache(self.directory, 1024 * 1024)
+        PersistentResultCache.register_serializer(self.Dummy, None)
+        try:
+            self.assertFalse(cache.store(self.make_module('abcd', value=1)))
+        finally:
+            PersistentResultCache.unregister_serializer(self.Dummy)
+        self.assertTrue(cache.store(self.make_module('abcd', value=1)))
+
+    def test_removed_path(self):
+        cache = PersistentResultCache(self.directory, 1024 * 1024)
+        fname = os.path.join(self.directory, 'file.txt')
+        open(fname, 'w').close()
+        cache.store(self.make_module('abcd', value=PathObject(fname)))
+        os.unlink(fname)
+        self.assertFalse(cache.load(self.make_module('abcd')))
+        self.assertFalse(cache.has_signature('abcd'))
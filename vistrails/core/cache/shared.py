@@ -0,0 +1,206 @@
+###############################################################################
+##
+## Copyright (C) 2011-2014, NYU-Poly.
+## Copyright (C) 2006-2011, University of Utah. 
+## All rights reserved.
+## Contact: contact@vistrails.org
+##
+## This file is part of VisTrails.
+##
+## "Redistribution and use in source and binary forms, with or without 
+## modification, are permitted provided that the following conditions are met:
+##
+##  - Redistributions of source code must retain the above copyright notice, 
+##    this list of conditions and the following disclaimer.
+##  - Redistributions in binary form must reproduce the above copyright 
+##    notice, this list of conditions and the following disclaimer in the 
+##    documentation and/or other materials provided with the distribution.
+##  - Neither the name of the University of Utah nor the names of its 
+##    contributors may be used to endorse or promote products derived from 
+##    this software without specific prior written permission.
+##
+## THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" 
+## AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, 
+## THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR 
+## PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR 
+## CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, 
+## EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, 
+## PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; 
+## OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, 
+## WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR 
+## OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF 
+## ADVISED OF THE POSSIBILITY OF SUCH DAMAGE."
+##
+###############################################################################
+"""In-memory store for module results shared between interpreters.
+
+Every CachedInterpreter reuses the modules of its own persistent
+pipeline only. When several interpreters execute related pipelines at
+the same time (e.g. the workers of a parameter exploration), a
+SharedResultCache lets one of them reuse the outputs computed by
+another for the same subpipeline signature. It has the same interface
+as the on-disk PersistentResultCache, which it can fall back on.
+
+The output values themselves are shared, not copied, so they should be
+treated as read-only by downstream modules (as they already are when
+reused by a single interpreter).
+
+"""
+
+import os
+import threading
+
+from vistrails.core.modules.basic_modules import PathObject
+
+##############################################################################
+
+class SharedResultCache(object):
+    """SharedResultCache keeps the outputs of computed modules in memory,
+    keyed by their signature. It can be used from several threads.
+
+    """
+
+    def __init__(self, fallback=None):
+        """SharedResultCache(fallback: PersistentResultCache)
+                -> SharedResultCache
+        Results that are not found in memory are looked up in fallback,
+        and stored results are written to it as well.
+
+        """
+        self.fallback = fallback
+        self._results = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self._results)
+
+    def has_signature(self, signature):
+        if signature in self._results:
+            return True
+        return (self.fallback is not None and
+                self.fallback.has_signature(signature))
+
+    def load(self, obj):
+        """load(obj: Module) -> bool
+        Sets the outputs of obj from the results stored for its
+        signature. Returns True if the module was found and restored.
+
+        """
+        with self._lock:
+            ports = self._results.get(obj.signature)
+        if (ports is not None and
+                set(obj.outputPorts).issubset(set(ports) | set(['self'])) and
+                all(os.path.exists(value.name)
+                    for value in ports.itervalues()
+                    if isinstance(value, PathObject))):
+            for port_name, value in ports.iteritems():
+                obj.set_output(port_name, value)
+            with self._lock:
+                self.hits += 1
+            return True
+        if self.fallback is not None and self.fallback.load(obj):
+            with self._lock:
+                self.hits += 1
+            return True
+        with self._lock:
+            self.misses += 1
+        return False
+
+    def store(self, obj):
+        """store(obj: Module) -> bool
+        Keeps the outputs of a computed module. Returns False if it has
+        no signature.
+
+        """
+        if not self.pin(obj):
+            return False
+        if self.fallback is not None:
+            self.fallback.store(obj)
+        return True
+
+    def pin(self, obj):
+        """pin(obj: Module) -> bool
+        Keeps the outputs of a computed module in memory only (they are
+        not written to the fallback). Use this to hand results over to
+        the other interpreters without storing them again.
+
+        """
+        if obj.signature is None:
+            return False
+        ports = dict((port_name, value)
+                     for port_name, value in obj.outputPorts.iteritems()
+                     if port_name != 'self')
+        with self._lock:
+            self._results[obj.signature] = ports
+        return True
+
+    def remove(self, signature):
+        with self._lock:
+            self._results.pop(signature, None)
+        if self.fallback is not None:
+            self.fallback.remove(signature)
+
+    def clear(self):
+        """clear() -> None
+        Forgets the results kept in memory (the fallback is left alone).
+
+        """
+        with self._lock:
+            self._results = {}
+
+##############################################################################
+
+import unittest
+
+from vistrails.core.modules.vistrails_module import Module
+
+
+class TestSharedResultCache(unittest.TestCase):
+    class Dummy(Module):
+        def compute(self):
+            pass
+
+    def make_module(self, signature, **outputs):
+        obj = self.Dummy()
+        obj.signature = signature
+        for port_name, value in outputs.iteritems():
+            obj.set_output(port_name, value)
+        return obj
+
+    def test_roundtrip(self):
+        cache = SharedResultCache()
+        data = [1, 2, 3]
+        self.assertTrue(cache.store(self.make_module('abc', value=data)))
+        self.assertTrue(cache.has_signature('abc'))
+        self.assertFalse(cache.has_signature('def'))
+        obj = self.make_module('abc')
+        self.assertTrue(cache.load(obj))
+        self.assertIs(obj.get_output('value'), data)
+        self.assertFalse(cache.load(self.make_module('def')))
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+
+    def test_fallback(self):
+        class Fallback(object):
+            def __init__(self):
+                self.stored = []
+            def has_signature(self, signature):
+                return signature == 'def'
+            def load(self, obj):
+                if obj.signature != 'def':
+                    return False
+                obj.set_output('value', 42)
+                return True
+            def store(self, obj):
+                self.stored.append(obj.signature)
+        fallback = Fallback()
+        cache = SharedResultCache(fallback)
+        cache.store(self.make_module('abc', value=1))
+        self.assertEqual(fallback.stored, ['abc'])
+        self.assertTrue(cache.has_signature('def'))
+        obj = self.make_module('def')
+        self.assertTrue(cache.load(obj))
+        self.assertEqual(obj.get_output('value'), 42)
+        cache.clear()
+        self.assertEqual(len(cache), 0)
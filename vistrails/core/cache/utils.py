@@ -34,6 +34,8 @@
 ###############################################################################
 """Helper functions for cache package."""
 
+import sys
+
 try:
     import hashlib
     sha_hash = hashlib.sha1
@@ -49,3 +51,72 @@ def hash_list(lst, hasher_f, constant_hasher_map={}):
     hash_l.sort()
     for hel in hash_l: hasher.update(hel)
     return hasher.digest()
+
+def estimate_size(value, seen=None, depth=4):
+    """estimate_size(value, seen: set, depth: int) -> int
+    Returns an estimate of the memory used by value, in bytes.
+
+    Objects exposing 'nbytes' (e.g. numpy arrays) report their buffer
+    size; containers and instance dictionaries are followed up to depth
+    levels, large sequences being extrapolated from a sample of their
+    elements. Objects whose id is in seen are not counted again, which
+    allows sharing seen between calls. Classes can override
+    __sizeof__ to report their actual size.
+
+    """
+    if seen is None:
+        seen = set()
+    if id(value) in seen:
+        return 0
+    seen.add(id(value))
+    nbytes = getattr(value, 'nbytes', None)
+    if isinstance(nbytes, (int, long)):
+        return nbytes
+    try:
+        size = sys.getsizeof(value)
+    except TypeError:
+        size = 64
+    if depth <= 0:
+        return size
+    if isinstance(value, dict):
+        items = value.items()
+        elements = [k for k, v in items] + [v for k, v in items]
+    elif isinstance(value, (list, tuple, set, frozenset)):
+        elements = list(value)
+    elif (hasattr(value, '__dict__') and
+          not isinstance(value, (type, basestring))):
+        elements = [value.__dict__]
+        # domain objects keep their fields in __slots__
+        for cls in type(value).__mro__:
+            for name in cls.__dict__.get('__slots__', ()):
+                if name not in ('__dict__', '__weakref__'):
+                    elements.append(getattr(value, name, None))
+    else:
+        return size
+    if len(elements) > 100:
+        sample = sum(estimate_size(e, seen, depth - 1)
+                     for e in elements[:100])
+        return size + sample * len(elements) // 100
+    return size + sum(estimate_size(e, seen, depth - 1) for e in elements)
+
+##############################################################################
+
+import unittest
+
+class TestEstimateSize(unittest.TestCase):
+    def test_containers(self):
+        s = 'x' * 10000
+        self.assertTrue(estimate_size(s) >= 10000)
+        self.assertTrue(estimate_size([s]) >= 10000)
+        self.assertTrue(estimate_size({'key': s}) >= 10000)
+        # shared objects are only counted once
+        self.assertTrue(estimate_size([s, s]) < 20000)
+
+    def test_sampling(self):
+        lst = ['x' * 100 for i in xrange(10000)]
+        self.assertTrue(estimate_size(lst) >= 1000000)
+
+    def test_nbytes(self):
+        class Buffer(object):
+            nbytes = 123456
+        self.assertEqual(estimate_size(Buffer()), 123456)
@@ -59,7 +59,9 @@ _simple_documentation = """
 autoConnect: Automatically connect dragged in modules
 autoSave: Automatically save backup vistrails every two minutes
 batch: Run in batch mode instead of interactive mode
+batchReport: File where batch mode writes a JSON report of the executions
 cache: Cache previous results so they may be used in future computations
+cacheMemoryLimit: Memory budget for cached results (MB)
 dataDir: Default data directory
 db: The name for the database to load the vistrail from
 dbDefault: Save vistrails in a database by default
@@ -71,6 +73,9 @@ enablePackagesSilently: Automatically enable packages when needed
 errorLog: Write errors to a log file
 execute: Execute any specified workflows
 executionLog: Track execution provenance when running workflows
+executionProfile: File where a profile of the module executions is written
+executionThreads: Number of threads used to execute independent branches
+explorationWorkers: Number of workflows of a parameter exploration run at once
 fileDir: Default vistrail directory
 fixedSpreadsheetCells: Draw spreadsheet cells at a fixed size
 handlerDontAsk: Do not ask about extension handling at startup
@@ -82,7 +87,10 @@ jobAutorun: Run jobs automatically when they finish
 jobCheckInterval: How often to check for jobs (in seconds)
 jobList: List running jobs
 jobRun: Continue running specified job by id
+jobs: Number of processes executing workflows in batch mode
 logDir: Log files directory
+loopLogging: Provenance recorded for loop iterations (full/sampled/summary/off)
+loopLoggingSample: Iterations between logged ones when loopLogging is sampled
 maxRecentVistrails: Number of recent vistrails
 maximizeWindows: VisTrails windows should be maximized
 migrateTags: Move tags to upgraded versions
@@ -91,7 +99,15 @@ multithread: Server will start a thread for each request
 packageDir: System packages directory
 parameterExploration: Run parameter exploration instead of workflow
 parameters: List of parameters to use when running workflow
+persistentCache: Store module results on disk and reuse them across sessions
+persistentCacheDir: Persistent result cache directory
+persistentCacheSize: Persistent result cache size (MB)
+pipelineCacheMinCost: Number of replayed actions for a pipeline to be cached
+pipelineCacheSize: Number of pipelines kept to speed up version switching
+pipelineCheckpointInterval: Number of actions between materialized pipelines
 port: The port for the database to load the vistrail from
+registryCache: Start from a snapshot of the module registry
+registryCacheDir: Module registry snapshot directory
 repositoryHTTPURL: Remote package repository URL
 repositoryLocalPath: Local package repository directory
 rootDirectory: Directory that contains the VisTrails source code
@@ -100,6 +116,8 @@ rpcInstances: Number of other instances that vistrails should start
 rpcLogFile: Log file for XML RPC server
 rpcPort: Port where this xml rpc server will work
 rpcServer: Hostname or ip address where this xml rpc server will work
+rpcTimeout: Seconds a workflow may run on a worker process before it is killed
+rpcWorkers: Number of worker processes executing workflows for the server
 shell.fontFace: Console Font
 shell.fontSize: Console Font Size
 showConnectionErrors: Show error when input value doesn't match type during execution
@@ -122,6 +140,8 @@ thumbs.cacheDir: Thumbnail cache directory
 thumbs.cacheSize: Thumbnail cache size (MB)
 thumbs.mouseHover: Show thumbnails when mouse is hovering above a version
 thumbs.tagsOnly: Store thumbnails only for tagged versions
+translationCache: Keep translated copies of vistrails saved by older versions
+translationCacheDir: Translated vistrails cache directory
 upgradeDelay: Persist upgrade only after other changes
 upgradeModuleFailPrompt: Alert when a subworkflow upgrade fails
 upgrades: Attempt to automatically upgrade old workflows
@@ -149,10 +169,23 @@ batch: Boolean
 
     Run vistrails in batch mode instead of interactive mode.
 
+batchReport: String
+
+    File where batch mode writes a JSON report listing, for each
+    workflow executed, its errors and execution time.
+
 cache: Boolean
 
     Cache previous results so they may be used in future computations.
 
+cacheMemoryLimit: Integer
+
+    Maximum memory (in MB) used by the results cached between
+    executions, 0 meaning no limit. When it is exceeded, the cached
+    modules that were not used recently, and the large ones that are
+    cheap to recompute, are discarded along with the modules that
+    depend on them.
+
 dataDir: Path
 
     The location that VisTrails uses as a default directory for data.
@@ -201,6 +234,30 @@ executionLog: Boolean
 
     Track execution provenance when running workflows.
 
+executionProfile: String
+
+    Profile the module executions and write the profile to this file
+    on exit. The profile aggregates, per module, the compute and CPU
+    times, the overhead of updating upstream, memory delta, cache hits
+    and input/output sizes, along with the time of each execution phase.
+    It is written as JSON if the file name ends with .json, and as
+    folded stacks (for flamegraph.pl) otherwise.
+
+executionThreads: Integer
+
+    Number of threads used to execute independent branches of a
+    workflow concurrently (1 executes modules one at a time). Modules
+    that are not cacheable or not thread-safe always run on the main
+    thread.
+
+explorationWorkers: Integer
+
+    Number of worker threads executing the workflows of a parameter
+    exploration concurrently. Each worker has its own cache, and
+    workers reuse the upstream results computed by each other.
+    Workflows containing modules that are not cacheable or not
+    thread-safe are executed on the main thread.
+
 fileDir: Path
 
     The location that VisTrails uses as a default directory for
@@ -247,6 +304,13 @@ jobRun: String
 
     Continue running specified job by id (use jobList to get).
 
+jobs: Integer
+
+    Number of processes executing workflows in batch mode. Each vistrail
+    is loaded once, before the processes are forked, and its versions
+    are distributed among them. With more than one process, the
+    vistrails are not updated with the executions.
+
 logDir: Path
 
     The path that indicates where log files should be stored.
@@ -255,6 +319,21 @@ logger: ConfigurationObject
 
     *Deprecated*
 
+loopLogging: String
+
+    How much provenance is recorded for the iterations of loops
+    (modules run once per list element, While, Map): 'full' logs every
+    iteration, 'sampled' one iteration out of loopLoggingSample,
+    'summary' none of them, and 'off' does not log the loop at all.
+    In sampled and summary modes the loop module is annotated with the
+    number of iterations, of failed iterations, and their minimum,
+    maximum and total durations.
+
+loopLoggingSample: Integer
+
+    When loopLogging is 'sampled', only iterations whose index is a
+    multiple of this number are logged.
+
 maximizeWindows: Boolean
 
     Whether the VisTrails windows should take up the entire screen space.
@@ -313,6 +392,41 @@ parameters: String
 
     List of parameters to use when running workflow.
 
+persistentCache: Boolean
+
+    Store the results of cacheable modules on disk, keyed by the
+    signature of their upstream subpipeline, so that later sessions
+    can reuse them instead of recomputing them. Modules reading
+    external files that change on disk should be marked NotCacheable.
+
+persistentCacheDir: Path
+
+    The directory to be used to store persistent results.
+
+persistentCacheSize: Integer
+
+    The size (in MB) of the persistent result cache.
+
+pipelineCacheMinCost: Integer
+
+    When switching versions, the pipeline of the new version is cached
+    (for later switches to it or its descendants) if building it took
+    at least this many actions. Tagged versions are always cached.
+
+pipelineCacheSize: Integer
+
+    The number of pipelines cached to speed up version switching, the
+    least recently used ones being discarded first. 0 disables the
+    cache.
+
+pipelineCheckpointInterval: Integer
+
+    Building the pipeline for a version replays the actions leading to
+    it. Every this many actions deep in the version tree (and at
+    tagged versions), the pipeline is kept in memory so that other
+    versions can be built from it instead of from the root. 0 disables
+    checkpoints.
+
 port: Integer
 
     The port for the database to load the vistrail from.
@@ -325,6 +439,21 @@ recentVistrailList: String
 
     Storage for recent vistrails. Users should not edit.
 
+registryCache: Boolean
+
+    Whether to store a snapshot of the module registry, along with
+    the metadata of the enabled packages and the versions of the
+    libraries they use, and to start from it instead of importing and
+    initializing every package. A package is then only initialized
+    when a workflow using its modules is validated or executed, or
+    when its modules are shown in the module palette. Intended for
+    batch and server use, as some settings that only affect the
+    builder window are not restored from the snapshot.
+
+registryCacheDir: Path
+
+    The directory to be used to store module registry snapshots.
+
 repositoryHTTPURL: URL
 
     URL used to locate packages available to be installed.
@@ -361,6 +490,19 @@ rpcServer: URL
 
     Hostname or ip address where this xml rpc server will work.
 
+rpcTimeout: Integer
+
+    Number of seconds a workflow may run on one of the server's worker
+    processes before the worker is killed and replaced. 0 means no limit.
+
+rpcWorkers: Integer
+
+    Number of worker processes the xml rpc server starts to execute
+    workflows. Workers are started once the packages are loaded and
+    serve requests from a queue; combine with multithread so that
+    concurrent requests run in parallel. 0 executes workflows in the
+    server process.
+
 runningJobsList: String
 
     Storage for recent vistrails; users should not edit.
@@ -470,6 +612,17 @@ thumbs.tagsOnly: Boolean
     If True, only stores thumbnails for tagged versions. Otherwise,
     stores thumbnails for all versions.
 
+translationCache: Boolean
+
+    When a vistrail saved by an older version of VisTrails is opened,
+    store the result of translating it to the current schema, keyed by
+    a hash of the file contents, so that opening the same file again
+    does not need to translate it.
+
+translationCacheDir: Path
+
+    The directory to be used to store translated vistrails.
+
 upgradeDelay: Boolean
 
     Persist upgrade only after other changes.
@@ -606,6 +759,8 @@ base_config = {
                  flag='-e'),
      ConfigField("batch", False, bool, ConfigType.COMMAND_LINE_FLAG,
                  flag='-b'),
+     ConfigField("batchReport", None, str, ConfigType.COMMAND_LINE),
+     ConfigField("jobs", 1, int, ConfigType.COMMAND_LINE),
      ConfigField("outputDirectory", None, ConfigPath, flag='-o'),
      ConfigField('outputDefaultSettings', [], str,
                  ConfigType.INTERNAL_SUBOBJECT),
@@ -630,6 +785,8 @@ base_config = {
      ConfigField('rpcLogFile', os.path.join(system.vistrails_root_directory(),
                        'rpcserver.log'), ConfigPath, ConfigType.COMMAND_LINE),
      ConfigField('rpcInstances', 0, int, ConfigType.COMMAND_LINE),
+     ConfigField('rpcWorkers', 0, int, ConfigType.COMMAND_LINE),
+     ConfigField('rpcTimeout', 0, int, ConfigType.COMMAND_LINE),
      ConfigField('multithread', None, bool, ConfigType.COMMAND_LINE_FLAG),
      ConfigField('rpcConfig', os.path.join(system.vistrails_root_directory(),
                       'server.cfg'), ConfigPath, ConfigType.COMMAND_LINE)],
@@ -637,8 +794,28 @@ base_config = {
     [ConfigField('autoSave', True, bool, ConfigType.ON_OFF),
      ConfigField('dbDefault', False, bool, ConfigType.ON_OFF),
      ConfigField('cache', True, bool, ConfigType.ON_OFF),
+     ConfigField('cacheMemoryLimit', 0, int),
+     ConfigField('persistentCache', False, bool, ConfigType.ON_OFF),
+     ConfigField('persistentCacheSize', 1024, int),
+     ConfigField('translationCache', False, bool, ConfigType.ON_OFF),
+     ConfigField('registryCache', False, bool, ConfigType.ON_OFF),
      ConfigField('stopOnError', True, bool, ConfigType.ON_OFF),
      ConfigField('executionLog', True, bool, ConfigType.ON_OFF),
+     ConfigField('executionProfile', None, str, ConfigType.COMMAND_LINE),
+     ConfigField('loopLogging', "full", str, widget_type='combo',
+                 widget_options={"allowed_values": ["full", "sampled",
+                                                    "summary", "off"],
+                                 "label": "Loop iterations logged:",
+                                 "remap": {"full": "All",
+                                           "sampled": "Sampled",
+                                           "summary": "Summary only",
+                                           "off": "None"}}),
+     ConfigField('loopLoggingSample', 10, int),
+     ConfigField('executionThreads', 1, int),
+     ConfigField('explorationWorkers', 1, int),
+     ConfigField('pipelineCacheSize', 32, int),
+     ConfigField('pipelineCacheMinCost', 10, int),
+     ConfigField('pipelineCheckpointInterval', 100, int),
      ConfigField('errorLog', True, bool, ConfigType.ON_OFF),
      ConfigField('defaultFileType', system.vistrails_default_file_type(), str,
                  widget_type="combo",
@@ -711,6 +888,9 @@ base_config = {
      ConfigField('userPackageDir', "userpackages", ConfigPath),
      ConfigField('fileDir', None, ConfigPath),
      ConfigField('logDir', "logs", ConfigPath),
+     ConfigField('persistentCacheDir', "results", ConfigPath),
+     ConfigField('translationCacheDir', "translated", ConfigPath),
+     ConfigField('registryCacheDir', "registry", ConfigPath),
      ConfigField('temporaryDir', None,  ConfigPath)],
     "Advanced":
     [ConfigField('singleInstance', True, bool, ConfigType.ON_OFF),
@@ -34,7 +34,10 @@
 ###############################################################################
 """ Module used when running  vistrails uninteractively """
 from __future__ import absolute_import
+from itertools import izip
+import json
 import os.path
+import time
 import uuid
 from vistrails.core.application import is_running_gui
 from vistrails.core.configuration import get_vistrails_configuration
@@ -47,6 +50,7 @@ from vistrails.core.interpreter.job import JobMonitor, Workflow as JobWorkflow
 from vistrails.core.utils import VistrailsInternalError, expression
 from vistrails.core.vistrail.controller import VistrailController
 from vistrails.core.vistrail.vistrail import Vistrail
+from vistrails.core.worker_pool import WorkerPool, WorkerError, summarize_run
 
 import vistrails.core.packagemanager
 import vistrails.core.system
@@ -64,106 +68,126 @@ def run_and_get_results(w_list, parameters='', output_dir=None,
                            extra_info:dict)
     Run all workflows in w_list, and returns an interpreter result object.
     version can be a tag name or a version id.
+    Each vistrail is only loaded once, however many of its versions are
+    listed.
     
     """
     elements = parameters.split("$&$")
     aliases = {}
     params = []
     result = []
+    loaded = {}
     for locator, workflow in w_list:
-        (v, abstractions , thumbnails, mashups)  = load_vistrail(locator)
-        controller = VistrailController(v, locator, abstractions, thumbnails, 
-                                        mashups, auto_save=update_vistrail)
-        if isinstance(workflow, basestring):
-            version = v.get_version_number(workflow)
-        elif isinstance(workflow, (int, long)):
-            version = workflow
-        elif workflow is None:
-            version = controller.get_latest_version_in_graph()
-        else:
-            msg = "Invalid version tag or number: %s" % workflow
-            raise VistrailsInternalError(msg)
-        controller.change_selected_version(version)
+        key = locator.to_url()
+        if key not in loaded:
+            loaded[key] = load_vistrail(locator)
+        result.append(_run_version(locator, loaded[key], workflow,
+                                   elements, aliases, params, output_dir,
+                                   update_vistrail, extra_info, reason))
+    return result
+
+def _run_version(locator, loaded, workflow, elements, aliases, params,
+                 output_dir, update_vistrail, extra_info, reason):
+    """_run_version(locator: locator, loaded: tuple, workflow: str/int,
+                    elements: list of str, aliases: dict, params: list,
+                    output_dir: str, update_vistrail: boolean,
+                    extra_info: dict, reason: str) -> InstanceObject
+    Runs one version of a vistrail, loaded is the result of load_vistrail()
+    and elements the "alias=value" strings from the parameters.
+
+    """
+    (v, abstractions , thumbnails, mashups) = loaded
+    controller = VistrailController(v, locator, abstractions, thumbnails, 
+                                    mashups, auto_save=update_vistrail)
+    if isinstance(workflow, basestring):
+        version = v.get_version_number(workflow)
+    elif isinstance(workflow, (int, long)):
+        version = workflow
+    elif workflow is None:
+        version = controller.get_latest_version_in_graph()
+    else:
+        msg = "Invalid version tag or number: %s" % workflow
+        raise VistrailsInternalError(msg)
+    controller.change_selected_version(version)
+    
+    for e in elements:
+        pos = e.find("=")
+        if pos != -1:
+            key = e[:pos].strip()
+            value = e[pos+1:].strip()
         
-        for e in elements:
-            pos = e.find("=")
-            if pos != -1:
-                key = e[:pos].strip()
-                value = e[pos+1:].strip()
-            
-                if controller.current_pipeline.has_alias(key):
-                    aliases[key] = value
-                elif 'mashup_id' in extra_info:
-                    # new-style mashups can have aliases not existing in pipeline
-                    for mashuptrail in mashups:
-                        if mashuptrail.vtVersion == version:
-                            mashup = mashuptrail.getMashup(extra_info['mashup_id'])
-                            c = mashup.getAliasByName(key).component
-                            params.append((c.vttype, c.vtid, value))
-
-        if output_dir is not None and controller.current_pipeline is not None:
-            # FIXME DAK: why is this always done?!? there is a flag for it...
-            if is_running_gui():
-                controller.updatePipelineScene()
-                base_fname = "%s_%s_pipeline.pdf" % (locator.short_filename, version)
-                filename = os.path.join(output_dir, base_fname)
-                controller.current_pipeline_scene.saveToPDF(filename)
-            else:
-                debug.critical("Cannot save pipeline figure when not "
-                               "running in gui mode")
-            base_fname = "%s_%s_pipeline.xml" % (locator.short_filename, version)
+            if controller.current_pipeline.has_alias(key):
+                aliases[key] = value
+            elif 'mashup_id' in extra_info:
+                # new-style mashups can have aliases not existing in pipeline
+                for mashuptrail in mashups:
+                    if mashuptrail.vtVersion == version:
+                        mashup = mashuptrail.getMashup(extra_info['mashup_id'])
+                        c = mashup.getAliasByName(key).component
+                        params.append((c.vttype, c.vtid, value))
+
+    if output_dir is not None and controller.current_pipeline is not None:
+        # FIXME DAK: why is this always done?!? there is a flag for it...
+        if is_running_gui():
+            controller.updatePipelineScene()
+            base_fname = "%s_%s_pipeline.pdf" % (locator.short_filename, version)
             filename = os.path.join(output_dir, base_fname)
-            vistrails.core.db.io.save_workflow(controller.current_pipeline, filename)
-        if not update_vistrail:
-            conf = get_vistrails_configuration()
-            if conf.has('thumbs'):
-                conf.thumbs.autoSave = False
-        
-        jobMonitor = JobMonitor.getInstance()
-        current_workflow = jobMonitor.currentWorkflow()
+            controller.current_pipeline_scene.saveToPDF(filename)
+        else:
+            debug.critical("Cannot save pipeline figure when not "
+                           "running in gui mode")
+        base_fname = "%s_%s_pipeline.xml" % (locator.short_filename, version)
+        filename = os.path.join(output_dir, base_fname)
+        vistrails.core.db.io.save_workflow(controller.current_pipeline, filename)
+    if not update_vistrail:
+        conf = get_vistrails_configuration()
+        if conf.has('thumbs'):
+            conf.thumbs.autoSave = False
+    
+    jobMonitor = JobMonitor.getInstance()
+    current_workflow = jobMonitor.currentWorkflow()
+    if not current_workflow:
+        for job in jobMonitor._running_workflows.itervalues():
+            try:
+                job_version = int(job.version)
+            except ValueError:
+                job_version =  v.get_version_number(job.version)
+            if version == job_version and locator.to_url() == job.vistrail:
+                current_workflow = job
+                jobMonitor.startWorkflow(job)
         if not current_workflow:
-            for job in jobMonitor._running_workflows.itervalues():
-                try:
-                    job_version = int(job.version)
-                except ValueError:
-                    job_version =  v.get_version_number(job.version)
-                if version == job_version and locator.to_url() == job.vistrail:
-                    current_workflow = job
-                    jobMonitor.startWorkflow(job)
-            if not current_workflow:
-                current_workflow = JobWorkflow(locator.to_url(), version)
-                jobMonitor.getInstance().startWorkflow(current_workflow)
+            current_workflow = JobWorkflow(locator.to_url(), version)
+            jobMonitor.getInstance().startWorkflow(current_workflow)
 
-        try:
-            (results, _) = \
-            controller.execute_current_workflow(custom_aliases=aliases,
-                                                custom_params=params,
-                                                extra_info=extra_info,
-                                                reason=reason)
-        finally:
-            jobMonitor.finishWorkflow()
-        new_version = controller.current_version
-        if new_version != version:
-            debug.log("Version '%s' (%s) was upgraded. The actual "
-                      "version executed was %s" % (
-                      workflow, version, new_version))
-        run = results[0]
-        run.workflow_info = (locator.name, new_version)
-        run.pipeline = controller.current_pipeline
-
-        if update_vistrail:
-            controller.write_vistrail(locator)
-        result.append(run)
-        if current_workflow.modules:
-            if current_workflow.completed():
-                run.job = "COMPLETED"
-            else:
-                run.job = "RUNNING: %s" % current_workflow.id
-                for job in current_workflow.modules.itervalues():
-                    if not job.finished:
-                        run.job += "\n  %s %s %s" % (job.start, job.name, job.description())
-            print run.job
-    return result
+    try:
+        (results, _) = \
+        controller.execute_current_workflow(custom_aliases=aliases,
+                                            custom_params=params,
+                                            extra_info=extra_info,
+                                            reason=reason)
+    finally:
+        jobMonitor.finishWorkflow()
+    new_version = controller.current_version
+    if new_version != version:
+        debug.log("Version '%s' (%s) was upgraded. The actual "
+                  "version executed was %s" % (
+                  workflow, version, new_version))
+    run = results[0]
+    run.workflow_info = (locator.name, new_version)
+    run.pipeline = controller.current_pipeline
+
+    if update_vistrail:
+        controller.write_vistrail(locator)
+    if current_workflow.modules:
+        if current_workflow.completed():
+            run.job = "COMPLETED"
+        else:
+            run.job = "RUNNING: %s" % current_workflow.id
+            for job in current_workflow.modules.itervalues():
+                if not job.finished:
+                    run.job += "\n  %s %s %s" % (job.start, job.name, job.description())
+        print run.job
+    return run
 
 ################################################################################
 
@@ -274,38 +298,164 @@ def run(w_list, parameters='', output_dir=None, update_vistrail=True,
             all_errors.append(result.workflow_info + err)
     return all_errors
 
+# vistrails loaded by run_batch(), inherited by the forked workers
+_batch_vistrails = {}
+
+def _run_batch_job(key, workflow, parameters, extra_info, reason):
+    """_run_batch_job(key: str, workflow: str/int, parameters: str,
+                      extra_info: dict, reason: str) -> (InstanceObject, float)
+    Worker job of run_batch(): runs a version of a vistrail from
+    _batch_vistrails and returns its summarized result and duration.
+
+    """
+    locator, loaded = _batch_vistrails[key]
+    start = time.time()
+    run = _run_version(locator, loaded, workflow, parameters.split("$&$"),
+                       {}, [], None, False, extra_info, reason)
+    return summarize_run(run), time.time() - start
+
+def run_batch(w_list, parameters='', output_dir=None, update_vistrail=True,
+              extra_info=None, reason="Console Mode Batch Execution",
+              jobs=1, report=None):
+    """run_batch(w_list: list of (locator, version), parameters: str,
+                 output_dir: str, update_vistrail: boolean,
+                 extra_info: dict, reason: str, jobs: int,
+                 report: str) -> list of errors
+    Like run(), but loads every vistrail once up front and, if jobs > 1,
+    executes the versions on that many worker processes. The workers are
+    forked once the vistrails are loaded, so they share them with the
+    module registry. They neither update the vistrails nor save pipeline
+    figures to output_dir. An error is reported for each run that raised
+    instead of stopping the batch.
+    If report is given, a JSON file listing the errors and duration of
+    each run is written to it.
+
+    """
+    start = time.time()
+    _batch_vistrails.clear()
+    entries = []
+    for locator, workflow in w_list:
+        key = locator.to_url()
+        if key not in _batch_vistrails:
+            _batch_vistrails[key] = (locator, load_vistrail(locator))
+        entries.append((key, workflow))
+    load_time = time.time() - start
+
+    outcomes = []
+    if jobs > 1:
+        pool = WorkerPool(jobs)
+        pool.start()
+        try:
+            submitted = [pool.submit(_run_batch_job,
+                                     (key, workflow, parameters, extra_info,
+                                      reason))
+                         for key, workflow in entries]
+            for job in submitted:
+                try:
+                    run, run_time = job.get()
+                    outcomes.append((run, run_time, None))
+                except WorkerError, e:
+                    outcomes.append((None, job.latency, str(e)))
+        finally:
+            pool.shutdown()
+    else:
+        elements = parameters.split("$&$")
+        aliases = {}
+        params = []
+        for key, workflow in entries:
+            locator, loaded = _batch_vistrails[key]
+            run_start = time.time()
+            try:
+                run = summarize_run(_run_version(locator, loaded, workflow,
+                                                 elements, aliases, params,
+                                                 output_dir, update_vistrail,
+                                                 extra_info, reason))
+                outcomes.append((run, time.time() - run_start, None))
+            except Exception, e:
+                debug.unexpected_exception(e)
+                outcomes.append((None, time.time() - run_start,
+                                 debug.format_exception(e)))
+
+    all_errors = []
+    records = []
+    for (key, workflow), (run, run_time, exception) in izip(entries,
+                                                             outcomes):
+        locator = _batch_vistrails[key][0]
+        record = {'vistrail': locator.name,
+                  'workflow': workflow,
+                  'time': run_time}
+        if run is None:
+            all_errors.append((locator.name, workflow, None, exception))
+            record.update(ok=False, exception=exception)
+        else:
+            for err in sorted(run.errors.iteritems()):
+                all_errors.append(run.workflow_info + err)
+            record.update(ok=not run.errors,
+                          version=run.workflow_info[1],
+                          executed=sum(1 for e in run.executed.itervalues()
+                                       if e),
+                          errors=dict((str(i), msg) for i, msg
+                                      in run.errors.iteritems()))
+        records.append(record)
+    _batch_vistrails.clear()
+
+    if report is not None:
+        summary = {'jobs': jobs,
+                   'workflows': len(records),
+                   'failed': sum(1 for r in records if not r['ok']),
+                   'load_time': load_time,
+                   'total_time': time.time() - start,
+                   'runs': records}
+        with open(report, 'w') as f:
+            json.dump(summary, f, indent=2)
+    return all_errors
+
 def run_parameter_exploration(locator, pe_id, extra_info = {},
-                              reason="Console Mode Parameter Exploration Execution"):
+                              reason="Console Mode Parameter Exploration Execution",
+                              workers=None):
     """run_parameter_exploration(w_list: (locator, version),
                                  pe_id: str/int,
-                                 reason: str) -> (pe_id, [error msg])
+                                 reason: str, workers: int)
+                                 -> (pe_id, [error msg])
     Run parameter exploration in w, and returns an interpreter result object.
     version can be a tag name or a version id.
+    Without a GUI, the workflows are executed on workers threads (defaults
+    to the explorationWorkers option).
     
     """
-    if is_running_gui():
-        from vistrails.gui.vistrail_controller import VistrailController as \
-             GUIVistrailController
-        try:
-            (v, abstractions , thumbnails, mashups)  = load_vistrail(locator)
-            controller = GUIVistrailController(v, locator, abstractions, 
+    try:
+        (v, abstractions , thumbnails, mashups)  = load_vistrail(locator)
+        if is_running_gui():
+            from vistrails.gui.vistrail_controller import VistrailController \
+                as GUIVistrailController
+            controller = GUIVistrailController(v, locator, abstractions,
                                                thumbnails, mashups)
-            try:
-                pe_id = int(pe_id)
-                pe = controller.vistrail.get_paramexp(pe_id)
-            except ValueError:
-                pe = controller.vistrail.get_named_paramexp(pe_id)
-            controller.change_selected_version(pe.action_id)
+        else:
+            controller = VistrailController(v, locator, abstractions,
+                                            thumbnails, mashups)
+        try:
+            pe_id = int(pe_id)
+            pe = controller.vistrail.get_paramexp(pe_id)
+        except ValueError:
+            pe = controller.vistrail.get_named_paramexp(pe_id)
+        controller.change_selected_version(pe.action_id)
+        if is_running_gui():
             controller.executeParameterExploration(pe, extra_info=extra_info,
                                                    showProgress=False)
-        except Exception, e:
-            import traceback
-            return (locator, pe_id,
-                    debug.format_exception(e), traceback.format_exc())
+        else:
+            controller.execute_parameter_exploration(pe,
+                                                     extra_info=extra_info,
+                                                     workers=workers)
+    except Exception, e:
+        import traceback
+        return (locator, pe_id,
+                debug.format_exception(e), traceback.format_exc())
 
 def run_parameter_explorations(w_list, extra_info = {},
-                       reason="Console Mode Parameter Exploration Execution"):
-    """run(w_list: list of (locator, pe_id), reason: str) -> boolean
+                       reason="Console Mode Parameter Exploration Execution",
+                       workers=None):
+    """run(w_list: list of (locator, pe_id), reason: str,
+           workers: int) -> boolean
     For each workflow in w_list, run parameter exploration pe_id
     version can be a tag name or a version id.
     Returns list of errors (empty list if there are no errors)
@@ -313,7 +463,8 @@ def run_parameter_explorations(w_list, extra_info = {},
     all_errors = []
     for locator, pe_id in w_list:
         result = run_parameter_exploration(locator, pe_id, reason=reason,
-                                           extra_info=extra_info)
+                                           extra_info=extra_info,
+                                           workers=workers)
         if result:
             all_errors.append(result)
     return all_errors
@@ -359,6 +510,30 @@ class TestConsoleMode(unittest.TestCase):
         finally:
             StandardOutput.compute = orig_compute
 
+    def test_batch(self):
+        import shutil
+        import tempfile
+        locator = XMLFileLocator(vistrails.core.system.vistrails_root_directory() +
+                                 '/tests/resources/dummy.xml')
+        w_list = [(locator, "int chain"), (locator, "float chain"),
+                  (locator, "no such tag")]
+        tmp_dir = tempfile.mkdtemp()
+        try:
+            for jobs in (1, 2):
+                report = os.path.join(tmp_dir, 'report_%d.json' % jobs)
+                errors = run_batch(w_list, update_vistrail=False, jobs=jobs,
+                                   report=report)
+                self.assertEqual([e[1] for e in errors], ["no such tag"])
+                with open(report) as f:
+                    summary = json.load(f)
+                self.assertEqual(summary['jobs'], jobs)
+                self.assertEqual(summary['failed'], 1)
+                self.assertEqual([r['ok'] for r in summary['runs']],
+                                 [True, True, False])
+                self.assertTrue(summary['runs'][0]['executed'] > 0)
+        finally:
+            shutil.rmtree(tmp_dir)
+
     def test_tuple(self):
         from vistrails.core.vistrail.module_param import ModuleParam
         from vistrails.core.vistrail.module_function import ModuleFunction
@@ -44,9 +44,11 @@ from xml.dom.minidom import parse, getDOMImplementation
 def get_db_vistrail_list(config):
     return vistrails.db.services.io.get_db_object_list(config,'vistrail')
 
-def get_workflow(vt, version):
+def get_workflow(vt, version, checkpoint_interval=0,
+                 checkpoint_version=False):
     from vistrails.core.vistrail.pipeline import Pipeline
-    workflow = vistrails.db.services.vistrail.materializeWorkflow(vt, version)
+    workflow = vistrails.db.services.vistrail.materializeWorkflow(
+            vt, version, checkpoint_interval, checkpoint_version)
     Pipeline.convert(workflow)
     return workflow
 
@@ -105,11 +107,21 @@ def serialize(object):
     """
     return vistrails.db.services.io.serialize(object)
 
-def open_log(fname, was_appended=False):
-    log = vistrails.db.services.io.open_log_from_xml(fname, was_appended)
+def open_log(fname, was_appended=False, versions=None, start=None,
+             end=None):
+    log = vistrails.db.services.io.open_log_from_xml(fname, was_appended,
+                                                     versions, start, end)
     Log.convert(log)
     return log
 
+def read_log_index(fname):
+    """read_log_index(fname: str) -> list of LogIndexEntry
+    Returns the version and times of the executions appended to the log
+    fname without loading them.
+
+    """
+    return vistrails.db.services.io.read_log_index(fname)
+
 
 def merge_logs(new_log, log_fname):
     log = vistrails.db.services.io.merge_logs(new_log, log_fname)
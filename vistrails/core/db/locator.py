@@ -44,7 +44,8 @@ from vistrails.core.thumbnails import ThumbnailCache
 from vistrails.core import debug
 from vistrails.db.services.locator import XMLFileLocator as _XMLFileLocator, \
     DBLocator as _DBLocator, ZIPFileLocator as _ZIPFileLocator, \
-    BaseLocator as _BaseLocator, UntitledLocator as _UntitledLocator
+    BaseLocator as _BaseLocator, UntitledLocator as _UntitledLocator, \
+    BINFileLocator as _BINFileLocator
 from vistrails.db.services.io import SaveBundle, test_db_connection
 from vistrails.db import VistrailsDBException
 from vistrails.db.domain import DBWorkflow
@@ -57,6 +58,8 @@ class BaseLocator(_BaseLocator):
             locator.__class__ = XMLFileLocator
         elif locator.__class__ == _ZIPFileLocator:
             locator.__class__ = ZIPFileLocator
+        elif locator.__class__ == _BINFileLocator:
+            locator.__class__ = BINFileLocator
         elif locator.__class__ == _DBLocator:
             DBLocator.convert(locator)
         elif locator.__class__ == _UntitledLocator:
@@ -529,11 +532,72 @@ class ZIPFileLocator(_ZIPFileLocator, CoreLocator):
         return db_gui.get_save_file_locator_from_gui(parent_widget, obj_type,
                                                          locator)
 
+class BINFileLocator(_BINFileLocator, CoreLocator):
+
+    def __init__(self, filename, **kwargs):
+        _BINFileLocator.__init__(self, filename, **kwargs)
+
+    def load(self, klass=None):
+        from vistrails.core.vistrail.vistrail import Vistrail
+        if klass is None:
+            klass = Vistrail
+        obj = _BINFileLocator.load(self, klass.vtType)
+        klass.convert(obj)
+        obj.locator = self
+        return obj
+
+    def save(self, obj):
+        return self._save(obj, False)
+
+    def save_as(self, obj, version=None):
+        return self._save(obj, True, version)
+
+    def _save(self, obj, do_copy, version=None):
+        is_bundle = False
+        if type(obj) == type(SaveBundle(None)):
+            is_bundle = True
+            save_bundle = obj
+            obj = save_bundle.get_primary_obj()
+        klass = obj.__class__
+        obj = _BINFileLocator.save(self, obj, do_copy, version)
+        klass.convert(obj)
+        obj.locator = self
+        if is_bundle:
+            return SaveBundle(save_bundle.bundle_type, obj)
+        return obj
+
+    ##########################################################################
+
+    def __eq__(self, other):
+        if not isinstance(other, BINFileLocator):
+            return False
+        return self._name == other._name
+
+    ##########################################################################
+
+    @staticmethod
+    def prompt_autosave(parent_widget):
+        import vistrails.gui.extras.core.db.locator as db_gui
+        return db_gui.get_autosave_prompt(parent_widget)
+
+    @staticmethod
+    def load_from_gui(parent_widget, obj_type):
+        import vistrails.gui.extras.core.db.locator as db_gui
+        return db_gui.get_load_file_locator_from_gui(parent_widget, obj_type)
+
+    @staticmethod
+    def save_from_gui(parent_widget, obj_type, locator=None):
+        import vistrails.gui.extras.core.db.locator as db_gui
+        return db_gui.get_save_file_locator_from_gui(parent_widget, obj_type,
+                                                         locator)
+
 class FileLocator(CoreLocator):
     def __new__(self, filename=None, **kwargs):
         if filename:
             if filename.endswith('.vt'):
                 return ZIPFileLocator(filename, **kwargs)
+            elif filename.endswith('.vtb'):
+                return BINFileLocator(filename, **kwargs)
             elif filename.endswith('.vtl'):
                 return FileLocator.from_link_file(filename)
             else:
@@ -33,6 +33,7 @@
 ##
 ###############################################################################
 from vistrails.core import debug
+from vistrails.core.vistrail.module import Module
 import copy
 
 ##############################################################################
@@ -187,8 +188,12 @@ class BaseInterpreter(object):
         for alias in aliases:
             try:
                 info = pipeline.aliases[alias]
+                # the parameter may be shared with a copy-on-write copy
+                pipeline.db_own_object(info[0],info[1])
                 param = pipeline.db_get_object(info[0],info[1])
                 param.strValue = str(aliases[alias])
+                # modified in place, the signatures are recomputed lazily
+                pipeline.invalidate_signatures(info[4])
             except KeyError:
                 pass
                     
@@ -205,21 +210,29 @@ class BaseInterpreter(object):
         if customParams:
             for (vttype, oId, strval) in customParams:
                 try:
+                    pipeline.db_own_object(vttype,oId)
                     param = pipeline.db_get_object(vttype,oId)
                     param.strValue = str(strval)
+                    # modified in place, the signatures are recomputed lazily
+                    pipeline.invalidate_object_signatures(vttype, oId)
                 except Exception, e:
                     debug.debug("Problem when updating params", e)
 
     def resolve_variables(self, vistrail_variables, pipeline):
-        for m in pipeline.module_list:
+        for m in list(pipeline.module_list):
             if m.is_vistrail_var():
                 vistrail_var = vistrail_variables(m.get_vistrail_var())
                 if vistrail_var is None: # assume set in parameter exploration
                     continue
                 strValue = vistrail_var.value
+                pipeline.db_own_object(Module.vtType, m.id)
+                m = pipeline.modules[m.id]
                 for func in m.functions:
                     if func.name == 'value':
                         func.params[0].strValue = strValue
+                        # modified in place, the signatures are
+                        # recomputed lazily
+                        pipeline.invalidate_signatures(m.id)
 
     def set_done_summon_hook(self, hook):
         """ set_done_summon_hook(hook: function(pipeline, objects)) -> None
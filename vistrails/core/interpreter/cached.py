@@ -37,7 +37,10 @@ import base64
 import copy
 import gc
 import cPickle as pickle
+import time
 
+from vistrails.core.cache.persistent import PersistentResultCache
+from vistrails.core.cache.utils import estimate_size
 from vistrails.core.common import InstanceObject, VistrailsInternalError
 from vistrails.core.configuration import get_vistrails_configuration
 from vistrails.core.data_structures.bijectivedict import Bidict
@@ -45,6 +48,9 @@ from vistrails.core import debug
 import vistrails.core.interpreter.base
 from vistrails.core.interpreter.base import AbortExecution
 from vistrails.core.interpreter.job import JobMonitor
+from vistrails.core.interpreter.parallel import ParallelScheduler
+from vistrails.core.interpreter.profiler import ExecutionProfiler, \
+    TimedLogger
 import vistrails.core.interpreter.utils
 from vistrails.core.log.controller import DummyLogController
 from vistrails.core.modules.basic_modules import identifier as basic_pkg, \
@@ -75,9 +81,12 @@ class ViewUpdatingLogController(object):
             self.log.finish_iteration(looped_obj)
 
     def __init__(self, logger, view, remap_id, ids,
-                 module_executed_hook=[]):
+                 module_executed_hook=[], profiler=None):
+        if profiler is not None:
+            logger = TimedLogger(logger, profiler)
         self.log = logger
         self.view = view
+        self.profiler = profiler
         self.remap_id = remap_id
         self.ids = set(ids) # modules left to be executed
         self.nb_modules = len(self.ids)
@@ -87,9 +96,14 @@ class ViewUpdatingLogController(object):
         self.executed = {}
         self.suspended = {}
         self.cached = {}
+        self.compute_start = {}
+        self.compute_times = {}
 
     def signalSuccess(self, obj):
         self.executed[obj.id] = True
+        start = self.compute_start.get(obj.id)
+        if start is not None:
+            self.compute_times[obj.id] = time.time() - start
         for callable_ in self.module_executed_hook:
             callable_(obj.id)
 
@@ -99,10 +113,15 @@ class ViewUpdatingLogController(object):
     def begin_update(self, obj):
         i = self.remap_id(obj.id)
         self.view.set_module_active(i)
+        if self.profiler is not None:
+            self.profiler.begin_update(obj)
 
     def begin_compute(self, obj):
         i = self.remap_id(obj.id)
         self.view.set_module_computing(i)
+        self.compute_start.setdefault(obj.id, time.time())
+        if self.profiler is not None:
+            self.profiler.begin_compute(obj)
 
         reg = get_module_registry()
         module_name = reg.get_descriptor(obj.__class__).name
@@ -149,6 +168,8 @@ class ViewUpdatingLogController(object):
             # It's ok, because that was already logged by the recursive
             # execute_pipeline() call
             return
+        if self.profiler is not None:
+            self.profiler.end_update(obj, error)
         if was_suspended:
             self._handle_suspended(obj, error)
             self.suspended[obj.id] = error
@@ -173,6 +194,8 @@ class ViewUpdatingLogController(object):
 
     def update_cached(self, obj):
         self.cached[obj.id] = True
+        if self.profiler is not None:
+            self.profiler.update_cached(obj)
         i = self.remap_id(obj.id)
 
         reg = get_module_registry()
@@ -206,6 +229,9 @@ class CachedInterpreter(vistrails.core.interpreter.base.BaseInterpreter):
     def __init__(self):
         vistrails.core.interpreter.base.BaseInterpreter.__init__(self)
         self.debugger = None
+        self.result_cache = None
+        self.pinned_signatures = set()
+        self.profiler = None
         self.create()
 
     def create(self):
@@ -216,6 +242,10 @@ class CachedInterpreter(vistrails.core.interpreter.base.BaseInterpreter):
         self._objects = {}
         self.filePool = self._file_pool
         self._streams = []
+        self._module_sizes = {}
+        self._module_costs = {}
+        self._module_priorities = {}
+        self._priority_clock = 0.0
 
     def clear(self):
         self._file_pool.cleanup()
@@ -223,6 +253,10 @@ class CachedInterpreter(vistrails.core.interpreter.base.BaseInterpreter):
         for obj in self._objects.itervalues():
             obj.clear()
         self._objects = {}
+        self._module_sizes = {}
+        self._module_costs = {}
+        self._module_priorities = {}
+        self._priority_clock = 0.0
 
     def __del__(self):
         self.clear()
@@ -241,6 +275,9 @@ class CachedInterpreter(vistrails.core.interpreter.base.BaseInterpreter):
         for v in dependencies:
             self._persistent_pipeline.delete_module(v)
             del self._objects[v]
+            self._module_sizes.pop(v, None)
+            self._module_costs.pop(v, None)
+            self._module_priorities.pop(v, None)
 
     def clean_non_cacheable_modules(self):
         """clean_non_cacheable_modules() -> None
@@ -253,6 +290,152 @@ class CachedInterpreter(vistrails.core.interpreter.base.BaseInterpreter):
                                  if not mod.is_cacheable()]
         self.clean_modules(non_cacheable_modules)
 
+    def get_result_cache(self):
+        """get_result_cache() -> PersistentResultCache
+
+        Returns the on-disk result cache, or None if the persistentCache
+        option is not set. A cache assigned to the result_cache attribute
+        (e.g. a SharedResultCache) is used instead if there is one.
+        """
+        if self.result_cache is not None:
+            return self.result_cache
+        if not get_vistrails_configuration().check('persistentCache'):
+            return None
+        return PersistentResultCache.getInstance()
+
+    def get_profiler(self):
+        """get_profiler() -> ExecutionProfiler
+
+        Returns the profiler executions are reported to: the profiler
+        attribute if it is set, the global ExecutionProfiler if the
+        executionProfile option is, None otherwise.
+        """
+        if self.profiler is not None:
+            return self.profiler
+        conf = get_vistrails_configuration()
+        if conf is not None and conf.check('executionProfile'):
+            return ExecutionProfiler.getInstance()
+        return None
+
+    def load_persistent_results(self, result_cache, tmp_id_to_module_map,
+                                module_added_set):
+        """load_persistent_results(result_cache: PersistentResultCache,
+                                   tmp_id_to_module_map: dict,
+                                   module_added_set: set) -> set
+
+        Restores the outputs of newly added modules from the on-disk
+        cache. Modules are visited downstream first so that upstream
+        results that are only needed by restored modules are not read at
+        all. Returns the set of persistent ids that were restored.
+        """
+        g = self._persistent_pipeline.graph
+        added = set(tmp_id_to_module_map[i].id for i in module_added_set)
+        restored = set()
+        not_needed = set()
+        for persistent_id in reversed(g.vertices_topological_sort(added)):
+            if persistent_id not in added:
+                continue
+            downstream = [to for (to, _) in g.edges_from(persistent_id)]
+            if downstream and all(to in restored or to in not_needed
+                                  for to in downstream):
+                not_needed.add(persistent_id)
+                continue
+            obj = self._objects[persistent_id]
+            if result_cache.load(obj):
+                # Results are there, upstream modules don't need to run
+                obj.inputPorts = {}
+                obj.upToDate = True
+                restored.add(persistent_id)
+        return restored
+
+    def store_persistent_results(self, result_cache, objs, errs, execs):
+        """store_persistent_results(result_cache: PersistentResultCache,
+                                    objs: dict, errs: dict,
+                                    execs: dict) -> None
+
+        Writes the outputs of the modules computed during this execution
+        to the on-disk cache. Modules that are not cacheable, and the
+        modules that depend on them, are not stored.
+        """
+        non_cacheable = [i for (i, mod) in self._objects.iteritems()
+                         if not mod.is_cacheable()]
+        # An empty vertex set would mean the whole graph
+        tainted = set()
+        if non_cacheable:
+            tainted.update(self._persistent_pipeline.graph \
+                               .vertices_topological_sort(non_cacheable))
+        for tmp_id, executed in execs.iteritems():
+            if not executed or tmp_id in errs:
+                continue
+            obj = objs[tmp_id]
+            if obj.id not in tainted:
+                result_cache.store(obj)
+
+    def get_memory_limit(self):
+        """get_memory_limit() -> int
+
+        Returns the memory budget for the results held by the persistent
+        pipeline in bytes, or 0 if it is unbounded (cacheMemoryLimit
+        option).
+        """
+        return get_vistrails_configuration().cacheMemoryLimit * 1024 * 1024
+
+    def update_memory_usage(self, objs):
+        """update_memory_usage(objs: dict) -> None
+
+        Records the size of the modules that were used by the last
+        execution and refreshes their eviction priority.
+
+        The priority of a module follows the GreedyDual-Size policy: it
+        is the current clock plus the time it took to compute the module
+        divided by its size, and the clock moves up to the priority of
+        each evicted module. Modules that have not been used for a while,
+        and large modules that are cheap to recompute, go first.
+        """
+        for obj in objs.itervalues():
+            if obj.id not in self._objects:
+                # removed by finalize_pipeline
+                continue
+            if obj.id not in self._module_sizes:
+                seen = set([id(obj)])
+                self._module_sizes[obj.id] = sum(
+                        estimate_size(value, seen)
+                        for port, value in obj.outputPorts.iteritems()
+                        if port != 'self')
+            size = max(self._module_sizes[obj.id], 1)
+            cost = self._module_costs.get(obj.id, 0.0)
+            self._module_priorities[obj.id] = (self._priority_clock +
+                                               cost / size)
+
+    def evict_modules(self, protected=set()):
+        """evict_modules(protected: set of persistent module ids) -> None
+
+        Removes modules from the persistent pipeline, lowest priority
+        first, until the estimated size of the cached results fits in the
+        memory budget. Modules depending on an evicted module are removed
+        too (see clean_modules). Modules in protected, and modules whose
+        signature is in pinned_signatures, are never evicted.
+        """
+        limit = self.get_memory_limit()
+        if limit <= 0:
+            return
+        total = sum(self._module_sizes.itervalues())
+        candidates = sorted((priority, i)
+                            for (i, priority)
+                            in self._module_priorities.iteritems()
+                            if i not in protected and
+                                getattr(self._objects.get(i), 'signature',
+                                        None) not in self.pinned_signatures)
+        for priority, i in candidates:
+            if total <= limit:
+                break
+            if i not in self._objects:
+                # already removed, downstream of an evicted module
+                continue
+            self._priority_clock = priority
+            self.clean_modules([i])
+            total = sum(self._module_sizes.itervalues())
+
     def _clear_package(self, identifier):
         """clear_package(identifier: str) -> None
 
@@ -305,6 +488,7 @@ class CachedInterpreter(vistrails.core.interpreter.base.BaseInterpreter):
         module_executed_hook = fetch('module_executed_hook', [])
         stop_on_error = fetch('stop_on_error', True)
         parent_exec = fetch('parent_exec', None)
+        threads = fetch('threads', 1)
 
         reg = get_module_registry()
 
@@ -352,10 +536,15 @@ class CachedInterpreter(vistrails.core.interpreter.base.BaseInterpreter):
 
         self.update_params(pipeline, params)
         
+        profiler = self.get_profiler()
+        if profiler is not None:
+            start = time.time()
         (tmp_to_persistent_module_map,
          conn_map,
          module_added_set,
          conn_added_set) = self.add_to_persistent_pipeline(pipeline)
+        if profiler is not None:
+            profiler.add_time('signatures', time.time() - start)
 
         # Create the new objects
         for i in module_added_set:
@@ -438,6 +627,41 @@ class CachedInterpreter(vistrails.core.interpreter.base.BaseInterpreter):
         return (tmp_id_to_module_map, tmp_to_persistent_module_map.inverse,
                 module_added_set, conn_added_set, to_delete, errors)
 
+    def update_and_log(self, update, logging_obj):
+        """update_and_log(update: callable,
+                          logging_obj: ViewUpdatingLogController) -> bool
+
+        Calls update(), usually a Module's update method, and logs the
+        errors it raises. Returns None if the execution can go on, False
+        if a module failed, and True if the execution should be aborted
+        even if stop_on_error is not set. AbortExecution is propagated.
+        """
+        try:
+            update()
+        except ModuleWasSuspended:
+            pass
+        except ModuleHadError:
+            return False
+        except ModuleSuspended, ms:
+            ms.module.logging.end_update(ms.module, ms,
+                                         was_suspended=True)
+        except ModuleErrors, mes:
+            abort = False
+            for me in mes.module_errors:
+                me.module.logging.end_update(me.module, me)
+                logging_obj.signalError(me.module, me)
+                abort = abort or me.abort
+            return abort
+        except ModuleError, me:
+            me.module.logging.end_update(me.module, me, me.errorTrace)
+            logging_obj.signalError(me.module, me)
+            return me.abort
+        except ModuleBreakpoint, mb:
+            mb.module.logging.end_update(mb.module)
+            logging_obj.signalError(mb.module, mb)
+            return True
+        return None
+
     def execute_pipeline(self, pipeline, tmp_id_to_module_map, 
                          persistent_to_tmp_id_map, **kwargs):
         def fetch(name, default):
@@ -459,6 +683,7 @@ class CachedInterpreter(vistrails.core.interpreter.base.BaseInterpreter):
         clean_pipeline = fetch('clean_pipeline', False)
         stop_on_error = fetch('stop_on_error', True)
         parent_exec = fetch('parent_exec', None)
+        threads = fetch('threads', 1)
 
         if len(kwargs) > 0:
             raise VistrailsInternalError('Wrong parameters passed '
@@ -468,12 +693,16 @@ class CachedInterpreter(vistrails.core.interpreter.base.BaseInterpreter):
         def get_remapped_id(id):
             return persistent_to_tmp_id_map[id]
 
+        profiler = self.get_profiler()
+        if profiler is not None:
+            profiler_marker = profiler.begin_pipeline()
         logging_obj = ViewUpdatingLogController(
                 logger=logger,
                 view=view,
                 remap_id=get_remapped_id,
                 ids=pipeline.modules.keys(),
-                module_executed_hook=module_executed_hook)
+                module_executed_hook=module_executed_hook,
+                profiler=profiler)
 
         # PARAMETER CHANGES SETUP
         parameter_changes = []
@@ -516,37 +745,38 @@ class CachedInterpreter(vistrails.core.interpreter.base.BaseInterpreter):
         self._streams.append(Generator.generators)
         Generator.generators = []
 
+        # Update independent branches concurrently
+        stopped = False
+        if threads > 1:
+            def handle_result(obj, exc_info):
+                if exc_info is None:
+                    return False
+                def reraise():
+                    raise exc_info[0], exc_info[1], exc_info[2]
+                try:
+                    error = self.update_and_log(reraise, logging_obj)
+                except AbortExecution:
+                    return True
+                return error is not None and (stop_on_error or error)
+            scheduler = ParallelScheduler(threads)
+            stopped = scheduler.update(persistent_sinks,
+                                       set(tmp_id_to_module_map.itervalues()),
+                                       logging_obj, handle_result)
+            # Streams need to be advanced in topological order
+            order = dict((v, i) for i, v in enumerate(
+                    self._persistent_pipeline.graph \
+                        .vertices_topological_sort()))
+            Generator.generators.sort(key=lambda m: order.get(m.id, -1))
+
         # Update new sinks
-        for obj in persistent_sinks:
-            abort = False
-            try:
-                obj.update()
-                continue
-            except ModuleWasSuspended:
-                continue
-            except ModuleHadError:
-                pass
-            except AbortExecution:
-                break
-            except ModuleSuspended, ms:
-                ms.module.logging.end_update(ms.module, ms,
-                                             was_suspended=True)
-                continue
-            except ModuleErrors, mes:
-                for me in mes.module_errors:
-                    me.module.logging.end_update(me.module, me)
-                    logging_obj.signalError(me.module, me)
-                    abort = abort or me.abort
-            except ModuleError, me:
-                me.module.logging.end_update(me.module, me, me.errorTrace)
-                logging_obj.signalError(me.module, me)
-                abort = me.abort
-            except ModuleBreakpoint, mb:
-                mb.module.logging.end_update(mb.module)
-                logging_obj.signalError(mb.module, mb)
-                abort = True
-            if stop_on_error or abort:
-                break
+        if not stopped:
+            for obj in persistent_sinks:
+                try:
+                    error = self.update_and_log(obj.update, logging_obj)
+                except AbortExecution:
+                    break
+                if error is not None and (stop_on_error or error):
+                    break
 
         # execute all generators until inputs are exhausted
         # this makes sure branching and multiple sinks are executed correctly
@@ -582,6 +812,9 @@ class CachedInterpreter(vistrails.core.interpreter.base.BaseInterpreter):
                     break
 
         Generator.generators = self._streams.pop()
+        self._module_costs.update(logging_obj.compute_times)
+        if profiler is not None:
+            profiler.end_pipeline(profiler_marker)
 
         if self.done_update_hook:
             self.done_update_hook(self._persistent_pipeline, self._objects)
@@ -661,6 +894,7 @@ class CachedInterpreter(vistrails.core.interpreter.base.BaseInterpreter):
           actions = fetch('actions', None)
           done_summon_hooks = fetch('done_summon_hooks', [])
           module_executed_hook = fetch('module_executed_hook', [])
+          threads = fetch('threads', None)
 
         Executes a pipeline using caching. Caching works by reusing
         pipelines directly.  This means that there exists one global
@@ -680,7 +914,11 @@ class CachedInterpreter(vistrails.core.interpreter.base.BaseInterpreter):
         whether they were executed or not.
 
         If modules have no error associated with but were not executed, it
-        means they were cached."""
+        means they were cached.
+
+        If threads is more than 1 (it defaults to the executionThreads
+        configuration option), independent branches of the pipeline are
+        executed concurrently on that many threads."""
 
         # Setup named arguments. We don't use named parameters so
         # that positional parameter calls fail earlier
@@ -704,12 +942,21 @@ class CachedInterpreter(vistrails.core.interpreter.base.BaseInterpreter):
         module_executed_hook = fetch('module_executed_hook', [])
         stop_on_error = fetch('stop_on_error', True)
         parent_exec = fetch('parent_exec', None)
+        threads = fetch('threads', None)
+        if threads is None:
+            conf = get_vistrails_configuration()
+            new_kwargs['threads'] = conf.executionThreads
 
         if len(kwargs) > 0:
             raise VistrailsInternalError('Wrong parameters passed '
                                          'to execute: %s' % kwargs)
         self.clean_non_cacheable_modules()
 
+        # packages registered from the registry cache are initialized
+        # when a pipeline first uses them
+        from vistrails.core.packagemanager import get_package_manager
+        get_package_manager().initialize_pipeline_packages(pipeline)
+
 
 #         if controller is not None:
 #             vistrail = controller.vistrail
@@ -730,18 +977,39 @@ class CachedInterpreter(vistrails.core.interpreter.base.BaseInterpreter):
         new_kwargs['logger'] = logger
         self.annotate_workflow_execution(logger, reason, aliases, params)
 
+        profiler = self.get_profiler()
+        def timed(phase, start):
+            now = time.time()
+            if profiler is not None:
+                profiler.add_time(phase, now - start)
+            return now
+        start = time.time()
+
         res = self.setup_pipeline(pipeline, **new_kwargs)
+        start = timed('setup', start)
         modules_added = res[2]
         conns_added = res[3]
         to_delete = res[4]
         errors = res[5]
         if len(errors) == 0:
+            result_cache = self.get_result_cache()
+            if result_cache is not None:
+                self.load_persistent_results(result_cache, res[0],
+                                             modules_added)
+                start = timed('result_cache', start)
             res = self.execute_pipeline(pipeline, *(res[:2]), **new_kwargs)
+            start = timed('execution', start)
+            if result_cache is not None:
+                self.store_persistent_results(result_cache, *res[1:4])
+                start = timed('result_cache', start)
         else:
             res = (to_delete, res[0], errors, {}, {}, {}, [])
             for (i, error) in errors.iteritems():
                 view.set_module_error(i, error)
         self.finalize_pipeline(pipeline, *(res[:-1]), **new_kwargs)
+        self.update_memory_usage(res[1])
+        self.evict_modules(set(obj.id for obj in res[1].itervalues()))
+        timed('finalize', start)
 
         result = InstanceObject(objects=res[1],
                               errors=res[2],
@@ -786,7 +1054,7 @@ class CachedInterpreter(vistrails.core.interpreter.base.BaseInterpreter):
         connection_id_map = Bidict()
         modules_added = set()
         connections_added = set()
-        pipeline.refresh_signatures()
+        pipeline.compute_signatures()
         # we must traverse vertices in topological sort order
         verts = pipeline.graph.vertices_topological_sort()
         for new_module_id in verts:
@@ -835,7 +1103,7 @@ class CachedInterpreter(vistrails.core.interpreter.base.BaseInterpreter):
         object_map = {}
         module_id_map = {}
         connection_id_map = {}
-        pipeline.refresh_signatures()
+        pipeline.compute_signatures()
         # we must traverse vertices in topological sort order
         verts = pipeline.graph.vertices_topological_sort()
         for module_id in verts:
@@ -934,6 +1202,250 @@ class TestCachedInterpreter(unittest.TestCase):
         finally:
             StandardOutput.compute = old_compute
 
+    def test_memory_limit(self):
+        from vistrails.core.db.locator import XMLFileLocator
+        from vistrails.core.db.io import load_vistrail
+        from vistrails.core.modules.basic_modules import StandardOutput
+        from vistrails.core.vistrail.controller import VistrailController
+
+        old_compute = StandardOutput.compute
+        StandardOutput.compute = lambda s: None
+        interpreter = CachedInterpreter()
+        interpreter.get_memory_limit = lambda: 1
+        try:
+            locator = XMLFileLocator(
+                    vistrails.core.system.vistrails_root_directory() +
+                    '/tests/resources/dummy.xml')
+            (v, abstractions, thumbnails, mashups) = load_vistrail(locator)
+            controller = VistrailController(v, locator, abstractions,
+                                            thumbnails, mashups)
+            pipelines = []
+            for version in (34, 36):
+                controller.change_selected_version(version)
+                controller.flush_delayed_actions()
+                pipelines.append(controller.current_pipeline)
+
+            result = interpreter.execute(pipelines[0], locator=v,
+                                         current_version=34,
+                                         view=DummyView())
+            self.assertFalse(result.errors)
+            # Modules of the current pipeline are not evicted
+            first = set(obj.id for obj in result.objects.itervalues()
+                        if obj.is_cacheable())
+            self.assertTrue(first)
+            self.assertTrue(first <= set(interpreter._objects))
+            self.assertTrue(all(interpreter._module_sizes[i] > 0
+                                for i in first))
+
+            result = interpreter.execute(pipelines[1], locator=v,
+                                         current_version=36,
+                                         view=DummyView())
+            self.assertFalse(result.errors)
+            second = set(obj.id for obj in result.objects.itervalues())
+            self.assertTrue(second <= set(interpreter._objects))
+            self.assertTrue(first - second)
+            self.assertFalse((first - second) & set(interpreter._objects))
+        finally:
+            interpreter.clear()
+            StandardOutput.compute = old_compute
+
+    def test_pinned(self):
+        from vistrails.core.db.locator import XMLFileLocator
+        from vistrails.core.db.io import load_vistrail
+        from vistrails.core.modules.basic_modules import StandardOutput
+        from vistrails.core.vistrail.controller import VistrailController
+
+        old_compute = StandardOutput.compute
+        StandardOutput.compute = lambda s: None
+        interpreter = CachedInterpreter()
+        interpreter.get_memory_limit = lambda: 1
+        try:
+            locator = XMLFileLocator(
+                    vistrails.core.system.vistrails_root_directory() +
+                    '/tests/resources/dummy.xml')
+            (v, abstractions, thumbnails, mashups) = load_vistrail(locator)
+            controller = VistrailController(v, locator, abstractions,
+                                            thumbnails, mashups)
+            pipelines = []
+            for version in (34, 36):
+                controller.change_selected_version(version)
+                controller.flush_delayed_actions()
+                pipelines.append(controller.current_pipeline)
+
+            result = interpreter.execute(pipelines[0], locator=v,
+                                         current_version=34,
+                                         view=DummyView())
+            self.assertFalse(result.errors)
+            first = set(obj.id for obj in result.objects.itervalues()
+                        if obj.is_cacheable())
+            interpreter.pinned_signatures = set(
+                    interpreter._objects[i].signature for i in first)
+
+            # Pinned modules are kept despite the memory limit
+            result = interpreter.execute(pipelines[1], locator=v,
+                                         current_version=36,
+                                         view=DummyView())
+            self.assertFalse(result.errors)
+            self.assertTrue(first <= set(interpreter._objects))
+        finally:
+            interpreter.clear()
+            StandardOutput.compute = old_compute
+
+    def test_threads(self):
+        from vistrails.tests.utils import execute
+        from vistrails.core.modules.basic_modules import StandardOutput
+
+        conf = get_vistrails_configuration()
+        old_threads = conf.executionThreads
+        old_compute = StandardOutput.compute
+        StandardOutput.compute = lambda s: None
+        try:
+            conf.executionThreads = 2
+            result = execute([
+                    ('String', 'org.vistrails.vistrails.basic', [
+                        ('value', [('String', 'ab')])]),
+                    ('String', 'org.vistrails.vistrails.basic', [
+                        ('value', [('String', 'cd')])]),
+                    ('ConcatenateString', 'org.vistrails.vistrails.basic',
+                     []),
+                    ('StandardOutput', 'org.vistrails.vistrails.basic', []),
+                ],
+                [
+                    (0, 'value', 2, 'str1'),
+                    (1, 'value', 2, 'str2'),
+                    (2, 'value', 3, 'value'),
+                ],
+                full_results=True)
+            self.assertFalse(result.errors)
+            self.assertEqual(len([e for e in result.executed.itervalues()
+                                  if e]), 4)
+            self.assertEqual(result.objects[2].get_output('value'), 'abcd')
+        finally:
+            conf.executionThreads = old_threads
+            StandardOutput.compute = old_compute
+
+    def test_update_params_copy_on_write(self):
+        from vistrails.core.db.locator import XMLFileLocator
+        from vistrails.core.db.io import load_vistrail
+        from vistrails.core.vistrail.controller import VistrailController
+
+        locator = XMLFileLocator(
+                vistrails.core.system.vistrails_root_directory() +
+                '/tests/resources/dummy.xml')
+        (v, abstractions, thumbnails, mashups) = load_vistrail(locator)
+        controller = VistrailController(v, locator, abstractions,
+                                        thumbnails, mashups)
+        n = v.get_version_number('int chain')
+        controller.change_selected_version(n)
+        controller.flush_delayed_actions()
+        p1 = controller.current_pipeline
+        p1.compute_signatures()
+        (m, param) = [(m, f.params[0]) for m in p1.module_list
+                      for f in m.functions if f.params][0]
+        old_value = param.strValue
+        old_signature = p1.module_signature(m.id)
+
+        p2 = p1.do_copy(cow=True)
+        interpreter = CachedInterpreter.get()
+        interpreter.update_params(p2, [(param.vtType, param.real_id, '999')])
+        self.assertEqual(
+            p2.db_get_object(param.vtType, param.real_id).strValue, '999')
+        self.assertNotEqual(p2.module_signature(m.id), old_signature)
+        # the source pipeline is unchanged
+        self.assertEqual(param.strValue, old_value)
+        self.assertIs(p1.db_get_object(param.vtType, param.real_id), param)
+        self.assertEqual(p1.module_signature(m.id), old_signature)
+
+
+class TestPersistentCache(unittest.TestCase):
+    def setUp(self):
+        import tempfile
+        from vistrails.core.modules.basic_modules import StandardOutput
+
+        self.old_compute = StandardOutput.compute
+        StandardOutput.compute = lambda s: None
+        conf = get_vistrails_configuration()
+        self.old_conf = conf.check('persistentCache')
+        self.old_instance = PersistentResultCache._instance
+        self.directory = tempfile.mkdtemp(prefix='vt_test_results_')
+        conf.persistentCache = True
+        PersistentResultCache._instance = PersistentResultCache(
+                self.directory, 1024 * 1024)
+        CachedInterpreter.flush()
+
+    def tearDown(self):
+        import shutil
+        from vistrails.core.modules.basic_modules import StandardOutput
+
+        CachedInterpreter.flush()
+        StandardOutput.compute = self.old_compute
+        get_vistrails_configuration().persistentCache = self.old_conf
+        PersistentResultCache._instance = self.old_instance
+        shutil.rmtree(self.directory)
+
+    def load_pipeline(self):
+        """load_pipeline() -> (Vistrail, int, Pipeline)
+        Loads the 'int chain' version of tests/resources/dummy.xml.
+
+        """
+        from vistrails.core.db.locator import XMLFileLocator
+        from vistrails.core.db.io import load_vistrail
+        from vistrails.core.vistrail.controller import VistrailController
+
+        locator = XMLFileLocator(
+                vistrails.core.system.vistrails_root_directory() +
+                '/tests/resources/dummy.xml')
+        (v, abstractions, thumbnails, mashups) = load_vistrail(locator)
+        controller = VistrailController(v, locator, abstractions,
+                                        thumbnails, mashups)
+        n = v.get_version_number('int chain')
+        controller.change_selected_version(n)
+        controller.flush_delayed_actions()
+        return v, n, controller.current_pipeline
+
+    def execute(self, v, n, p):
+        """execute(v: Vistrail, n: int, p: Pipeline) -> [int]
+        Runs p on a fresh interpreter and returns the ids of the modules
+        that were executed.
+
+        """
+        CachedInterpreter.flush()
+        result = CachedInterpreter.get().execute(p, locator=v,
+                                                 current_version=n,
+                                                 view=DummyView())
+        self.assertFalse(result.errors)
+        return [k for k, e in result.executed.iteritems() if e]
+
+    def test_persistent_cache(self):
+        from vistrails.core.modules.basic_modules import StandardOutput
+
+        v, n, p = self.load_pipeline()
+        self.assertEqual(len(self.execute(v, n, p)), 3)
+        # StandardOutput is not cacheable
+        self.assertEqual(len(PersistentResultCache._instance.elements), 2)
+
+        # A fresh interpreter gets the results from disk
+        executed = self.execute(v, n, p)
+        self.assertEqual(len(executed), 1)
+        self.assertEqual(p.modules[executed[0]].module_descriptor.module,
+                         StandardOutput)
+        self.assertEqual(PersistentResultCache._instance.hits, 1)
+
+    def test_persistent_cache_all_cacheable(self):
+        import copy
+        from vistrails.core.modules.basic_modules import StandardOutput
+
+        v, n, p = self.load_pipeline()
+        p = copy.copy(p)
+        # Only keep cacheable modules
+        for module in p.module_list:
+            if module.module_descriptor.module is StandardOutput:
+                p.delete_module(module.id)
+
+        self.assertEqual(len(self.execute(v, n, p)), 2)
+        self.assertEqual(len(PersistentResultCache._instance.elements), 2)
+        self.assertFalse(self.execute(v, n, p))
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -46,6 +46,9 @@ class Interpreter(vistrails.core.interpreter.cached.CachedInterpreter):
                                  (i, mod) in self._objects.iteritems()]
         self.clean_modules(non_cacheable_modules)
 
+    def get_result_cache(self):
+        return None
+
     __instance = None
     @staticmethod
     def get():
@@ -0,0 +1,301 @@
+###############################################################################
+##
+## Copyright (C) 2011-2014, NYU-Poly.
+## Copyright (C) 2006-2011, University of Utah. 
+## All rights reserved.
+## Contact: contact@vistrails.org
+##
+## This file is part of VisTrails.
+##
+## "Redistribution and use in source and binary forms, with or without 
+## modification, are permitted provided that the following conditions are met:
+##
+##  - Redistributions of source code must retain the above copyright notice, 
+##    this list of conditions and the following disclaimer.
+##  - Redistributions in binary form must reproduce the above copyright 
+##    notice, this list of conditions and the following disclaimer in the 
+##    documentation and/or other materials provided with the distribution.
+##  - Neither the name of the University of Utah nor the names of its 
+##    contributors may be used to endorse or promote products derived from 
+##    this software without specific prior written permission.
+##
+## THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" 
+## AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, 
+## THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR 
+## PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR 
+## CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, 
+## EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, 
+## PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; 
+## OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, 
+## WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR 
+## OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF 
+## ADVISED OF THE POSSIBILITY OF SUCH DAMAGE."
+##
+###############################################################################
+"""Execution of independent pipeline branches on a pool of threads.
+
+Module.update() walks the pipeline depth-first from the sinks, so
+branches that share nothing are computed one after the other. The
+ParallelScheduler instead orders the modules topologically and calls
+update() on every module whose upstream modules are done, using a pool
+of worker threads. When update() reaches a module, its upstream modules
+have already been computed, so the recursion does no further work.
+
+Modules that are not cacheable (they usually have side-effects, like
+spreadsheet cells) and modules whose is_thread_safe() returns False are
+always updated on the calling thread. Logging and view updates made by
+modules running on worker threads are forwarded to the calling thread
+as well, since neither the log controller nor the (Qt) view can be used
+concurrently.
+
+"""
+
+import Queue
+import sys
+import threading
+
+##############################################################################
+
+class MainThreadLogging(object):
+    """Wraps a module logging object so that calls made from worker
+    threads are run by the thread that created it, in process_call().
+
+    """
+
+    def __init__(self, logging, calls):
+        self._logging = logging
+        self._calls = calls
+        self._thread = threading.current_thread()
+
+    def __getattr__(self, name):
+        attr = getattr(self._logging, name)
+        if not callable(attr):
+            return attr
+        def call(*args, **kwargs):
+            if threading.current_thread() is self._thread:
+                return self._wrap(attr(*args, **kwargs))
+            done = threading.Event()
+            result = []
+            self._calls.put(('call', (attr, args, kwargs, done, result)))
+            done.wait()
+            value, exc_info = result
+            if exc_info is not None:
+                raise exc_info[0], exc_info[1], exc_info[2]
+            return self._wrap(value)
+        return call
+
+    def _wrap(self, value):
+        # Loop objects returned by begin_loop_execution() log too, and so
+        # do the controllers returned by a LogController
+        if (hasattr(value, 'begin_iteration') or
+                hasattr(value, 'start_iteration') or
+                hasattr(value, 'start_execution')):
+            return MainThreadLogging(value, self._calls)
+        return value
+
+    @staticmethod
+    def process_call(call):
+        attr, args, kwargs, done, result = call
+        try:
+            result.extend([attr(*args, **kwargs), None])
+        except Exception:
+            result.extend([None, sys.exc_info()])
+        done.set()
+
+class ParallelScheduler(object):
+    """ParallelScheduler updates the modules upstream of a list of sinks,
+    running independent modules concurrently on nb_threads threads.
+
+    """
+
+    def __init__(self, nb_threads):
+        self.nb_threads = nb_threads
+
+    @staticmethod
+    def runs_on_main_thread(obj):
+        return (obj.upToDate or
+                not obj.is_cacheable() or
+                not obj.is_thread_safe())
+
+    @staticmethod
+    def build_graph(sinks, modules):
+        """build_graph(sinks: list of Module, modules: set of Module)
+            -> (dict, dict)
+
+        Returns the upstream and downstream dependencies between the
+        modules that need to be updated for sinks, following the
+        connectors of their input ports. Only the modules in the set
+        modules are considered.
+
+        """
+        upstream = {}
+        downstream = {}
+        to_visit = list(sinks)
+        while to_visit:
+            obj = to_visit.pop()
+            if obj in upstream:
+                continue
+            upstream[obj] = set()
+            downstream.setdefault(obj, set())
+            for connector_list in obj.inputPorts.itervalues():
+                for connector in connector_list:
+                    src = connector.obj
+                    if src in modules and src is not obj:
+                        upstream[obj].add(src)
+                        downstream.setdefault(src, set()).add(obj)
+                        to_visit.append(src)
+        return upstream, downstream
+
+    def update(self, sinks, modules, logging_obj, handle_result):
+        """update(sinks: list of Module, modules: set of Module,
+                  logging_obj: ViewUpdatingLogController,
+                  handle_result: callable) -> bool
+
+        Updates all the modules upstream of sinks. For each module,
+        handle_result(obj, exc_info) is called on this thread with the
+        exception info raised by obj.update() (or None); it returns True
+        if the execution should stop. Modules that are already running
+        when that happens are allowed to finish.
+
+        Returns True if the execution was stopped.
+
+        """
+        upstream, downstream = self.build_graph(sinks, modules)
+        events = Queue.Queue()
+        tasks = Queue.Queue()
+        proxy = MainThreadLogging(logging_obj, events)
+        for obj in upstream:
+            obj.logging = proxy
+
+        def worker():
+            while True:
+                obj = tasks.get()
+                if obj is None:
+                    break
+                try:
+                    obj.update()
+                    events.put(('done', (obj, None)))
+                except BaseException:
+                    events.put(('done', (obj, sys.exc_info())))
+
+        threads = [threading.Thread(target=worker)
+                   for i in xrange(self.nb_threads)]
+        for thread in threads:
+            thread.daemon = True
+            thread.start()
+
+        ready = [obj for obj, deps in upstream.iteritems() if not deps]
+        running = 0
+        stopped = False
+        try:
+            while ready or running:
+                if not stopped:
+                    main_thread = []
+                    for obj in ready:
+                        if self.runs_on_main_thread(obj):
+                            main_thread.append(obj)
+                        else:
+                            tasks.put(obj)
+                            running += 1
+                    ready = []
+                    if main_thread:
+                        obj = main_thread.pop()
+                        ready = main_thread
+                        try:
+                            obj.update()
+                            exc_info = None
+                        except BaseException:
+                            exc_info = sys.exc_info()
+                        events.put(('done', (obj, exc_info)))
+                        running += 1
+                else:
+                    ready = []
+                if not running:
+                    break
+                kind, value = events.get()
+                if kind == 'call':
+                    MainThreadLogging.process_call(value)
+                    continue
+                running -= 1
+                obj, exc_info = value
+                if handle_result(obj, exc_info):
+                    stopped = True
+                for dst in downstream[obj]:
+                    upstream[dst].discard(obj)
+                    if not upstream[dst]:
+                        ready.append(dst)
+        finally:
+            for thread in threads:
+                tasks.put(None)
+            for obj in upstream:
+                obj.logging = logging_obj
+        return stopped
+
+##############################################################################
+
+import time
+import unittest
+
+from vistrails.core.modules.vistrails_module import DummyModuleLogging, \
+    Module, ModuleConnector, ModuleError, NotThreadSafe
+
+class TestParallelScheduler(unittest.TestCase):
+    class Slow(Module):
+        def compute(self):
+            self.thread = threading.current_thread()
+            time.sleep(0.2)
+            value = sum(self.force_get_input_list('in'))
+            self.set_output('out', value + 1)
+
+    class SlowNotThreadSafe(NotThreadSafe, Slow):
+        pass
+
+    class Failing(Module):
+        def compute(self):
+            raise ModuleError(self, "failed")
+
+    def build(self, klasses, connections):
+        objs = [klass() for klass in klasses]
+        for src, dst in connections:
+            objs[src].enable_output_port('out')
+            objs[dst].set_input_port('in', ModuleConnector(objs[src], 'out'))
+        return objs
+
+    def test_branches(self):
+        # 0 -> 2 <- 1, 0 and 1 are independent
+        Slow = self.Slow
+        objs = self.build([Slow, Slow, Slow], [(0, 2), (1, 2)])
+        results = []
+        def handle_result(obj, exc_info):
+            results.append((obj, exc_info))
+            return exc_info is not None
+        start = time.time()
+        stopped = ParallelScheduler(2).update([objs[2]], set(objs),
+                                              DummyModuleLogging(),
+                                              handle_result)
+        self.assertFalse(stopped)
+        self.assertTrue(time.time() - start < 0.55)
+        self.assertEqual(objs[2].get_output('out'), 3)
+        self.assertEqual([obj for obj, _ in results][-1], objs[2])
+        self.assertNotEqual(objs[0].thread, objs[1].thread)
+
+    def test_main_thread(self):
+        objs = self.build([self.SlowNotThreadSafe, self.Slow], [(0, 1)])
+        ParallelScheduler(2).update([objs[1]], set(objs),
+                                    DummyModuleLogging(),
+                                    lambda obj, exc_info: False)
+        self.assertIs(objs[0].thread, threading.current_thread())
+        self.assertIsNot(objs[1].thread, threading.current_thread())
+
+    def test_stop(self):
+        objs = self.build([self.Failing, self.Slow], [(0, 1)])
+        results = []
+        def handle_result(obj, exc_info):
+            results.append(obj)
+            return exc_info is not None
+        stopped = ParallelScheduler(2).update([objs[1]], set(objs),
+                                              DummyModuleLogging(),
+                                              handle_result)
+        self.assertTrue(stopped)
+        self.assertEqual(results, [objs[0]])
+        self.assertFalse(objs[1].computed)
@@ -0,0 +1,377 @@
+###############################################################################
+##
+## Copyright (C) 2011-2014, NYU-Poly.
+## Copyright (C) 2006-2011, University of Utah. 
+## All rights reserved.
+## Contact: contact@vistrails.org
+##
+## This file is part of VisTrails.
+##
+## "Redistribution and use in source and binary forms, with or without 
+## modification, are permitted provided that the following conditions are met:
+##
+##  - Redistributions of source code must retain the above copyright notice, 
+##    this list of conditions and the following disclaimer.
+##  - Redistributions in binary form must reproduce the above copyright 
+##    notice, this list of conditions and the following disclaimer in the 
+##    documentation and/or other materials provided with the distribution.
+##  - Neither the name of the University of Utah nor the names of its 
+##    contributors may be used to endorse or promote products derived from 
+##    this software without specific prior written permission.
+##
+## THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" 
+## AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, 
+## THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR 
+## PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR 
+## CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, 
+## EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, 
+## PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; 
+## OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, 
+## WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR 
+## OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF 
+## ADVISED OF THE POSSIBILITY OF SUCH DAMAGE."
+##
+###############################################################################
+"""Opt-in profiling of pipeline executions.
+
+An ExecutionProfiler receives the same module events as the log
+controller and aggregates, for each kind of module: how often it was
+computed or taken from the cache, the wall-clock and CPU time of its
+compute() and the overhead of updating its upstream (both excluding the
+modules it updated itself), the change in memory usage while it was
+computed, and the size of its inputs and outputs. It also totals the
+time spent in the phases of CachedInterpreter.execute().
+
+Profiling is enabled for every execution by the executionProfile option,
+in which case the profile is written to that file when the application
+exits, or for a single interpreter by setting its profiler attribute.
+When modules run on several threads (executionThreads), their events are
+forwarded to the main thread and the timings include that delay.
+
+"""
+
+import json
+import os
+import threading
+import time
+
+from vistrails.core.cache.utils import estimate_size
+from vistrails.core.modules.module_registry import get_module_registry
+
+import unittest
+
+##############################################################################
+
+def memory_usage():
+    """memory_usage() -> int
+    Returns the resident memory of this process in bytes, or 0 if it
+    cannot be determined. Only implemented through /proc (Linux).
+
+    """
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except (IOError, OSError, ValueError, IndexError):
+        return 0
+
+def outputs_size(obj):
+    seen = set([id(obj)])
+    return sum(estimate_size(value, seen)
+               for port, value in obj.outputPorts.iteritems()
+               if port != 'self')
+
+def inputs_size(obj):
+    seen = set()
+    return sum(estimate_size(connector.obj.outputPorts.get(connector.port),
+                             seen)
+               for connectors in obj.inputPorts.itervalues()
+               for connector in connectors)
+
+class ModuleProfile(object):
+    """Statistics of all the executions of one kind of module"""
+    fields = ['computed', 'cached', 'errors', 'compute_time',
+              'max_compute_time', 'cpu_time', 'upstream_time', 'memory_delta',
+              'input_bytes', 'output_bytes']
+
+    def __init__(self):
+        for field in self.fields:
+            setattr(self, field, 0)
+
+    def to_dict(self):
+        return dict((field, getattr(self, field)) for field in self.fields)
+
+class _Frame(object):
+    """A module being updated"""
+    def __init__(self, obj, name, key):
+        self.obj = obj
+        self.name = name
+        self.key = key
+        self.update_start = time.time()
+        self.compute_start = None
+        self.cpu_start = None
+        self.memory_start = None
+        self.input_bytes = 0
+        self.upstream_children = 0.0
+        self.compute_children = 0.0
+        self.cpu_children = 0.0
+
+class ExecutionProfiler(object):
+    """ExecutionProfiler collects module and phase timings across pipeline
+    executions.
+
+    The interpreter calls begin_update(), begin_compute(), end_update()
+    and update_cached() for each module, and add_time() for its phases.
+    to_dict() returns the aggregated report, folded_stacks() the
+    per-call-path times in the format of flamegraph.pl.
+
+    """
+    _instance = None
+
+    @staticmethod
+    def getInstance():
+        if ExecutionProfiler._instance is None:
+            ExecutionProfiler._instance = ExecutionProfiler()
+        return ExecutionProfiler._instance
+
+    @staticmethod
+    def clearInstance():
+        ExecutionProfiler._instance = None
+
+    def __init__(self):
+        self.lock = threading.RLock()
+        self.local = threading.local()
+        self.runs = 0
+        self.modules = {}
+        self.phases = {}
+        self.stacks = {}
+
+    def _stack(self):
+        try:
+            return self.local.stack
+        except AttributeError:
+            self.local.stack = []
+            return self.local.stack
+
+    def _names(self, obj):
+        reg = get_module_registry()
+        try:
+            descriptor = reg.get_descriptor(obj.__class__)
+        except Exception:
+            name = obj.__class__.__name__
+            return name, name
+        return (descriptor.name,
+                '%s:%s' % (descriptor.identifier, descriptor.name))
+
+    def add_time(self, phase, seconds):
+        """add_time(phase: str, seconds: float) -> None
+        Adds to the time spent in an execution phase.
+
+        """
+        with self.lock:
+            self.phases[phase] = self.phases.get(phase, 0.0) + seconds
+
+    def begin_pipeline(self):
+        """begin_pipeline() -> int
+        Marks the start of a pipeline execution (possibly nested in a
+        module). The result has to be passed to end_pipeline().
+
+        """
+        return len(self._stack())
+
+    def end_pipeline(self, marker):
+        """end_pipeline(marker: int) -> None
+        Drops the modules that failed to report the end of their update.
+
+        """
+        stack = self._stack()
+        del stack[marker:]
+        if marker == 0:
+            with self.lock:
+                self.runs += 1
+
+    def begin_update(self, obj):
+        self._stack().append(_Frame(obj, *self._names(obj)))
+
+    def begin_compute(self, obj):
+        stack = self._stack()
+        if not stack or stack[-1].obj is not obj:
+            # streaming modules are computed without begin_update()
+            stack.append(_Frame(obj, *self._names(obj)))
+        frame = stack[-1]
+        if frame.compute_start is None:
+            frame.input_bytes = inputs_size(obj)
+            frame.memory_start = memory_usage()
+            frame.cpu_start = time.clock()
+            frame.compute_start = time.time()
+
+    def update_cached(self, obj):
+        self._finish(obj, cached=True)
+
+    def end_update(self, obj, error=None):
+        self._finish(obj, error=error is not None)
+
+    def _finish(self, obj, cached=False, error=False):
+        end = time.time()
+        stack = self._stack()
+        for i in xrange(len(stack) - 1, -1, -1):
+            if stack[i].obj is obj:
+                break
+        else:
+            return
+        frame = stack[i]
+        path = [f.name for f in stack[:i + 1]]
+        del stack[i:]
+        total = end - frame.update_start
+        if frame.compute_start is not None:
+            cpu = time.clock() - frame.cpu_start - frame.cpu_children
+            upstream = (frame.compute_start - frame.update_start -
+                        frame.upstream_children)
+            compute = end - frame.compute_start - frame.compute_children
+        else:
+            cpu = compute = 0.0
+            upstream = total - frame.upstream_children
+        if stack:
+            parent = stack[-1]
+            if parent.compute_start is None:
+                parent.upstream_children += total
+            else:
+                parent.compute_children += total
+                parent.cpu_children += cpu
+        with self.lock:
+            profile = self.modules.get(frame.key)
+            if profile is None:
+                profile = self.modules[frame.key] = ModuleProfile()
+            if cached:
+                profile.cached += 1
+            elif error:
+                profile.errors += 1
+            else:
+                profile.computed += 1
+            profile.upstream_time += upstream
+            if frame.compute_start is not None:
+                profile.compute_time += compute
+                profile.max_compute_time = max(profile.max_compute_time,
+                                               compute)
+                profile.cpu_time += cpu
+                profile.memory_delta += memory_usage() - frame.memory_start
+                profile.input_bytes += frame.input_bytes
+                if not error:
+                    profile.output_bytes += outputs_size(obj)
+            path = ';'.join(path)
+            self.stacks[path] = self.stacks.get(path, 0.0) + upstream + compute
+
+    def to_dict(self):
+        """to_dict() -> dict
+        Returns the report: number of runs, time per phase, statistics
+        per module (keyed by 'package:name') and the modules sorted by
+        the time spent in them. The 'signatures' phase (matching with the
+        persistent pipeline) is part of 'setup' and the 'logging' phase
+        part of 'execution'.
+
+        """
+        with self.lock:
+            modules = dict((key, profile.to_dict())
+                           for key, profile in self.modules.iteritems())
+            hot = sorted(modules, reverse=True,
+                         key=lambda k: (modules[k]['compute_time'] +
+                                        modules[k]['upstream_time']))
+            return {'runs': self.runs,
+                    'phases': dict(self.phases),
+                    'modules': modules,
+                    'hot_modules': hot}
+
+    def folded_stacks(self):
+        """folded_stacks() -> list of str
+        Returns lines 'A;B;C <microseconds>' giving the time spent in
+        module C when updated by B, itself updated by A, as expected by
+        flamegraph.pl.
+
+        """
+        with self.lock:
+            return ['%s %d' % (path, int(seconds * 1e6))
+                    for path, seconds in sorted(self.stacks.iteritems())
+                    if seconds > 0]
+
+    def write(self, filename):
+        """write(filename: str) -> None
+        Writes the JSON report if filename ends with .json, the folded
+        stacks otherwise.
+
+        """
+        with open(filename, 'w') as f:
+            if filename.lower().endswith('.json'):
+                json.dump(self.to_dict(), f, indent=2, sort_keys=True)
+            else:
+                for line in self.folded_stacks():
+                    f.write(line + '\n')
+
+class TimedLogger(object):
+    """Wraps a log controller, adding the time spent in each of its methods
+    to the 'logging' phase of a profiler"""
+    def __init__(self, log, profiler):
+        self.log = log
+        self.profiler = profiler
+
+    def __getattr__(self, name):
+        attr = getattr(self.log, name)
+        if not callable(attr):
+            return attr
+        def timed(*args, **kwargs):
+            start = time.time()
+            try:
+                return attr(*args, **kwargs)
+            finally:
+                self.profiler.add_time('logging', time.time() - start)
+        return timed
+
+##############################################################################
+
+class TestExecutionProfiler(unittest.TestCase):
+    def test_profile(self):
+        from vistrails.core.interpreter.cached import CachedInterpreter
+        from vistrails.core.modules.basic_modules import identifier as \
+            basic_pkg, version as basic_version
+        from vistrails.core.utils import DummyView
+        from vistrails.core.vistrail.connection import Connection
+        from vistrails.core.vistrail.module import Module
+        from vistrails.core.vistrail.module_function import ModuleFunction
+        from vistrails.core.vistrail.module_param import ModuleParam
+        from vistrails.core.vistrail.pipeline import Pipeline
+        from vistrails.core.vistrail.port import Port
+
+        pipeline = Pipeline()
+        pipeline.add_module(Module(
+                id=0, name='String', package=basic_pkg,
+                version=basic_version, functions=[
+                    ModuleFunction(name='value', parameters=[
+                            ModuleParam(pos=0, type='String',
+                                        val='x' * 1000)])]))
+        pipeline.add_module(Module(
+                id=1, name='ConcatenateString', package=basic_pkg,
+                version=basic_version))
+        pipeline.add_connection(Connection(id=0, ports=[
+                Port(id=0, type='source', moduleId=0, name='value',
+                     signature='(%s:String)' % basic_pkg),
+                Port(id=1, type='destination', moduleId=1, name='str1',
+                     signature='(%s:String)' % basic_pkg)]))
+
+        interpreter = CachedInterpreter()
+        interpreter.profiler = profiler = ExecutionProfiler()
+        try:
+            for i in xrange(2):
+                result = interpreter.execute(pipeline, view=DummyView())
+                self.assertFalse(result.errors)
+        finally:
+            interpreter.clear()
+        report = profiler.to_dict()
+        self.assertEqual(report['runs'], 2)
+        for phase in ('setup', 'execution', 'finalize'):
+            self.assertIn(phase, report['phases'])
+        concat = report['modules'][
+                'org.vistrails.vistrails.basic:ConcatenateString']
+        self.assertEqual((concat['computed'], concat['cached']), (1, 1))
+        self.assertTrue(concat['input_bytes'] >= 1000)
+        self.assertTrue(concat['output_bytes'] >= 1000)
+        self.assertEqual(set(report['hot_modules']), set(report['modules']))
+        stacks = [line.rsplit(' ', 1)[0] for line in profiler.folded_stacks()]
+        self.assertIn('ConcatenateString;String', stacks)
@@ -34,8 +34,10 @@
 ###############################################################################
 
 import copy
+import time
 
 from vistrails.core import debug
+from vistrails.core.configuration import get_vistrails_configuration
 from vistrails.core.log.workflow_exec import WorkflowExec
 from vistrails.core.log.module_exec import ModuleExec
 from vistrails.core.log.loop_exec import LoopExec, LoopIteration
@@ -87,6 +89,7 @@ class LogController(object):
         self.module_execs = {}      # vistrails_module -> *Exec
         self.parent_execs = {}      # vistrails_module -> *Exec
         self.children_execs = {}    # vistrails_module -> [*Exec]
+        self.loop_controllers = {}  # vistrails_module -> LogLoopController
         if machine is not None:
             self.machine = machine
         else:
@@ -137,10 +140,50 @@ class LogController(object):
 
 
 class LogLoopController(object):
-    def __init__(self, controller, loop_exec, loop_module):
+    """Logs the iterations of a loop.
+
+    Depending on the loopLogging option, iterations get a LoopIteration
+    with the execution of the looped module ('full'), only one iteration
+    out of loopLoggingSample does ('sampled'), or none does ('summary' and
+    'off'). The other iterations are only counted and timed; in sampled
+    and summary modes these statistics are added as annotations to the
+    loop module when the loop finishes. While an iteration is not logged,
+    the looped module's parent is this controller instead of a
+    LoopIteration.
+    """
+    def __init__(self, controller, loop_exec, loop_module, mode='full',
+                 sample=1):
         self.controller = controller
         self.loop_exec = loop_exec
         self.loop_module = loop_module
+        self.mode = mode
+        self.sample = max(1, sample)
+        self.iteration = None
+        self.iteration_start = None
+        self.count = 0
+        self.errors = 0
+        self.min_time = None
+        self.max_time = None
+        self.total_time = 0.0
+        self.summarized = False
+
+    def is_logged(self, iteration):
+        """is_logged(iteration: int) -> bool
+        Whether the iteration gets a LoopIteration.
+        """
+        if self.mode == 'full':
+            return True
+        elif self.mode == 'sampled':
+            return iteration % self.sample == 0
+        return False
+
+    def _add_duration(self, duration):
+        self.count += 1
+        self.total_time += duration
+        if self.min_time is None or duration < self.min_time:
+            self.min_time = duration
+        if self.max_time is None or duration > self.max_time:
+            self.max_time = duration
 
     def _create_loop_iteration(self, iteration):
         l_iteration_id = self.controller.log.id_scope.getNewId(
@@ -153,19 +196,39 @@ class LogLoopController(object):
     def finish_loop_execution(self):
         """Signals that we are done looping.
         """
+        if self.loop_exec is None:
+            return
         self.loop_exec.ts_end = vistrails.core.system.current_time()
         try:
             execs = self.controller.children_execs[self.loop_module]
             execs.discard(self.loop_exec)
         except KeyError:
             pass
+        self._insert_summary()
+
+    def _insert_summary(self):
+        if self.summarized or self.mode not in ('sampled', 'summary'):
+            return
+        self.summarized = True
+        self.controller.insert_module_annotations(self.loop_module, {
+                'loop_iterations': str(self.count),
+                'loop_errors': str(self.errors),
+                'loop_min_time': str(self.min_time or 0.0),
+                'loop_max_time': str(self.max_time or 0.0),
+                'loop_total_time': str(self.total_time)})
 
     def start_iteration(self, looped_module, iteration):
         """Signals that we are executing a module as an iteration of the loop.
         """
-        loop_iteration = self._create_loop_iteration(iteration)
-        self.loop_exec.add_loop_iteration(loop_iteration)
-        self.controller.parent_execs[looped_module] = loop_iteration
+        self.iteration = iteration
+        self.iteration_start = time.time()
+        self.controller.loop_controllers[looped_module] = self
+        if self.is_logged(iteration):
+            loop_iteration = self._create_loop_iteration(iteration)
+            self.loop_exec.add_loop_iteration(loop_iteration)
+            self.controller.parent_execs[looped_module] = loop_iteration
+        else:
+            self.controller.parent_execs[looped_module] = self
 
     def finish_iteration(self, looped_module):
         """Signals that the iteration is done.
@@ -173,9 +236,23 @@ class LogLoopController(object):
         loop_iteration = self.controller.parent_execs.get(looped_module)
         assert loop_iteration is not None
 
+        self.controller.loop_controllers.pop(looped_module, None)
+        self._add_duration(time.time() - self.iteration_start)
+        if loop_iteration is self:
+            return
         loop_iteration.ts_end = vistrails.core.system.current_time()
         loop_iteration.completed = 1
 
+    def iteration_failed(self):
+        """Signals that the module of an iteration failed.
+
+        The error goes through the loop module, which won't finish the
+        loop, so the statistics are added right away.
+        """
+        self.errors += 1
+        self._add_duration(time.time() - self.iteration_start)
+        self._insert_summary()
+
 
 class LogWorkflowController(LogController):
     """A log controller for a specific workflow execution.
@@ -210,6 +287,9 @@ class LogWorkflowController(LogController):
 
         This returns a new log controller object for that execution context.
         """
+        if isinstance(self.parent_execs.get(parent_exec), LogLoopController):
+            # unlogged loop iteration
+            return DummyLogController
         if parent_exec in self.module_execs:
             parent_exec = self.module_execs[parent_exec]
         return LogWorkflowController(self.log, self.machine, parent_exec,
@@ -229,6 +309,9 @@ class LogWorkflowController(LogController):
     def start_execution(self, module, module_id, module_name, cached=0):
         """Signals the start of the execution of a module (before compute).
         """
+        if isinstance(self.parent_execs.get(module), LogLoopController):
+            # unlogged loop iteration
+            return
         if isinstance(module, Group):
             module_exec = self._create_group_exec(module, module_id,
                                                  module_name, cached)
@@ -253,6 +336,13 @@ class LogWorkflowController(LogController):
     def start_loop_execution(self, loop_module, total_iterations=None):
         """Starts a loop.
         """
+        mode, sample = 'full', 1
+        conf = get_vistrails_configuration()
+        if conf is not None:
+            mode = conf.check('loopLogging') or mode
+            sample = conf.check('loopLoggingSample') or sample
+        if mode == 'off':
+            return LogLoopController(self, None, loop_module, mode)
         loop_exec = self._create_loop_exec()
         for parent_exec in (self.module_execs.get(loop_module),
                             self.parent_exec):
@@ -265,7 +355,7 @@ class LogWorkflowController(LogController):
         else:
             self.workflow_exec.add_item_exec(loop_exec)
         self.children_execs.setdefault(loop_module, set()).add(loop_exec)
-        return LogLoopController(self, loop_exec, loop_module)
+        return LogLoopController(self, loop_exec, loop_module, mode, sample)
 
     def finish_execution(self, module, error, errorTrace=None, suspended=False):
         """Signals the end of the execution of a module.
@@ -273,6 +363,9 @@ class LogWorkflowController(LogController):
         Called by a module after succeeded of suspended, or called by the
         interpreter after an exception.
         """
+        loop = self.loop_controllers.pop(module, None)
+        if error and loop is not None:
+            loop.iteration_failed()
         module_exec = self.module_execs.pop(module, None)
         if module_exec is None:
             # The module can finish execution without starting (if it was
@@ -308,12 +401,16 @@ class LogWorkflowController(LogController):
     def insert_module_annotations(self, module, a_dict):
         """Adds an annotation on the execution object for this module.
         """
+        module_exec = self.module_execs.get(module)
+        if module_exec is None:
+            # unlogged loop iteration
+            return
         for k, v in a_dict.iteritems():
             a_id = self.log.id_scope.getNewId(Annotation.vtType)
             annotation = Annotation(id=a_id,
                                     key=k,
                                     value=v)
-            self.module_execs[module].add_annotation(annotation)
+            module_exec.add_annotation(annotation)
 
     def insert_workflow_exec_annotations(self, a_dict):
         """Adds an annotation on the whole workflow log object.
@@ -384,3 +481,105 @@ class LogWorkflowExecController(LogWorkflowController):
             self.workflow_exec.completed = -1
         else:
             self.workflow_exec.completed = 1
+
+
+import unittest
+
+class TestLogLoopController(unittest.TestCase):
+    def run_loop(self, mode, sample=2, fail_on=None):
+        from vistrails.core.interpreter.cached import CachedInterpreter
+        from vistrails.core.log.log import Log
+        from vistrails.core.modules.basic_modules import identifier as \
+            basic_pkg, version as basic_version, ConcatenateString
+        from vistrails.core.modules.vistrails_module import ModuleError
+        from vistrails.core.utils import DummyView
+        from vistrails.core.vistrail.connection import Connection
+        from vistrails.core.vistrail.module import Module
+        from vistrails.core.vistrail.module_function import ModuleFunction
+        from vistrails.core.vistrail.module_param import ModuleParam
+        from vistrails.core.vistrail.pipeline import Pipeline
+        from vistrails.core.vistrail.port import Port
+
+        pipeline = Pipeline()
+        pipeline.add_module(Module(
+                id=0, name='List', package=basic_pkg,
+                version=basic_version, functions=[
+                    ModuleFunction(name='value', parameters=[
+                            ModuleParam(pos=0, type='List',
+                                        val="['a', 'b', 'c', 'd', 'e']")])]))
+        pipeline.add_module(Module(
+                id=1, name='ConcatenateString', package=basic_pkg,
+                version=basic_version))
+        pipeline.add_connection(Connection(id=0, ports=[
+                Port(id=0, type='source', moduleId=0, name='value',
+                     signature='(%s:List)' % basic_pkg),
+                Port(id=1, type='destination', moduleId=1, name='str1',
+                     signature='(%s:String)' % basic_pkg)]))
+
+        conf = get_vistrails_configuration()
+        old = conf.loopLogging, conf.loopLoggingSample
+        conf.loopLogging, conf.loopLoggingSample = mode, sample
+        old_compute = ConcatenateString.compute
+        def compute(module):
+            if module.get_input('str1') == fail_on:
+                raise ModuleError(module, "failing on %s" % fail_on)
+            old_compute(module)
+        ConcatenateString.compute = compute
+        log = Log()
+        interpreter = CachedInterpreter()
+        try:
+            result = interpreter.execute(pipeline, view=DummyView(),
+                                         logger=LogController(log))
+            self.assertEqual(bool(result.errors), fail_on is not None)
+        finally:
+            ConcatenateString.compute = old_compute
+            conf.loopLogging, conf.loopLoggingSample = old
+            interpreter.clear()
+        workflow_exec, = log.workflow_execs
+        module_execs = dict((e.module_id, e)
+                            for e in workflow_exec.item_execs
+                            if isinstance(e, ModuleExec))
+        loop_execs = module_execs[1].loop_execs
+        annotations = dict((a.key, a.value)
+                           for a in module_execs[1].annotations)
+        return loop_execs, annotations
+
+    def test_full(self):
+        loop_execs, annotations = self.run_loop('full')
+        self.assertEqual(len(loop_execs), 1)
+        iterations = loop_execs[0].loop_iterations
+        self.assertEqual([i.iteration for i in iterations], range(5))
+        self.assertTrue(all(len(i.item_execs) == 1 for i in iterations))
+        self.assertNotIn('loop_iterations', annotations)
+
+    def test_sampled(self):
+        loop_execs, annotations = self.run_loop('sampled')
+        self.assertEqual([i.iteration for i in loop_execs[0].loop_iterations],
+                         [0, 2, 4])
+        self.assertEqual(annotations['loop_iterations'], '5')
+        self.assertEqual(annotations['loop_errors'], '0')
+
+    def test_sampled_error(self):
+        # iteration 2 is logged and fails, which ends the loop
+        loop_execs, annotations = self.run_loop('sampled', fail_on='c')
+        self.assertEqual([i.iteration for i in loop_execs[0].loop_iterations],
+                         [0, 2])
+        self.assertEqual(annotations['loop_iterations'], '3')
+        self.assertEqual(annotations['loop_errors'], '1')
+
+    def test_summary_error(self):
+        loop_execs, annotations = self.run_loop('summary', fail_on='b')
+        self.assertEqual(annotations['loop_iterations'], '2')
+        self.assertEqual(annotations['loop_errors'], '1')
+
+    def test_summary(self):
+        loop_execs, annotations = self.run_loop('summary')
+        self.assertEqual(loop_execs[0].loop_iterations, [])
+        self.assertEqual(annotations['loop_iterations'], '5')
+        self.assertTrue(float(annotations['loop_max_time']) >=
+                        float(annotations['loop_min_time']))
+
+    def test_off(self):
+        loop_execs, annotations = self.run_loop('off')
+        self.assertEqual(loop_execs, [])
+        self.assertNotIn('loop_iterations', annotations)
@@ -909,18 +909,37 @@ class ModuleRegistry(DBRegistry):
         else:
             package = self.package_versions[(identifier, package_version)]
 
-        # create descriptor
-        descriptor_id = self.idScope.getNewId(ModuleDescriptor.vtType)
-        descriptor = ModuleDescriptor(id=descriptor_id,
-                                      module=module,
-                                      package=identifier,
-                                      base_descriptor=base_descriptor,
-                                      name=name,
-                                      namespace=namespace,
-                                      package_version=package_version,
-                                      version=version
-                                      )
-        self.add_descriptor(descriptor, package)
+        descriptor = package._cached_descriptors.pop(
+            (name, namespace or '', version or ''), None)
+        if descriptor is not None:
+            # keep the descriptor read from the registry cache, which
+            # pipelines and other descriptors may already point to, and
+            # let the package add its ports again
+            descriptor.module = module
+            if descriptor.base_descriptor is not base_descriptor:
+                if descriptor.base_descriptor is not None:
+                    descriptor.base_descriptor.children.remove(descriptor)
+                if base_descriptor is not None:
+                    descriptor.base_descriptor = base_descriptor
+                    base_descriptor.children.append(descriptor)
+                else:
+                    descriptor._base_descriptor = None
+                    descriptor.base_descriptor_id = -1
+            for spec in list(descriptor.port_specs_list):
+                descriptor.delete_port_spec(spec)
+        else:
+            # create descriptor
+            descriptor_id = self.idScope.getNewId(ModuleDescriptor.vtType)
+            descriptor = ModuleDescriptor(id=descriptor_id,
+                                          module=module,
+                                          package=identifier,
+                                          base_descriptor=base_descriptor,
+                                          name=name,
+                                          namespace=namespace,
+                                          package_version=package_version,
+                                          version=version
+                                          )
+            self.add_descriptor(descriptor, package)
 
         # invalidate the map of converters
         if issubclass(module,
@@ -1140,7 +1159,9 @@ class ModuleRegistry(DBRegistry):
 
         package = self.package_versions[(identifier, package_version)]
         desc_key = (name, namespace, version)
-        if desc_key in package.descriptor_versions:
+        is_cached = (name, namespace or '', version or '') in \
+            package._cached_descriptors
+        if desc_key in package.descriptor_versions and not is_cached:
             raise ModuleAlreadyExists(identifier, name)
 
         # We allow multiple inheritance as long as only one of the superclasses
@@ -1163,8 +1184,9 @@ class ModuleRegistry(DBRegistry):
             if identifier != 'local.abstractions':
                 raise DuplicateModule(self.get_descriptor(module), identifier,
                                       name, namespace)
-        elif self.has_descriptor_with_name(identifier, name, namespace,
-                                           package_version, version):
+        elif not is_cached and \
+                self.has_descriptor_with_name(identifier, name, namespace,
+                                              package_version, version):
             raise DuplicateIdentifier(identifier, name, namespace,
                                       package_version, version)
         descriptor = self.update_registry(base_descriptor, module, identifier, 
@@ -1231,9 +1253,10 @@ class ModuleRegistry(DBRegistry):
         if settings.ghost_namespace:
             descriptor.ghost_namespace = settings.ghost_namespace
                  
-        self.signals.emit_new_module(descriptor)
-        if self.is_abstraction(descriptor):
-            self.signals.emit_new_abstraction(descriptor)
+        if not is_cached:
+            self.signals.emit_new_module(descriptor)
+            if self.is_abstraction(descriptor):
+                self.signals.emit_new_abstraction(descriptor)
         return descriptor
 
     def auto_add_subworkflow(self, subworkflow):
@@ -1583,9 +1606,19 @@ class ModuleRegistry(DBRegistry):
         return package
 
     def initialize_package(self, package):
+        """initialize_package(package: Package) -> bool
+        Initializes the package and registers its modules. Returns True
+        if the package was registered from the registry cache and its
+        modules differ from the cached ones (some were dropped or added),
+        meaning that the cache is outdated.
+
+        """
         if package.initialized():
-            return
+            return False
         debug.splashMessage("Initializing " + package.codepath + "...")
+        cached_keys = set((name, namespace or '', version or '')
+                          for (name, namespace, version)
+                          in package._cached_descriptors)
         debug.log("Initializing " + package.codepath)
         if (package.identifier, package.version) not in self.package_versions:
             self.add_package(package)
@@ -1644,8 +1677,82 @@ class ModuleRegistry(DBRegistry):
 
         # The package might have decided to rename itself, let's store that
         self.set_current_package(None)
+        # drop the cached modules the package doesn't provide anymore
+        cached = package._cached_descriptors
+        changed = bool(cached)
+        while cached:
+            keys = [k for k, d in cached.iteritems() if not d.children]
+            if not keys:
+                break
+            for key in keys:
+                descriptor = cached.pop(key)
+                self.delete_module(descriptor.identifier, descriptor.name,
+                                   descriptor.namespace)
+        cached.clear()
+        if cached_keys and not changed:
+            changed = any((d.name, d.namespace or '', d.version or '')
+                          not in cached_keys
+                          for d in package.descriptor_list)
         debug.splashMessage("Initializing " + package.codepath + '... done.')
         package._initialized = True 
+        return changed
+
+    def add_cached_package(self, package, cached_package, cached_descriptors):
+        """add_cached_package(package: Package, cached_package: DBPackage,
+                              cached_descriptors: dict) -> bool
+        Registers the modules and ports of a package from the registry
+        cache instead of initializing it. cached_package is the package
+        read from the cache and cached_descriptors maps the ids of all
+        the descriptors of the cache to the descriptors. Returns False
+        if the cached modules do not fit in this registry.
+
+        The descriptors have no module class until the package is
+        initialized by initialize_package(), which keeps them.
+
+        """
+        Package.convert(cached_package)
+        for descriptor in cached_package.descriptor_list:
+            if descriptor.id in self.descriptors_by_id:
+                return False
+            base_id = descriptor.base_descriptor_id
+            if base_id >= 0 and base_id not in cached_package.descriptors_by_id:
+                # the base descriptor has to come from the same cache
+                if base_id not in self.descriptors_by_id or \
+                        base_id not in cached_descriptors:
+                    return False
+                base = self.descriptors_by_id[base_id]
+                cached_base = cached_descriptors[base_id]
+                if (base.db_package, base.db_name, base.db_namespace) != \
+                        (cached_base.db_package, cached_base.db_name,
+                         cached_base.db_namespace):
+                    return False
+
+        if (package.identifier, package.version) not in self.package_versions:
+            self.add_package(package)
+        for descriptor in cached_package.descriptor_list:
+            self.add_descriptor(descriptor, package)
+            package._cached_descriptors[(descriptor.name,
+                                         descriptor.namespace,
+                                         descriptor.version)] = descriptor
+            if descriptor.base_descriptor_id < 0:
+                self.root_descriptor = descriptor
+        converter_desc = None
+        if vistrails.core.modules.vistrails_module.Converter in \
+                self._module_key_map:
+            converter_desc = self.get_descriptor(
+                vistrails.core.modules.vistrails_module.Converter)
+        for descriptor in package._cached_descriptors.itervalues():
+            if descriptor.base_descriptor is not None:
+                descriptor.base_descriptor.children.append(descriptor)
+            if converter_desc is not None and \
+                    self.is_descriptor_subclass(descriptor, converter_desc):
+                self._conversions = dict()
+                self._converters.add(descriptor)
+        for descriptor in package._cached_descriptors.itervalues():
+            self.signals.emit_new_module(descriptor)
+            if self.is_abstraction(descriptor):
+                self.signals.emit_new_abstraction(descriptor)
+        return True
 
     def delete_module(self, identifier, module_name, namespace=None):
         """deleteModule(module_name): Removes a module from the registry."""
@@ -1700,6 +1807,7 @@ class ModuleRegistry(DBRegistry):
                                    descriptor.namespace)
         package._abs_pkg_upgrades.clear()
         
+        package._cached_descriptors.clear()
         package.unload()
         self.delete_package(package)
         self.signals.emit_deleted_package(package)
@@ -136,6 +136,13 @@ class Package(DBPackage):
             self._loaded = False
             self._initialized = False
             self._abs_pkg_upgrades = {}
+            # descriptors registered from the registry cache that the
+            # package has not added again yet, see
+            # ModuleRegistry.add_cached_package
+            self._cached_descriptors = {}
+            # what get_metadata() returned in an earlier session, when
+            # the package was registered from it instead of being loaded
+            self._metadata = None
             self.package_dir = None
             self.prefix = None
             self.py_dependencies = set()
@@ -148,6 +155,8 @@ class Package(DBPackage):
             self._loaded = other._loaded
             self._initialized = other._initialized
             self._abs_pkg_upgrades = copy.copy(other._abs_pkg_upgrades)
+            self._cached_descriptors = copy.copy(other._cached_descriptors)
+            self._metadata = other._metadata
             self.package_dir = other.package_dir
             self.prefix = other.prefix
             self.py_dependencies = copy.copy(other.py_dependencies)
@@ -412,8 +421,12 @@ class Package(DBPackage):
 
     def initialize(self):
         if not self._loaded:
-            raise VistrailsInternalError("Called initialize() on non-loaded "
-                                         "Package %s" % self.codepath)
+            if self._metadata is None:
+                raise VistrailsInternalError("Called initialize() on "
+                                             "non-loaded Package %s" %
+                                             self.codepath)
+            # registered with set_metadata(), import it now
+            self.load()
 
         self.check_requirements()
 
@@ -461,6 +474,7 @@ class Package(DBPackage):
                 del sys.modules[path]
         self.py_dependencies.clear()
         self._loaded = False
+        self._metadata = None
 
     def set_properties(self):
         # Set properties
@@ -630,6 +644,9 @@ class Package(DBPackage):
         self._initialized = False
 
     def dependencies(self):
+        if self._module is None and self._metadata is not None:
+            return [tuple(dep) if isinstance(dep, list) else dep
+                    for dep in self._metadata['dependencies']]
         deps = []
         try:
             callable_ = self._module.package_dependencies
@@ -647,6 +664,104 @@ class Package(DBPackage):
             deps.extend(self._module._dependencies)
         return deps
 
+    def library_versions(self):
+        """library_versions() -> dict
+        Returns the versions of the libraries the modules of the package
+        are built from, as returned by the package_library_versions()
+        function of the package. These are stored with the registry
+        cache, which is rebuilt when a library is upgraded.
+
+        """
+        if self._module is None and self._metadata is not None:
+            return self._metadata['library_versions']
+        try:
+            callable_ = self._module.package_library_versions
+        except AttributeError:
+            return {}
+        try:
+            return callable_()
+        except Exception, e:
+            debug.critical("Couldn't get library versions of %s: %s: %s" % (
+                           self.name, type(e).__name__, ', '.join(e.args)))
+            return None
+
+    def source_stamp(self, prefix=None):
+        """source_stamp(prefix: str) -> list
+        Returns the prefix and the path of the file defining the package,
+        found the way load() would import it but without importing it,
+        followed by the path, size and modification time of each Python
+        file of the package (including init.py and the modules it
+        imports), or None if it can't be found.
+
+        """
+        if self.prefix is not None:
+            prefixes = [self.prefix]
+        elif prefix is not None:
+            prefixes = [prefix]
+        else:
+            prefixes = ['vistrails.packages.', 'userpackages.']
+        for p_path in prefixes:
+            parent = sys.modules.get(p_path[:-1])
+            for dirname in getattr(parent, '__path__', []):
+                package_dir = os.path.join(dirname, self.codepath)
+                filename = os.path.join(package_dir, '__init__.py')
+                if os.path.isfile(filename):
+                    filenames = []
+                    for root, dirs, files in os.walk(package_dir):
+                        dirs.sort()
+                        filenames.extend(os.path.join(root, f)
+                                         for f in sorted(files)
+                                         if f.endswith('.py'))
+                else:
+                    filename = package_dir + '.py'
+                    if not os.path.isfile(filename):
+                        continue
+                    filenames = [filename]
+                stamp = [p_path, filename]
+                for f in filenames:
+                    stat = os.stat(f)
+                    stamp.append([f, stat.st_size, stat.st_mtime])
+                return stamp
+        return None
+
+    def get_metadata(self):
+        """get_metadata() -> dict
+        Returns what is needed to register the package without importing
+        it, see set_metadata().
+
+        """
+        if self._module is None:
+            return self._metadata
+        return {'stamp': self.source_stamp(),
+                'name': self.name,
+                'identifier': self.identifier,
+                'version': self.version,
+                'old_identifiers': list(self.old_identifiers),
+                'description': self.description,
+                'dependencies': self.dependencies(),
+                'library_versions': self.library_versions()}
+
+    def set_metadata(self, metadata, prefix=None):
+        """set_metadata(metadata: dict, prefix: str) -> bool
+        Sets the properties of the package from what get_metadata()
+        returned in an earlier session, if the file defining the package
+        has not changed since. The package is then loaded when it gets
+        initialized. Returns False if the metadata cannot be used.
+
+        """
+        if metadata['stamp'] is None or \
+                metadata['stamp'] != self.source_stamp(prefix):
+            return False
+        self.prefix = str(metadata['stamp'][0])
+        self.name = metadata['name']
+        self.identifier = str(metadata['identifier'])
+        self.version = str(metadata['version'])
+        self.old_identifiers = [str(old_id)
+                                for old_id in metadata['old_identifiers']]
+        self.description = metadata['description']
+        self._metadata = metadata
+        return True
+
     def initialized(self):
         return self._initialized
 
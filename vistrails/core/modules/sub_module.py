@@ -228,6 +228,10 @@ class Group(Module):
     def is_cacheable(self):
         return all(m.is_cacheable() for m in self.persistent_modules)
 
+    def is_thread_safe(self):
+        # Executing the group's pipeline changes the interpreter's state
+        return False
+
     def transfer_attrs(self, module):
         self.pipeline = module.pipeline
         if module._port_specs is None:
@@ -262,6 +262,10 @@ class Module(Serializable):
     subclass in the class hierarchy declarations). These modules (and
     anything that depends on their results) will then never be reused.
 
+    Similarly, modules that cannot be computed on a worker thread,
+    concurrently with other modules, should subclass from the
+    NotThreadSafe mixin.
+
     *Intermediate Files*
 
     Many modules communicate through intermediate files. VisTrails
@@ -392,6 +396,17 @@ class Module(Serializable):
         """
         return True
 
+    def is_thread_safe(self):
+        """is_thread_safe() -> bool.
+        A Module should return whether it can be computed on a worker
+        thread, concurrently with other modules, when the interpreter
+        executes independent branches of a pipeline in parallel.
+        Modules that are not thread-safe are computed on the main
+        thread, like modules that are not cacheable.
+
+        """
+        return True
+
     def update_upstream_port(self, port_name):
         """Updates upstream of a single port instead of all ports."""
 
@@ -1571,6 +1586,13 @@ class NotCacheable(object):
 
 ################################################################################
 
+class NotThreadSafe(object):
+
+    def is_thread_safe(self):
+        return False
+
+################################################################################
+
 class Streaming(object):
     """ A mixin indicating support for streamable inputs
 
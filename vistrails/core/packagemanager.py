@@ -37,8 +37,10 @@
 with handling packages, from setting paths to adding new packages
 to checking dependencies to initializing them."""
 import copy
+import hashlib
 import inspect
 import itertools
+import json
 import os
 import sys
 import warnings
@@ -47,8 +49,11 @@ from vistrails.core import debug, get_vistrails_application, system
 from vistrails.core.configuration import ConfigurationObject
 import vistrails.core.data_structures.graph
 import vistrails.core.db.io
+import vistrails.db.services.io
+import vistrails.db.versions
 from vistrails.core.modules.module_registry import ModuleRegistry, \
-                                         MissingPackage, MissingPackageVersion
+                                         MissingPackage, MissingPackageVersion, \
+                                         ModuleRegistryException
 from vistrails.core.modules.package import Package
 from vistrails.core.requirements import MissingRequirement
 from vistrails.core.utils import VistrailsInternalError, InstanceObject, \
@@ -162,6 +167,9 @@ class PackageManager(object):
         self._package_versions = {} # identifier: str -> version -> Package
         self._old_identifier_map = {} # old_id: str -> new_id: str
         self._dependency_graph = vistrails.core.data_structures.graph.Graph()
+        # packages registered from the registry cache that have not
+        # been initialized yet, codepath: str -> cache files: [str]
+        self._deferred_packages = {}
         self._default_prefix_dict = \
                                 {'basic_modules': 'vistrails.core.modules.',
                                  'abstraction': 'vistrails.core.modules.'}
@@ -252,6 +260,7 @@ class PackageManager(object):
         self._package_list = {}
         self._package_versions = {}
         self._old_identifier_map = {}
+        self._deferred_packages = {}
         global _package_manager
         _package_manager = None
 
@@ -305,6 +314,7 @@ class PackageManager(object):
         self.remove_menu_items(pkg)
         pkg.finalize()
         del self._package_list[codepath]
+        self._deferred_packages.pop(codepath, None)
         self._registry.remove_package(pkg)
         app = get_vistrails_application()
         app.send_notification("package_removed", codepath)
@@ -559,19 +569,37 @@ class PackageManager(object):
         packages = self.import_packages_module()
         userpackages = self.import_user_packages_module()
 
+        # packages found in the registry cache are registered from it
+        # without being imported, and only initialized when they are
+        # first needed
+        new_packages = [pkg for pkg in self._package_list.itervalues()
+                        if not pkg.initialized() and
+                            pkg.codepath not in self._deferred_packages]
+        metadata_filename = self.get_registry_cache_filename(new_packages,
+                                                             False)
+        cached_metadata = {}
+        if metadata_filename is not None:
+            cached_metadata = self.open_package_metadata(metadata_filename)
+
         failed = []
         # import the modules
         app = get_vistrails_application()
         for package in self._package_list.itervalues():
             # print '+ initializing', package.codepath, id(package)
-            if package.initialized():
+            if package.initialized() or \
+                    package.codepath in self._deferred_packages:
                 # print '- already initialized'
                 continue
             try:
                 prefix = prefix_dictionary.get(package.codepath)
                 if prefix is None:
                     prefix = self._default_prefix_dict.get(package.codepath)
-                package.load(prefix)
+                metadata = cached_metadata.get(package.codepath)
+                # packages reporting library versions are imported, as
+                # the versions are part of the registry cache's name
+                if metadata is None or metadata['library_versions'] or \
+                        not package.set_metadata(metadata, prefix):
+                    package.load(prefix)
             except Package.LoadFailed, e:
                 debug.critical("Package %s failed to load and will be "
                                "disabled" % package.name, e)
@@ -653,13 +681,50 @@ class PackageManager(object):
             raise self.DependencyCycle(e.back_edge[0],
                                        e.back_edge[1])
 
+        cache_filename = self.get_registry_cache_filename(new_packages)
+        cache_files = [f for f in (cache_filename, metadata_filename)
+                       if f is not None]
+        cached_packages = {}
+        cached_descriptors = {}
+        restored = set()
+        if cached_metadata and cache_filename is not None:
+            cached_registry = \
+                vistrails.db.services.io.open_cached_registry(cache_filename)
+            if cached_registry is not None:
+                for cached_pkg in cached_registry.db_packages:
+                    cached_packages[cached_pkg.db_codepath] = cached_pkg
+                    for descriptor in cached_pkg.db_module_descriptors:
+                        cached_descriptors[descriptor.db_id] = descriptor
+                # keep the ids of the cached objects free
+                for (obj_type, begin_id) in \
+                        cached_registry.idScope.ids.iteritems():
+                    self._registry.idScope.updateBeginId(obj_type, begin_id)
+
         for name in sorted_packages:
             pkg = self.get_package(name)
+            if pkg.codepath in self._deferred_packages:
+                continue
             if not pkg.initialized():
+                cached_pkg = cached_packages.get(pkg.codepath)
+                if cached_pkg is not None and \
+                        cached_pkg.db_identifier == pkg.identifier and \
+                        cached_pkg.db_version == pkg.version and \
+                        self._registry.add_cached_package(pkg, cached_pkg,
+                                                          cached_descriptors):
+                    self._deferred_packages[pkg.codepath] = cache_files
+                    if pkg._metadata is not None:
+                        restored.add(pkg.codepath)
+                    app = get_vistrails_application()
+                    app.send_notification("package_added", pkg.codepath)
+                    continue
+                # a package from the cache may subclass the modules of a
+                # deferred package
+                self.initialize_deferred_packages(self.all_dependencies(name))
                 #check_requirements is now called in pkg.initialize()
                 #pkg.check_requirements()
                 try:
-                    self._registry.initialize_package(pkg)
+                    changed = self._registry.initialize_package(pkg)
+                    self.check_package_metadata(pkg, cache_files, changed)
                 except MissingRequirement, e:
                     if report_missing_dependencies:
                         debug.critical("Package <codepath %s> is missing a "
@@ -681,8 +746,195 @@ class PackageManager(object):
                     app = get_vistrails_application()
                     app.send_notification("package_added", pkg.codepath)
 
+        # the modules of the core packages are used everywhere
+        self.initialize_deferred_packages(
+            [pkg.identifier for pkg in self._package_list.itervalues()
+             if pkg.prefix == 'vistrails.core.modules.'])
+
+        # write the cache again if an enabled package was not restored
+        # from it
+        if cache_filename is not None and \
+                any(pkg.codepath in self._package_list and
+                    pkg.codepath not in restored for pkg in new_packages):
+            vistrails.db.services.io.save_cached_registry(self._registry,
+                                                          cache_filename)
+            self.save_package_metadata(metadata_filename)
+
         self._startup.save_persisted_startup()
 
+    def get_registry_cache_filename(self, packages, registry=True):
+        """get_registry_cache_filename(packages: [Package],
+                                       registry: bool) -> str
+        Returns the file of the registry cache for initializing the
+        given packages, or if registry is False, the file of the
+        metadata stored along with it. Returns None if the registryCache
+        option is not set or the cache cannot be used.
+
+        The name of the metadata file is a hash of the version of
+        VisTrails and of the codepaths of the packages, which do not need
+        to be loaded; the metadata tells whether each package changed
+        since. The name of the registry file also includes the versions
+        of the libraries reported by the packages, which have to be
+        loaded for that.
+
+        """
+        from vistrails.core.configuration import get_vistrails_configuration
+        conf = get_vistrails_configuration()
+        if not packages or conf is None or not conf.check('registryCache'):
+            return None
+        cache_dir = system.get_vistrails_directory('registryCacheDir', conf)
+        if cache_dir is None:
+            return None
+        key = [system.vistrails_version(),
+               vistrails.db.versions.currentVersion]
+        key.extend(sorted(pkg.codepath for pkg in packages))
+        if not registry:
+            sha1 = hashlib.sha1(repr(key))
+            return os.path.join(cache_dir, sha1.hexdigest() + '.json')
+        for pkg in sorted(packages, key=lambda pkg: pkg.codepath):
+            library_versions = pkg.library_versions()
+            if library_versions is None:
+                return None
+            if library_versions:
+                key.append((pkg.codepath,
+                            sorted(library_versions.iteritems())))
+        sha1 = hashlib.sha1(repr(key))
+        return os.path.join(cache_dir, sha1.hexdigest() + '.vtbin')
+
+    def open_package_metadata(self, filename):
+        """open_package_metadata(filename: str) -> dict
+        Returns the metadata of the packages stored along with the
+        registry cache, indexed by codepath, or {} if there is none.
+
+        """
+        if not os.path.isfile(filename):
+            return {}
+        try:
+            with open(filename, 'rb') as f:
+                return json.load(f)
+        except (ValueError, EnvironmentError), e:
+            debug.warning("Ignoring invalid package metadata file '%s'" %
+                          filename, e)
+            return {}
+
+    def save_package_metadata(self, filename):
+        """save_package_metadata(filename: str) -> None
+        Stores the metadata of the enabled packages along with the
+        registry cache, so that they don't need to be imported to be
+        registered from it.
+
+        """
+        metadata = {}
+        for pkg in self._package_list.itervalues():
+            pkg_metadata = pkg.get_metadata()
+            if pkg_metadata is None or \
+                    pkg_metadata['library_versions'] is None:
+                continue
+            metadata[pkg.codepath] = pkg_metadata
+        try:
+            tmp_filename = filename + '.tmp'
+            with open(tmp_filename, 'wb') as f:
+                json.dump(metadata, f)
+            if os.path.exists(filename):
+                os.remove(filename)
+            os.rename(tmp_filename, filename)
+        except (TypeError, ValueError, EnvironmentError), e:
+            debug.warning("Could not write package metadata file '%s'" %
+                          filename, e)
+
+    def check_package_metadata(self, pkg, cache_files, changed=False):
+        """check_package_metadata(pkg: Package, cache_files: [str],
+                                  changed: bool) -> None
+        Compares a package registered from the registry cache with what
+        it reports once loaded, and removes the cache files if it changed
+        (for instance if one of its libraries was upgraded) or if changed
+        is True (its modules differ from the cached ones), so that the
+        cache is built again on the next start.
+
+        """
+        if not changed:
+            cached = pkg._metadata
+            if cached is None or pkg.module is None:
+                return
+            metadata = json.loads(json.dumps(pkg.get_metadata()))
+            if metadata == cached:
+                return
+        debug.log("Package %s changed since the registry cache was "
+                  "written" % pkg.codepath)
+        for filename in cache_files:
+            try:
+                os.remove(filename)
+            except OSError:
+                pass
+
+    def initialize_deferred_packages(self, identifiers=None):
+        """initialize_deferred_packages(identifiers: [str]) -> None
+        Initializes the packages that were registered from the registry
+        cache, along with their dependencies. If identifiers is None, all
+        of them are initialized.
+
+        """
+        if not self._deferred_packages:
+            return
+        if identifiers is None:
+            identifiers = [self._package_list[codepath].identifier
+                           for codepath in self._deferred_packages]
+        names = set()
+        for identifier in identifiers:
+            identifier = self._old_identifier_map.get(identifier, identifier)
+            if identifier in self._dependency_graph.vertices:
+                names.update(self.all_dependencies(identifier))
+        if not names:
+            return
+
+        g = self._dependency_graph.inverse_immutable()
+        for name in g.vertices_topological_sort(names):
+            if name not in names:
+                continue
+            pkg = self.get_package(name)
+            if pkg.codepath not in self._deferred_packages:
+                continue
+            cache_files = self._deferred_packages.pop(pkg.codepath)
+            try:
+                changed = self._registry.initialize_package(pkg)
+                self.check_package_metadata(pkg, cache_files, changed)
+            except MissingRequirement, e:
+                debug.critical("Package <codepath %s> is missing a "
+                               "requirement: %s" % (
+                                   pkg.codepath, e.requirement),
+                               e)
+                self.late_disable_package(pkg.codepath)
+            except Package.InitializationFailed, e:
+                debug.critical("Initialization of package <codepath %s> "
+                               "failed and will be disabled" %
+                               pkg.codepath,
+                               e)
+                self.late_disable_package(pkg.codepath)
+            else:
+                self.add_menu_items(pkg)
+
+    def initialize_pipeline_packages(self, pipeline):
+        """initialize_pipeline_packages(pipeline: Pipeline) -> None
+        Initializes the deferred packages that the modules of pipeline,
+        including the ones inside groups and subworkflows, come from.
+
+        """
+        if not self._deferred_packages:
+            return
+        identifiers = set()
+        def process_pipeline(pipeline):
+            for module in pipeline.modules.itervalues():
+                identifiers.add(module.package)
+                if module.is_group() or module.is_abstraction():
+                    try:
+                        sub_pipeline = module.pipeline
+                    except (ModuleRegistryException, AttributeError):
+                        continue
+                    if sub_pipeline is not None:
+                        process_pipeline(sub_pipeline)
+        process_pipeline(pipeline)
+        self.initialize_deferred_packages(identifiers)
+
     def add_menu_items(self, pkg):
         """add_menu_items(pkg: Package) -> None
         If the package implemented the function menu_items(),
@@ -947,3 +1199,118 @@ class TestImports(unittest.TestCase):
                 pm.late_disable_package('test_import_pkg')
             except MissingPackage:
                 pass
+
+
+class TestRegistryCache(unittest.TestCase):
+    def test_deferred_package(self):
+        """test registering a package from the registry cache"""
+        import shutil
+        import tempfile
+        from vistrails.core.configuration import get_vistrails_configuration
+        from vistrails.core.vistrail.module import Module
+        from vistrails.core.vistrail.pipeline import Pipeline
+
+        pm = get_package_manager()
+        registry = pm._registry
+        conf = get_vistrails_configuration()
+        old_conf = (conf.check('registryCache'),
+                    conf.check('registryCacheDir'))
+        testdir = tempfile.mkdtemp(prefix='vt_')
+        identifier = 'org.vistrails.vistrails.tabledata'
+        try:
+            conf.registryCache = True
+            conf.registryCacheDir = testdir
+            if pm.has_package(identifier):
+                pm.late_disable_package('tabledata')
+
+            pm.add_package('tabledata')
+            pm.initialize_packages()
+            self.assertEqual(len(os.listdir(testdir)), 2)
+            package = pm.get_package(identifier)
+            self.assertTrue(package.initialized())
+            version = package.version
+            ids = dict((d.spec_tuple, d.id)
+                       for d in package.descriptor_list)
+            ports = dict((d.spec_tuple, len(d.port_specs_list))
+                         for d in package.descriptor_list)
+            pm.late_disable_package('tabledata')
+
+            pm.add_package('tabledata')
+            pm.initialize_packages()
+            package = pm.get_package(identifier)
+            self.assertFalse(package.initialized())
+            # registered from the cached metadata, not imported
+            self.assertIsNone(package.module)
+            self.assertEqual(package.version, version)
+            descriptors = dict((d.spec_tuple, d)
+                               for d in package.descriptor_list)
+            self.assertEqual(dict((k, d.id)
+                                  for k, d in descriptors.iteritems()),
+                             ids)
+            for k, d in descriptors.iteritems():
+                self.assertIsNone(d.module)
+                self.assertEqual(len(d.port_specs_list), ports[k])
+
+            # validating a pipeline that uses it initializes the package
+            desc = descriptors.values()[0]
+            pipeline = Pipeline()
+            pipeline.add_module(Module(id=0, name=desc.name,
+                                       package=desc.identifier,
+                                       namespace=desc.namespace))
+            pipeline.validate(False)
+            self.assertTrue(package.initialized())
+            self.assertIsNotNone(package.module)
+            for k, d in descriptors.iteritems():
+                self.assertIs(registry.get_descriptor_by_name(*k), d)
+                self.assertIsNotNone(d.module)
+                self.assertEqual(len(d.port_specs_list), ports[k])
+        finally:
+            (conf.registryCache, conf.registryCacheDir) = old_conf
+            shutil.rmtree(testdir)
+            if pm.has_package(identifier):
+                pm.late_disable_package('tabledata')
+
+    def test_new_module(self):
+        """test removing the registry cache when a package adds a module"""
+        import shutil
+        import tempfile
+        from vistrails.core.configuration import get_vistrails_configuration
+        from vistrails.core.modules.vistrails_module import Module
+
+        pm = get_package_manager()
+        conf = get_vistrails_configuration()
+        old_conf = (conf.check('registryCache'),
+                    conf.check('registryCacheDir'))
+        testdir = tempfile.mkdtemp(prefix='vt_')
+        identifier = 'org.vistrails.vistrails.tabledata'
+        class NewModule(Module):
+            pass
+        try:
+            conf.registryCache = True
+            conf.registryCacheDir = testdir
+            if pm.has_package(identifier):
+                pm.late_disable_package('tabledata')
+
+            pm.add_package('tabledata')
+            pm.initialize_packages()
+            self.assertEqual(len(os.listdir(testdir)), 2)
+            pm.late_disable_package('tabledata')
+
+            pm.add_package('tabledata')
+            pm.initialize_packages()
+            package = pm.get_package(identifier)
+            self.assertFalse(package.initialized())
+            # the package now has a module the cache doesn't know about
+            from vistrails.packages.tabledata import init
+            init._modules.setdefault('test', []).append(NewModule)
+            try:
+                pm.initialize_deferred_packages([identifier])
+            finally:
+                init._modules['test'].remove(NewModule)
+            self.assertTrue(package.initialized())
+            self.assertEqual(os.listdir(testdir), [])
+        finally:
+            (conf.registryCache, conf.registryCacheDir) = old_conf
+            shutil.rmtree(testdir)
+            if pm.has_package(identifier):
+                pm.late_disable_package('tabledata')
@@ -36,9 +36,22 @@
 This module handles Parameter Exploration in VisTrails
 """
 from vistrails.core import debug
+from vistrails.core.cache.shared import SharedResultCache
+from vistrails.core.configuration import get_vistrails_configuration
+import vistrails.core.db.action
+from vistrails.core.interpreter.cached import CachedInterpreter
+from vistrails.core.interpreter.default import get_default_interpreter
+from vistrails.core.interpreter.noncached import \
+    Interpreter as NoncachedInterpreter
+from vistrails.core.interpreter.parallel import MainThreadLogging
+from vistrails.core.modules.vistrails_module import Module
 from vistrails.core.vistrail.module_function import ModuleFunction
 from vistrails.core.vistrail.module_param import ModuleParam
+from itertools import chain, izip
 import copy
+import Queue
+import sys
+import threading
 
 import unittest
 
@@ -173,6 +186,7 @@ class InterpolateDiscreteParam(object):
             p.strValue = str(v)
             f.params.append(p)
         m.functions.append(f)
+        pipeline.invalidate_signatures(m.id)
 
 class ActionBasedParameterExploration(object):
     """
@@ -204,40 +218,491 @@ class ActionBasedParameterExploration(object):
         back to the builder.
         
         """
-        results = []
-        resultActions = []
-        
-        def exploreDimension(pipeline, performedActions, dim):
-            """ exploreDimension(pipeline: Pipeline, performedActions: [actions],
-                                 dim: int) -> None
-            Start applying actions to the pipeline at dimension
-            dim. 'pipeline' will not be modified in the function
-            
-            """
-            if dim<0:
-                results.append(pipeline)
-                resultActions.append(performedActions)
-                return
-            currentActions = actions[dim]
-            if len(currentActions)==0:
-                # Ignore empty dimension
-                exploreDimension(pipeline, performedActions, dim-1)
+        count = self.count(actions)
+        results = [None] * count
+        resultActions = [None] * count
+        for i, pipeline, performedActions in self.iter_explore(pipeline,
+                                                               actions,
+                                                               pre_actions):
+            results[i] = pipeline.do_copy(cow=True)
+            resultActions[i] = performedActions
+        return (results, resultActions)
+
+    @staticmethod
+    def count(actions):
+        """ count(actions: [action set]) -> int
+        Returns the number of pipelines in the exploration, without
+        building them. Empty dimensions are ignored
+
+        """
+        count = 1
+        for dimActions in actions:
+            if dimActions:
+                count *= len(dimActions)
+        return count
+
+    def iter_explore(self, pipeline, actions, pre_actions=[]):
+        """ iter_explore(pipeline: Pipeline, actions: [action set],
+                         pre_actions: [action set])
+                -> iterator over (int, Pipeline, [actions])
+        Lazy version of explore(): yields the index of each interpolated
+        pipeline in the list explore() returns, the pipeline and the
+        actions leading to it.
+
+        The combinations are visited in reflected Gray-code order, so
+        that two consecutive pipelines only differ in one dimension: a
+        single pipeline is updated in place by replacing the changes of
+        one action set with those of the next one, instead of being
+        copied. The pipeline that is yielded is thus only valid until
+        the next iteration and should be copied to be kept. 'pipeline'
+        is not modified.
+
+        """
+        dims = [dim for dim in xrange(len(actions)) if actions[dim]]
+        sizes = [len(actions[dim]) for dim in dims]
+        digits = [0] * len(dims)
+        directions = [1] * len(dims)
+
+        def performedActions():
+            result = list(pre_actions)
+            for k in reversed(xrange(len(dims))):
+                result.extend(actions[dims[k]][digits[k]])
+            return result
+
+        def index():
+            i = 0
+            for k in reversed(xrange(len(dims))):
+                i = i * sizes[k] + digits[k]
+            return i
+
+        base = pipeline.do_copy(cow=True)
+        for action in pre_actions:
+            base.perform_action(action)
+        currentPipeline = base.do_copy(cow=True)
+        for k in reversed(xrange(len(dims))):
+            for action in actions[dims[k]][0]:
+                currentPipeline.perform_action(action)
+        yield index(), currentPipeline, performedActions()
+
+        switches = {}
+        while True:
+            # Move the first dimension that is not at the end of its range
+            # in the current direction, and reverse the previous ones
+            for k in xrange(len(dims)):
+                step = digits[k] + directions[k]
+                if 0 <= step < sizes[k]:
+                    break
+                directions[k] = -directions[k]
+            else:
                 return
-            for actionSet in currentActions:
-                currentPipeline = copy.copy(pipeline)
-                currentPeformedActions = copy.copy(performedActions)
-                for action in actionSet:
+            key = (k, digits[k], step)
+            if key not in switches:
+                switches[key] = self._switch_action(
+                    actions[dims[k]][digits[k]], actions[dims[k]][step])
+            digits[k] = step
+            if switches[key] is not None:
+                currentPipeline.perform_action(switches[key])
+            else:
+                # Not simple parameter changes, apply all the actions
+                currentPipeline = base.do_copy(cow=True)
+                for action in performedActions()[len(pre_actions):]:
                     currentPipeline.perform_action(action)
-                    currentPeformedActions.append(action)
-                exploreDimension(currentPipeline, currentPeformedActions, dim-1)
-        
-        # perform pre_actions
-        currentPipeline = copy.copy(pipeline)
-        for action in pre_actions:
-            currentPipeline.perform_action(action)
-        
-        exploreDimension(currentPipeline, pre_actions, len(actions)-1)
-        return (results, resultActions)
+            yield index(), currentPipeline, performedActions()
+
+    @staticmethod
+    def _switch_action(oldActions, newActions):
+        """ _switch_action(oldActions: [Action], newActions: [Action])
+                -> Action
+        Returns an action that turns a pipeline on which oldActions were
+        performed into one on which newActions were performed instead,
+        or None if they are not changes of the same objects
+
+        """
+        op_list = []
+        for oldAction, newAction in izip(oldActions, newActions):
+            oldOps = oldAction.operations
+            newOps = newAction.operations
+            if len(oldOps) != len(newOps):
+                return None
+            for oldOp, newOp in izip(oldOps, newOps):
+                if (oldOp.vtType != 'change' or newOp.vtType != 'change' or
+                        oldOp.what != newOp.what or
+                        oldOp.oldObjId != newOp.oldObjId or
+                        oldOp.parentObjType != newOp.parentObjType or
+                        oldOp.parentObjId != newOp.parentObjId):
+                    return None
+                op_list.append(('change', oldOp.data, newOp.data,
+                                newOp.parentObjType, newOp.parentObjId))
+        if len(oldActions) != len(newActions):
+            return None
+        return vistrails.core.db.action.create_action(op_list)
+
+class ExplorationInterpreter(CachedInterpreter):
+    """
+    ExplorationInterpreter is the private cached interpreter of a worker
+    thread of a ParameterExplorationRunner. It shares the file pool of
+    the main interpreter, since the temporary files it creates can be
+    handed over to the other workers through the result cache
+
+    """
+    def __init__(self, main_interpreter, result_cache, pinned_signatures):
+        self._main_interpreter = main_interpreter
+        CachedInterpreter.__init__(self)
+        self.result_cache = result_cache
+        self.pinned_signatures = pinned_signatures
+
+    def create(self):
+        CachedInterpreter.create(self)
+        self._file_pool.cleanup()
+        self._file_pool = self.filePool = self._main_interpreter.filePool
+
+    def clear(self):
+        self._persistent_pipeline.clear()
+        self._objects = {}
+        self._module_sizes = {}
+        self._module_costs = {}
+        self._module_priorities = {}
+
+    def __del__(self):
+        # The computed modules can still be referenced by the results
+        pass
+
+class ParameterExplorationRunner(object):
+    """
+    ParameterExplorationRunner executes the pipelines of a parameter
+    exploration on a pool of worker threads, without needing a GUI.
+
+    Each worker executes pipelines with its own ExplorationInterpreter;
+    the upstream results computed by one of them are reused by the
+    others through a SharedResultCache keyed by signature, which falls
+    back on the on-disk cache if persistentCache is set. Pipelines
+    containing modules that are not cacheable or not thread-safe (e.g.
+    spreadsheet cells) are executed on the calling thread by the default
+    interpreter, which also gets logging and view calls from the workers.
+
+    When executing an exploration, the modules that do not depend on
+    the varied parameters are executed once before the others, and
+    pinned in the caches for the duration of the exploration so that
+    memory-limit eviction never drops them.
+
+    """
+    def __init__(self, workers=None):
+        """ ParameterExplorationRunner(workers: int)
+                -> ParameterExplorationRunner
+        workers defaults to the explorationWorkers configuration option
+
+        """
+        if workers is None:
+            workers = get_vistrails_configuration().explorationWorkers
+        self.workers = max(1, workers)
+        self.result_cache = None
+
+    def explore(self, pipeline, actions, pre_actions=[]):
+        """ explore(pipeline: Pipeline, actions: [action set],
+                    pre_actions: [action set]) -> ([Pipeline], [actions])
+        Returns the pipelines of the exploration and the actions leading
+        to each of them, see ActionBasedParameterExploration.explore()
+
+        """
+        explorer = ActionBasedParameterExploration()
+        return explorer.explore(pipeline, actions, pre_actions)
+
+    @staticmethod
+    def runs_on_main_thread(pipeline):
+        """ runs_on_main_thread(pipeline: Pipeline) -> bool
+        Whether pipeline contains modules that have to be computed on
+        the main thread. Modules deciding this at execution time (those
+        overriding is_cacheable() or is_thread_safe()) are assumed to.
+
+        """
+        for module in pipeline.modules.itervalues():
+            try:
+                klass = module.module_descriptor.module
+            except Exception:
+                # The interpreter will report it
+                return True
+            if klass is None:
+                return True
+            if (klass.is_cacheable.im_func is not
+                    Module.is_cacheable.im_func or
+                    klass.is_thread_safe.im_func is not
+                    Module.is_thread_safe.im_func):
+                return True
+        return False
+
+    @staticmethod
+    def varied_modules(pipeline, actions):
+        """ varied_modules(pipeline: Pipeline, actions: [action set])
+                -> set(int)
+        Returns the ids of the modules whose functions are changed by
+        the actions of the exploration, pipeline being one of the
+        explored pipelines. Returns None if the actions do something
+        else than changing function parameters
+
+        """
+        function_modules = {}
+        for module in pipeline.modules.itervalues():
+            for function in module.functions:
+                function_modules[function.real_id] = module.id
+        varied = set()
+        for dimActions in actions:
+            for actionSet in dimActions:
+                for action in actionSet:
+                    for op in action.operations:
+                        if (op.parentObjType != ModuleFunction.vtType or
+                                op.parentObjId not in function_modules):
+                            return None
+                        varied.add(function_modules[op.parentObjId])
+        return varied
+
+    @staticmethod
+    def shared_prefix(pipeline, varied):
+        """ shared_prefix(pipeline: Pipeline, varied: set(int))
+                -> Pipeline
+        Returns the subpipeline of the modules upstream of the varied
+        modules that do not depend on them, i.e. the part that is the
+        same in all the explored pipelines, or None if there is none.
+        Non-cacheable modules, and the modules depending on them, are
+        left out since their results cannot be reused
+
+        """
+        if not varied:
+            return None
+        graph = pipeline.graph
+        cone = set(graph.vertices_topological_sort(list(varied)))
+        upstream = set(graph.inverse_immutable() \
+                           .vertices_topological_sort(list(cone)))
+        prefix = upstream - cone
+        non_cacheable = []
+        for module_id in prefix:
+            try:
+                klass = pipeline.modules[module_id].module_descriptor.module
+            except Exception:
+                klass = None
+            if (klass is None or
+                    klass.is_cacheable.im_func is not
+                    Module.is_cacheable.im_func):
+                non_cacheable.append(module_id)
+        if non_cacheable:
+            prefix.difference_update(
+                graph.vertices_topological_sort(non_cacheable))
+        if not prefix:
+            return None
+        prefix_pipeline = pipeline.do_copy(cow=True)
+        for connection in pipeline.connections.itervalues():
+            if (connection.sourceId not in prefix or
+                    connection.destinationId not in prefix):
+                prefix_pipeline.delete_connection(connection.id)
+        for module_id in pipeline.modules:
+            if module_id not in prefix:
+                prefix_pipeline.delete_module(module_id)
+        return prefix_pipeline
+
+    def execute(self, pipelines, variant_kwargs=None, progress=None,
+                **kwargs):
+        """ execute(pipelines: [Pipeline],
+                    variant_kwargs: callable(int) -> dict,
+                    progress: callable(int, int), **kwargs)
+                -> iterator over (int, InstanceObject)
+        Executes the pipelines, yielding the index and the interpreter
+        result of each one as soon as it is done (so not necessarily in
+        order). kwargs are passed to the interpreter for every pipeline,
+        updated with variant_kwargs(index) if given. progress(done,
+        total) is called on this thread each time a pipeline finishes.
+
+        Closing the iterator stops the exploration once the pipelines
+        that are running are done.
+
+        """
+        def variants():
+            for i, pipeline in enumerate(pipelines):
+                if variant_kwargs is not None:
+                    yield i, pipeline, variant_kwargs(i)
+                else:
+                    yield i, pipeline, {}
+        return self._execute(variants(), len(pipelines), False, None,
+                             progress, kwargs)
+
+    def execute_exploration(self, pipeline, actions, pre_actions=[],
+                            variant_kwargs=None, progress=None, **kwargs):
+        """ execute_exploration(pipeline: Pipeline, actions: [action set],
+                                pre_actions: [action set],
+                                variant_kwargs: callable(int) -> dict,
+                                progress: callable(int, int), **kwargs)
+                -> iterator over (int, InstanceObject)
+        Like execute() on the pipelines explore() would return, but the
+        pipelines are built lazily with
+        ActionBasedParameterExploration.iter_explore() as workers become
+        available, and the actions leading to each one are passed to the
+        interpreter. Indexes are those of the pipelines in explore()
+
+        """
+        explorer = ActionBasedParameterExploration()
+        explored = explorer.iter_explore(pipeline, actions, pre_actions)
+        first = next(explored)
+        varied = self.varied_modules(first[1], actions)
+        if varied is not None:
+            prefix = self.shared_prefix(first[1], varied)
+        else:
+            prefix = None
+        def variants():
+            for i, p, performedActions in chain([first], explored):
+                pipeline_kwargs = {'actions': performedActions}
+                if variant_kwargs is not None:
+                    pipeline_kwargs.update(variant_kwargs(i))
+                yield i, p, pipeline_kwargs
+        return self._execute(variants(), explorer.count(actions), True,
+                             prefix, progress, kwargs)
+
+    def _execute(self, variants, total, copy_pipelines, prefix, progress,
+                 kwargs):
+        """ _execute(variants: iterator over (int, Pipeline, dict),
+                     total: int, copy_pipelines: bool, prefix: Pipeline,
+                     progress: callable(int, int), kwargs: dict)
+                -> iterator over (int, InstanceObject)
+        Pulls the pipelines to execute from variants as they are needed;
+        if copy_pipelines is set, those sent to a worker are copied
+        first, since variants may modify them afterwards. prefix, if
+        given, is executed first and its modules are pinned
+
+        """
+        main_interpreter = get_default_interpreter()
+        done = 0
+        if isinstance(main_interpreter, NoncachedInterpreter):
+            prefix = None
+        old_pinned = main_interpreter.pinned_signatures
+        prefix_objects = self._execute_prefix(main_interpreter, prefix,
+                                              kwargs)
+        pinned = set(obj.signature for obj in prefix_objects)
+        main_interpreter.pinned_signatures = old_pinned | pinned
+        if (self.workers == 1 or
+                isinstance(main_interpreter, NoncachedInterpreter)):
+            try:
+                for i, pipeline, pipeline_kwargs in variants:
+                    pipeline_kwargs = dict(kwargs, **pipeline_kwargs)
+                    result = main_interpreter.execute(pipeline,
+                                                      **pipeline_kwargs)
+                    done += 1
+                    if progress is not None:
+                        progress(done, total)
+                    yield i, result
+            finally:
+                main_interpreter.pinned_signatures = old_pinned
+            return
+
+        self.result_cache = SharedResultCache(
+                main_interpreter.get_result_cache())
+        for obj in prefix_objects:
+            self.result_cache.pin(obj)
+        events = Queue.Queue()
+        tasks = Queue.Queue()
+        proxied = {}
+        for name in ('logger', 'view'):
+            if name in kwargs:
+                proxied[name] = MainThreadLogging(kwargs[name], events)
+
+        def worker():
+            interpreter = ExplorationInterpreter(main_interpreter,
+                                                 self.result_cache, pinned)
+            while True:
+                task = tasks.get()
+                if task is None:
+                    break
+                i, pipeline, pipeline_kwargs = task
+                pipeline_kwargs.update(proxied)
+                pipeline_kwargs['threads'] = 1
+                try:
+                    result = interpreter.execute(pipeline, **pipeline_kwargs)
+                    events.put(('done', (i, result, None)))
+                except BaseException:
+                    events.put(('done', (i, None, sys.exc_info())))
+
+        threads = [threading.Thread(target=worker)
+                   for i in xrange(min(self.workers, total))]
+        for thread in threads:
+            thread.daemon = True
+            thread.start()
+
+        old_result_cache = main_interpreter.result_cache
+        main_interpreter.result_cache = self.result_cache
+        # Only a few pipelines wait for a worker at any time
+        backlog = 2 * len(threads)
+        running = 0
+        exhausted = False
+        exc_info = None
+        try:
+            while True:
+                while not exhausted and running < backlog:
+                    try:
+                        i, pipeline, pipeline_kwargs = next(variants)
+                    except StopIteration:
+                        exhausted = True
+                        break
+                    pipeline_kwargs = dict(kwargs, **pipeline_kwargs)
+                    running += 1
+                    if self.runs_on_main_thread(pipeline):
+                        try:
+                            result = main_interpreter.execute(
+                                    pipeline, **pipeline_kwargs)
+                            events.put(('done', (i, result, None)))
+                        except BaseException:
+                            events.put(('done', (i, None, sys.exc_info())))
+                    else:
+                        if copy_pipelines:
+                            pipeline = copy.copy(pipeline)
+                        tasks.put((i, pipeline, pipeline_kwargs))
+                if not running:
+                    break
+                kind, value = events.get()
+                if kind == 'call':
+                    MainThreadLogging.process_call(value)
+                    continue
+                running -= 1
+                i, result, exc_info = value
+                if exc_info is not None:
+                    break
+                done += 1
+                if progress is not None:
+                    progress(done, total)
+                yield i, result
+        finally:
+            # Let the running pipelines finish, then stop the workers
+            while True:
+                try:
+                    tasks.get_nowait()
+                    running -= 1
+                except Queue.Empty:
+                    break
+            for thread in threads:
+                tasks.put(None)
+            while running > 0:
+                kind, value = events.get()
+                if kind == 'call':
+                    MainThreadLogging.process_call(value)
+                else:
+                    running -= 1
+            main_interpreter.result_cache = old_result_cache
+            main_interpreter.pinned_signatures = old_pinned
+            self.result_cache.clear()
+        if exc_info is not None:
+            raise exc_info[0], exc_info[1], exc_info[2]
+
+    @staticmethod
+    def _execute_prefix(interpreter, prefix, kwargs):
+        """ _execute_prefix(interpreter: CachedInterpreter,
+                            prefix: Pipeline, kwargs: dict) -> [Module]
+        Executes the shared prefix of an exploration and returns the
+        modules that were successfully computed (or reused)
+
+        """
+        if prefix is None:
+            return []
+        prefix_kwargs = dict(kwargs)
+        reason = prefix_kwargs.get('reason') or 'Parameter Exploration'
+        prefix_kwargs['reason'] = '%s (shared upstream)' % reason
+        result = interpreter.execute(prefix, **prefix_kwargs)
+        return [obj for obj in result.objects.itervalues()
+                if obj.upToDate and obj.signature is not None]
 
 def _pipelinePositions(sheetCount, rowCount, colCount,
                        pipelines):
@@ -280,5 +745,175 @@ class TestParameterExploration(unittest.TestCase):
                           (5, 5.0, 'two'),
                           (10, 10.0, 'three')])
 
+    def make_exploration(self, dims):
+        """Returns a String(value='x') -> ConcatenateString(str1)
+        pipeline, and the actions exploring the other ports of
+        ConcatenateString with the given lists of values (one per
+        dimension)
+
+        """
+        from vistrails.core.modules.basic_modules import identifier as \
+            basic_pkg, version as basic_version
+        from vistrails.core.paramexplore.function import PEFunction
+        from vistrails.core.paramexplore.param import PEParam
+        from vistrails.core.paramexplore.paramexplore import \
+            ParameterExploration as PE
+        from vistrails.core.vistrail.connection import Connection
+        from vistrails.core.vistrail.module import Module as VTModule
+        from vistrails.core.vistrail.pipeline import Pipeline
+        from vistrails.core.vistrail.port import Port
+
+        pipeline = Pipeline()
+        pipeline.add_module(VTModule(
+                id=0, name='String', package=basic_pkg,
+                version=basic_version, functions=[
+                    ModuleFunction(name='value', parameters=[
+                            ModuleParam(pos=0, type='String', val='x')])]))
+        pipeline.add_module(VTModule(
+                id=1, name='ConcatenateString', package=basic_pkg,
+                version=basic_version))
+        pipeline.add_connection(Connection(id=0, ports=[
+                Port(id=0, type='source', moduleId=0, name='value',
+                     signature='(%s:String)' % basic_pkg),
+                Port(id=1, type='destination', moduleId=1, name='str1',
+                     signature='(%s:String)' % basic_pkg)]))
+        sizes = [len(values) for values in dims] + [1] * (4 - len(dims))
+        pe = PE(action_id=1, dims=repr(sizes), functions=[
+                PEFunction(module_id=1, port_name='str%d' % (dim + 2),
+                           parameters=[
+                        PEParam(pos=0, interpolator='List',
+                                value=repr(values), dimension=dim)])
+                for dim, values in enumerate(dims)])
+        actions, pre_actions, _ = pe.collectParameterActions(pipeline)
+        return pipeline, actions, pre_actions
+
+    def test_iter_explore(self):
+        def values(pipeline):
+            functions = pipeline.modules[1].functions
+            return tuple(f.params[0].strValue
+                         for f in sorted(functions, key=lambda f: f.name))
+
+        dims = [['a', 'b', 'c'], ['1', '2']]
+        pipeline, actions, pre_actions = self.make_exploration(dims)
+        explorer = ActionBasedParameterExploration()
+        self.assertEqual(explorer.count(actions), 6)
+        self.assertIsNotNone(explorer._switch_action(actions[0][0],
+                                                     actions[0][1]))
+        expected = [(s2, s3) for s3 in dims[1] for s2 in dims[0]]
+        previous = None
+        indexes = []
+        for i, p, performedActions in explorer.iter_explore(pipeline,
+                                                            actions,
+                                                            pre_actions):
+            self.assertEqual(values(p), expected[i])
+            self.assertEqual(len(performedActions), len(pre_actions) + 2)
+            if previous is not None:
+                # Gray code: a single dimension changes
+                self.assertEqual(sum(a != b for a, b in zip(previous,
+                                                            values(p))),
+                                 1)
+            previous = values(p)
+            indexes.append(i)
+        self.assertEqual(sorted(indexes), range(6))
+        self.assertFalse(pipeline.modules[1].functions)
+
+        pipelines, performedActions = explorer.explore(pipeline, actions,
+                                                       pre_actions)
+        self.assertEqual([values(p) for p in pipelines], expected)
+        for p, a in zip(pipelines, performedActions):
+            q = copy.copy(pipeline)
+            q.perform_action_chain(a)
+            self.assertEqual(values(q), values(p))
+
+    def test_runner(self):
+        from vistrails.core.modules.basic_modules import ConcatenateString
+        from vistrails.tests.utils import intercept_result
+
+        pipeline, actions, pre_actions = self.make_exploration(
+                [['1', '2', '3', '4']])
+        runner = ParameterExplorationRunner(workers=2)
+        pipelines, performed_actions = runner.explore(pipeline, actions,
+                                                      pre_actions)
+        self.assertEqual(len(pipelines), 4)
+        self.assertFalse(any(runner.runs_on_main_thread(p)
+                             for p in pipelines))
+        progress = []
+        indexes = []
+        with intercept_result(ConcatenateString, 'value') as results:
+            for i, result in runner.execute(
+                    pipelines,
+                    progress=lambda done, total: progress.append((done,
+                                                                  total))):
+                self.assertFalse(result.errors)
+                indexes.append(i)
+        self.assertEqual(sorted(indexes), [0, 1, 2, 3])
+        self.assertEqual(sorted(results), ['x1', 'x2', 'x3', 'x4'])
+        self.assertEqual(progress, [(1, 4), (2, 4), (3, 4), (4, 4)])
+
+        # Lazily
+        with intercept_result(ConcatenateString, 'value') as results:
+            indexes = [i for i, result in runner.execute_exploration(
+                    pipeline, actions, pre_actions)]
+        self.assertEqual(sorted(indexes), [0, 1, 2, 3])
+        self.assertEqual(sorted(results), ['x1', 'x2', 'x3', 'x4'])
+
+    def test_main_thread_error(self):
+        pipeline, actions, pre_actions = self.make_exploration(
+                [['1', '2', '3', '4']])
+        runner = ParameterExplorationRunner(workers=2)
+        pipelines, performed_actions = runner.explore(pipeline, actions,
+                                                      pre_actions)
+        interpreter = get_default_interpreter()
+        def execute(pipeline, **kwargs):
+            raise RuntimeError("main thread failure")
+        runner.runs_on_main_thread = lambda pipeline: True
+        interpreter.execute = execute
+        try:
+            with self.assertRaises(RuntimeError):
+                list(runner.execute(pipelines))
+        finally:
+            del interpreter.execute
+
+    def test_shared_prefix(self):
+        from vistrails.core.modules.basic_modules import ConcatenateString, \
+            String
+        from vistrails.tests.utils import intercept_result
+
+        pipeline, actions, pre_actions = self.make_exploration(
+                [['1', '2', '3', '4']])
+        explorer = ActionBasedParameterExploration()
+        first = next(explorer.iter_explore(pipeline, actions, pre_actions))[1]
+        runner = ParameterExplorationRunner(workers=2)
+        varied = runner.varied_modules(first, actions)
+        self.assertEqual(varied, set([1]))
+        prefix = runner.shared_prefix(first, varied)
+        self.assertEqual(set(prefix.modules), set([0]))
+        self.assertFalse(prefix.connections)
+        self.assertIsNone(runner.shared_prefix(first, set([0])))
+
+        interpreter = get_default_interpreter()
+        pinned = interpreter.pinned_signatures
+        computed = []
+        had_compute = 'compute' in String.__dict__
+        old_compute = String.compute
+        def compute(module):
+            computed.append(module)
+            old_compute(module)
+        String.compute = compute
+        try:
+            with intercept_result(ConcatenateString, 'value') as results:
+                for i, result in runner.execute_exploration(
+                        pipeline, actions, pre_actions):
+                    self.assertFalse(result.errors)
+        finally:
+            if had_compute:
+                String.compute = old_compute
+            else:
+                del String.compute
+        # The String is computed at most once (it might already be cached)
+        self.assertLessEqual(len(computed), 1)
+        self.assertEqual(sorted(results), ['x1', 'x2', 'x3', 'x4'])
+        self.assertIs(interpreter.pinned_signatures, pinned)
+
 if __name__ == '__main__':
     unittest.main()
@@ -234,6 +234,19 @@ class TestAction(unittest.TestCase):
         self.assertEquals(a1, a3)
         self.assertNotEquals(a1.id, a3.id)
 
+    def test_slots(self):
+        """domain fields live in slots, deleted lists are allocated lazily"""
+        a1 = self.create_action()
+        self.assertEquals(a1.__dict__, {})
+        op = a1.operations[0]
+        self.assertFalse(hasattr(op, '_db_deleted_data'))
+        self.assertEquals(op.db_deleted_data, [])
+        op.is_new = False
+        a1.db_delete_operation(op)
+        self.assertEquals(a1.db_deleted_operations, [op])
+        self.assertEquals(len(a1.db_deleted_children(remove=True)), 1)
+        self.assertFalse(hasattr(a1, '_db_deleted_operations'))
+
     def test_serialization(self):
         import vistrails.core.db.io
         a1 = self.create_action()
@@ -65,6 +65,8 @@ from vistrails.core.modules.sub_module import new_abstraction, read_vistrail, \
     get_all_abs_namespaces, get_cur_abs_namespace, get_cur_abs_annotation_key, \
     get_next_abs_annotation_key, save_abstraction, parse_abstraction_name
 from vistrails.core.packagemanager import PackageManager, get_package_manager
+from vistrails.core.param_explore import ActionBasedParameterExploration, \
+    ParameterExplorationRunner, _pipelinePositions
 import vistrails.core.packagerepository
 from vistrails.core.thumbnails import ThumbnailCache
 from vistrails.core.upgradeworkflow import UpgradeWorkflowHandler, UpgradeWorkflowError
@@ -83,6 +85,7 @@ from vistrails.core.vistrail.module_control_param import ModuleControlParam
 from vistrails.core.vistrail.module_function import ModuleFunction
 from vistrails.core.vistrail.module_param import ModuleParam
 from vistrails.core.vistrail.pipeline import Pipeline
+from vistrails.core.vistrail.pipeline_cache import PipelineCache
 from vistrails.core.vistrail.port import Port
 from vistrails.core.vistrail.port_spec import PortSpec
 from vistrails.core.vistrail.port_spec_item import PortSpecItem
@@ -208,7 +211,10 @@ class VistrailController(object):
     current_pipeline = property(_get_current_pipeline, _set_current_pipeline)
 
     def flush_pipeline_cache(self):
-        self._pipelines = {0: Pipeline()}
+        if hasattr(self, '_pipelines'):
+            self._pipelines.clear()
+        else:
+            self._pipelines = PipelineCache()
 
     def logging_on(self):
         return get_vistrails_configuration().check('executionLog')
@@ -1664,6 +1670,8 @@ class VistrailController(object):
                     # don't add it!
                     continue
 
+                # full copy, its parameters are not shared with
+                # full_pipeline and can be changed in place
                 m = m.do_copy(True, id_scope, id_remap)
                 name_function = None
                 for function in m.functions:
@@ -2714,6 +2722,57 @@ class VistrailController(object):
                 debug.unexpected_exception(e)
                 raise
 
+    def execute_parameter_exploration(self, pe, extra_info=None,
+                                      workers=None, progress=None):
+        """ execute_parameter_exploration(pe: ParameterExploration,
+                                          extra_info: dict, workers: int,
+                                          progress: callable(int, int))
+                -> list
+        Executes all the workflows of a parameter exploration with a
+        ParameterExplorationRunner using workers threads (defaults to
+        the explorationWorkers option). This does not need a GUI.
+        progress(done, total) is called after each workflow. Returns a
+        list of ((column, row, sheet), error) tuples
+
+        """
+        if pe.action_id != self.current_version:
+            self.change_selected_version(pe.action_id)
+        if not self.current_pipeline:
+            return []
+        collected = pe.collectParameterActions(self.current_pipeline)
+        if not collected:
+            return []
+        actions, pre_actions, vistrail_vars = collected
+
+        runner = ParameterExplorationRunner(workers)
+        count = ActionBasedParameterExploration.count(actions)
+        dim = [max(1, len(a)) for a in actions]
+        positions = _pipelinePositions(dim[2], dim[1], dim[0], xrange(count))
+        pe_log_id = uuid.uuid1()
+        kwargs = {'locator': self.locator,
+                  'current_version': self.current_version,
+                  'logger': self.get_logger(),
+                  'extra_info': extra_info}
+        if self.get_vistrail_variables():
+            # remove vars used in pe
+            vars = dict([(v.uuid, v) for v in self.get_vistrail_variables()
+                         if v.uuid not in vistrail_vars])
+            kwargs['vistrail_variables'] = lambda x: vars.get(x, None)
+        def variant_kwargs(i):
+            pe_cell_id = (pe_log_id,) + positions[i]
+            return {'reason': 'Parameter Exploration %s %s_%s_%s' % pe_cell_id}
+
+        errors = []
+        for i, result in runner.execute_exploration(self.current_pipeline,
+                                                    actions, pre_actions,
+                                                    variant_kwargs, progress,
+                                                    **kwargs):
+            row, col, sheet = positions[i]
+            for error in result.errors.itervalues():
+                errors.append((i, (col, row, sheet), error))
+        errors.sort(key=lambda e: e[0])
+        return [(position, error) for (i, position, error) in errors]
+
     def recompute_terse_graph(self):
         # get full version tree (including pruned nodes) this tree is
         # kept updated all the time. This data is read only and should
@@ -3007,6 +3066,9 @@ class VistrailController(object):
         if vistrail is None:
             vistrail = self.vistrail
         pm = get_package_manager()
+        if e._pipeline is not None:
+            # upgrades are handled by the packages themselves
+            pm.initialize_pipeline_packages(e._pipeline)
         root_exceptions = e.get_exception_set()
         missing_packages = {}
         def process_missing_packages(exception_set):
@@ -3407,12 +3469,12 @@ class VistrailController(object):
                     return result
             # Fast check: if target is cached, copy it and we're done.
             elif version in self._pipelines:
-                result = copy.copy(self._pipelines[version])
+                result = self._pipelines.get(version).do_copy(cow=True)
             else:
                 # Find the closest upstream pipeline to the current one
-                cv = self._current_full_graph.inverse_immutable().closest_vertex
-                closest = cv(version, self._pipelines)
-                cost_to_closest_version = get_cost(version, closest)
+                closest, cost_to_closest_version = \
+                    self._pipelines.closest_ancestor(version,
+                                                     self.vistrail.actionMap)
                 # Now we have to decide between the closest pipeline
                 # to version and the current pipeline
                 shared_parent = getSharedRoot(self.vistrail, 
@@ -3423,27 +3485,39 @@ class VistrailController(object):
                 cost_common_to_new = get_cost(version, shared_parent)
                 cost_to_current_version = cost_common_to_old + \
                     cost_common_to_new
+                # Building from scratch only replays the actions after
+                # the closest materialized pipeline
+                cost_from_checkpoint = \
+                    self.vistrail.get_checkpoint_distance(version)
                 # FIXME I'm assuming copying the pipeline has zero cost.
                 # Formulate a better cost model
-                if cost_to_closest_version < cost_to_current_version:
+                if cost_from_checkpoint <= cost_to_closest_version and \
+                        cost_from_checkpoint < cost_to_current_version:
+                    cost = cost_from_checkpoint
+                    result = self.vistrail.getPipeline(version)
+                elif cost_to_closest_version < cost_to_current_version:
+                    cost = cost_to_closest_version
                     if closest == 0:
                         result = self.vistrail.getPipeline(version)
                     else:
-                        result = copy.copy(self._pipelines[closest])
+                        result = \
+                            self._pipelines.get(closest).do_copy(cow=True)
                         action = self.vistrail.general_action_chain(closest, 
                                                                     version)
                         result.perform_action(action)
                 else:
+                    cost = cost_to_current_version
                     action = \
                         self.vistrail.general_action_chain(self.current_version,
                                                            version)
                     if self.current_version == -1 or self.current_version == 0:
                         result = Pipeline()
                     else:
-                        result = copy.copy(self.current_pipeline)
+                        result = self.current_pipeline.do_copy(cow=True)
                     result.perform_action(action)
                 if self._cache_pipelines and \
-                        self.vistrail.has_tag(long(version)):
+                        (self.vistrail.has_tag(long(version)) or
+                         self._pipelines.admits(cost)):
                     # stash a copy for future use
                     if do_validate:
                         try:
@@ -3452,9 +3526,10 @@ class VistrailController(object):
                             if not allow_fail:
                                 raise
                         else:
-                            self._pipelines[version] = copy.copy(result)
+                            self._pipelines.add(version,
+                                                result.do_copy(cow=True))
                     else:
-                        self._pipelines[version] = copy.copy(result)
+                        self._pipelines.add(version, result.do_copy(cow=True))
             if do_validate:
                 try:
                     self.validate(result)
@@ -3802,11 +3877,14 @@ class VistrailController(object):
             save_bundle = SaveBundle(log.vtType,log=log)
             locator.save_as(save_bundle)
 
-    def read_log(self):
+    def read_log(self, versions=None, start=None, end=None):
         """ Returns the saved log from zip or DB
+
+        The executions can be restricted to some versions and to a range
+        of start times, see Vistrail.get_persisted_log().
         
         """
-        return self.vistrail.get_persisted_log()
+        return self.vistrail.get_persisted_log(versions, start, end)
  
     def write_registry(self, locator):
         registry = vistrails.core.modules.module_registry.get_module_registry()
@@ -3993,8 +4071,9 @@ class VistrailController(object):
                 moves.append((module.id, new_x, new_y))
             else:
                 #module doesn't exist in pipeline yet, just change x,y
-                module.location.x = new_x
-                module.location.y = new_y
+                #(on a new location, the old one may be shared)
+                module.location = Location(id=module.location.id,
+                                           x=new_x, y=new_y)
                 
         #return module move operations
         return self.move_modules_ops(moves)
@@ -136,7 +136,7 @@ class Pipeline(DBWorkflow):
             self.name = 'untitled'
         self.set_defaults()
 
-    def set_defaults(self, other=None):
+    def set_defaults(self, other=None, cow=False):
         if other is None:
             self.is_valid = False
             self.aliases = Bidict()
@@ -156,6 +156,11 @@ class Pipeline(DBWorkflow):
             self._module_signatures = \
                 Bidict([(k,copy.copy(v))
                         for (k,v) in other._module_signatures.iteritems()])
+            if cow:
+                # the modules are shared, so their aliases and connected
+                # ports are already set up
+                self.graph = copy.copy(other.graph)
+                return
 
         self.graph = Graph()
         for module in self.module_list:
@@ -194,10 +199,23 @@ class Pipeline(DBWorkflow):
         """ __copy__() -> Pipeline - Returns a clone of itself """ 
         return Pipeline.do_copy(self)
 
-    def do_copy(self, new_ids=False, id_scope=None, id_remap=None):
-        cp = DBWorkflow.do_copy(self, new_ids, id_scope, id_remap)
+    def do_copy(self, new_ids=False, id_scope=None, id_remap=None,
+                cow=False):
+        """do_copy(new_ids: bool, id_scope: IdScope, id_remap: dict,
+                   cow: bool) -> Pipeline
+        With cow, the copy shares its modules and connections with this
+        pipeline until either one changes them through operations (see
+        DBWorkflow.db_own_object).
+
+        """
+        cp = DBWorkflow.do_copy(self, new_ids, id_scope, id_remap, cow)
         cp.__class__ = Pipeline
-        cp.set_defaults(self)
+        cp.set_defaults(self, cow)
+        if new_ids:
+            # cached signatures are keyed by the old ids
+            cp._subpipeline_signatures = Bidict()
+            cp._module_signatures = Bidict()
+            cp._connection_signatures = Bidict()
         return cp
 
     @staticmethod
@@ -346,10 +364,10 @@ class Pipeline(DBWorkflow):
         else:
             what = op.db_what
         funname = '%s_%s' % (op.vtType, what)
+        db_funname = 'db_%s_object' % op.vtType
         try:
             f = getattr(self, funname)
         except AttributeError:
-            db_funname = 'db_%s_object' % op.vtType
             try:
                 f = getattr(self, db_funname)
             except AttributeError:
@@ -364,6 +382,13 @@ class Pipeline(DBWorkflow):
         elif op.vtType == 'change':
             f(op.oldObjId, op.data, op.parentObjType, op.parentObjId)
 
+        if f.__name__ == db_funname and \
+                what not in self._signature_neutral_types:
+            # generic operations on module contents (functions,
+            # control parameters, ...) change the module's signature
+            self.invalidate_object_signatures(op.parentObjType,
+                                              op.parentObjId)
+
     def add_module(self, m, *args):
         """add_module(m: Module) -> None 
         Add new module to pipeline
@@ -376,13 +401,16 @@ class Pipeline(DBWorkflow):
 #             m.abstraction = self.abstraction_map[m.abstraction_id]
         self.db_add_object(m)
         self.graph.add_vertex(m.id)
+        self.invalidate_signatures(m.id)
 
     def change_module(self, old_id, m, *args):
         if not self.has_module_with_id(old_id):
             raise VistrailsInternalError("module %s doesn't exist" % old_id)
+        self.invalidate_signatures(old_id)
         self.db_change_object(old_id, m)
         self.graph.delete_vertex(old_id)
         self.graph.add_vertex(m.id)
+        self.invalidate_signatures(m.id)
 
     def delete_module(self, id, *args):
         """delete_module(id:int) -> None 
@@ -418,7 +446,10 @@ class Pipeline(DBWorkflow):
         if c.source is not None and c.destination is not None:
             assert(c.sourceId != c.destinationId)        
             self.graph.add_edge(c.sourceId, c.destinationId, c.id)
+            self.invalidate_downstream_signatures(c.destinationId)
             self.ensure_connection_specs([c.id])
+            self.db_own_object(Module.vtType, c.sourceId)
+            self.db_own_object(Module.vtType, c.destinationId)
 
             source_name = c.source.name
             output_ports = self.modules[c.sourceId].connected_output_ports
@@ -442,8 +473,11 @@ class Pipeline(DBWorkflow):
 
         old_conn = self.connections[old_id]
         if old_conn.source is not None and old_conn.destination is not None:
+            self.invalidate_downstream_signatures(old_conn.destinationId)
             self.graph.delete_edge(old_conn.sourceId, old_conn.destinationId,
                                    old_conn.id)
+            self.db_own_object(Module.vtType, old_conn.sourceId)
+            self.db_own_object(Module.vtType, old_conn.destinationId)
             if self.graph.out_degree(old_conn.sourceId) < 1:
                 self.modules[old_conn.sourceId].connected_output_ports.discard(
                     old_conn.source.name)
@@ -458,7 +492,10 @@ class Pipeline(DBWorkflow):
         if c.source is not None and c.destination is not None:
             assert(c.sourceId != c.destinationId)
             self.graph.add_edge(c.sourceId, c.destinationId, c.id)
+            self.invalidate_downstream_signatures(c.destinationId)
             self.ensure_connection_specs([c.id])
+            self.db_own_object(Module.vtType, c.sourceId)
+            self.db_own_object(Module.vtType, c.destinationId)
             self.modules[c.sourceId].connected_output_ports.add(c.source.name)
             self.modules[c.destinationId].connected_input_ports.add(
                 c.destination.name)
@@ -477,6 +514,7 @@ class Pipeline(DBWorkflow):
         if conn.source is not None and conn.destination is not None and \
                 (conn.destinationId, conn.id) in \
                 self.graph.edges_from(conn.sourceId):
+            self.invalidate_downstream_signatures(conn.destinationId)
             self.graph.delete_edge(conn.sourceId, conn.destinationId, conn.id)
 
             c = conn
@@ -493,6 +531,7 @@ class Pipeline(DBWorkflow):
         
     def add_parameter(self, param, parent_type, parent_id):
         self.db_add_object(param, parent_type, parent_id)
+        self.invalidate_object_signatures(parent_type, parent_id)
         if not self.has_alias(param.alias):
             self.change_alias(param.alias, 
                               param.vtType, 
@@ -502,6 +541,7 @@ class Pipeline(DBWorkflow):
                               None)
 
     def delete_parameter(self, param_id, param_type, parent_type, parent_id):
+        self.invalidate_object_signatures(parent_type, parent_id)
         self.db_delete_object(param_id, ModuleParam.vtType,
                               parent_type, parent_id)
         self.remove_alias(ModuleParam.vtType, param_id, parent_type, 
@@ -510,6 +550,7 @@ class Pipeline(DBWorkflow):
     def change_parameter(self, old_param_id, param, parent_type, parent_id):
         self.remove_alias(ModuleParam.vtType, old_param_id, 
                           parent_type, parent_id, None)
+        self.invalidate_object_signatures(parent_type, parent_id)
         self.db_change_object(old_param_id, param,
                               parent_type, parent_id)
         if not self.has_alias(param.alias):
@@ -528,6 +569,7 @@ class Pipeline(DBWorkflow):
             self.graph.add_edge(connection.sourceId, 
                                 connection.destinationId, 
                                 connection.id)
+            self.invalidate_downstream_signatures(connection.destinationId)
             c = connection
             source_name = c.source.name
             output_ports = self.modules[c.sourceId].connected_output_ports
@@ -544,6 +586,7 @@ class Pipeline(DBWorkflow):
     def delete_port(self, port_id, port_type, parent_type, parent_id):
         conn = self.connections[parent_id]
         if len(conn.ports) >= 2:
+            self.invalidate_downstream_signatures(conn.destinationId)
             self.graph.delete_edge(conn.sourceId, 
                                    conn.destinationId, 
                                    conn.id)
@@ -561,6 +604,7 @@ class Pipeline(DBWorkflow):
     def change_port(self, old_port_id, port, parent_type, parent_id):
         connection = self.connections[parent_id]
         if len(connection.ports) >= 2:
+            self.invalidate_downstream_signatures(connection.destinationId)
             source_list = self.graph.adjacency_list[connection.sourceId]
             source_list.remove((connection.destinationId, connection.id))
             dest_list = \
@@ -573,8 +617,10 @@ class Pipeline(DBWorkflow):
             dest_list = \
                 self.graph.inverse_adjacency_list[connection.destinationId]
             dest_list.append((connection.sourceId, connection.id))
+            self.invalidate_downstream_signatures(connection.destinationId)
 
     def add_port_to_registry(self, portSpec, moduleId):
+        self.db_own_object(Module.vtType, moduleId)
         m = self.get_module_by_id(moduleId)
         m.add_port_spec(portSpec)
 
@@ -583,6 +629,7 @@ class Pipeline(DBWorkflow):
         self.add_port_to_registry(port_spec, parent_id)
         
     def delete_port_from_registry(self, id, moduleId):
+        self.db_own_object(Module.vtType, moduleId)
         m = self.get_module_by_id(moduleId)
         portSpec = m.port_specs[id]
         m.delete_port_spec(portSpec)
@@ -686,8 +733,10 @@ class Pipeline(DBWorkflow):
         else:
             if what == 'parameter':
                 #FIXME: check if a change parameter action needs to be generated
+                self.db_own_object(what, oId)
                 parameter = self.db_get_object(what, oId)
                 parameter.strValue = str(value)
+                self.invalidate_signatures(mId)
             else:
                 raise VistrailsInternalError("only parameters are supported")
         
@@ -834,15 +883,78 @@ class Pipeline(DBWorkflow):
     def has_connection_signature(self, signature):
         return signature in self._connection_signatures.inverse
 
+    # Invalidation
+
+    # operations on these module children do not change module signatures
+    _signature_neutral_types = set(['location', 'annotation'])
+
+    def invalidate_signatures(self, module_id):
+        """invalidate_signatures(module_id: int) -> None
+        Discards the signature of the module with given id, along with the
+        subpipeline and connection signatures downstream of it. Code that
+        modifies a module's functions in place (instead of going through
+        perform_operation) must call this."""
+        if module_id in self._module_signatures:
+            del self._module_signatures[module_id]
+        self.invalidate_downstream_signatures(module_id)
+
+    def invalidate_downstream_signatures(self, module_id):
+        """invalidate_downstream_signatures(module_id: int) -> None
+        Discards the subpipeline signatures of module_id and of every module
+        downstream of it, and the signatures of the connections into them.
+        Module signatures are kept."""
+        to_visit = [module_id]
+        while to_visit:
+            m_id = to_visit.pop()
+            if m_id not in self._subpipeline_signatures:
+                # signatures are computed from upstream, so nothing
+                # downstream of m_id can be cached either
+                continue
+            del self._subpipeline_signatures[m_id]
+            for (_, conn_id) in self.graph.edges_to(m_id):
+                if conn_id in self._connection_signatures:
+                    del self._connection_signatures[conn_id]
+            to_visit.extend(dest_id
+                            for (dest_id, _) in self.graph.edges_from(m_id))
+
+    def _owner_module_id(self, obj_type, obj_id):
+        """_owner_module_id(obj_type: str, obj_id: int) -> int
+        Returns the id of the module that is or contains the given object,
+        or None if it isn't part of a module."""
+        if obj_type in (Module.vtType, Abstraction.vtType, Group.vtType):
+            return obj_id
+        elif obj_type == ModuleFunction.vtType:
+            for module in self.module_list:
+                if obj_id in module.db_functions_id_index:
+                    return module.id
+        elif obj_type == ModuleParam.vtType:
+            for module in self.module_list:
+                for function in module.functions:
+                    if obj_id in function.db_parameters_id_index:
+                        return module.id
+        return None
+
+    def invalidate_object_signatures(self, obj_type, obj_id):
+        """invalidate_object_signatures(obj_type: str, obj_id: int) -> None
+        Same as invalidate_signatures, for the module containing the given
+        function or parameter."""
+        module_id = self._owner_module_id(obj_type, obj_id)
+        if module_id is not None:
+            self.invalidate_signatures(module_id)
+
     def refresh_signatures(self):
-        self._connection_signatures = {}
-        self._subpipeline_signatures = {}
-        self._module_signatures = {}
+        """refresh_signatures(): discards and recomputes all signatures.
+        Signatures are kept up to date by the pipeline's own operations, so
+        this is only needed after modules were modified in place."""
+        self._connection_signatures = Bidict()
+        self._subpipeline_signatures = Bidict()
+        self._module_signatures = Bidict()
         self.compute_signatures()
 
     def compute_signatures(self):
         """compute_signatures(): compute all module and subpipeline signatures
-        for this pipeline."""
+        for this pipeline. Only signatures missing or invalidated since the
+        last call are actually computed."""
         for i in self.modules.iterkeys():
             self.subpipeline_signature(i)
         for c in self.connections.iterkeys():
@@ -856,6 +968,10 @@ class Pipeline(DBWorkflow):
         # registry - if anything fails, generate invalid pipeline with
         # the errors
         exceptions = set()
+        # packages registered from the registry cache are initialized
+        # when a pipeline first uses them
+        from vistrails.core.packagemanager import get_package_manager
+        get_package_manager().initialize_pipeline_packages(self)
         try:
             self.ensure_modules_are_on_registry()
         except InvalidPipeline, e:
@@ -864,9 +980,13 @@ class Pipeline(DBWorkflow):
         # do this before we check connection specs because it is
         # possible that a subpipeline invalidates the module, meaning
         # we shouldn't check the connection specs
-        for module in self.modules.itervalues():
+        for module_id in self.modules.keys():
+            module = self.modules[module_id]
             if module.is_valid and (module.is_group() or 
                                     module.is_abstraction()):
+                # validating the subpipeline updates it in place
+                self.db_own_object(Module.vtType, module_id)
+                module = self.modules[module_id]
                 try:
                     subpipeline = module.pipeline
                     if subpipeline is not None:
@@ -932,36 +1052,43 @@ class Pipeline(DBWorkflow):
 
         # print 'ensure_connection_specs:', sorted(self.modules.keys())
 
-        def find_spec(port):
-            port.is_valid = False
+        def find_spec(conn_id, port_attr):
+            port = getattr(self.connections[conn_id], port_attr)
             module = self.get_module_by_id(port.moduleId)
             port_type_map = PortSpec.port_type_map
+            spec = port.spec
+            is_valid = False
             try:
                 # print 'running get_port_spec', port.name
-                port.spec = module.get_port_spec(port.name, 
+                spec = module.get_port_spec(port.name, 
                                             port_type_map.inverse[port.type])
                 # print 'got spec', spec, spec.sigstring
             except ModuleRegistryException, e:
                 # debug.critical('CONNECTION EXCEPTION: %s' % e)
                 exceptions.add(e)
             else:
-                if port.spec.is_valid:
-                    port.is_valid = True
+                if spec.is_valid:
+                    is_valid = True
+            if port.spec is not spec or port.is_valid != is_valid:
+                self.db_own_object('connection', conn_id)
+                port = getattr(self.connections[conn_id], port_attr)
+                port.spec = spec
+                port.is_valid = is_valid
             
         if connection_ids is None:
-            connection_ids = self.connections.iterkeys()
+            connection_ids = self.connections.keys()
         for conn_id in connection_ids:
             conn = self.connections[conn_id]
             # print 'checking connection', conn_id, conn.source.moduleId, conn.source.moduleName, conn.source.name, conn.destination.moduleId, conn.destination.moduleName, conn.destination.name
             src_module = self.modules[conn.source.moduleId]
             if src_module.is_valid:
                 # print 'src_module:', src_module.name, src_module.id
-                find_spec(conn.source)
+                find_spec(conn_id, 'source')
             
             dst_module = self.modules[conn.destination.moduleId]
             if dst_module.is_valid:
                 # print 'dst_module:', dst_module.name, dst_module.id
-                find_spec(conn.destination)
+                find_spec(conn_id, 'destination')
 
             # if not conn.source.spec:
             # conn.source.spec = find_spec(conn.source)
@@ -990,13 +1117,15 @@ class Pipeline(DBWorkflow):
             registry = get_module_registry()
             conf = get_vistrails_configuration()
             if module_ids == None:
-                module_ids = pipeline.modules.iterkeys()
+                module_ids = pipeline.modules.keys()
             exceptions = set()
             for mid in module_ids:
                 module = pipeline.modules[mid]
-                module.is_valid = False
                 if not module.version:
+                    pipeline.db_own_object(Module.vtType, mid)
+                    module = pipeline.modules[mid]
                     module.version = '0'
+                is_valid = False
                 try:
                     # FIXME check for upgrades, otherwise use similar
                     # descriptor, the old behavior
@@ -1005,7 +1134,11 @@ class Pipeline(DBWorkflow):
                     e._module_id = mid
                     exceptions.add(e)
                 else:
-                    module.is_valid = True
+                    is_valid = True
+                if module.is_valid != is_valid:
+                    pipeline.db_own_object(Module.vtType, mid)
+                    module = pipeline.modules[mid]
+                    module.is_valid = is_valid
             return exceptions
         # end find_descriptors
 
@@ -1016,8 +1149,9 @@ class Pipeline(DBWorkflow):
     def ensure_functions(self):
         exceptions = set()
         reg = get_module_registry()
-        for module in self.modules.itervalues():
-            for function in module.functions:
+        for module_id in self.modules.keys():
+            module = self.modules[module_id]
+            for i, function in enumerate(module.functions):
                 is_valid = True
                 if module.is_valid and not module.has_port_spec(function.name, 
                                                                 'input'):
@@ -1052,7 +1186,10 @@ class Pipeline(DBWorkflow):
                                                         function.real_id))
                         exceptions.add(e)
                     pos_map[p.pos] = p
-                function.is_valid = is_valid
+                if function.is_valid != is_valid:
+                    self.db_own_object(Module.vtType, module_id)
+                    module = self.modules[module_id]
+                    module.functions[i].is_valid = is_valid
         if len(exceptions) > 0:
             raise InvalidPipeline(exceptions, self)
         
@@ -1081,26 +1218,35 @@ class Pipeline(DBWorkflow):
 
     def ensure_port_specs(self):
         exceptions = set()
-        for module in self.modules.itervalues():
+        for module_id in self.modules.keys():
+            module = self.modules[module_id]
             # if module.is_valid:
             try:
+                invalid = []
                 for port_spec in module.port_specs.itervalues():
                     try:
                         port_spec.descriptors()
                     except MissingPackage, e:
-                        port_spec.is_valid = False
+                        invalid.append(port_spec.id)
                         e._module_id = module.id
                         exceptions.add(e)
                     except ModuleRegistryException, e:
                         e = PortMismatch(module.package, module.name,
                                          module.namespace, port_spec.name,
                                          port_spec.type, port_spec.sigstring)
-                        port_spec.is_valid = False
+                        invalid.append(port_spec.id)
                         e._module_id = module.id
                         exceptions.add(e)
+                if any(module.port_specs[spec_id].is_valid
+                       for spec_id in invalid):
+                    self.db_own_object(Module.vtType, module_id)
+                    module = self.modules[module_id]
+                    for spec_id in invalid:
+                        module.port_specs[spec_id].is_valid = False
             except ModuleRegistryException, e:
                 if module.is_valid:
-                    module.is_valid = False
+                    self.db_own_object(Module.vtType, module_id)
+                    self.modules[module_id].is_valid = False
     
         if len(exceptions) > 0:
             raise InvalidPipeline(exceptions, self)
@@ -1133,7 +1279,7 @@ class Pipeline(DBWorkflow):
                 else:
                     continue
             module = self.get_module_by_id(module_id)
-            module.list_depth = 0
+            list_depth = 0
             ports = []
             for module_from_id, conn_id in self.graph.edges_to(module_id):
                 prev_depth = self.get_module_by_id(module_from_id).list_depth
@@ -1169,9 +1315,14 @@ class Pipeline(DBWorkflow):
                 # list to match its depth
                 # if source depth is greater this module will be executed
                 # once for each input in the (possibly nested) list
-                module.list_depth = max(module.list_depth, depth)
-            result.append((module_id, module.list_depth))
-            module.iterated_ports = ports
+                list_depth = max(list_depth, depth)
+            if (module.list_depth != list_depth or
+                    module.iterated_ports != ports):
+                self.db_own_object(Module.vtType, module_id)
+                module = self.get_module_by_id(module_id)
+                module.list_depth = list_depth
+                module.iterated_ports = ports
+            result.append((module_id, list_depth))
         return result
 
 
@@ -1461,6 +1612,39 @@ class TestPipeline(unittest.TestCase):
         self.assertNotEquals(c_sig_size_before, c_sig_size_after)
         self.assertNotEquals(p_sig_size_before, p_sig_size_after)
 
+    def test_incremental_signatures(self):
+        """Makes sure only the downstream signatures are invalidated."""
+        from vistrails.core.vistrail.operation import AddOp
+        p = self.create_default_pipeline()
+        sigs = dict(p._subpipeline_signatures)
+        param = ModuleParam(id=100, type='Float', val='3.0')
+        function = ModuleFunction(id=100, name='value2', parameters=[param])
+        p.perform_operation(AddOp(id=100, what=ModuleFunction.vtType,
+                                  objectId=function.real_id,
+                                  parentObjType=Module.vtType,
+                                  parentObjId=0, data=function))
+        self.assertNotIn(0, p._module_signatures)
+        self.assertNotIn(0, p._subpipeline_signatures)
+        self.assertNotIn(2, p._subpipeline_signatures)
+        self.assertEqual(p._subpipeline_signatures[1], sigs[1])
+        self.assertEqual(len(p._connection_signatures), 0)
+
+        p.compute_signatures()
+        self.assertNotEqual(p._subpipeline_signatures[0], sigs[0])
+        self.assertNotEqual(p._subpipeline_signatures[2], sigs[2])
+        incremental = (dict(p._subpipeline_signatures),
+                       dict(p._connection_signatures))
+        p.refresh_signatures()
+        self.assertEqual(incremental, (dict(p._subpipeline_signatures),
+                                       dict(p._connection_signatures)))
+
+        # parameter changes made in place need explicit invalidation
+        p.get_module_by_id(1).functions[0].params[0].strValue = '3.0'
+        p.invalidate_signatures(1)
+        self.assertEqual(p._subpipeline_signatures.keys(), [0])
+        p.compute_signatures()
+        self.assertNotEqual(p._subpipeline_signatures[1], sigs[1])
+
     def test_delete_connections(self):
         p = self.create_default_pipeline()
         p.delete_connection(0)
@@ -1496,6 +1680,74 @@ class TestPipeline(unittest.TestCase):
         self.assertNotEquals(p1, p3)
         self.assertNotEquals(p1.id, p3.id)
 
+    def test_copy_on_write(self):
+        id_scope = IdScope()
+        p1 = self.create_default_pipeline(id_scope)
+        (m1, m2, m3) = sorted(p1.module_list, key=lambda m: m.id)
+        func = ModuleFunction(id=id_scope.getNewId(ModuleFunction.vtType),
+                              name='value1')
+        p1.db_add_object(func, m1.vtType, m1.id)
+        param = ModuleParam(id=id_scope.getNewId(ModuleParam.vtType),
+                            type='Float',
+                            val='1.0')
+        p1.add_parameter(param, func.vtType, func.real_id)
+        p2 = p1.do_copy(cow=True)
+        self.assertEquals(p1, p2)
+        self.assertIs(p2.modules[m1.id], m1)
+
+        # changing a parameter only copies the module that holds it
+        new_param = ModuleParam(id=id_scope.getNewId(ModuleParam.vtType),
+                                type='Float',
+                                val='2.0')
+        p2.change_parameter(param.real_id, new_param,
+                            func.vtType, func.real_id)
+        self.assertIsNot(p2.modules[m1.id], m1)
+        self.assertIs(p2.modules[m2.id], m2)
+        self.assertEquals(
+            p1.db_get_object(func.vtType, func.real_id).params[0].strValue,
+            '1.0')
+        self.assertEquals(
+            p2.db_get_object(func.vtType, func.real_id).params[0].strValue,
+            '2.0')
+
+        # the original can still be changed without affecting the copy
+        p1.db_delete_object(func.real_id, func.vtType, m1.vtType, m1.id)
+        self.assertEquals(len(p1.modules[m1.id].functions), 1)
+        self.assertEquals(len(p2.modules[m1.id].functions), 2)
+        self.assertEquals(len(m1.functions), 2)
+
+    def test_copy_on_write_in_place(self):
+        id_scope = IdScope()
+        p1 = self.create_default_pipeline(id_scope)
+        for module in p1.module_list:
+            module.location = Location(id=id_scope.getNewId(Location.vtType),
+                                       x=1.0, y=2.0)
+        p1.build_index()
+        (m1, m2, m3) = sorted(p1.module_list, key=lambda m: m.id)
+        p2 = p1.do_copy(cow=True)
+
+        # port visibility, as set by the module configuration widget
+        p2.db_own_object(Module.vtType, m1.id)
+        p2.modules[m1.id].visible_input_ports.add('value2')
+        self.assertEquals(m1.visible_input_ports, set())
+        self.assertIs(p1.modules[m1.id], m1)
+
+        # location changes, as done by move operations
+        location = Location(id=id_scope.getNewId(Location.vtType),
+                            x=5.0, y=6.0)
+        p2.db_change_object(m2.location.id, location, m2.vtType, m2.id)
+        self.assertEquals((m2.location.x, m2.location.y), (1.0, 2.0))
+        self.assertEquals(p2.modules[m2.id].location.x, 5.0)
+
+        # validation doesn't change the shared modules
+        states = [(m.is_valid, [f.is_valid for f in m.functions])
+                  for m in (m1, m2, m3)]
+        p2.validate(False)
+        self.assertEquals([(m.is_valid, [f.is_valid for f in m.functions])
+                           for m in (m1, m2, m3)],
+                          states)
+        self.assertIs(p1.modules[m3.id], m3)
+
     def test_serialization(self):
         import vistrails.core.db.io
         p1 = self.create_default_pipeline()
@@ -0,0 +1,246 @@
+###############################################################################
+##
+## Copyright (C) 2011-2014, NYU-Poly.
+## Copyright (C) 2006-2011, University of Utah. 
+## All rights reserved.
+## Contact: contact@vistrails.org
+##
+## This file is part of VisTrails.
+##
+## "Redistribution and use in source and binary forms, with or without 
+## modification, are permitted provided that the following conditions are met:
+##
+##  - Redistributions of source code must retain the above copyright notice, 
+##    this list of conditions and the following disclaimer.
+##  - Redistributions in binary form must reproduce the above copyright 
+##    notice, this list of conditions and the following disclaimer in the 
+##    documentation and/or other materials provided with the distribution.
+##  - Neither the name of the University of Utah nor the names of its 
+##    contributors may be used to endorse or promote products derived from 
+##    this software without specific prior written permission.
+##
+## THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" 
+## AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, 
+## THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR 
+## PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR 
+## CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, 
+## EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, 
+## PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; 
+## OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, 
+## WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR 
+## OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF 
+## ADVISED OF THE POSSIBILITY OF SUCH DAMAGE."
+##
+###############################################################################
+"""Cache of version pipelines used by VistrailController.
+
+Building the pipeline for a version means replaying the actions that lead
+to it, either from the root (or the closest checkpoint, see
+Vistrail.getPipeline) or from another pipeline that is already available.
+PipelineCache keeps a bounded number of pipelines around to start from,
+discarding the least recently used ones. Only pipelines that were costly
+to build (in number of replayed actions) are admitted, so that cheap ones
+don't push useful entries out.
+
+"""
+
+from vistrails.core.configuration import get_vistrails_configuration
+from vistrails.core.vistrail.pipeline import Pipeline
+
+import unittest
+
+##############################################################################
+
+class PipelineCache(object):
+    """PipelineCache maps versions to pipelines. The empty pipeline for
+    version 0 is always present. The cached pipelines should not be
+    modified; callers should copy them.
+
+    """
+
+    def __init__(self, max_size=None, min_cost=None):
+        """__init__(max_size: int, min_cost: int) -> PipelineCache
+        max_size is the number of pipelines kept, and min_cost the number
+        of actions a pipeline must have taken to build to be admitted.
+        They default to the pipelineCacheSize and pipelineCacheMinCost
+        options.
+
+        """
+        self._max_size = max_size
+        self._min_cost = min_cost
+        self._pipelines = {}
+        # version -> value of self._clock when it was last used
+        self._last_used = {}
+        self._clock = 0
+        self.clear()
+
+    def get_max_size(self):
+        if self._max_size is not None:
+            return self._max_size
+        conf = get_vistrails_configuration()
+        return getattr(conf, 'pipelineCacheSize', 32)
+
+    def get_min_cost(self):
+        if self._min_cost is not None:
+            return self._min_cost
+        conf = get_vistrails_configuration()
+        return getattr(conf, 'pipelineCacheMinCost', 10)
+
+    def clear(self):
+        """clear() -> None
+        Discards all pipelines except the empty one and resets the
+        statistics.
+
+        """
+        self._pipelines.clear()
+        self._last_used.clear()
+        self._pipelines[0] = Pipeline()
+        self._touch(0)
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __contains__(self, version):
+        return version in self._pipelines
+
+    def __len__(self):
+        return len(self._pipelines)
+
+    def __iter__(self):
+        return iter(self._pipelines)
+
+    def _touch(self, version):
+        self._clock += 1
+        self._last_used[version] = self._clock
+
+    def get(self, version):
+        """get(version: int) -> Pipeline
+        Returns the cached pipeline for version, or None, and marks it as
+        recently used.
+
+        """
+        try:
+            pipeline = self._pipelines[version]
+        except KeyError:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._touch(version)
+        return pipeline
+
+    def closest_ancestor(self, version, action_map):
+        """closest_ancestor(version: int, action_map: dict) -> (int, int)
+        Returns the closest version upstream of version that is cached
+        (at worst, version 0) and the number of actions between the two.
+        The returned pipeline counts as a hit if it is version itself,
+        and as a miss otherwise.
+
+        """
+        cost = 0
+        while version not in self._pipelines:
+            version = action_map[version].parent
+            cost += 1
+        if cost > 0:
+            self.misses += 1
+            self._touch(version)
+        else:
+            self.get(version)
+        return (version, cost)
+
+    def admits(self, cost):
+        """admits(cost: int) -> bool
+        Whether a pipeline that took cost actions to build is worth
+        caching.
+
+        """
+        return self.get_max_size() > 0 and cost >= self.get_min_cost()
+
+    def add(self, version, pipeline):
+        """add(version: int, pipeline: Pipeline) -> None
+        Stores pipeline as the most recently used entry, discarding the
+        least recently used ones if the cache is full.
+
+        """
+        self._pipelines[version] = pipeline
+        self._touch(version)
+        excess = len(self._pipelines) - self.get_max_size() - 1
+        if excess > 0:
+            old_versions = sorted((v for v in self._pipelines
+                                   if v != 0 and v != version),
+                                  key=self._last_used.__getitem__)
+            for old_version in old_versions[:excess]:
+                del self._pipelines[old_version]
+                del self._last_used[old_version]
+                self.evictions += 1
+
+    def remove(self, version):
+        if version != 0:
+            self._pipelines.pop(version, None)
+            self._last_used.pop(version, None)
+
+    def stats(self):
+        """stats() -> dict
+        Returns the number of cached pipelines, hits, misses and
+        evictions since the cache was last cleared.
+
+        """
+        return {'size': len(self._pipelines) - 1,
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions}
+
+##############################################################################
+
+class TestPipelineCache(unittest.TestCase):
+    class DummyAction(object):
+        def __init__(self, parent):
+            self.parent = parent
+
+    def test_lru(self):
+        cache = PipelineCache(max_size=2, min_cost=0)
+        for version in (1, 2):
+            cache.add(version, Pipeline())
+        self.assertIsNotNone(cache.get(1))
+        cache.add(3, Pipeline())
+        self.assertEqual(sorted(cache), [0, 1, 3])
+        self.assertIsNone(cache.get(2))
+        self.assertEqual(cache.stats(), {'size': 2, 'hits': 1,
+                                         'misses': 1, 'evictions': 1})
+
+    def test_admission(self):
+        cache = PipelineCache(max_size=2, min_cost=5)
+        self.assertFalse(cache.admits(4))
+        self.assertTrue(cache.admits(5))
+        self.assertFalse(PipelineCache(max_size=0, min_cost=0).admits(5))
+
+    def test_closest_ancestor(self):
+        action_map = dict((v, self.DummyAction(v - 1)) for v in xrange(1, 10))
+        cache = PipelineCache(max_size=2, min_cost=0)
+        self.assertEqual(cache.closest_ancestor(5, action_map), (0, 5))
+        cache.add(3, Pipeline())
+        self.assertEqual(cache.closest_ancestor(5, action_map), (3, 2))
+        self.assertEqual(cache.closest_ancestor(3, action_map), (3, 0))
+        cache.clear()
+        self.assertEqual(list(cache), [0])
+        self.assertEqual(cache.hits, 0)
+
+    def test_version_switch(self):
+        from vistrails.core.db.locator import XMLFileLocator
+        from vistrails.core.db.io import load_vistrail
+        from vistrails.core.system import vistrails_root_directory
+        from vistrails.core.vistrail.controller import VistrailController
+
+        locator = XMLFileLocator(vistrails_root_directory() +
+                                 '/tests/resources/dummy.xml')
+        (v, abstractions, thumbnails, mashups) = load_vistrail(locator)
+        controller = VistrailController(v, locator, abstractions,
+                                        thumbnails, mashups)
+        cache = controller._pipelines = PipelineCache(max_size=2,
+                                                      min_cost=1)
+        for version in [20, 36, 25, 36, 41, 20, 36]:
+            controller.do_version_switch(version, do_validate=False)
+            self.assertEqual(controller.current_pipeline,
+                             v.getPipeline(version))
+            self.assertTrue(len(cache) <= 3)
+        self.assertTrue(cache.hits > 0)
+        self.assertTrue(cache.evictions > 0)
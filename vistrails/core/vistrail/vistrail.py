@@ -38,14 +38,16 @@ import copy
 import datetime
 import getpass
 
-from vistrails.db.domain import DBVistrail
+from vistrails.db.domain import DBVistrail, DBLog
 from vistrails.db.services.io import open_vt_log_from_db, open_log_from_xml
 from vistrails.core.db.locator import DBLocator
 from vistrails.core.log.log import Log
 from vistrails.core.data_structures.graph import Graph
 from vistrails.core.data_structures.bijectivedict import Bidict
 from vistrails.core import debug
+from vistrails.core.configuration import get_vistrails_configuration
 import vistrails.core.db.io
+import vistrails.db.services.vistrail
 from vistrails.core.utils import VistrailsInternalError, \
      InvalidPipeline
 from vistrails.core.vistrail.action import Action
@@ -324,9 +326,37 @@ class Vistrail(DBVistrail):
         Returns a pipeline given a version number.
 
         """
-        workflow = vistrails.core.db.io.get_workflow(self, version)
+        interval = self.get_checkpoint_interval()
+        workflow = vistrails.core.db.io.get_workflow(
+                self, version, interval,
+                interval > 0 and self.has_tag(version))
         return workflow
 
+    def get_checkpoint_interval(self):
+        """get_checkpoint_interval() -> int
+        Returns the number of actions between materialized pipelines, as
+        set by the pipelineCheckpointInterval option (0 if disabled).
+
+        """
+        conf = get_vistrails_configuration()
+        if conf is None or not conf.check('pipelineCheckpointInterval'):
+            return 0
+        return conf.pipelineCheckpointInterval
+
+    def get_checkpoint_distance(self, version):
+        """get_checkpoint_distance(version: int) -> int
+        Returns the number of actions getPipeline(version) has to replay,
+        starting from the closest materialized pipeline.
+
+        """
+        if self.get_checkpoint_interval() > 0:
+            checkpoints = None
+        else:
+            checkpoints = {}
+        (_, actions) = vistrails.db.services.vistrail.getNearestCheckpoint(
+                self, version, checkpoints)
+        return len(actions)
+
     def get_pipeline_diff_with_connections(self, v1, v2):
         """like get_pipeline_diff but returns connection info
         Keyword arguments:
@@ -1024,17 +1054,28 @@ class Vistrail(DBVistrail):
     class InvalidAbstraction(Exception):
         pass
 
-    def get_persisted_log(self):
+    def get_persisted_log(self, versions=None, start=None, end=None):
         """
         Returns the log object for this vistrail if available
+
+        The executions can be restricted to the given versions and to
+        those started between the datetimes start and end; for .vt files
+        only these are read.
         """
         log = Log()
         if isinstance(self.locator, vistrails.core.db.locator.ZIPFileLocator):
             if self.db_log_filename is not None:
-                log = open_log_from_xml(self.db_log_filename, True)
+                log = open_log_from_xml(self.db_log_filename, True,
+                                        versions, start, end)
         if isinstance(self.locator, vistrails.core.db.locator.DBLocator):
             connection = self.locator.get_connection()
             log = open_vt_log_from_db(connection, self.db_id)
+            if versions is not None or start is not None or end is not None:
+                log = DBLog(workflow_execs=[
+                    w for w in log.db_workflow_execs
+                    if (versions is None or w.db_parent_version in versions)
+                    and (start is None or w.db_ts_start >= start)
+                    and (end is None or w.db_ts_start <= end)])
         Log.convert(log)
         return log
     
@@ -1202,6 +1243,28 @@ class TestVistrail(unittest.TestCase):
                            '/tests/resources/dummy.xml').load()
         assert v.actionChain(17, 17) == []
 
+    def test_checkpoints(self):
+        """Makes sure pipelines built from checkpoints are the same as
+        those built from the root."""
+        from vistrails.core.db.locator import XMLFileLocator
+        import vistrails.core.system
+        from vistrails.db.services.vistrail import getCheckpoints
+        v = XMLFileLocator(vistrails.core.system.vistrails_root_directory() +
+                           '/tests/resources/dummy.xml').load()
+        versions = sorted(v.actionMap.iterkeys())
+        for version in versions:
+            p1 = vistrails.core.db.io.get_workflow(v, version)
+            p2 = vistrails.core.db.io.get_workflow(v, version, 3)
+            self.assertEqual(p1, p2)
+            self.assertEqual(sorted(p1.modules), sorted(p2.modules))
+            self.assertEqual(sorted(p1.connections), sorted(p2.connections))
+        checkpoints = getCheckpoints(v)
+        self.assertTrue(checkpoints)
+        self.assertTrue(all(depth % 3 == 0
+                            for (depth, _) in checkpoints.itervalues()))
+        self.assertTrue(all(v.get_checkpoint_distance(version) < 3
+                            for version in versions))
+
     def test_get_version_negative_one(self):
         """Tests getting the 'no version' vistrail. This should raise
         VistrailsDBException.
@@ -0,0 +1,452 @@
+###############################################################################
+##
+## Copyright (C) 2011-2014, NYU-Poly.
+## Copyright (C) 2006-2011, University of Utah. 
+## All rights reserved.
+## Contact: contact@vistrails.org
+##
+## This file is part of VisTrails.
+##
+## "Redistribution and use in source and binary forms, with or without 
+## modification, are permitted provided that the following conditions are met:
+##
+##  - Redistributions of source code must retain the above copyright notice, 
+##    this list of conditions and the following disclaimer.
+##  - Redistributions in binary form must reproduce the above copyright 
+##    notice, this list of conditions and the following disclaimer in the 
+##    documentation and/or other materials provided with the distribution.
+##  - Neither the name of the University of Utah nor the names of its 
+##    contributors may be used to endorse or promote products derived from 
+##    this software without specific prior written permission.
+##
+## THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" 
+## AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, 
+## THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR 
+## PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR 
+## CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, 
+## EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, 
+## PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; 
+## OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, 
+## WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR 
+## OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF 
+## ADVISED OF THE POSSIBILITY OF SUCH DAMAGE."
+##
+###############################################################################
+"""Pool of pre-initialized worker processes executing workflows.
+
+Workers are forked from the running application once it has loaded its
+packages, so each of them starts with the module registry already built
+and only has to load and execute the workflows it is given. Jobs wait in
+a single queue; one dispatcher thread per worker feeds it jobs, enforces
+the per-job timeout (replacing a worker that overran it) and records the
+statistics reported by WorkerPool.status().
+
+"""
+import multiprocessing
+import Queue
+import threading
+import time
+import traceback
+
+from vistrails.core import debug
+from vistrails.core.utils import InstanceObject
+
+import unittest
+
+################################################################################
+
+class WorkerError(Exception):
+    """A job failed in its worker; the message holds the worker traceback"""
+    pass
+
+class WorkerTimeout(WorkerError):
+    """A job did not finish within its timeout; its worker was replaced"""
+    pass
+
+class PoolJob(object):
+    """A call submitted to a WorkerPool.
+
+    wait() blocks until the job is done; get() returns its result or
+    raises the WorkerError it failed with.
+
+    """
+    def __init__(self, func, args, kwargs, timeout):
+        self.func = func
+        self.args = args
+        self.kwargs = kwargs
+        self.timeout = timeout
+        self.submitted = time.time()
+        self.started = None
+        self.finished = None
+        self.result = None
+        self.error = None
+        self._done = threading.Event()
+
+    def done(self):
+        return self._done.is_set()
+
+    def wait(self, timeout=None):
+        self._done.wait(timeout)
+        return self._done.is_set()
+
+    def get(self, timeout=None):
+        if not self.wait(timeout):
+            raise WorkerTimeout("Job did not finish in %s seconds" % timeout)
+        if self.error is not None:
+            raise self.error
+        return self.result
+
+    def _finish(self, finished, result=None, error=None):
+        self.finished = finished
+        self.result = result
+        self.error = error
+        self._done.set()
+
+    def _get_latency(self):
+        if self.finished is None:
+            return None
+        return self.finished - self.submitted
+    latency = property(_get_latency)
+
+    def _get_wait_time(self):
+        if self.started is None:
+            return None
+        return self.started - self.submitted
+    wait_time = property(_get_wait_time)
+
+def _worker_main(conn, initializer):
+    """Loop of a worker process: runs (func, args, kwargs) received on conn
+    and sends back (True, result) or (False, traceback)."""
+    if initializer is not None:
+        initializer()
+    conn.send('ready')
+    while True:
+        try:
+            job = conn.recv()
+        except EOFError:
+            break
+        if job is None:
+            break
+        func, args, kwargs = job
+        try:
+            reply = (True, func(*args, **kwargs))
+        except Exception:
+            reply = (False, traceback.format_exc())
+        try:
+            conn.send(reply)
+        except Exception, e:
+            # the result could not be pickled; nothing has been written yet
+            conn.send((False, "Cannot send result back: %s" %
+                       debug.format_exception(e)))
+    conn.close()
+
+class _Worker(object):
+    def __init__(self, initializer):
+        self.conn, child_conn = multiprocessing.Pipe()
+        self.process = multiprocessing.Process(target=_worker_main,
+                                               args=(child_conn, initializer))
+        self.process.daemon = True
+        self.process.start()
+        child_conn.close()
+
+    def wait_ready(self):
+        self.conn.recv()
+
+    def stop(self, kill=False):
+        if not kill:
+            try:
+                self.conn.send(None)
+            except (IOError, EOFError):
+                pass
+            self.process.join(5)
+        if self.process.is_alive():
+            self.process.terminate()
+            self.process.join()
+        self.conn.close()
+
+class WorkerPool(object):
+    """WorkerPool(size: int, timeout: float, initializer: callable)
+
+    Executes picklable calls on 'size' worker processes (one per CPU by
+    default). 'timeout' is the default number of seconds a job may run
+    (None for no limit) and 'initializer' is called in each new worker
+    before it accepts jobs.
+
+    """
+    def __init__(self, size=None, timeout=None, initializer=None):
+        if size is None:
+            size = multiprocessing.cpu_count()
+        self.size = max(1, size)
+        self.timeout = timeout
+        self.initializer = initializer
+        self._jobs = Queue.Queue()
+        self._threads = []
+        self._lock = threading.Lock()
+        self._running = 0
+        self._completed = 0
+        self._failed = 0
+        self._timeouts = 0
+        self._restarts = 0
+        self._total_latency = 0.0
+        self._max_latency = 0.0
+        self._total_wait = 0.0
+
+    def start(self):
+        """start() -> None
+        Starts the workers and waits for them to be ready.
+
+        """
+        # fork every worker before starting any dispatcher thread
+        workers = [_Worker(self.initializer) for i in xrange(self.size)]
+        for worker in workers:
+            worker.wait_ready()
+        for worker in workers:
+            thread = threading.Thread(target=self._dispatch, args=(worker,))
+            thread.daemon = True
+            thread.start()
+            self._threads.append(thread)
+
+    def shutdown(self):
+        """shutdown() -> None
+        Stops the workers once the queued jobs are done.
+
+        """
+        for thread in self._threads:
+            self._jobs.put(None)
+        for thread in self._threads:
+            thread.join()
+        self._threads = []
+
+    def submit(self, func, args=(), kwargs=None, timeout=None):
+        """submit(func: callable, args: tuple, kwargs: dict,
+                  timeout: float) -> PoolJob
+        Queues the call func(*args, **kwargs). func has to be picklable,
+        i.e. defined at the top level of a module.
+
+        """
+        if kwargs is None:
+            kwargs = {}
+        if timeout is None:
+            timeout = self.timeout
+        job = PoolJob(func, args, kwargs, timeout)
+        self._jobs.put(job)
+        return job
+
+    def run(self, func, args=(), kwargs=None, timeout=None):
+        """run(func: callable, args: tuple, kwargs: dict,
+               timeout: float) -> result
+        Runs func(*args, **kwargs) on a worker and returns its result.
+
+        """
+        return self.submit(func, args, kwargs, timeout).get()
+
+    def status(self):
+        """status() -> dict
+        Returns the size of the pool, the number of queued and running
+        jobs, counts of finished jobs, and the mean and maximum latency
+        (time from submission to completion, in seconds).
+
+        """
+        with self._lock:
+            finished = self._completed + self._failed
+            return {'workers': len(self._threads),
+                    'queued': self._jobs.qsize(),
+                    'running': self._running,
+                    'completed': self._completed,
+                    'failed': self._failed,
+                    'timeouts': self._timeouts,
+                    'restarts': self._restarts,
+                    'mean_latency': (self._total_latency / finished
+                                     if finished else 0.0),
+                    'max_latency': self._max_latency,
+                    'mean_wait': (self._total_wait / finished
+                                  if finished else 0.0)}
+
+    def _dispatch(self, worker):
+        while True:
+            job = self._jobs.get()
+            if job is None:
+                worker.stop()
+                break
+            with self._lock:
+                self._running += 1
+            job.started = time.time()
+            result = error = None
+            try:
+                try:
+                    worker.conn.send((job.func, job.args, job.kwargs))
+                except (IOError, EOFError):
+                    raise
+                except Exception, e:
+                    # pickling failed before anything was sent
+                    raise WorkerError("Cannot send job to worker: %s" %
+                                      debug.format_exception(e))
+                if not worker.conn.poll(job.timeout):
+                    worker.stop(kill=True)
+                    worker = self._replace_worker(timeout=True)
+                    raise WorkerTimeout("Job did not finish in %s seconds" %
+                                        job.timeout)
+                ok, value = worker.conn.recv()
+                if ok:
+                    result = value
+                else:
+                    raise WorkerError(value)
+            except (IOError, EOFError), e:
+                error = WorkerError("Worker process died: %s" %
+                                    debug.format_exception(e))
+                worker = self._restart_worker(worker)
+            except WorkerError, e:
+                error = e
+            except Exception, e:
+                # e.g. the reply could not be unpickled; the worker is in
+                # an unknown state
+                error = WorkerError(debug.format_exception(e))
+                worker = self._restart_worker(worker)
+            finished = time.time()
+            with self._lock:
+                self._running -= 1
+                if error is None:
+                    self._completed += 1
+                else:
+                    self._failed += 1
+                self._total_latency += finished - job.submitted
+                self._max_latency = max(self._max_latency,
+                                        finished - job.submitted)
+                self._total_wait += job.wait_time
+            job._finish(finished, result, error)
+            if worker is None:
+                break
+
+    def _restart_worker(self, worker):
+        """_restart_worker(worker: _Worker) -> _Worker
+        Kills the worker and starts a new one, returning None if that
+        fails; the dispatcher then stops and the pool has one fewer
+        worker.
+
+        """
+        worker.stop(kill=True)
+        try:
+            return self._replace_worker()
+        except Exception, e:
+            debug.critical("Cannot start a new worker process", e)
+            return None
+
+    def _replace_worker(self, timeout=False):
+        with self._lock:
+            self._restarts += 1
+            if timeout:
+                self._timeouts += 1
+        worker = _Worker(self.initializer)
+        worker.wait_ready()
+        return worker
+
+################################################################################
+
+def summarize_run(run):
+    """summarize_run(run: InstanceObject) -> InstanceObject
+    Returns a picklable copy of an interpreter result: the ids of the
+    modules, their error messages and executed flags.
+
+    """
+    return InstanceObject(objects=dict.fromkeys(run.objects),
+                          errors=dict((i, debug.format_exception(e))
+                                      for i, e in run.errors.iteritems()),
+                          executed=dict(run.executed),
+                          workflow_info=getattr(run, 'workflow_info', None),
+                          job=getattr(run, 'job', None))
+
+def run_workflows(w_list, parameters='', update_vistrail=True,
+                  extra_info=None, reason='Console Mode Execution'):
+    """run_workflows(w_list: list of (locator, version), parameters: str,
+                     update_vistrail: bool, extra_info: dict,
+                     reason: str) -> list of InstanceObject
+    Job running console_mode.run_and_get_results() in a worker, returning
+    the results as summarized by summarize_run().
+
+    """
+    from vistrails.core.console_mode import run_and_get_results
+    results = run_and_get_results(w_list, parameters,
+                                  update_vistrail=update_vistrail,
+                                  extra_info=extra_info, reason=reason)
+    return [summarize_run(run) for run in results]
+
+################################################################################
+
+def _test_job(seconds, fail=False):
+    time.sleep(seconds)
+    if fail:
+        raise ValueError("failing as requested")
+    return seconds
+
+def _unpickle_error():
+    raise ValueError("cannot unpickle")
+
+class _BadResult(object):
+    def __reduce__(self):
+        return _unpickle_error, ()
+
+def _test_bad_result():
+    return _BadResult()
+
+class TestWorkerPool(unittest.TestCase):
+    def test_pool(self):
+        pool = WorkerPool(2)
+        pool.start()
+        try:
+            jobs = [pool.submit(_test_job, (0.1 * i,)) for i in xrange(4)]
+            self.assertEqual([job.get() for job in jobs],
+                             [0.1 * i for i in xrange(4)])
+            self.assertRaises(WorkerError, pool.run, _test_job, (0, True))
+            status = pool.status()
+            self.assertEqual(status['workers'], 2)
+            self.assertEqual(status['queued'], 0)
+            self.assertEqual(status['completed'], 4)
+            self.assertEqual(status['failed'], 1)
+            self.assertTrue(status['max_latency'] >= 0.3)
+        finally:
+            pool.shutdown()
+
+    def test_timeout(self):
+        pool = WorkerPool(1, timeout=0.5)
+        pool.start()
+        try:
+            job = pool.submit(_test_job, (30,))
+            self.assertRaises(WorkerTimeout, job.get)
+            self.assertTrue(job.latency < 10)
+            # the worker was replaced and still runs jobs
+            self.assertEqual(pool.run(_test_job, (0,)), 0)
+            status = pool.status()
+            self.assertEqual((status['timeouts'], status['restarts']), (1, 1))
+        finally:
+            pool.shutdown()
+
+    def test_bad_result(self):
+        pool = WorkerPool(1)
+        pool.start()
+        try:
+            self.assertRaises(WorkerError, pool.run, _test_bad_result)
+            # the worker was replaced and still runs jobs
+            self.assertEqual(pool.run(_test_job, (0,)), 0)
+            status = pool.status()
+            self.assertEqual(status['running'], 0)
+            self.assertEqual((status['failed'], status['restarts']), (1, 1))
+        finally:
+            pool.shutdown()
+
+    def test_workflow(self):
+        import os
+        from vistrails.core.db.locator import XMLFileLocator
+        import vistrails.core.system
+        locator = XMLFileLocator(os.path.join(
+                vistrails.core.system.vistrails_root_directory(),
+                'tests', 'resources', 'dummy.xml'))
+        pool = WorkerPool(1)
+        pool.start()
+        try:
+            results = pool.run(run_workflows, ([(locator, 'int chain')],),
+                               {'update_vistrail': False})
+        finally:
+            pool.shutdown()
+        self.assertEqual(len(results), 1)
+        self.assertEqual(results[0].errors, {})
+        self.assertTrue(results[0].objects)
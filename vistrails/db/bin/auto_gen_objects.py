@@ -125,6 +125,12 @@ class Field(object):
     def getPrivateName(self):
         return '_%s' % Field.getFieldName(self)
 
+    def getDeletedName(self):
+        return 'db_deleted_%s' % Field.getRegularName(self)
+
+    def getPrivateDeletedName(self):
+        return '_%s' % Field.getDeletedName(self)
+
     def getMapping(self):
         try:
             return self.params['mapping']
@@ -345,6 +351,20 @@ class Object(object):
     def getChildren(self):
         return 'db_children'
 
+    def hasSlots(self):
+        """Whether the class can be generated with __slots__.
+
+        Objects whose domain subclasses also derive from another generated
+        class (e.g. Group derives from both DBGroup and Module) must set
+        slots="false" in the spec on one side, since two bases with slots
+        cannot be combined.
+        """
+        try:
+            return self.params['slots'] != 'false'
+        except KeyError:
+            pass
+        return True
+
     def getKey(self):
         for property in self.properties:
             if property.isPrimaryKey():
@@ -59,11 +59,13 @@ DOMAIN_INIT = """from auto_gen import *"""
 PERSISTENCE_INIT = \
 """from xml.auto_gen import XMLDAOListBase
 from sql.auto_gen import SQLDAOListBase
+from bin.auto_gen import BINDAOListBase
 
 class DAOList(dict):
     def __init__(self):
         self['xml'] = XMLDAOListBase()
         self['sql'] = SQLDAOListBase()
+        self['bin'] = BINDAOListBase()
 
 """
 COPYRIGHT_NOTICE = \
@@ -148,7 +150,7 @@ def indent_python(fname):
                      stdout=subprocess.PIPE).communicate()
 
 def run_template(template_fname, objects, version, version_string, output_file,
-                 indent=False):
+                 indent=False, **kwargs):
     [prefix, suffix] = os.path.basename(template_fname).split('.', 1)
     (fd, p_fname) = tempfile.mkstemp(prefix=prefix, suffix=suffix)
     os.close(fd)
@@ -159,7 +161,8 @@ def run_template(template_fname, objects, version, version_string, output_file,
         f = open(output_file, 'w')
         f.write(template.render(objs=objects,
                                 version=version,
-                                version_string=version_string))
+                                version_string=version_string,
+                                **kwargs))
         f.close()
         if indent:
             indent_python(output_file)
@@ -195,6 +198,7 @@ def dirStructure(baseDir):
     dirs['schemas'] = os.path.join(dirs['base'], 'schemas')
     dirs['xmlPersistence'] = os.path.join(dirs['persistence'], 'xml')
     dirs['sqlPersistence'] = os.path.join(dirs['persistence'], 'sql')
+    dirs['binPersistence'] = os.path.join(dirs['persistence'], 'bin')
     dirs['xmlSchema'] = os.path.join(dirs['schemas'], 'xml')
     dirs['sqlSchema'] = os.path.join(dirs['schemas'], 'sql')
     return dirs
@@ -222,11 +226,14 @@ def main(argv=None):
     options = {}
     objects = None
 
-    optionsUsage = {'a': ('generate all database information (-p -s -x)', 
+    optionsUsage = {'a': ('generate all database information (-p -s -x -c)', 
                           False),
+                    'c': ('generate binary persistence classes', False),
                     'b:': ('base directory', False, 'dir'),
                     'd:': ('versions directory', False, 'dir'),
                     'p': ('generate python domain classes', False),
+                    'l': ('generate python domain classes with __slots__ '
+                          '(implied for versions >= 1.0.4)', False),
                     's': ('generate sql schema and persistence classes', False),
                     'x': ('generate xml schema and persistence classes', False),
                     'v:': ('vistrail version tag', True, 'version'),
@@ -263,6 +270,9 @@ def main(argv=None):
     # make sure version use dot-style
     assert(len(version.split('.'))==3)
     versionName = 'v' + version.replace('.', '_')
+    # the domain classes of 1.0.4 and later are written to use __slots__
+    slots = bool(options['l']) or \
+        tuple(int(v) for v in version.split('.')) >= (1, 0, 4)
     if options['d']:
         versionsDir = options['d']
     else:
@@ -305,7 +315,7 @@ def main(argv=None):
             objects = parser.parse(versionDirs['specs'])
         run_template('templates/domain.py.mako', objects, version, versionName,
                      os.path.join(versionDirs['domain'], 'auto_gen.py'),
-                     True)
+                     True, slots=slots)
 
         if not options['n']:
             domainFile = os.path.join(baseDirs['domain'], '__init__.py')
@@ -372,6 +382,19 @@ def main(argv=None):
                      os.path.join(versionDirs['sqlPersistence'], 'auto_gen.py'),
                      True)
 
+    if options['c'] or options['a']:
+        # generate binary dao objects
+        print "generating binary dao objects..."
+        if objects is None:
+            parser = AutoGenParser()
+            objects = parser.parse(versionDirs['specs'])
+        # the binary format stores what the xml format stores
+        bin_objects = xml_gen_objects.convert(objects)
+
+        run_template('templates/bin.py.mako', bin_objects, version, versionName,
+                     os.path.join(versionDirs['binPersistence'], 'auto_gen.py'),
+                     False)
+
     if not options['n']:
         domainFile = os.path.join(baseDirs['persistence'], '__init__.py')
         f = open(domainFile, 'w')
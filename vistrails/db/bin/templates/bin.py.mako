@@ -0,0 +1,196 @@
+<%text>###############################################################################
+##
+## Copyright (C) 2011-2014, NYU-Poly.
+## Copyright (C) 2006-2011, University of Utah. 
+## All rights reserved.
+## Contact: contact@vistrails.org
+##
+## This file is part of VisTrails.
+##
+## "Redistribution and use in source and binary forms, with or without 
+## modification, are permitted provided that the following conditions are met:
+##
+##  - Redistributions of source code must retain the above copyright notice, 
+##    this list of conditions and the following disclaimer.
+##  - Redistributions in binary form must reproduce the above copyright 
+##    notice, this list of conditions and the following disclaimer in the 
+##    documentation and/or other materials provided with the distribution.
+##  - Neither the name of the University of Utah nor the names of its 
+##    contributors may be used to endorse or promote products derived from 
+##    this software without specific prior written permission.
+##
+## THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" 
+## AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, 
+## THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR 
+## PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR 
+## CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, 
+## EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, 
+## PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; 
+## OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, 
+## WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR 
+## OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF 
+## ADVISED OF THE POSSIBILITY OF SUCH DAMAGE."
+##
+###############################################################################
+</%text>
+"""generated automatically by auto_dao.py"""
+
+from bin_dao import BINDAO
+from vistrails.db.versions.${version_string}.domain import *
+<%!
+def read_child(prop, target):
+    if prop.isReference():
+        return "%s = self.getDao('%s').fromBin(reader)" % (
+            target, prop.getReference())
+    return "%s = reader.read_value()" % target
+
+def write_child(prop, source):
+    if prop.isReference():
+        return "self.getDao('%s').toBin(%s, writer)" % (
+            prop.getReference(), source)
+    return "writer.write_value(%s)" % source
+%>
+% for obj in objs:
+class ${obj.getClassName()}BINDAOBase(BINDAO):
+
+    def __init__(self, daoList):
+        self.daoList = daoList
+
+    def getDao(self, dao):
+        return self.daoList[dao]
+
+    def fromBin(self, reader):
+        % if len(obj.getXMLAttributes()) > 0:
+        read_value = reader.read_value
+
+        # read attributes
+        % for prop in obj.getXMLAttributes():
+        ${prop.getRegularName()} = read_value()
+        % endfor
+        % endif
+        % if len(obj.getXMLElements()) + len(obj.getXMLChoices()) > 0:
+        % if len(obj.getXMLAttributes()) > 0:
+
+        % endif
+        # read children
+        % for field in obj.getXMLElements() + obj.getXMLChoices():
+        % if field.isChoice():
+        % if field.isPlural():
+        % if field.getPythonType() == 'hash':
+        ${field.getRegularName()} = {}
+        % else:
+        ${field.getRegularName()} = []
+        % endif
+        for i in xrange(reader.read_count()):
+            _tag = reader.read_count()
+            % for idx, prop in enumerate(field.getXMLProperties()):
+            ${'if' if idx == 0 else 'elif'} _tag == ${idx + 1}:
+                ${read_child(prop, '_data')}
+            % endfor
+            else:
+                continue
+            % if field.getPythonType() == 'hash':
+            ${field.getRegularName()}[_data.${field.getReferencedObject().getKey().getFieldName()}] = _data
+            % else:
+            ${field.getRegularName()}.append(_data)
+            % endif
+        % else:
+        ${field.getRegularName()} = None
+        _tag = reader.read_count()
+        % for idx, prop in enumerate(field.getXMLProperties()):
+        ${'if' if idx == 0 else 'elif'} _tag == ${idx + 1}:
+            ${read_child(prop, field.getRegularName())}
+        % endfor
+        % endif
+        % elif field.isPlural():
+        % if field.getPythonType() == 'hash':
+        ${field.getRegularName()} = {}
+        for i in xrange(reader.read_count()):
+            ${read_child(field, '_data')}
+            ${field.getRegularName()}[_data.${field.getReferencedObject().getKey().getFieldName()}] = _data
+        % else:
+        ${field.getRegularName()} = []
+        for i in xrange(reader.read_count()):
+            ${read_child(field, '_data')}
+            ${field.getRegularName()}.append(_data)
+        % endif
+        % elif field.isReference():
+        ${field.getRegularName()} = None
+        if reader.read_count():
+            ${read_child(field, field.getRegularName())}
+        % else:
+        ${read_child(field, field.getRegularName())}
+        % endif
+        % endfor
+        % endif
+
+        obj = ${obj.getClassName()}(${', '.join(['%s=%s' % f for f in obj.getConstructorPairs()])})
+        obj.is_dirty = False
+        return obj
+
+    def toBin(self, ${obj.getRegularName()}, writer):
+        % if len(obj.getXMLAttributes()) > 0:
+        write_value = writer.write_value
+
+        # write attributes
+        % for prop in obj.getXMLAttributes():
+        write_value(${obj.getRegularName()}.${prop.getFieldName()})
+        % endfor
+        % endif
+        % if len(obj.getXMLElements()) + len(obj.getXMLChoices()) > 0:
+        % if len(obj.getXMLAttributes()) > 0:
+
+        % endif
+        # write children
+        % for field in obj.getXMLElements() + obj.getXMLChoices():
+        ${field.getRegularName()} = ${obj.getRegularName()}.${field.getFieldName()}
+        % if field.isChoice():
+        % if field.isPlural():
+        writer.write_count(len(${field.getRegularName()}))
+        for ${field.getSingleName()} in ${field.getRegularIterator()}:
+            % for idx, prop in enumerate(field.getXMLProperties()):
+            ${'if' if idx == 0 else 'elif'} ${field.getSingleName()}.vtType == '${prop.getReference()}':
+                writer.write_count(${idx + 1})
+                ${write_child(prop, field.getSingleName())}
+            % endfor
+            else:
+                writer.write_count(0)
+        % else:
+        % for idx, prop in enumerate(field.getXMLProperties()):
+        ${'if' if idx == 0 else 'elif'} ${field.getRegularName()} is not None and ${field.getRegularName()}.vtType == '${prop.getReference()}':
+            writer.write_count(${idx + 1})
+            ${write_child(prop, field.getRegularName())}
+        % endfor
+        else:
+            writer.write_count(0)
+        % endif
+        % elif field.isPlural():
+        writer.write_count(len(${field.getRegularName()}))
+        for ${field.getSingleName()} in ${field.getRegularIterator()}:
+            ${write_child(field, field.getSingleName())}
+        % elif field.isReference():
+        if ${field.getRegularName()} is not None:
+            writer.write_count(1)
+            ${write_child(field, field.getRegularName())}
+        else:
+            writer.write_count(0)
+        % else:
+        ${write_child(field, field.getRegularName())}
+        % endif
+        % endfor
+        % endif
+
+% endfor
+"""generated automatically by auto_dao.py"""
+
+class BINDAOListBase(dict):
+
+    def __init__(self, daos=None):
+        if daos is not None:
+            dict.update(self, daos)
+
+        % for obj in objs:
+        if '${obj.getRegularName()}' not in self:
+            self['${obj.getRegularName()}'] = \
+                ${obj.getClassName()}BINDAOBase(self)
+        % endfor
@@ -25,6 +25,24 @@ def shouldIgnoreIndexDelete(index):
     if type(index) == type([]):
         return index[0][0] == '!'
     return index[0] == '!'
+
+def useSlots(obj):
+    return slots and obj.hasSlots()
+
+def getSlotNames(obj):
+    # __dict__ keeps the domain subclasses (and __class__ assignment in
+    # their convert() methods) working; it is only allocated for objects
+    # that get other attributes
+    names = ['__dict__', '__weakref__', 'is_dirty', 'is_new']
+    for field in obj.getPythonFields():
+        names.append(field.getPrivateName())
+        if field.isReference() and not field.isInverse():
+            names.append(field.getPrivateDeletedName())
+        if field.isPlural():
+            for index in field.getAllIndices():
+                names.append('db_%s_%s_index' % (field.getRegularName(),
+                                                 getIndexName(index)))
+    return names
 %> \\
 <%text>###############################################################################
 ##
@@ -65,15 +83,57 @@ def shouldIgnoreIndexDelete(index):
 
 import copy
 
+% if slots:
+class LazyList(object):
+    """Descriptor for a list attribute that is stored in a slot and only
+    allocated when it is first used."""
+
+    def __init__(self, name):
+        self.name = name
+
+    def __get__(self, obj, cls=None):
+        if obj is None:
+            return self
+        try:
+            return getattr(obj, self.name)
+        except AttributeError:
+            value = []
+            setattr(obj, self.name, value)
+            return value
+
+    def __set__(self, obj, value):
+        setattr(obj, self.name, value)
+
+    def __delete__(self, obj):
+        try:
+            delattr(obj, self.name)
+        except AttributeError:
+            pass
+
+% endif
 % for obj in objs:
 class ${obj.getClassName()}(object):
 
     vtType = '${obj.getRegularName()}'
+    % if useSlots(obj):
+
+    __slots__ = (
+        % for name in getSlotNames(obj):
+        '${name}',
+        % endfor
+        )
+    % for field in obj.getPythonFields():
+    % if field.isReference() and not field.isInverse():
+    ${field.getDeletedName()} = LazyList('${field.getPrivateDeletedName()}')
+    % endif
+    % endfor
+    % endif
 
     def __init__(self, ${', '.join(['%s=None' % n \
                                     for n in obj.getConstructorNames()])}):
         % for field in obj.getPythonFields():
-        % if field.isReference() and not field.isInverse():
+        % if field.isReference() and not field.isInverse() and \
+                not useSlots(obj):
         self.db_deleted_${field.getRegularName()} = []
         % endif
         % if field.isPlural():
@@ -109,7 +169,8 @@ class ${obj.getClassName()}(object):
     def __copy__(self):
         return ${obj.getClassName()}.do_copy(self)
 
-    def do_copy(self, new_ids=False, id_scope=None, id_remap=None):
+    def do_copy(self, new_ids=False, id_scope=None, id_remap=None,
+                shared=()):
         cp = ${obj.getClassName()}( \!
             ${',\n'.join(['%s=self.%s' % f for f in obj.getCopyNames()])})
         % for field in obj.getPythonFields():
@@ -120,6 +181,12 @@ class ${obj.getClassName()}(object):
             % else:
             cp.${field.getPrivateName()} = []
             % endif
+        elif '${field.getRegularName()}' in shared:
+            % if field.getPythonType() == 'hash':
+            cp.${field.getPrivateName()} = dict(self.${field.getPrivateName()})
+            % else:
+            cp.${field.getPrivateName()} = list(self.${field.getPrivateName()})
+            % endif
         else:
             % if field.getPythonType() == 'hash':
             % if field.shouldExpand():
@@ -339,6 +406,15 @@ class ${obj.getClassName()}(object):
     def db_deleted_children(self, remove=False):
         children = []
         % if len(obj.getNonInverseReferences()) > 0:
+        % if useSlots(obj):
+        % for ref in obj.getNonInverseReferences():
+        children.extend(getattr(self, '${ref.getPrivateDeletedName()}', ()))
+        % endfor
+        if remove:
+            % for ref in obj.getNonInverseReferences():
+            del self.${ref.getDeletedName()}
+            % endfor
+        % else:
         % for ref in obj.getNonInverseReferences():
         children.extend(self.db_deleted_${ref.getRegularName()})
         % endfor
@@ -347,6 +423,7 @@ class ${obj.getClassName()}(object):
             self.db_deleted_${ref.getRegularName()} = []
             % endfor
         % endif
+        % endif
         return children
     ## dirty method
     def has_changes(self):
@@ -41,8 +41,23 @@ def getActionChain(obj, version, start=0):
         result.append(action)
         currentId = action.db_prevId
     result.reverse()
+    loadOperations(obj, result)
     return result
 
+def loadOperations(obj, actions):
+    """loadOperations(obj, actions) -> None
+    Makes sure the operations of the given actions are there, reading
+    them if obj is a vistrail opened as a skeleton (see
+    vistrails.db.services.io.load_vistrail_operations).
+
+    """
+    unloaded = getattr(obj, 'db_unloaded_actions', None)
+    if unloaded:
+        action_ids = [a.db_id for a in actions if a.db_id in unloaded]
+        if action_ids:
+            from vistrails.db.services.io import load_vistrail_operations
+            load_vistrail_operations(obj, action_ids=action_ids)
+
 def simplify_ops(ops):
     addDict = {}
     deleteDict = {}
@@ -89,31 +104,30 @@ def getCurrentOperationDict(actions, currentOperations=None):
     for action in actions:
         for operation in action.db_operations:
             operationvtType = operation.vtType
-            d = operation.__dict__
             if operationvtType == 'add':
-                currentOperations[(d['_db_what'], 
-                                   d['_db_objectId'])] = \
+                currentOperations[(operation._db_what, 
+                                   operation._db_objectId)] = \
                                    operation
             elif operationvtType == 'delete':
-                what = d['_db_what']
-                objectId = d['_db_objectId']
+                what = operation._db_what
+                objectId = operation._db_objectId
                 t = (what, objectId)
                 try:
                     del currentOperations[t]
                 except KeyError:
-                    msg = "Illegal delete operation: %d" % d['_db_id']
+                    msg = "Illegal delete operation: %d" % operation._db_id
                     raise RuntimeError(msg)
             elif operationvtType == 'change':
-                what = d['_db_what']
-                objectId = d['_db_oldObjId']
+                what = operation._db_what
+                objectId = operation._db_oldObjId
                 t = (what, objectId)
                 try:
                     del currentOperations[t]
                 except KeyError:
-                    msg = "Illegal change operation: %d" % d['_db_id']
+                    msg = "Illegal change operation: %d" % operation._db_id
                     raise RuntimeError(msg)
                 currentOperations[(what,
-                                   d['_db_newObjId'])] = operation
+                                   operation._db_newObjId)] = operation
             else:
                 msg = "Unrecognized operation '%s'" % operation.vtType
                 raise TypeError(msg)
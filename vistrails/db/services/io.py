@@ -45,10 +45,13 @@ from vistrails.core.modules.sub_module import get_cur_abs_namespace,\
 
 import vistrails.core.requirements
 
+import hashlib
 import os.path
+import re
 import shutil
 import tempfile
 import copy
+import struct
 import zipfile
 
 from vistrails.db import VistrailsDBException
@@ -162,9 +165,144 @@ class SaveBundle(object):
 
         for m in self.mashups:
             cp.mashups.append(m)
-        
+
         return cp
 
+class LazyBundleArchive(object):
+    """LazyBundleArchive keeps track of the members of a .vt file that
+    have not been extracted to its save directory yet. Members can be
+    read straight from the zip file, or extracted one at a time when a
+    file on disk is needed.
+
+    """
+
+    def __init__(self, filename, vt_save_dir):
+        self.filename = filename
+        self.vt_save_dir = vt_save_dir
+        z = zipfile.ZipFile(filename)
+        try:
+            self.names = [name for name in z.namelist()
+                          if not name.endswith('/')]
+        finally:
+            z.close()
+        self.pending = set(self.names)
+
+    def open(self, name):
+        """open(name: str) -> file
+        Returns a file object reading member name from the zip file.
+
+        """
+        z = zipfile.ZipFile(self.filename)
+        try:
+            return z.open(name)
+        finally:
+            z.close()
+
+    def extract(self, name):
+        """extract(name: str) -> str
+        Extracts member name to the save directory, if it was not already,
+        and returns the path of the extracted file.
+
+        """
+        if name in self.pending:
+            z = zipfile.ZipFile(self.filename)
+            try:
+                z.extract(name, self.vt_save_dir)
+            finally:
+                z.close()
+            self.pending.discard(name)
+        return os.path.join(self.vt_save_dir, *name.split('/'))
+
+    def extract_all(self):
+        if self.pending:
+            z = zipfile.ZipFile(self.filename)
+            try:
+                for name in sorted(self.pending):
+                    z.extract(name, self.vt_save_dir)
+            finally:
+                z.close()
+            self.pending.clear()
+
+# Archives of the bundles opened lazily, indexed by their save directory
+_lazy_archives = {}
+
+def extract_lazy_file(filename):
+    """extract_lazy_file(filename: str) -> bool
+    Extracts filename from the .vt file it was deferred from, if it lies
+    in the save directory of a lazily opened bundle. Returns whether the
+    file was found in such a bundle.
+
+    """
+    for vt_save_dir, archive in _lazy_archives.iteritems():
+        name = os.path.relpath(filename, vt_save_dir)
+        if name.startswith(os.pardir):
+            continue
+        name = name.replace(os.sep, '/')
+        if name in archive.pending:
+            archive.extract(name)
+            return True
+    return False
+
+def extract_lazy_bundle(vt_save_dir):
+    """extract_lazy_bundle(vt_save_dir: str) -> None
+    Extracts all the deferred files of the bundle opened lazily in
+    vt_save_dir, so that the directory holds the complete bundle.
+
+    """
+    archive = _lazy_archives.pop(vt_save_dir, None)
+    if archive is not None:
+        archive.extract_all()
+
+class LazySaveBundle(SaveBundle):
+    """LazySaveBundle is the SaveBundle of a .vt file opened with
+    open_vistrail_bundle_from_zip_xml(filename, lazy=True). Only the
+    vistrail is loaded up front; the log, abstractions, thumbnails and
+    mashups are read from the zip file the first time they are accessed.
+    Once loaded (or set), they behave as regular attributes.
+
+    """
+
+    _lazy_attrs = ('log', 'abstractions', 'thumbnails', 'mashups')
+
+    def __init__(self, bundle_type, vistrail, archive):
+        SaveBundle.__init__(self, bundle_type, vistrail)
+        self._archive = archive
+        for attr in self._lazy_attrs:
+            delattr(self, attr)
+
+    def __getattr__(self, name):
+        if name not in self._lazy_attrs:
+            raise AttributeError(name)
+        value = getattr(self, '_load_%s' % name)()
+        setattr(self, name, value)
+        return value
+
+    def _members(self, predicate):
+        return [name for name in self._archive.names if predicate(name)]
+
+    def _load_log(self):
+        if 'log' not in self._archive.names:
+            return None
+        return open_log_from_xml(self._archive.open('log'), True)
+
+    def _load_abstractions(self):
+        return [self._archive.extract(name) for name in self._members(
+                lambda n: n.rsplit('/', 1)[-1].startswith('abstraction_'))]
+
+    def _load_thumbnails(self):
+        return [self._archive.extract(name) for name in self._members(
+                lambda n: n.startswith('thumbs/') and n.endswith('.png'))]
+
+    def _load_mashups(self):
+        return [open_mashuptrail_from_xml(self._archive.open(name))
+                for name in self._members(
+                lambda n: n.startswith('mashups/') and n.count('/') == 1)]
+
+    def get_db_objs(self):
+        """Gets a list containing only the DB* objects already loaded"""
+        return [obj for obj in SaveBundle.get_db_objs(self)
+                if obj is not self._archive]
+
 def format_prepared_statement(statement):
     """format_prepared_statement(statement: str) -> str
     Formats a prepared statement for compatibility with the currently
@@ -572,9 +710,128 @@ def save_to_xml(obj, filename, version=None):
         raise VistrailsDBException("cannot save object of type "
                                    "'%s' to xml" % type)
 
-def open_bundle_from_zip_xml(bundle_type, filename):
+# Binary files start with BIN_MAGIC followed by the schema version and
+# the type of the object, each prefixed by its length in one byte. The
+# encoding of the object itself belongs to the schema version's DAOs.
+BIN_MAGIC = 'VTBIN\x01'
+
+def get_bin_translators():
+    return {DBVistrail.vtType: (translate_vistrail,
+                                vistrails.db.services.vistrail.update_id_scope),
+            DBWorkflow.vtType: (translate_workflow,
+                                vistrails.db.services.workflow.update_id_scope),
+            DBLog.vtType: (translate_log,
+                           vistrails.db.services.log.update_id_scope),
+            DBRegistry.vtType: (translate_registry,
+                                vistrails.db.services.registry.update_id_scope)}
+
+def is_bin_file(filename):
+    """is_bin_file(filename: str) -> bool
+    Checks whether filename starts like a binary file.
+
+    """
+    f = open(filename, 'rb')
+    try:
+        return f.read(len(BIN_MAGIC)) == BIN_MAGIC
+    finally:
+        f.close()
+
+def read_bin_header(data):
+    """read_bin_header(data: str) -> (str, str, int)
+    Returns the schema version and object type of the binary encoded data
+    and the offset where the object starts.
+
+    """
+    if not data.startswith(BIN_MAGIC):
+        raise VistrailsDBException("Not a binary VisTrails file")
+    pos = len(BIN_MAGIC)
+    fields = []
+    for i in xrange(2):
+        if pos >= len(data):
+            raise VistrailsDBException("Truncated binary VisTrails file")
+        n = ord(data[pos])
+        fields.append(data[pos + 1:pos + 1 + n])
+        pos += 1 + n
+    return fields[0], fields[1], pos
+
+def write_bin_header(f, version, obj_type):
+    f.write(BIN_MAGIC)
+    for field in (version, obj_type):
+        f.write(chr(len(field)))
+        f.write(field)
+
+def open_from_bin(filename, type):
+    """open_from_bin(filename: str, type: str) -> DB*
+    Opens a vistrail, workflow, log or registry saved by save_to_bin.
+
+    """
+    translators = get_bin_translators()
+    if type not in translators:
+        raise VistrailsDBException("cannot open object of type "
+                                   "'%s' from binary file" % type)
+    f = open(filename, 'rb')
+    try:
+        data = f.read()
+    finally:
+        f.close()
+    (version, obj_type, pos) = read_bin_header(data)
+    if obj_type != type:
+        raise VistrailsDBException("File contains a %s, not a %s" % \
+                                       (obj_type, type))
+    try:
+        daoList = getVersionDAO(version)
+    except VistrailsDBException:
+        raise VistrailsDBException(
+            "This file was created by a newer version of VisTrails "
+            "and cannot be opened.")
+    if 'bin' not in daoList:
+        raise VistrailsDBException("Binary format is not supported for "
+                                   "version %s" % version)
+    try:
+        obj = daoList.open_from_bin(data, type, pos)
+    except (IndexError, ValueError, struct.error), e:
+        raise VistrailsDBException("Error when reading binary file: %s" % e)
+    (translate, update_id_scope) = translators[type]
+    obj = translate(obj, version)
+    update_id_scope(obj)
+    return obj
+
+def save_to_bin(obj, filename, version=None):
+    """save_to_bin(obj: DB*, filename: str, version: str) -> DB*
+    Saves a vistrail, workflow, log or registry to the compact binary
+    format of schema version (the current one by default).
+
+    """
+    translators = get_bin_translators()
+    if obj.vtType not in translators:
+        raise VistrailsDBException("cannot save object of type "
+                                   "'%s' to binary file" % obj.vtType)
+    (translate, update_id_scope) = translators[obj.vtType]
+    if version is None:
+        version = currentVersion
+    daoList = getVersionDAO(version)
+    if 'bin' not in daoList:
+        raise VistrailsDBException("Binary format is not supported for "
+                                   "version %s" % version)
+    if not obj.db_version:
+        obj.db_version = currentVersion
+    # see save_vistrail_to_xml
+    current_action = getattr(obj, 'db_currentVersion', None)
+    obj = translate(obj, obj.db_version, version)
+    f = open(filename, 'wb')
+    try:
+        write_bin_header(f, version, obj.vtType)
+        daoList.save_to_bin(obj, f)
+    finally:
+        f.close()
+    obj = translate(obj, version)
+    if current_action is not None:
+        obj.db_currentVersion = current_action
+    return obj
+
+def open_bundle_from_zip_xml(bundle_type, filename, lazy=False):
     if bundle_type == DBVistrail.vtType:
-        return open_vistrail_bundle_from_zip_xml(filename)
+        return open_vistrail_bundle_from_zip_xml(filename, lazy)
     else:
         raise VistrailsDBException("cannot open bundle of type '%s' from zip" %\
                                        bundle_type)
@@ -653,6 +910,7 @@ def close_zip_xml(temp_dir):
     """
     if temp_dir is None:
         return
+    _lazy_archives.pop(temp_dir, None)
     if not os.path.isdir(temp_dir):
         if os.path.isfile(temp_dir):
             os.remove(temp_dir)
@@ -680,10 +938,132 @@ def unserialize(str, obj_type):
 ##############################################################################
 # Vistrail I/O
 
-def open_vistrail_from_xml(filename):
-    """open_vistrail_from_xml(filename) -> Vistrail"""
-    tree = ElementTree.parse(filename)
+def get_translation_cache_filename(filename):
+    """get_translation_cache_filename(filename: str) -> str
+    Returns the file where the translation of the given vistrail file to
+    the current schema is cached, or None if the translationCache option
+    is not set. The name is a hash of the contents of the file, so
+    copies of a file share their translation and changing the file
+    invalidates it.
+
+    """
+    from vistrails.core.configuration import get_vistrails_configuration
+    conf = get_vistrails_configuration()
+    if conf is None or not conf.check('translationCache'):
+        return None
+    cache_dir = vistrails.core.system.get_vistrails_directory(
+        'translationCacheDir', conf)
+    if cache_dir is None:
+        return None
+    sha1 = hashlib.sha1(currentVersion + '\0')
+    f = open(filename, 'rb')
+    try:
+        for data in iter(lambda: f.read(1 << 16), ''):
+            sha1.update(data)
+    finally:
+        f.close()
+    return os.path.join(cache_dir, sha1.hexdigest() + '.vtbin')
+
+def open_translated_vistrail(cache_filename):
+    """open_translated_vistrail(cache_filename: str) -> DBVistrail
+    Returns the vistrail cached in cache_filename by
+    save_translated_vistrail, or None if there is no usable one.
+
+    """
+    if not os.path.isfile(cache_filename):
+        return None
+    try:
+        return open_from_bin(cache_filename, DBVistrail.vtType)
+    except (VistrailsDBException, IOError), e:
+        debug.warning("Ignoring invalid translation cache file '%s'" %
+                      cache_filename, e)
+        return None
+
+def save_translated_vistrail(vistrail, cache_filename):
+    """save_translated_vistrail(vistrail: DBVistrail,
+                                cache_filename: str) -> None
+    Stores a translated vistrail in the translation cache.
+
+    """
+    try:
+        save_cache_file(vistrail, cache_filename)
+    except (VistrailsDBException, EnvironmentError), e:
+        debug.warning("Could not write translation cache file '%s'" %
+                      cache_filename, e)
+
+def open_cached_registry(cache_filename):
+    """open_cached_registry(cache_filename: str) -> DBRegistry
+    Returns the registry snapshot stored in cache_filename by
+    save_cached_registry, or None if there is no usable one.
+
+    """
+    if not os.path.isfile(cache_filename):
+        return None
+    try:
+        return open_from_bin(cache_filename, DBRegistry.vtType)
+    except (VistrailsDBException, IOError), e:
+        debug.warning("Ignoring invalid registry cache file '%s'" %
+                      cache_filename, e)
+        return None
+
+def save_cached_registry(registry, cache_filename):
+    """save_cached_registry(registry: DBRegistry,
+                            cache_filename: str) -> None
+    Stores a snapshot of the module registry in the registry cache.
+
+    """
+    try:
+        save_cache_file(registry, cache_filename)
+    except (VistrailsDBException, EnvironmentError), e:
+        debug.warning("Could not write registry cache file '%s'" %
+                      cache_filename, e)
+
+def save_cache_file(obj, cache_filename):
+    """save_cache_file(obj: DB*, cache_filename: str) -> None
+    Saves obj to the binary format for a cache. The file is written
+    under a temporary name first so that concurrent readers never see a
+    partial file.
+
+    """
+    cache_dir = os.path.dirname(cache_filename)
+    if not os.path.isdir(cache_dir):
+        os.makedirs(cache_dir)
+    (fd, tmp_filename) = tempfile.mkstemp(dir=cache_dir, suffix='.tmp')
+    os.close(fd)
+    try:
+        save_to_bin(obj, tmp_filename)
+        os.rename(tmp_filename, cache_filename)
+    except:
+        os.remove(tmp_filename)
+        raise
+
+def open_vistrail_from_xml(filename, skeleton=False):
+    """open_vistrail_from_xml(filename, skeleton=False) -> Vistrail
+
+    If skeleton is True, only the version tree is read: the actions have
+    no operations until load_vistrail_operations() is called, which
+    happens automatically when a version that needs them is materialized
+    or when the vistrail is saved. This is only possible for files in the
+    current schema version; older ones are read completely.
+
+    Files in older schema versions are translated to the current one;
+    if the translationCache option is set, the translated vistrail is
+    cached and reused the next time the same file is opened.
+
+    """
+    tree = StreamedTree(filename)
     version = get_version_for_xml(tree.getroot())
+    cache_filename = None
+    if version != currentVersion:
+        cache_filename = get_translation_cache_filename(filename)
+    if cache_filename is not None:
+        vistrail = open_translated_vistrail(cache_filename)
+        if vistrail is not None:
+            return vistrail
+    skeleton = skeleton and version == currentVersion
+    if skeleton:
+        pruner = OperationPruner()
+        tree.getroot().prune = pruner
     try:
         daoList = getVersionDAO(version)
         vistrail = daoList.open_from_xml(filename, DBVistrail.vtType, tree)
@@ -691,6 +1071,11 @@ def open_vistrail_from_xml(filename):
             raise VistrailsDBException("Couldn't read vistrail from XML")
         vistrail = translate_vistrail(vistrail, version)
         vistrails.db.services.vistrail.update_id_scope(vistrail)
+        if cache_filename is not None:
+            save_translated_vistrail(vistrail, cache_filename)
+        if skeleton:
+            pruner.update_vistrail(vistrail)
+            vistrail.db_unloaded_filename = filename
     except VistrailsDBException, e:
         if str(e).startswith('VistrailsDBException: Cannot find DAO for'):
             raise VistrailsDBException(
@@ -700,15 +1085,62 @@ def open_vistrail_from_xml(filename):
 
     return vistrail
 
-def open_vistrail_bundle_from_zip_xml(filename):
-    """open_vistrail_bundle_from_zip_xml(filename) -> SaveBundle
+def load_vistrail_operations(vistrail, filename=None, action_ids=None):
+    """load_vistrail_operations(vistrail: DBVistrail, filename: str,
+                                action_ids: [long]) -> None
+    Reads the operations of the given actions (by default, all of them)
+    for a vistrail opened from filename (by default, the file it was
+    opened from) with skeleton=True. The file is only read up to the last
+    of these actions. Note that the operations are db objects, which the
+    caller has to convert if needed.
+
+    """
+    if action_ids is None:
+        action_ids = set(vistrail.db_unloaded_actions)
+    else:
+        action_ids = set(action_ids) & vistrail.db_unloaded_actions
+    if not action_ids:
+        return
+    if filename is None:
+        filename = vistrail.db_unloaded_filename
+        if filename is None:
+            raise VistrailsDBException("Operations of actions %s were not "
+                                       "loaded" % sorted(action_ids))
+    action_dao = getVersionDAO(currentVersion)['xml']['action']
+    for node in StreamedTree(filename).getroot().getchildren():
+        if node.tag != 'action' or long(node.get('id')) not in action_ids:
+            continue
+        loaded_action = action_dao.fromXML(node)
+        action = vistrail.db_get_action_by_id(loaded_action.db_id)
+        for operation in loaded_action.db_operations:
+            action.db_add_operation(operation)
+            if operation.vtType == 'add' or operation.vtType == 'change':
+                if operation.db_data is None:
+                    if operation.vtType == 'change':
+                        operation.db_objectId = operation.db_oldObjId
+                vistrail.db_add_object(operation.db_data)
+        vistrail.db_unloaded_actions.discard(loaded_action.db_id)
+        action_ids.discard(loaded_action.db_id)
+        if not action_ids:
+            break
+    if action_ids:
+        raise VistrailsDBException("Cannot find actions %s in '%s'" % \
+                                       (sorted(action_ids), filename))
+
+def open_vistrail_bundle_from_zip_xml(filename, lazy=False):
+    """open_vistrail_bundle_from_zip_xml(filename, lazy) -> SaveBundle
     Open a vistrail from a zip compressed format.
     It expects that the vistrail file inside archive has name 'vistrail',
     the log inside archive has name 'log',
     abstractions inside archive have prefix 'abstraction_',
     and thumbnails inside archive are '.png' files in 'thumbs' dir
 
+    If lazy is True, only the vistrail is extracted and parsed, and a
+    LazySaveBundle is returned.
+
     """
+    if lazy:
+        return open_vistrail_bundle_from_zip_xml_lazy(filename)
     vt_save_dir = tempfile.mkdtemp(prefix='vt_save')
 
     z = zipfile.ZipFile(filename)
@@ -777,6 +1209,58 @@ def open_vistrail_bundle_from_zip_xml(filename):
                              thumbnails=thumbnail_files, mashups=mashups)
     return (save_bundle, vt_save_dir)
 
+def open_vistrail_bundle_from_zip_xml_lazy(filename):
+    """open_vistrail_bundle_from_zip_xml_lazy(filename) -> LazySaveBundle
+    Open a vistrail from a zip compressed format, deferring everything
+    but the vistrail until it is accessed. Only the vistrail file and the
+    files handled by packages are extracted to the save directory; the
+    rest is extracted on demand, or when the bundle is saved again.
+
+    """
+    vt_save_dir = tempfile.mkdtemp(prefix='vt_save')
+    try:
+        archive = LazyBundleArchive(filename, vt_save_dir)
+    except (IOError, zipfile.BadZipfile), e:
+        raise VistrailsDBException("Error when reading vt file")
+
+    from vistrails.core.packagemanager import get_package_manager
+    pm = get_package_manager()
+    unknown_files = []
+    for name in archive.names:
+        fname = name.rsplit('/', 1)[-1]
+        if name in ('vistrail', 'log') or fname.startswith('abstraction_'):
+            continue
+        elif name.startswith('thumbs/') and name.endswith('.png'):
+            continue
+        elif name.startswith('mashups/') and name.count('/') == 1:
+            continue
+        handled = False
+        for package in pm.enabled_package_list():
+            if package.can_handle_vt_file(fname):
+                handled = True
+                archive.extract(name)
+                break
+        if not handled:
+            unknown_files.append(os.path.join(vt_save_dir, name))
+    if len(unknown_files) > 0:
+        raise VistrailsDBException("Unknown files in vt file: %s" % \
+                                       unknown_files)
+    if 'vistrail' not in archive.names:
+        raise VistrailsDBException("vt file does not contain vistrail")
+    vistrail = open_vistrail_from_xml(archive.extract('vistrail'))
+    if 'log' in archive.names:
+        vistrail.db_log_filename = os.path.join(vt_save_dir, 'log')
+    else:
+        vistrail.db_log_filename = None
+
+    # call package hooks
+    for package in pm.enabled_package_list():
+        package.loadVistrailFileHook(vistrail, vt_save_dir)
+
+    _lazy_archives[vt_save_dir] = archive
+    save_bundle = LazySaveBundle(DBVistrail.vtType, vistrail, archive)
+    return (save_bundle, vt_save_dir)
+
 def open_vistrail_bundle_from_db(db_connection, vistrail_id, tmp_dir=None):
     """open_vistrail_bundle_from_db(db_connection, id: long, tmp_dir: str) -> SaveBundle
        Open a vistrail bundle from the database.
@@ -844,6 +1328,8 @@ def save_vistrail_to_xml(vistrail, filename, version=None):
         version = currentVersion
     if not vistrail.db_version:
         vistrail.db_version = currentVersion
+    if getattr(vistrail, 'db_unloaded_actions', None):
+        load_vistrail_operations(vistrail)
 
     # current_action holds the current action id 
     # (used by the controller--write_vistrail)
@@ -878,6 +1364,10 @@ def save_vistrail_bundle_to_zip_xml(save_bundle, filename, vt_save_dir=None, ver
                                    'bundle does not contain a vistrail')
     if not vt_save_dir:
         vt_save_dir = tempfile.mkdtemp(prefix='vt_save')
+    else:
+        # the directory is zipped as a whole, so files that were deferred
+        # when the bundle was opened need to be there
+        extract_lazy_bundle(vt_save_dir)
     # abstractions are saved in the root of the zip file
     # abstraction_dir = os.path.join(vt_save_dir, 'abstractions')
     #thumbnails and mashups have their own folder
@@ -893,6 +1383,13 @@ def save_vistrail_bundle_to_zip_xml(save_bundle, filename, vt_save_dir=None, ver
         xml_fname = os.path.join(vt_save_dir, 'log')
         if save_bundle.vistrail.db_log_filename != xml_fname:
             shutil.copyfile(save_bundle.vistrail.db_log_filename, xml_fname)
+            index_fname = get_log_index_filename(
+                    save_bundle.vistrail.db_log_filename)
+            if os.path.exists(index_fname):
+                shutil.copyfile(index_fname,
+                                get_log_index_filename(xml_fname))
+            elif os.path.exists(get_log_index_filename(xml_fname)):
+                os.unlink(get_log_index_filename(xml_fname))
             save_bundle.vistrail.db_log_filename = xml_fname
 
     if save_bundle.log is not None:
@@ -981,8 +1478,12 @@ def save_vistrail_bundle_to_zip_xml(save_bundle, filename, vt_save_dir=None, ver
     try:
         with Chdir(vt_save_dir):
             # zip current directory
+            log_index = os.path.join('.', get_log_index_filename('log'))
             for root, dirs, files in os.walk('.'):
                 for f in files:
+                    # the log index is rebuilt when the bundle is opened
+                    if os.path.join(root, f) == log_index:
+                        continue
                     z.write(os.path.join(root, f))
         z.close()
         shutil.copyfile(tmp_zip_file, filename)
@@ -1031,6 +1532,8 @@ def save_vistrail_to_db(vistrail, db_connection, do_copy=False, version=None):
             version = currentVersion
     if not vistrail.db_version:
         vistrail.db_version = currentVersion
+    if getattr(vistrail, 'db_unloaded_actions', None):
+        load_vistrail_operations(vistrail)
 
     dao_list = getVersionDAO(version)
 
@@ -1096,7 +1599,7 @@ def save_vistrail_to_db(vistrail, db_connection, do_copy=False, version=None):
 
 def open_workflow_from_xml(filename):
     """open_workflow_from_xml(filename) -> DBWorkflow"""
-    tree = ElementTree.parse(filename)
+    tree = StreamedTree(filename)
     version = get_version_for_xml(tree.getroot())
     daoList = getVersionDAO(version)
     workflow = daoList.open_from_xml(filename, DBWorkflow.vtType, tree)
@@ -1187,34 +1690,227 @@ def get_saved_workflows(vistrail, db_connection):
 ##############################################################################
 # Logging I/O
 
-def open_log_from_xml(filename, was_appended=False):
-    """open_log_from_xml(filename) -> DBLog"""
+class LogIndexEntry(object):
+    """LogIndexEntry is the index entry of one record of an appended log:
+    the byte range of a serialized workflow execution in the log file,
+    with the workflow version it executed and its start and end times.
+
+    """
+
+    def __init__(self, offset, length, parent_version, ts_start, ts_end):
+        self.offset = offset
+        self.length = length
+        self.parent_version = parent_version
+        self.ts_start = ts_start
+        self.ts_end = ts_end
+
+    @staticmethod
+    def from_line(line):
+        (offset, length, parent_version, ts_start, ts_end) = \
+            line.rstrip('\r\n').split('\t')
+        if parent_version:
+            parent_version = long(parent_version)
+        else:
+            parent_version = None
+        return LogIndexEntry(long(offset), long(length), parent_version,
+                             ts_start, ts_end)
+
+    def to_line(self):
+        if self.parent_version is None:
+            parent_version = ''
+        else:
+            parent_version = str(self.parent_version)
+        return '%d\t%d\t%s\t%s\t%s\n' % (self.offset, self.length,
+                                         parent_version, self.ts_start,
+                                         self.ts_end)
+
+    def matches(self, versions=None, start=None, end=None):
+        """matches(versions: set, start: str, end: str) -> bool
+        Whether the execution is of one of versions and started between
+        start and end (inclusive). Times are formatted by date_to_str().
+
+        """
+        if versions is not None and self.parent_version not in versions:
+            return False
+        if start is not None and self.ts_start < start:
+            return False
+        if end is not None and self.ts_start > end:
+            return False
+        return True
+
+_log_record_re = re.compile(r'<workflowExec\b([^>]*)>')
+_log_attr_re = re.compile(r'(\w+)="([^"]*)"')
+
+def get_log_index_filename(filename):
+    """get_log_index_filename(filename: str) -> str
+    Returns the name of the index file of the appended log filename.
+
+    """
+    return filename + '.index'
+
+def _scan_log_records(filename, offset=0):
+    """_scan_log_records(filename: str, offset: int) -> list
+    Finds the workflow executions appended to filename after offset,
+    without parsing them, and returns their LogIndexEntry objects.
+
+    """
+    f = open(filename, 'rb')
+    try:
+        f.seek(offset)
+        data = f.read()
+    finally:
+        f.close()
+    matches = list(_log_record_re.finditer(data))
+    entries = []
+    for i, match in enumerate(matches):
+        if i + 1 < len(matches):
+            length = matches[i + 1].start() - match.start()
+        else:
+            length = len(data) - match.start()
+        attrs = dict(_log_attr_re.findall(match.group(1)))
+        parent_version = attrs.get('parentVersion')
+        if parent_version:
+            parent_version = long(parent_version)
+        else:
+            parent_version = None
+        entries.append(LogIndexEntry(offset + match.start(), length,
+                                     parent_version,
+                                     attrs.get('tsStart', ''),
+                                     attrs.get('tsEnd', '')))
+    return entries
+
+def read_log_index(filename):
+    """read_log_index(filename: str) -> list of LogIndexEntry
+    Returns the index of the workflow executions appended to the log
+    filename, in the order they were saved. Records missing from the index
+    file (logs written without one, or by an older version) are indexed
+    first, and the index file is brought up to date.
+
+    """
+    if not os.path.exists(filename):
+        extract_lazy_file(filename)
+        if not os.path.exists(filename):
+            return []
+    index_fname = get_log_index_filename(filename)
+    entries = []
+    if os.path.exists(index_fname):
+        f = open(index_fname, 'rb')
+        try:
+            entries = [LogIndexEntry.from_line(line)
+                       for line in f if line.strip()]
+        except ValueError:
+            debug.warning("Rebuilding invalid log index '%s'" % index_fname)
+            entries = []
+        finally:
+            f.close()
+    size = os.path.getsize(filename)
+    end = 0
+    if entries:
+        last = entries[-1]
+        end = last.offset + last.length
+        if end <= size:
+            f = open(filename, 'rb')
+            try:
+                f.seek(last.offset)
+                valid = f.read(len('<workflowExec')) == '<workflowExec'
+            finally:
+                f.close()
+        else:
+            valid = False
+        if not valid:
+            # the log file was replaced
+            entries = []
+            end = 0
+    if end < size:
+        new_entries = _scan_log_records(filename, end)
+        if entries:
+            index_file = open(index_fname, 'ab')
+        else:
+            index_file = open(index_fname, 'wb')
+        try:
+            for entry in new_entries:
+                index_file.write(entry.to_line())
+        finally:
+            index_file.close()
+        entries.extend(new_entries)
+    return entries
+
+def _read_appended_workflow_exec(node):
+    version = get_version_for_xml(node)
+    daoList = getVersionDAO(version)
+    workflow_exec = daoList.read_xml_object(DBWorkflowExec.vtType, node)
+    if version != currentVersion:
+        # if version is wrong, dump this into a dummy log object, 
+        # then translate, then get workflow_exec back
+        log = DBLog()
+        translate_log(log, currentVersion, version)
+        log.db_add_workflow_exec(workflow_exec)
+        log = translate_log(log, version)
+        workflow_exec = log.db_workflow_execs[0]
+    return workflow_exec
+
+def open_log_records_from_xml(filename, entries):
+    """open_log_records_from_xml(filename: str, entries: list) -> DBLog
+    Reads only the workflow executions of the given index entries (see
+    read_log_index()) from the appended log filename.
+
+    """
+    workflow_execs = []
+    f = open(filename, 'rb')
+    try:
+        for entry in entries:
+            f.seek(entry.offset)
+            node = ElementTree.fromstring(f.read(entry.length))
+            workflow_execs.append(_read_appended_workflow_exec(node))
+    finally:
+        f.close()
+    log = DBLog(workflow_execs=workflow_execs)
+    vistrails.db.services.log.update_ids(log)
+    return log
+
+def open_log_from_xml(filename, was_appended=False, versions=None,
+                      start=None, end=None):
+    """open_log_from_xml(filename, was_appended, versions, start, end)
+         -> DBLog
+    An appended log can also be read from a file object.
+
+    When reading an appended log from a file, the executions can be
+    restricted to the workflow versions in versions and to those started
+    between the datetimes start and end; only these are parsed.
+
+    """
+    if isinstance(filename, basestring) and not os.path.exists(filename):
+        extract_lazy_file(filename)
+    if was_appended and isinstance(filename, basestring) and \
+            (versions is not None or start is not None or end is not None):
+        if versions is not None:
+            versions = set(versions)
+        if start is not None:
+            start = date_to_str(start)
+        if end is not None:
+            end = date_to_str(end)
+        entries = [entry for entry in read_log_index(filename)
+                   if entry.matches(versions, start, end)]
+        return open_log_records_from_xml(filename, entries)
     if was_appended:
         parser = ElementTree.XMLTreeBuilder()
         parser.feed("<log>\n")
-        f = open(filename, "rb")
-        parser.feed(f.read())
+        if isinstance(filename, basestring):
+            f = open(filename, "rb")
+        else:
+            f = filename
+        try:
+            parser.feed(f.read())
+        finally:
+            f.close()
         parser.feed("</log>\n")
         root = parser.close()
-        workflow_execs = []
-        for node in root:
-            version = get_version_for_xml(node)
-            daoList = getVersionDAO(version)
-            workflow_exec = \
-                daoList.read_xml_object(DBWorkflowExec.vtType, node)
-            if version != currentVersion:
-                # if version is wrong, dump this into a dummy log object, 
-                # then translate, then get workflow_exec back
-                log = DBLog()
-                translate_log(log, currentVersion, version)
-                log.db_add_workflow_exec(workflow_exec)
-                log = translate_log(log, version)
-                workflow_exec = log.db_workflow_execs[0]
-            workflow_execs.append(workflow_exec)
+        workflow_execs = [_read_appended_workflow_exec(node)
+                          for node in root]
         log = DBLog(workflow_execs=workflow_execs)
         vistrails.db.services.log.update_ids(log)
     else:
-        tree = ElementTree.parse(filename)
+        tree = StreamedTree(filename)
         version = get_version_for_xml(tree.getroot())
         daoList = getVersionDAO(version)
         log = daoList.open_from_xml(filename, DBLog.vtType, tree)
@@ -1273,21 +1969,41 @@ def save_log_to_xml(log, filename, version=None, do_append=False):
     log = translate_log(log, log.db_version, version)
 
     daoList = getVersionDAO(version)
+    index_fname = get_log_index_filename(filename)
     if do_append:
+        # make sure the index covers the existing records, so that only
+        # the new executions have to be indexed
+        read_log_index(filename)
         log_file = open(filename, 'ab')
-        for workflow_exec in log.db_workflow_execs:
-            # cannot do correct numbering here...
-            # but need to save so that we can use it for deletes
-            wf_exec_id = workflow_exec.db_id
-            workflow_exec.db_id = -1L
-            daoList.save_to_xml(workflow_exec, log_file, {}, version)
-            workflow_exec.db_id = wf_exec_id
-        log_file.close()
+        index_file = open(index_fname, 'ab')
+        try:
+            log_file.seek(0, os.SEEK_END)
+            for workflow_exec in log.db_workflow_execs:
+                # cannot do correct numbering here...
+                # but need to save so that we can use it for deletes
+                wf_exec_id = workflow_exec.db_id
+                workflow_exec.db_id = -1L
+                offset = log_file.tell()
+                daoList.save_to_xml(workflow_exec, log_file, {}, version)
+                workflow_exec.db_id = wf_exec_id
+                entry = LogIndexEntry(
+                    offset, log_file.tell() - offset,
+                    workflow_exec.db_parent_version,
+                    date_to_str(workflow_exec.db_ts_start)
+                        if workflow_exec.db_ts_start else '',
+                    date_to_str(workflow_exec.db_ts_end)
+                        if workflow_exec.db_ts_end else '')
+                index_file.write(entry.to_line())
+        finally:
+            log_file.close()
+            index_file.close()
     else:
         tags = {'xmlns:xsi': 'http://www.w3.org/2001/XMLSchema-instance',
                 'xsi:schemaLocation': 'http://www.vistrails.org/log.xsd'
                 }
         daoList.save_to_xml(log, filename, tags, version)
+        if os.path.exists(index_fname):
+            os.unlink(index_fname)
     log = translate_log(log, version)
     return log
 
@@ -1825,6 +2541,97 @@ def delete_entity_from_db(db_connection, type, obj_id):
     dao_list.delete_from_db(db_connection, type, obj_id)
     db_connection.commit()
     
+class StreamedElement(object):
+    """StreamedElement stands for the root element of an XML document
+    parsed incrementally by ElementTree.iterparse. It provides what the
+    XML DAOs read from a node (tag, get() and getchildren()), but each
+    child is built only when getchildren() gets to it and discarded once
+    the DAO moves on to the next one, so that the whole tree never has to
+    be in memory. As a consequence, the children can only be iterated
+    over once.
+
+    If set, prune is called on each child before it is handed out and
+    may remove parts of it that should not be read.
+
+    """
+
+    def __init__(self, filename):
+        self._file = open(filename, 'rb')
+        self._events = ElementTree.iterparse(self._file, ('start', 'end'))
+        event, self._root = self._events.next()
+        self.tag = self._root.tag
+        self.text = self._root.text
+        self.prune = None
+
+    def get(self, key, default=None):
+        return self._root.get(key, default)
+
+    def getchildren(self):
+        depth = 0
+        try:
+            for event, elem in self._events:
+                if event == 'start':
+                    depth += 1
+                elif elem is self._root:
+                    break
+                else:
+                    depth -= 1
+                    if depth == 0:
+                        if self.prune is not None:
+                            self.prune(elem)
+                        yield elem
+                        elem.clear()
+                        self._root.remove(elem)
+        finally:
+            self._file.close()
+
+class StreamedTree(object):
+    """StreamedTree(filename) can be passed as the already-parsed tree
+    to the DAOs' open_from_xml; see StreamedElement."""
+
+    def __init__(self, filename):
+        self._root = StreamedElement(filename)
+
+    def getroot(self):
+        return self._root
+
+class OperationPruner(object):
+    """OperationPruner removes the operations from the action elements
+    of a vistrail, keeping track of the ids it would have used so that
+    the vistrail's id scope can be updated after loading.
+
+    """
+
+    def __init__(self):
+        self.action_ids = set()
+        self.max_ids = {}
+
+    def _update_id(self, what, id):
+        if id > self.max_ids.get(what, -1):
+            self.max_ids[what] = id
+
+    def __call__(self, node):
+        if node.tag != 'action':
+            return
+        operations = [child for child in node.getchildren()
+                      if child.tag in ('add', 'change', 'delete')]
+        if operations:
+            self.action_ids.add(long(node.get('id')))
+        for child in operations:
+            self._update_id('operation', long(child.get('id')))
+            if child.tag == 'add':
+                self._update_id(child.get('what'),
+                                long(child.get('objectId')))
+            elif child.tag == 'change':
+                self._update_id(child.get('what'),
+                                long(child.get('newObjId')))
+            node.remove(child)
+
+    def update_vistrail(self, vistrail):
+        for what, id in self.max_ids.iteritems():
+            vistrail.idScope.updateBeginId(what, id + 1)
+        vistrail.db_unloaded_actions.update(self.action_ids)
+
 def get_version_for_xml(root):
     version = root.get('version', None)
     if version is not None:
@@ -1860,6 +2667,7 @@ def create_temp_folder(prefix='vt_save'):
 def remove_temp_folder(temp_dir):
     if temp_dir is None:
         return
+    _lazy_archives.pop(temp_dir, None)
     if not os.path.isdir(temp_dir):
         if os.path.isfile(temp_dir):
             os.remove(temp_dir)
@@ -1897,6 +2705,112 @@ class TestDBIO(unittest.TestCase):
                          'tests/resources/dummy_new.xml'))
         assert vistrail is not None
 
+    def test_skeleton(self):
+        """test reading operations lazily"""
+        testdir = tempfile.mkdtemp(prefix='vt_')
+        filename = os.path.join(testdir, 'dummy_new.xml')
+        try:
+            save_vistrail_to_xml(open_vistrail_from_xml(
+                    os.path.join(vistrails.core.system.vistrails_root_directory(),
+                                 'tests/resources/dummy_new.xml')),
+                                 filename)
+            vistrail = open_vistrail_from_xml(filename)
+            skeleton = open_vistrail_from_xml(filename, skeleton=True)
+            self.assertEqual(sorted(a.db_id for a in vistrail.db_actions),
+                             sorted(a.db_id for a in skeleton.db_actions))
+            self.assertTrue(skeleton.db_unloaded_actions)
+            self.assertFalse(any(a.db_operations
+                                 for a in skeleton.db_actions))
+            for what in ('operation', 'module', 'connection'):
+                self.assertEqual(vistrail.idScope.getNewId(what),
+                                 skeleton.idScope.getNewId(what))
+
+            def operations(v, action_id):
+                return [(op.vtType, op.db_id)
+                        for op in v.db_get_action_by_id(action_id).db_operations]
+            action_id = max(skeleton.db_unloaded_actions)
+            load_vistrail_operations(skeleton, filename, [action_id])
+            self.assertEqual(operations(vistrail, action_id),
+                             operations(skeleton, action_id))
+            self.assertNotIn(action_id, skeleton.db_unloaded_actions)
+            load_vistrail_operations(skeleton, filename)
+            self.assertFalse(skeleton.db_unloaded_actions)
+            for action in vistrail.db_actions:
+                self.assertEqual(operations(vistrail, action.db_id),
+                                 operations(skeleton, action.db_id))
+        finally:
+            shutil.rmtree(testdir)
+
+    def test_skeleton_materialize(self):
+        """test materializing versions of a skeleton vistrail"""
+        from vistrails.db.services.vistrail import materializeWorkflow
+        testdir = tempfile.mkdtemp(prefix='vt_')
+        filename = os.path.join(testdir, 'dummy_new.xml')
+        try:
+            save_vistrail_to_xml(open_vistrail_from_xml(
+                    os.path.join(vistrails.core.system.vistrails_root_directory(),
+                                 'tests/resources/dummy_new.xml')),
+                                 filename)
+            vistrail = open_vistrail_from_xml(filename)
+
+            def contents(workflow):
+                return (sorted(workflow.db_modules_id_index),
+                        sorted(workflow.db_connections_id_index),
+                        sorted((f.db_id, [p.db_val for p in f.db_parameters])
+                               for m in workflow.db_modules
+                               for f in m.db_functions))
+            for checkpoint_interval in (0, 2):
+                skeleton = open_vistrail_from_xml(filename, skeleton=True)
+                version = max(skeleton.db_unloaded_actions)
+                self.assertEqual(
+                    contents(materializeWorkflow(vistrail, version)),
+                    contents(materializeWorkflow(skeleton, version,
+                                                 checkpoint_interval)))
+                self.assertNotIn(version, skeleton.db_unloaded_actions)
+                self.assertTrue(skeleton.db_unloaded_actions)
+
+            # without the file, missing operations are an error
+            skeleton = open_vistrail_from_xml(filename, skeleton=True)
+            skeleton.db_unloaded_filename = None
+            self.assertRaises(VistrailsDBException, materializeWorkflow,
+                              skeleton, max(skeleton.db_unloaded_actions))
+        finally:
+            shutil.rmtree(testdir)
+
+    def test_translation_cache(self):
+        """test caching the translation of old vistrails"""
+        from vistrails.core.configuration import get_vistrails_configuration
+        conf = get_vistrails_configuration()
+        old_conf = (conf.check('translationCache'),
+                    conf.check('translationCacheDir'))
+        testdir = tempfile.mkdtemp(prefix='vt_')
+        filename = os.path.join(vistrails.core.system.vistrails_root_directory(),
+                                'tests/resources/dummy_new.xml')
+        try:
+            conf.translationCache = True
+            conf.translationCacheDir = testdir
+            cache_filename = get_translation_cache_filename(filename)
+            self.assertEqual(os.path.dirname(cache_filename), testdir)
+            vistrail = open_vistrail_from_xml(filename)
+            self.assertEqual(os.listdir(testdir),
+                             [os.path.basename(cache_filename)])
+            cached = open_vistrail_from_xml(filename)
+            self.assertEqual(serialize(vistrail), serialize(cached))
+            self.assertEqual(vistrail.idScope.getNewId('module'),
+                             cached.idScope.getNewId('module'))
+
+            # an unreadable cache file is translated again
+            f = open(cache_filename, 'r+b')
+            f.truncate(os.path.getsize(cache_filename) // 2)
+            f.close()
+            vistrail = open_vistrail_from_xml(filename)
+            self.assertEqual(serialize(vistrail), serialize(cached))
+            self.assertEqual(open_translated_vistrail(cache_filename).db_id,
+                             vistrail.db_id)
+        finally:
+            (conf.translationCache, conf.translationCacheDir) = old_conf
+            shutil.rmtree(testdir)
+
     def test3(self):
         """test importing a vt file"""
 
@@ -1927,3 +2841,150 @@ class TestDBIO(unittest.TestCase):
                 self.fail(str(e))
         finally:
             os.rmdir(testdir)
+
+    def test_bin(self):
+        """test saving and opening binary files"""
+        testdir = tempfile.mkdtemp(prefix='vt_')
+        try:
+            vistrail = open_vistrail_from_xml(
+                os.path.join(vistrails.core.system.vistrails_root_directory(),
+                             'tests/resources/dummy.xml'))
+            bin_fname = os.path.join(testdir, 'dummy.vtb')
+            save_to_bin(vistrail, bin_fname)
+            self.assertTrue(is_bin_file(bin_fname))
+            vistrail2 = open_from_bin(bin_fname, DBVistrail.vtType)
+            self.assertEqual(vistrail.idScope.getNewId('module'),
+                             vistrail2.idScope.getNewId('module'))
+
+            # both have to serialize to the same xml
+            xml_fnames = [os.path.join(testdir, 'dummy%d.xml' % i)
+                          for i in xrange(2)]
+            for v, xml_fname in zip([vistrail, vistrail2], xml_fnames):
+                save_vistrail_to_xml(v, xml_fname)
+            data = [open(xml_fname).read() for xml_fname in xml_fnames]
+            self.assertEqual(data[0], data[1])
+
+            self.assertRaises(VistrailsDBException, open_from_bin,
+                              bin_fname, DBLog.vtType)
+            f = open(bin_fname, 'r+b')
+            f.truncate(os.path.getsize(bin_fname) // 2)
+            f.close()
+            self.assertRaises(VistrailsDBException, open_from_bin,
+                              bin_fname, DBVistrail.vtType)
+        finally:
+            shutil.rmtree(testdir)
+
+    def test_lazy_bundle(self):
+        """test opening a vt file lazily"""
+        examples = os.path.join(vistrails.core.system.vistrails_root_directory(),
+                                '..', 'examples')
+        testdir = tempfile.mkdtemp(prefix='vt_')
+        try:
+            for example in ('triangle_area.vt', 'EMBOSS_webservices.vt'):
+                filename = os.path.join(examples, example)
+                (bundle, vt_save_dir) = open_vistrail_bundle_from_zip_xml(
+                    filename)
+                (lazy, lazy_save_dir) = open_vistrail_bundle_from_zip_xml(
+                    filename, lazy=True)
+                try:
+                    self.assertEqual(os.listdir(lazy_save_dir), ['vistrail'])
+                    self.assertEqual(len(bundle.vistrail.db_actions),
+                                     len(lazy.vistrail.db_actions))
+                    self.assertEqual(lazy.get_db_objs(), [lazy.vistrail])
+
+                    names = lambda l: sorted(os.path.basename(f) for f in l)
+                    self.assertEqual(names(bundle.abstractions),
+                                     names(lazy.abstractions))
+                    self.assertEqual(names(bundle.thumbnails),
+                                     names(lazy.thumbnails))
+                    self.assertTrue(all(os.path.isfile(f)
+                                        for f in lazy.thumbnails))
+                    self.assertEqual(sorted(m.id for m in bundle.mashups),
+                                     sorted(m.id for m in lazy.mashups))
+                    log = open_log_from_xml(bundle.vistrail.db_log_filename,
+                                            True)
+                    self.assertEqual(len(log.db_workflow_execs),
+                                     len(lazy.log.db_workflow_execs))
+                    self.assertFalse(os.path.exists(
+                            os.path.join(lazy_save_dir, 'log')))
+
+                    # saving in place has to bring back the deferred files
+                    (lazy2, lazy_save_dir2) = open_vistrail_bundle_from_zip_xml(
+                        filename, lazy=True)
+                    saved = os.path.join(testdir, example)
+                    try:
+                        save_vistrail_bundle_to_zip_xml(lazy2, saved,
+                                                        lazy_save_dir2)
+                    finally:
+                        close_zip_xml(lazy_save_dir2)
+                    z = zipfile.ZipFile(saved)
+                    try:
+                        self.assertIn('log', z.namelist())
+                        self.assertEqual(
+                            len([n for n in z.namelist()
+                                 if n.startswith('thumbs/')
+                                 and n.endswith('.png')]),
+                            len(bundle.thumbnails))
+                    finally:
+                        z.close()
+                finally:
+                    close_zip_xml(vt_save_dir)
+                    close_zip_xml(lazy_save_dir)
+        finally:
+            shutil.rmtree(testdir)
+
+    def test_log_index(self):
+        """test indexing and appending to a log"""
+        filename = os.path.join(vistrails.core.system.vistrails_root_directory(),
+                                'tests', 'resources', 'paramexp-1.0.3.vt')
+        testdir = tempfile.mkdtemp(prefix='vt_')
+        (bundle, vt_save_dir) = open_vistrail_bundle_from_zip_xml(filename)
+        try:
+            log_fname = bundle.vistrail.db_log_filename
+            log = open_log_from_xml(log_fname, True)
+            entries = read_log_index(log_fname)
+            self.assertEqual(len(entries), len(log.db_workflow_execs))
+            self.assertTrue(os.path.exists(get_log_index_filename(log_fname)))
+            self.assertEqual([e.parent_version for e in entries],
+                             [w.db_parent_version
+                              for w in log.db_workflow_execs])
+
+            version = entries[1].parent_version
+            selected = open_log_from_xml(log_fname, True, versions=[version])
+            self.assertTrue(selected.db_workflow_execs)
+            self.assertTrue(all(w.db_parent_version == version
+                                for w in selected.db_workflow_execs))
+            start = log.db_workflow_execs[-1].db_ts_start
+            selected = open_log_from_xml(log_fname, True, start=start)
+            self.assertEqual([w.db_ts_start
+                              for w in selected.db_workflow_execs],
+                             [w.db_ts_start for w in log.db_workflow_execs
+                              if w.db_ts_start >= start])
+
+            # appending only indexes the new execution
+            new_log = DBLog(workflow_execs=[
+                    copy.copy(log.db_workflow_execs[0])])
+            new_log.db_workflow_execs[0].db_parent_version = 1000L
+            save_log_to_xml(new_log, log_fname, do_append=True)
+            entries = read_log_index(log_fname)
+            self.assertEqual(len(entries), len(log.db_workflow_execs) + 1)
+            self.assertEqual(entries[-1].offset + entries[-1].length,
+                             os.path.getsize(log_fname))
+            selected = open_log_from_xml(log_fname, True, versions=[1000L])
+            self.assertEqual(len(selected.db_workflow_execs), 1)
+            self.assertEqual(len(open_log_from_xml(
+                        log_fname, True).db_workflow_execs),
+                             len(entries))
+
+            # the index is not part of the bundle
+            saved = os.path.join(testdir, 'saved.vt')
+            save_vistrail_bundle_to_zip_xml(bundle, saved, vt_save_dir)
+            z = zipfile.ZipFile(saved)
+            try:
+                self.assertNotIn(get_log_index_filename('log'),
+                                 [os.path.basename(n) for n in z.namelist()])
+            finally:
+                z.close()
+        finally:
+            close_zip_xml(vt_save_dir)
+            shutil.rmtree(testdir)
@@ -147,7 +147,7 @@ class BaseLocator(object):
         All file:// URLs are absolute, so abspath() will be used on the
         argument.
         """
-        exts = ["vt", "xml"]
+        exts = ["vtb", "vt", "xml"]
         q_mark = False
         query_str_idx = None
         for match in re.finditer("\.(%s)(\??)" % "|".join(exts), filename):
@@ -194,6 +194,8 @@ class BaseLocator(object):
             path = url2pathname(path)
             if path.endswith(".vt"):
                 return ZIPFileLocator.from_url(url)
+            elif path.endswith(".vtb"):
+                return BINFileLocator.from_url(url)
             elif path.endswith(".xml"):
                 return XMLFileLocator.from_url(url)
         return None
@@ -721,6 +723,44 @@ class ZIPFileLocator(XMLFileLocator):
             return None
         return None
 
+class BINFileLocator(XMLFileLocator):
+    """Files are stored in the compact binary format. The temporaries are
+    still in xml"""
+
+    def load(self, type):
+        fname = self.get_temporary()
+        if fname:
+            obj = io.open_from_xml(fname, type)
+        else:
+            obj = io.open_from_bin(self._name, type)
+        obj.locator = self
+        return obj
+
+    def save(self, obj, do_copy=True, version=None):
+        is_bundle = False
+        if type(obj) == type(SaveBundle(None)):
+            is_bundle = True
+            save_bundle = obj
+            obj = save_bundle.get_primary_obj()
+        obj = io.save_to_bin(obj, self._name, version)
+        obj.locator = self
+        # Only remove the temporaries if save succeeded!
+        self.clean_temporaries()
+        if is_bundle:
+            return SaveBundle(save_bundle.bundle_type, obj)
+        return obj
+
+    ###########################################################################
+    # Operators
+
+    def __eq__(self, other):
+        if not isinstance(other, BINFileLocator):
+            return False
+        return self._name == other._name
+
+    def __ne__(self, other):
+        return not self.__eq__(other)
+
 # class URLLocator(ZIPFileLocator):
 #     def load(self, type):
         
@@ -1147,6 +1187,14 @@ class TestLocators(unittest.TestCase):
         self.assertEqual(loc.short_filename, "test_parse_zip_file \xE9 \xEA")
         self.assertEqual(loc.to_url(), loc_str)
 
+    def test_parse_bin_file(self):
+        loc_str = self.path2url("/vistrails/tmp/test_parse_bin_file.vtb")
+        loc_str += "?workflow=abc"
+        loc = BaseLocator.from_url(loc_str)
+        self.assertIsInstance(loc, BINFileLocator)
+        self.assertEqual(loc.kwargs['version_tag'], "abc")
+        self.assertEqual(loc.to_url(), loc_str)
+
     def test_parse_zip_file_no_scheme(self):
         loc_str = os.path.abspath(
                 "../tmp/test_parse_zip_file_no_scheme \xE9 \xEA.vt")
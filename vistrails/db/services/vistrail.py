@@ -35,7 +35,7 @@
 from vistrails.db.domain import DBWorkflow, DBAdd, DBDelete, DBAction, DBAbstraction, \
     DBModule, DBConnection, DBPort, DBFunction, DBParameter, DBGroup
 from vistrails.db.services.action_chain import getActionChain, getCurrentOperationDict, \
-    getCurrentOperations, simplify_ops
+    getCurrentOperations, simplify_ops, loadOperations
 from vistrails.db import VistrailsDBException
 
 import copy
@@ -67,14 +67,26 @@ def update_id_scope(vistrail):
             for annotation in action.db_annotations:
                 vistrail.idScope.updateBeginId('annotation', annotation.db_id+1)
 
-def materializeWorkflow(vistrail, version):
+def materializeWorkflow(vistrail, version, checkpoint_interval=0,
+                        checkpoint_version=False):
+    """materializeWorkflow(vistrail, version, checkpoint_interval=0,
+                           checkpoint_version=False) -> DBWorkflow
+    Builds the workflow for the given version, replaying actions from the
+    nearest checkpoint if checkpoint_interval is positive.
+
+    """
     # construct path up through tree and perform each action
     if vistrail.db_has_action_with_id(version):
-        workflow = DBWorkflow()
-        #for action in getActionChain(vistrail, version):
-        #    oldPerformAction(action, workflow)
-        performActions(getActionChain(vistrail, version), 
-                            workflow)
+        if checkpoint_interval > 0:
+            workflow = materializeFromCheckpoint(vistrail, version,
+                                                 checkpoint_interval,
+                                                 checkpoint_version)
+        else:
+            workflow = DBWorkflow()
+            #for action in getActionChain(vistrail, version):
+            #    oldPerformAction(action, workflow)
+            performActions(getActionChain(vistrail, version), 
+                                workflow)
         workflow.db_id = version
         workflow.db_vistrailId = vistrail.db_id
         return workflow
@@ -83,6 +95,63 @@ def materializeWorkflow(vistrail, version):
     else:
         raise VistrailsDBException("invalid workflow version %s" % version)
 
+def getCheckpoints(vistrail):
+    """getCheckpoints(vistrail) -> dict
+    Returns the checkpoints stored on vistrail, as a dictionary mapping a
+    version to a (depth, operations) pair, operations being the current
+    operation dictionary of that version (see getCurrentOperationDict).
+    Versions never change once added (pruning a version or replacing it
+    with an upgrade only adds annotations and actions), so checkpoints stay
+    valid for the vistrail's lifetime.
+
+    """
+    try:
+        return vistrail._checkpoints
+    except AttributeError:
+        vistrail._checkpoints = {}
+        return vistrail._checkpoints
+
+def getNearestCheckpoint(vistrail, version, checkpoints=None):
+    """getNearestCheckpoint(vistrail, version, checkpoints=None)
+          -> (int, [DBAction])
+    Returns the closest ancestor of version that has a checkpoint (0 if
+    none does) and the actions leading from it to version.
+
+    """
+    if checkpoints is None:
+        checkpoints = getCheckpoints(vistrail)
+    actions = []
+    current = version
+    while current > 0 and current not in checkpoints:
+        action = vistrail.db_get_action_by_id(current)
+        actions.append(action)
+        current = action.db_prevId
+    actions.reverse()
+    return (current, actions)
+
+def materializeFromCheckpoint(vistrail, version, checkpoint_interval,
+                              checkpoint_version=False):
+    checkpoints = getCheckpoints(vistrail)
+    (start, actions) = getNearestCheckpoint(vistrail, version)
+    loadOperations(vistrail, actions)
+    if start in checkpoints:
+        (depth, operations) = checkpoints[start]
+        operations = operations.copy()
+    else:
+        depth = 0
+        operations = {}
+    for action in actions:
+        getCurrentOperationDict([action], operations)
+        depth += 1
+        if depth % checkpoint_interval == 0 or \
+                (checkpoint_version and action.db_id == version):
+            checkpoints[action.db_id] = (depth, operations.copy())
+    sortedOperations = operations.values()
+    sortedOperations.sort(key=lambda x: x.db_id)
+    workflow = DBWorkflow()
+    performAdds(sortedOperations, workflow)
+    return workflow
+
 def performAction(action, workflow):
     if action.actionType == 'add':
         for operation in action.db_operations:
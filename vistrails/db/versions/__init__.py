@@ -114,6 +114,7 @@ def translate_object(obj, method_name, version=None, target_version=None):
 
     # don't get stuck in an infinite loop
     count = 0
+    steps = []
     while version != target_version:
         if count > len(map):
             break
@@ -129,7 +130,7 @@ def translate_object(obj, method_name, version=None, target_version=None):
             raise VistrailsDBException("Cannot translate version: "
                                        "version %s missing method '%s'" % \
                                            (version, method_name))
-        obj = getattr(translate_module, method_name)(obj)
+        steps.append(translate_module)
         version = next_version
         count += 1
 
@@ -138,6 +139,17 @@ def translate_object(obj, method_name, version=None, target_version=None):
         msg += "only able to translate to version '%s'" % version
         raise VistrailsDBException(msg)
 
+    # A translation listed in plain_translations only copies the fields
+    # into the classes of the newer schema, so the next translation can
+    # read the older objects directly and the copy is skipped; only the
+    # last one has to run to get objects of the target version
+    for i, translate_module in enumerate(steps):
+        if (i + 1 < len(steps) and
+                method_name in getattr(translate_module, 'plain_translations',
+                                       ())):
+            continue
+        obj = getattr(translate_module, method_name)(obj)
+
     return obj
 
 def translate_vistrail(vistrail, version=None, target_version=None):
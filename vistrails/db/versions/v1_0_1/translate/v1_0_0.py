@@ -36,6 +36,12 @@ import copy
 from vistrails.db.versions.v1_0_1.domain import DBVistrail, DBWorkflow, DBLog, \
     DBRegistry, DBModuleDescriptor, DBGroup
 
+# These translations only copy the fields of the 1.0.0 objects, see
+# translate_object
+plain_translations = ['translateVistrail',
+                      'translateWorkflow',
+                      'translateLog']
+
 def translateVistrail(_vistrail):
     def update_workflow(old_obj, translate_dict):
         return DBWorkflow.update_version(old_obj.db_workflow, translate_dict)
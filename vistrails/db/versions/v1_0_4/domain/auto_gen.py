@@ -37,23 +37,66 @@
 
 import copy
 
+class LazyList(object):
+    """Descriptor for a list attribute that is stored in a slot and only
+    allocated when it is first used."""
+
+    def __init__(self, name):
+        self.name = name
+
+    def __get__(self, obj, cls=None):
+        if obj is None:
+            return self
+        try:
+            return getattr(obj, self.name)
+        except AttributeError:
+            value = []
+            setattr(obj, self.name, value)
+            return value
+
+    def __set__(self, obj, value):
+        setattr(obj, self.name, value)
+
+    def __delete__(self, obj):
+        try:
+            delattr(obj, self.name)
+        except AttributeError:
+            pass
+
 class DBOpmWasGeneratedBy(object):
 
     vtType = 'opm_was_generated_by'
 
+    __slots__ = (
+        '__dict__',
+        '__weakref__',
+        'is_dirty',
+        'is_new',
+        '_db_effect',
+        '_db_deleted_effect',
+        '_db_role',
+        '_db_deleted_role',
+        '_db_cause',
+        '_db_deleted_cause',
+        '_db_accounts',
+        '_db_deleted_accounts',
+        '_db_opm_times',
+        '_db_deleted_opm_times',
+        )
+    db_deleted_effect = LazyList('_db_deleted_effect')
+    db_deleted_role = LazyList('_db_deleted_role')
+    db_deleted_cause = LazyList('_db_deleted_cause')
+    db_deleted_accounts = LazyList('_db_deleted_accounts')
+    db_deleted_opm_times = LazyList('_db_deleted_opm_times')
+
     def __init__(self, effect=None, role=None, cause=None, accounts=None, opm_times=None):
-        self.db_deleted_effect = []
         self._db_effect = effect
-        self.db_deleted_role = []
         self._db_role = role
-        self.db_deleted_cause = []
         self._db_cause = cause
-        self.db_deleted_accounts = []
         if accounts is None:
             self._db_accounts = []
         else:
             self._db_accounts = accounts
-        self.db_deleted_opm_times = []
         if opm_times is None:
             self._db_opm_times = []
         else:
@@ -64,7 +107,8 @@ class DBOpmWasGeneratedBy(object):
     def __copy__(self):
         return DBOpmWasGeneratedBy.do_copy(self)
 
-    def do_copy(self, new_ids=False, id_scope=None, id_remap=None):
+    def do_copy(self, new_ids=False, id_scope=None, id_remap=None,
+                shared=()):
         cp = DBOpmWasGeneratedBy()
         if self._db_effect is not None:
             cp._db_effect = self._db_effect.do_copy(new_ids, id_scope, id_remap)
@@ -74,10 +118,14 @@ class DBOpmWasGeneratedBy(object):
             cp._db_cause = self._db_cause.do_copy(new_ids, id_scope, id_remap)
         if self._db_accounts is None:
             cp._db_accounts = []
+        elif 'accounts' in shared:
+            cp._db_accounts = list(self._db_accounts)
         else:
             cp._db_accounts = [v.do_copy(new_ids, id_scope, id_remap) for v in self._db_accounts]
         if self._db_opm_times is None:
             cp._db_opm_times = []
+        elif 'opm_times' in shared:
+            cp._db_opm_times = list(self._db_opm_times)
         else:
             cp._db_opm_times = [v.do_copy(new_ids, id_scope, id_remap) for v in self._db_opm_times]
         
@@ -191,17 +239,17 @@ class DBOpmWasGeneratedBy(object):
         return children
     def db_deleted_children(self, remove=False):
         children = []
-        children.extend(self.db_deleted_effect)
-        children.extend(self.db_deleted_role)
-        children.extend(self.db_deleted_cause)
-        children.extend(self.db_deleted_accounts)
-        children.extend(self.db_deleted_opm_times)
+        children.extend(getattr(self, '_db_deleted_effect', ()))
+        children.extend(getattr(self, '_db_deleted_role', ()))
+        children.extend(getattr(self, '_db_deleted_cause', ()))
+        children.extend(getattr(self, '_db_deleted_accounts', ()))
+        children.extend(getattr(self, '_db_deleted_opm_times', ()))
         if remove:
-            self.db_deleted_effect = []
-            self.db_deleted_role = []
-            self.db_deleted_cause = []
-            self.db_deleted_accounts = []
-            self.db_deleted_opm_times = []
+            del self.db_deleted_effect
+            del self.db_deleted_role
+            del self.db_deleted_cause
+            del self.db_deleted_accounts
+            del self.db_deleted_opm_times
         return children
     def has_changes(self):
         if self.is_dirty:
@@ -310,8 +358,18 @@ class DBConfigKey(object):
 
     vtType = 'config_key'
 
+    __slots__ = (
+        '__dict__',
+        '__weakref__',
+        'is_dirty',
+        'is_new',
+        '_db_value',
+        '_db_deleted_value',
+        '_db_name',
+        )
+    db_deleted_value = LazyList('_db_deleted_value')
+
     def __init__(self, value=None, name=None):
-        self.db_deleted_value = []
         self._db_value = value
         self._db_name = name
         self.is_dirty = True
@@ -320,7 +378,8 @@ class DBConfigKey(object):
     def __copy__(self):
         return DBConfigKey.do_copy(self)
 
-    def do_copy(self, new_ids=False, id_scope=None, id_remap=None):
+    def do_copy(self, new_ids=False, id_scope=None, id_remap=None,
+                shared=()):
         cp = DBConfigKey(name=self._db_name)
         if self._db_value is not None:
             cp._db_value = self._db_value.do_copy(new_ids, id_scope, id_remap)
@@ -398,9 +457,9 @@ class DBConfigKey(object):
         return children
     def db_deleted_children(self, remove=False):
         children = []
-        children.extend(self.db_deleted_value)
+        children.extend(getattr(self, '_db_deleted_value', ()))
         if remove:
-            self.db_deleted_value = []
+            del self.db_deleted_value
         return children
     def has_changes(self):
         if self.is_dirty:
@@ -454,7 +513,8 @@ class DBMashupAlias(object):
     def __copy__(self):
         return DBMashupAlias.do_copy(self)
 
-    def do_copy(self, new_ids=False, id_scope=None, id_remap=None):
+    def do_copy(self, new_ids=False, id_scope=None, id_remap=None,
+                shared=()):
         cp = DBMashupAlias(id=self._db_id,
                            name=self._db_name)
         if self._db_component is not None:
@@ -574,18 +634,48 @@ class DBGroup(object):
 
     vtType = 'group'
 
+    __slots__ = (
+        '__dict__',
+        '__weakref__',
+        'is_dirty',
+        'is_new',
+        '_db_id',
+        '_db_workflow',
+        '_db_deleted_workflow',
+        '_db_cache',
+        '_db_name',
+        '_db_namespace',
+        '_db_package',
+        '_db_version',
+        '_db_location',
+        '_db_deleted_location',
+        '_db_functions',
+        '_db_deleted_functions',
+        'db_functions_id_index',
+        '_db_annotations',
+        '_db_deleted_annotations',
+        'db_annotations_id_index',
+        'db_annotations_key_index',
+        '_db_controlParameters',
+        '_db_deleted_controlParameters',
+        'db_controlParameters_id_index',
+        'db_controlParameters_name_index',
+        )
+    db_deleted_workflow = LazyList('_db_deleted_workflow')
+    db_deleted_location = LazyList('_db_deleted_location')
+    db_deleted_functions = LazyList('_db_deleted_functions')
+    db_deleted_annotations = LazyList('_db_deleted_annotations')
+    db_deleted_controlParameters = LazyList('_db_deleted_controlParameters')
+
     def __init__(self, id=None, workflow=None, cache=None, name=None, namespace=None, package=None, version=None, location=None, functions=None, annotations=None, controlParameters=None):
         self._db_id = id
-        self.db_deleted_workflow = []
         self._db_workflow = workflow
         self._db_cache = cache
         self._db_name = name
         self._db_namespace = namespace
         self._db_package = package
         self._db_version = version
-        self.db_deleted_location = []
         self._db_location = location
-        self.db_deleted_functions = []
         self.db_functions_id_index = {}
         if functions is None:
             self._db_functions = []
@@ -593,7 +683,6 @@ class DBGroup(object):
             self._db_functions = functions
             for v in self._db_functions:
                 self.db_functions_id_index[v.db_id] = v
-        self.db_deleted_annotations = []
         self.db_annotations_id_index = {}
         self.db_annotations_key_index = {}
         if annotations is None:
@@ -603,7 +692,6 @@ class DBGroup(object):
             for v in self._db_annotations:
                 self.db_annotations_id_index[v.db_id] = v
                 self.db_annotations_key_index[v.db_key] = v
-        self.db_deleted_controlParameters = []
         self.db_controlParameters_id_index = {}
         self.db_controlParameters_name_index = {}
         if controlParameters is None:
@@ -619,7 +707,8 @@ class DBGroup(object):
     def __copy__(self):
         return DBGroup.do_copy(self)
 
-    def do_copy(self, new_ids=False, id_scope=None, id_remap=None):
+    def do_copy(self, new_ids=False, id_scope=None, id_remap=None,
+                shared=()):
         cp = DBGroup(id=self._db_id,
                      cache=self._db_cache,
                      name=self._db_name,
@@ -632,14 +721,20 @@ class DBGroup(object):
             cp._db_location = self._db_location.do_copy(new_ids, id_scope, id_remap)
         if self._db_functions is None:
             cp._db_functions = []
+        elif 'functions' in shared:
+            cp._db_functions = list(self._db_functions)
         else:
             cp._db_functions = [v.do_copy(new_ids, id_scope, id_remap) for v in self._db_functions]
         if self._db_annotations is None:
             cp._db_annotations = []
+        elif 'annotations' in shared:
+            cp._db_annotations = list(self._db_annotations)
         else:
             cp._db_annotations = [v.do_copy(new_ids, id_scope, id_remap) for v in self._db_annotations]
         if self._db_controlParameters is None:
             cp._db_controlParameters = []
+        elif 'controlParameters' in shared:
+            cp._db_controlParameters = list(self._db_controlParameters)
         else:
             cp._db_controlParameters = [v.do_copy(new_ids, id_scope, id_remap) for v in self._db_controlParameters]
         
@@ -788,17 +883,17 @@ class DBGroup(object):
         return children
     def db_deleted_children(self, remove=False):
         children = []
-        children.extend(self.db_deleted_workflow)
-        children.extend(self.db_deleted_location)
-        children.extend(self.db_deleted_functions)
-        children.extend(self.db_deleted_annotations)
-        children.extend(self.db_deleted_controlParameters)
+        children.extend(getattr(self, '_db_deleted_workflow', ()))
+        children.extend(getattr(self, '_db_deleted_location', ()))
+        children.extend(getattr(self, '_db_deleted_functions', ()))
+        children.extend(getattr(self, '_db_deleted_annotations', ()))
+        children.extend(getattr(self, '_db_deleted_controlParameters', ()))
         if remove:
-            self.db_deleted_workflow = []
-            self.db_deleted_location = []
-            self.db_deleted_functions = []
-            self.db_deleted_annotations = []
-            self.db_deleted_controlParameters = []
+            del self.db_deleted_workflow
+            del self.db_deleted_location
+            del self.db_deleted_functions
+            del self.db_deleted_annotations
+            del self.db_deleted_controlParameters
         return children
     def has_changes(self):
         if self.is_dirty:
@@ -1072,24 +1167,43 @@ class DBOpmWasControlledBy(object):
 
     vtType = 'opm_was_controlled_by'
 
+    __slots__ = (
+        '__dict__',
+        '__weakref__',
+        'is_dirty',
+        'is_new',
+        '_db_effect',
+        '_db_deleted_effect',
+        '_db_role',
+        '_db_deleted_role',
+        '_db_cause',
+        '_db_deleted_cause',
+        '_db_accounts',
+        '_db_deleted_accounts',
+        '_db_starts',
+        '_db_deleted_starts',
+        '_db_ends',
+        '_db_deleted_ends',
+        )
+    db_deleted_effect = LazyList('_db_deleted_effect')
+    db_deleted_role = LazyList('_db_deleted_role')
+    db_deleted_cause = LazyList('_db_deleted_cause')
+    db_deleted_accounts = LazyList('_db_deleted_accounts')
+    db_deleted_starts = LazyList('_db_deleted_starts')
+    db_deleted_ends = LazyList('_db_deleted_ends')
+
     def __init__(self, effect=None, role=None, cause=None, accounts=None, starts=None, ends=None):
-        self.db_deleted_effect = []
         self._db_effect = effect
-        self.db_deleted_role = []
         self._db_role = role
-        self.db_deleted_cause = []
         self._db_cause = cause
-        self.db_deleted_accounts = []
         if accounts is None:
             self._db_accounts = []
         else:
             self._db_accounts = accounts
-        self.db_deleted_starts = []
         if starts is None:
             self._db_starts = []
         else:
             self._db_starts = starts
-        self.db_deleted_ends = []
         if ends is None:
             self._db_ends = []
         else:
@@ -1100,7 +1214,8 @@ class DBOpmWasControlledBy(object):
     def __copy__(self):
         return DBOpmWasControlledBy.do_copy(self)
 
-    def do_copy(self, new_ids=False, id_scope=None, id_remap=None):
+    def do_copy(self, new_ids=False, id_scope=None, id_remap=None,
+                shared=()):
         cp = DBOpmWasControlledBy()
         if self._db_effect is not None:
             cp._db_effect = self._db_effect.do_copy(new_ids, id_scope, id_remap)
@@ -1110,14 +1225,20 @@ class DBOpmWasControlledBy(object):
             cp._db_cause = self._db_cause.do_copy(new_ids, id_scope, id_remap)
         if self._db_accounts is None:
             cp._db_accounts = []
+        elif 'accounts' in shared:
+            cp._db_accounts = list(self._db_accounts)
         else:
             cp._db_accounts = [v.do_copy(new_ids, id_scope, id_remap) for v in self._db_accounts]
         if self._db_starts is None:
             cp._db_starts = []
+        elif 'starts' in shared:
+            cp._db_starts = list(self._db_starts)
         else:
             cp._db_starts = [v.do_copy(new_ids, id_scope, id_remap) for v in self._db_starts]
         if self._db_ends is None:
             cp._db_ends = []
+        elif 'ends' in shared:
+            cp._db_ends = list(self._db_ends)
         else:
             cp._db_ends = [v.do_copy(new_ids, id_scope, id_remap) for v in self._db_ends]
         
@@ -1249,19 +1370,19 @@ class DBOpmWasControlledBy(object):
         return children
     def db_deleted_children(self, remove=False):
         children = []
-        children.extend(self.db_deleted_effect)
-        children.extend(self.db_deleted_role)
-        children.extend(self.db_deleted_cause)
-        children.extend(self.db_deleted_accounts)
-        children.extend(self.db_deleted_starts)
-        children.extend(self.db_deleted_ends)
+        children.extend(getattr(self, '_db_deleted_effect', ()))
+        children.extend(getattr(self, '_db_deleted_role', ()))
+        children.extend(getattr(self, '_db_deleted_cause', ()))
+        children.extend(getattr(self, '_db_deleted_accounts', ()))
+        children.extend(getattr(self, '_db_deleted_starts', ()))
+        children.extend(getattr(self, '_db_deleted_ends', ()))
         if remove:
-            self.db_deleted_effect = []
-            self.db_deleted_role = []
-            self.db_deleted_cause = []
-            self.db_deleted_accounts = []
-            self.db_deleted_starts = []
-            self.db_deleted_ends = []
+            del self.db_deleted_effect
+            del self.db_deleted_role
+            del self.db_deleted_cause
+            del self.db_deleted_accounts
+            del self.db_deleted_starts
+            del self.db_deleted_ends
         return children
     def has_changes(self):
         if self.is_dirty:
@@ -1393,8 +1514,22 @@ class DBAdd(object):
 
     vtType = 'add'
 
+    __slots__ = (
+        '__dict__',
+        '__weakref__',
+        'is_dirty',
+        'is_new',
+        '_db_data',
+        '_db_deleted_data',
+        '_db_id',
+        '_db_what',
+        '_db_objectId',
+        '_db_parentObjId',
+        '_db_parentObjType',
+        )
+    db_deleted_data = LazyList('_db_deleted_data')
+
     def __init__(self, data=None, id=None, what=None, objectId=None, parentObjId=None, parentObjType=None):
-        self.db_deleted_data = []
         self._db_data = data
         self._db_id = id
         self._db_what = what
@@ -1407,7 +1542,8 @@ class DBAdd(object):
     def __copy__(self):
         return DBAdd.do_copy(self)
 
-    def do_copy(self, new_ids=False, id_scope=None, id_remap=None):
+    def do_copy(self, new_ids=False, id_scope=None, id_remap=None,
+                shared=()):
         cp = DBAdd(id=self._db_id,
                    what=self._db_what,
                    objectId=self._db_objectId,
@@ -1553,9 +1689,9 @@ class DBAdd(object):
         return children
     def db_deleted_children(self, remove=False):
         children = []
-        children.extend(self.db_deleted_data)
+        children.extend(getattr(self, '_db_deleted_data', ()))
         if remove:
-            self.db_deleted_data = []
+            del self.db_deleted_data
         return children
     def has_changes(self):
         if self.is_dirty:
@@ -1650,10 +1786,22 @@ class DBProvGeneration(object):
 
     vtType = 'prov_generation'
 
+    __slots__ = (
+        '__dict__',
+        '__weakref__',
+        'is_dirty',
+        'is_new',
+        '_db_prov_entity',
+        '_db_deleted_prov_entity',
+        '_db_prov_activity',
+        '_db_deleted_prov_activity',
+        '_db_prov_role',
+        )
+    db_deleted_prov_entity = LazyList('_db_deleted_prov_entity')
+    db_deleted_prov_activity = LazyList('_db_deleted_prov_activity')
+
     def __init__(self, prov_entity=None, prov_activity=None, prov_role=None):
-        self.db_deleted_prov_entity = []
         self._db_prov_entity = prov_entity
-        self.db_deleted_prov_activity = []
         self._db_prov_activity = prov_activity
         self._db_prov_role = prov_role
         self.is_dirty = True
@@ -1662,7 +1810,8 @@ class DBProvGeneration(object):
     def __copy__(self):
         return DBProvGeneration.do_copy(self)
 
-    def do_copy(self, new_ids=False, id_scope=None, id_remap=None):
+    def do_copy(self, new_ids=False, id_scope=None, id_remap=None,
+                shared=()):
         cp = DBProvGeneration(prov_role=self._db_prov_role)
         if self._db_prov_entity is not None:
             cp._db_prov_entity = self._db_prov_entity.do_copy(new_ids, id_scope, id_remap)
@@ -1734,11 +1883,11 @@ class DBProvGeneration(object):
         return children
     def db_deleted_children(self, remove=False):
         children = []
-        children.extend(self.db_deleted_prov_entity)
-        children.extend(self.db_deleted_prov_activity)
+        children.extend(getattr(self, '_db_deleted_prov_entity', ()))
+        children.extend(getattr(self, '_db_deleted_prov_activity', ()))
         if remove:
-            self.db_deleted_prov_entity = []
-            self.db_deleted_prov_activity = []
+            del self.db_deleted_prov_entity
+            del self.db_deleted_prov_activity
         return children
     def has_changes(self):
         if self.is_dirty:
@@ -1797,19 +1946,36 @@ class DBOpmUsed(object):
 
     vtType = 'opm_used'
 
+    __slots__ = (
+        '__dict__',
+        '__weakref__',
+        'is_dirty',
+        'is_new',
+        '_db_effect',
+        '_db_deleted_effect',
+        '_db_role',
+        '_db_deleted_role',
+        '_db_cause',
+        '_db_deleted_cause',
+        '_db_accounts',
+        '_db_deleted_accounts',
+        '_db_opm_times',
+        '_db_deleted_opm_times',
+        )
+    db_deleted_effect = LazyList('_db_deleted_effect')
+    db_deleted_role = LazyList('_db_deleted_role')
+    db_deleted_cause = LazyList('_db_deleted_cause')
+    db_deleted_accounts = LazyList('_db_deleted_accounts')
+    db_deleted_opm_times = LazyList('_db_deleted_opm_times')
+
     def __init__(self, effect=None, role=None, cause=None, accounts=None, opm_times=None):
-        self.db_deleted_effect = []
         self._db_effect = effect
-        self.db_deleted_role = []
         self._db_role = role
-        self.db_deleted_cause = []
         self._db_cause = cause
-        self.db_deleted_accounts = []
         if accounts is None:
             self._db_accounts = []
         else:
             self._db_accounts = accounts
-        self.db_deleted_opm_times = []
         if opm_times is None:
             self._db_opm_times = []
         else:
@@ -1820,7 +1986,8 @@ class DBOpmUsed(object):
     def __copy__(self):
         return DBOpmUsed.do_copy(self)
 
-    def do_copy(self, new_ids=False, id_scope=None, id_remap=None):
+    def do_copy(self, new_ids=False, id_scope=None, id_remap=None,
+                shared=()):
         cp = DBOpmUsed()
         if self._db_effect is not None:
             cp._db_effect = self._db_effect.do_copy(new_ids, id_scope, id_remap)
@@ -1830,10 +1997,14 @@ class DBOpmUsed(object):
             cp._db_cause = self._db_cause.do_copy(new_ids, id_scope, id_remap)
         if self._db_accounts is None:
             cp._db_accounts = []
+        elif 'accounts' in shared:
+            cp._db_accounts = list(self._db_accounts)
         else:
             cp._db_accounts = [v.do_copy(new_ids, id_scope, id_remap) for v in self._db_accounts]
         if self._db_opm_times is None:
             cp._db_opm_times = []
+        elif 'opm_times' in shared:
+            cp._db_opm_times = list(self._db_opm_times)
         else:
             cp._db_opm_times = [v.do_copy(new_ids, id_scope, id_remap) for v in self._db_opm_times]
         
@@ -1947,17 +2118,17 @@ class DBOpmUsed(object):
         return children
     def db_deleted_children(self, remove=False):
         children = []
-        children.extend(self.db_deleted_effect)
-        children.extend(self.db_deleted_role)
-        children.extend(self.db_deleted_cause)
-        children.extend(self.db_deleted_accounts)
-        children.extend(self.db_deleted_opm_times)
+        children.extend(getattr(self, '_db_deleted_effect', ()))
+        children.extend(getattr(self, '_db_deleted_role', ()))
+        children.extend(getattr(self, '_db_deleted_cause', ()))
+        children.extend(getattr(self, '_db_deleted_accounts', ()))
+        children.extend(getattr(self, '_db_deleted_opm_times', ()))
         if remove:
-            self.db_deleted_effect = []
-            self.db_deleted_role = []
-            self.db_deleted_cause = []
-            self.db_deleted_accounts = []
-            self.db_deleted_opm_times = []
+            del self.db_deleted_effect
+            del self.db_deleted_role
+            del self.db_deleted_cause
+            del self.db_deleted_accounts
+            del self.db_deleted_opm_times
         return children
     def has_changes(self):
         if self.is_dirty:
@@ -2066,6 +2237,14 @@ class DBOpmArtifactIdCause(object):
 
     vtType = 'opm_artifact_id_cause'
 
+    __slots__ = (
+        '__dict__',
+        '__weakref__',
+        'is_dirty',
+        'is_new',
+        '_db_id',
+        )
+
     def __init__(self, id=None):
         self._db_id = id
         self.is_dirty = True
@@ -2074,7 +2253,8 @@ class DBOpmArtifactIdCause(object):
     def __copy__(self):
         return DBOpmArtifactIdCause.do_copy(self)
 
-    def do_copy(self, new_ids=False, id_scope=None, id_remap=None):
+    def do_copy(self, new_ids=False, id_scope=None, id_remap=None,
+                shared=()):
         cp = DBOpmArtifactIdCause(id=self._db_id)
         
         # set new ids
@@ -2138,6 +2318,14 @@ class DBRefProvEntity(object):
 
     vtType = 'ref_prov_entity'
 
+    __slots__ = (
+        '__dict__',
+        '__weakref__',
+        'is_dirty',
+        'is_new',
+        '_db_prov_ref',
+        )
+
     def __init__(self, prov_ref=None):
         self._db_prov_ref = prov_ref
         self.is_dirty = True
@@ -2146,7 +2334,8 @@ class DBRefProvEntity(object):
     def __copy__(self):
         return DBRefProvEntity.do_copy(self)
 
-    def do_copy(self, new_ids=False, id_scope=None, id_remap=None):
+    def do_copy(self, new_ids=False, id_scope=None, id_remap=None,
+                shared=()):
         cp = DBRefProvEntity(prov_ref=self._db_prov_ref)
         
         # set new ids
@@ -2210,6 +2399,20 @@ class DBVtConnection(object):
 
     vtType = 'vt_connection'
 
+    __slots__ = (
+        '__dict__',
+        '__weakref__',
+        'is_dirty',
+        'is_new',
+        '_db_id',
+        '_db_vt_source',
+        '_db_vt_dest',
+        '_db_vt_source_port',
+        '_db_vt_dest_port',
+        '_db_vt_source_signature',
+        '_db_vt_dest_signature',
+        )
+
     def __init__(self, id=None, vt_source=None, vt_dest=None, vt_source_port=None, vt_dest_port=None, vt_source_signature=None, vt_dest_signature=None):
         self._db_id = id
         self._db_vt_source = vt_source
@@ -2224,7 +2427,8 @@ class DBVtConnection(object):
     def __copy__(self):
         return DBVtConnection.do_copy(self)
 
-    def do_copy(self, new_ids=False, id_scope=None, id_remap=None):
+    def do_copy(self, new_ids=False, id_scope=None, id_remap=None,
+                shared=()):
         cp = DBVtConnection(id=self._db_id,
                             vt_source=self._db_vt_source,
                             vt_dest=self._db_vt_dest,
@@ -2401,6 +2605,15 @@ class DBOpmAccount(object):
 
     vtType = 'opm_account'
 
+    __slots__ = (
+        '__dict__',
+        '__weakref__',
+        'is_dirty',
+        'is_new',
+        '_db_id',
+        '_db_value',
+        )
+
     def __init__(self, id=None, value=None):
         self._db_id = id
         self._db_value = value
@@ -2410,7 +2623,8 @@ class DBOpmAccount(object):
     def __copy__(self):
         return DBOpmAccount.do_copy(self)
 
-    def do_copy(self, new_ids=False, id_scope=None, id_remap=None):
+    def do_copy(self, new_ids=False, id_scope=None, id_remap=None,
+                shared=()):
         cp = DBOpmAccount(id=self._db_id,
                           value=self._db_value)
         
@@ -2492,8 +2706,32 @@ class DBGroupExec(object):
 
     vtType = 'group_exec'
 
+    __slots__ = (
+        '__dict__',
+        '__weakref__',
+        'is_dirty',
+        'is_new',
+        '_db_item_execs',
+        '_db_deleted_item_execs',
+        'db_item_execs_id_index',
+        '_db_id',
+        '_db_ts_start',
+        '_db_ts_end',
+        '_db_cached',
+        '_db_module_id',
+        '_db_group_name',
+        '_db_group_type',
+        '_db_completed',
+        '_db_error',
+        '_db_machine_id',
+        '_db_annotations',
+        '_db_deleted_annotations',
+        'db_annotations_id_index',
+        )
+    db_deleted_item_execs = LazyList('_db_deleted_item_execs')
+    db_deleted_annotations = LazyList('_db_deleted_annotations')
+
     def __init__(self, item_execs=None, id=None, ts_start=None, ts_end=None, cached=None, module_id=None, group_name=None, group_type=None, completed=None, error=None, machine_id=None, annotations=None):
-        self.db_deleted_item_execs = []
         self.db_item_execs_id_index = {}
         if item_execs is None:
             self._db_item_execs = []
@@ -2511,7 +2749,6 @@ class DBGroupExec(object):
         self._db_completed = completed
         self._db_error = error
         self._db_machine_id = machine_id
-        self.db_deleted_annotations = []
         self.db_annotations_id_index = {}
         if annotations is None:
             self._db_annotations = []
@@ -2525,7 +2762,8 @@ class DBGroupExec(object):
     def __copy__(self):
         return DBGroupExec.do_copy(self)
 
-    def do_copy(self, new_ids=False, id_scope=None, id_remap=None):
+    def do_copy(self, new_ids=False, id_scope=None, id_remap=None,
+                shared=()):
         cp = DBGroupExec(id=self._db_id,
                          ts_start=self._db_ts_start,
                          ts_end=self._db_ts_end,
@@ -2538,10 +2776,14 @@ class DBGroupExec(object):
                          machine_id=self._db_machine_id)
         if self._db_item_execs is None:
             cp._db_item_execs = []
+        elif 'item_execs' in shared:
+            cp._db_item_execs = list(self._db_item_execs)
         else:
             cp._db_item_execs = [v.do_copy(new_ids, id_scope, id_remap) for v in self._db_item_execs]
         if self._db_annotations is None:
             cp._db_annotations = []
+        elif 'annotations' in shared:
+            cp._db_annotations = list(self._db_annotations)
         else:
             cp._db_annotations = [v.do_copy(new_ids, id_scope, id_remap) for v in self._db_annotations]
         
@@ -2681,11 +2923,11 @@ class DBGroupExec(object):
         return children
     def db_deleted_children(self, remove=False):
         children = []
-        children.extend(self.db_deleted_annotations)
-        children.extend(self.db_deleted_item_execs)
+        children.extend(getattr(self, '_db_deleted_annotations', ()))
+        children.extend(getattr(self, '_db_deleted_item_execs', ()))
         if remove:
-            self.db_deleted_annotations = []
-            self.db_deleted_item_execs = []
+            del self.db_deleted_annotations
+            del self.db_deleted_item_execs
         return children
     def has_changes(self):
         if self.is_dirty:
@@ -2918,6 +3160,14 @@ class DBOpmAgentId(object):
 
     vtType = 'opm_agent_id'
 
+    __slots__ = (
+        '__dict__',
+        '__weakref__',
+        'is_dirty',
+        'is_new',
+        '_db_id',
+        )
+
     def __init__(self, id=None):
         self._db_id = id
         self.is_dirty = True
@@ -2926,7 +3176,8 @@ class DBOpmAgentId(object):
     def __copy__(self):
         return DBOpmAgentId.do_copy(self)
 
-    def do_copy(self, new_ids=False, id_scope=None, id_remap=None):
+    def do_copy(self, new_ids=False, id_scope=None, id_remap=None,
+                shared=()):
         cp = DBOpmAgentId(id=self._db_id)
         
         # set new ids
@@ -2990,6 +3241,19 @@ class DBParameter(object):
 
     vtType = 'parameter'
 
+    __slots__ = (
+        '__dict__',
+        '__weakref__',
+        'is_dirty',
+        'is_new',
+        '_db_id',
+        '_db_pos',
+        '_db_name',
+        '_db_type',
+        '_db_val',
+        '_db_alias',
+        )
+
     def __init__(self, id=None, pos=None, name=None, type=None, val=None, alias=None):
         self._db_id = id
         self._db_pos = pos
@@ -3003,7 +3267,8 @@ class DBParameter(object):
     def __copy__(self):
         return DBParameter.do_copy(self)
 
-    def do_copy(self, new_ids=False, id_scope=None, id_remap=None):
+    def do_copy(self, new_ids=False, id_scope=None, id_remap=None,
+                shared=()):
         cp = DBParameter(id=self._db_id,
                          pos=self._db_pos,
                          name=self._db_name,
@@ -3161,13 +3426,58 @@ class DBVistrail(object):
 
     vtType = 'vistrail'
 
+    __slots__ = (
+        '__dict__',
+        '__weakref__',
+        'is_dirty',
+        'is_new',
+        '_db_id',
+        '_db_entity_type',
+        '_db_version',
+        '_db_name',
+        '_db_last_modified',
+        '_db_actions',
+        '_db_deleted_actions',
+        'db_actions_id_index',
+        '_db_tags',
+        '_db_deleted_tags',
+        'db_tags_id_index',
+        'db_tags_name_index',
+        '_db_annotations',
+        '_db_deleted_annotations',
+        'db_annotations_id_index',
+        'db_annotations_key_index',
+        '_db_controlParameters',
+        '_db_deleted_controlParameters',
+        'db_controlParameters_id_index',
+        'db_controlParameters_name_index',
+        '_db_vistrailVariables',
+        '_db_deleted_vistrailVariables',
+        'db_vistrailVariables_name_index',
+        'db_vistrailVariables_uuid_index',
+        '_db_parameter_explorations',
+        '_db_deleted_parameter_explorations',
+        'db_parameter_explorations_id_index',
+        '_db_actionAnnotations',
+        '_db_deleted_actionAnnotations',
+        'db_actionAnnotations_id_index',
+        'db_actionAnnotations_action_id_index',
+        'db_actionAnnotations_key_index',
+        )
+    db_deleted_actions = LazyList('_db_deleted_actions')
+    db_deleted_tags = LazyList('_db_deleted_tags')
+    db_deleted_annotations = LazyList('_db_deleted_annotations')
+    db_deleted_controlParameters = LazyList('_db_deleted_controlParameters')
+    db_deleted_vistrailVariables = LazyList('_db_deleted_vistrailVariables')
+    db_deleted_parameter_explorations = LazyList('_db_deleted_parameter_explorations')
+    db_deleted_actionAnnotations = LazyList('_db_deleted_actionAnnotations')
+
     def __init__(self, id=None, entity_type=None, version=None, name=None, last_modified=None, actions=None, tags=None, annotations=None, controlParameters=None, vistrailVariables=None, parameter_explorations=None, actionAnnotations=None):
         self._db_id = id
         self._db_entity_type = entity_type
         self._db_version = version
         self._db_name = name
         self._db_last_modified = last_modified
-        self.db_deleted_actions = []
         self.db_actions_id_index = {}
         if actions is None:
             self._db_actions = []
@@ -3175,7 +3485,6 @@ class DBVistrail(object):
             self._db_actions = actions
             for v in self._db_actions:
                 self.db_actions_id_index[v.db_id] = v
-        self.db_deleted_tags = []
         self.db_tags_id_index = {}
         self.db_tags_name_index = {}
         if tags is None:
@@ -3185,7 +3494,6 @@ class DBVistrail(object):
             for v in self._db_tags:
                 self.db_tags_id_index[v.db_id] = v
                 self.db_tags_name_index[v.db_name] = v
-        self.db_deleted_annotations = []
         self.db_annotations_id_index = {}
         self.db_annotations_key_index = {}
         if annotations is None:
@@ -3195,7 +3503,6 @@ class DBVistrail(object):
             for v in self._db_annotations:
                 self.db_annotations_id_index[v.db_id] = v
                 self.db_annotations_key_index[v.db_key] = v
-        self.db_deleted_controlParameters = []
         self.db_controlParameters_id_index = {}
         self.db_controlParameters_name_index = {}
         if controlParameters is None:
@@ -3205,7 +3512,6 @@ class DBVistrail(object):
             for v in self._db_controlParameters:
                 self.db_controlParameters_id_index[v.db_id] = v
                 self.db_controlParameters_name_index[v.db_name] = v
-        self.db_deleted_vistrailVariables = []
         self.db_vistrailVariables_name_index = {}
         self.db_vistrailVariables_uuid_index = {}
         if vistrailVariables is None:
@@ -3215,7 +3521,6 @@ class DBVistrail(object):
             for v in self._db_vistrailVariables:
                 self.db_vistrailVariables_name_index[v.db_name] = v
                 self.db_vistrailVariables_uuid_index[v.db_uuid] = v
-        self.db_deleted_parameter_explorations = []
         self.db_parameter_explorations_id_index = {}
         if parameter_explorations is None:
             self._db_parameter_explorations = []
@@ -3223,7 +3528,6 @@ class DBVistrail(object):
             self._db_parameter_explorations = parameter_explorations
             for v in self._db_parameter_explorations:
                 self.db_parameter_explorations_id_index[v.db_id] = v
-        self.db_deleted_actionAnnotations = []
         self.db_actionAnnotations_id_index = {}
         self.db_actionAnnotations_action_id_index = {}
         self.db_actionAnnotations_key_index = {}
@@ -3241,7 +3545,8 @@ class DBVistrail(object):
     def __copy__(self):
         return DBVistrail.do_copy(self)
 
-    def do_copy(self, new_ids=False, id_scope=None, id_remap=None):
+    def do_copy(self, new_ids=False, id_scope=None, id_remap=None,
+                shared=()):
         cp = DBVistrail(id=self._db_id,
                         entity_type=self._db_entity_type,
                         version=self._db_version,
@@ -3249,30 +3554,44 @@ class DBVistrail(object):
                         last_modified=self._db_last_modified)
         if self._db_actions is None:
             cp._db_actions = []
+        elif 'actions' in shared:
+            cp._db_actions = list(self._db_actions)
         else:
             cp._db_actions = [v.do_copy(new_ids, id_scope, id_remap) for v in self._db_actions]
         if self._db_tags is None:
             cp._db_tags = []
+        elif 'tags' in shared:
+            cp._db_tags = list(self._db_tags)
         else:
             cp._db_tags = [v.do_copy(new_ids, id_scope, id_remap) for v in self._db_tags]
         if self._db_annotations is None:
             cp._db_annotations = []
+        elif 'annotations' in shared:
+            cp._db_annotations = list(self._db_annotations)
         else:
             cp._db_annotations = [v.do_copy(new_ids, id_scope, id_remap) for v in self._db_annotations]
         if self._db_controlParameters is None:
             cp._db_controlParameters = []
+        elif 'controlParameters' in shared:
+            cp._db_controlParameters = list(self._db_controlParameters)
         else:
             cp._db_controlParameters = [v.do_copy(new_ids, id_scope, id_remap) for v in self._db_controlParameters]
         if self._db_vistrailVariables is None:
             cp._db_vistrailVariables = []
+        elif 'vistrailVariables' in shared:
+            cp._db_vistrailVariables = list(self._db_vistrailVariables)
         else:
             cp._db_vistrailVariables = [v.do_copy(new_ids, id_scope, id_remap) for v in self._db_vistrailVariables]
         if self._db_parameter_explorations is None:
             cp._db_parameter_explorations = []
+        elif 'parameter_explorations' in shared:
+            cp._db_parameter_explorations = list(self._db_parameter_explorations)
         else:
             cp._db_parameter_explorations = [v.do_copy(new_ids, id_scope, id_remap) for v in self._db_parameter_explorations]
         if self._db_actionAnnotations is None:
             cp._db_actionAnnotations = []
+        elif 'actionAnnotations' in shared:
+            cp._db_actionAnnotations = list(self._db_actionAnnotations)
         else:
             cp._db_actionAnnotations = [v.do_copy(new_ids, id_scope, id_remap) for v in self._db_actionAnnotations]
         
@@ -3472,21 +3791,21 @@ class DBVistrail(object):
         return children
     def db_deleted_children(self, remove=False):
         children = []
-        children.extend(self.db_deleted_actions)
-        children.extend(self.db_deleted_tags)
-        children.extend(self.db_deleted_annotations)
-        children.extend(self.db_deleted_controlParameters)
-        children.extend(self.db_deleted_vistrailVariables)
-        children.extend(self.db_deleted_parameter_explorations)
-        children.extend(self.db_deleted_actionAnnotations)
+        children.extend(getattr(self, '_db_deleted_actions', ()))
+        children.extend(getattr(self, '_db_deleted_tags', ()))
+        children.extend(getattr(self, '_db_deleted_annotations', ()))
+        children.extend(getattr(self, '_db_deleted_controlParameters', ()))
+        children.extend(getattr(self, '_db_deleted_vistrailVariables', ()))
+        children.extend(getattr(self, '_db_deleted_parameter_explorations', ()))
+        children.extend(getattr(self, '_db_deleted_actionAnnotations', ()))
         if remove:
-            self.db_deleted_actions = []
-            self.db_deleted_tags = []
-            self.db_deleted_annotations = []
-            self.db_deleted_controlParameters = []
-            self.db_deleted_vistrailVariables = []
-            self.db_deleted_parameter_explorations = []
-            self.db_deleted_actionAnnotations = []
+            del self.db_deleted_actions
+            del self.db_deleted_tags
+            del self.db_deleted_annotations
+            del self.db_deleted_controlParameters
+            del self.db_deleted_vistrailVariables
+            del self.db_deleted_parameter_explorations
+            del self.db_deleted_actionAnnotations
         return children
     def has_changes(self):
         if self.is_dirty:
@@ -3924,8 +4243,17 @@ class DBOpmArtifactValue(object):
 
     vtType = 'opm_artifact_value'
 
+    __slots__ = (
+        '__dict__',
+        '__weakref__',
+        'is_dirty',
+        'is_new',
+        '_db_value',
+        '_db_deleted_value',
+        )
+    db_deleted_value = LazyList('_db_deleted_value')
+
     def __init__(self, value=None):
-        self.db_deleted_value = []
         self._db_value = value
         self.is_dirty = True
         self.is_new = True
@@ -3933,7 +4261,8 @@ class DBOpmArtifactValue(object):
     def __copy__(self):
         return DBOpmArtifactValue.do_copy(self)
 
-    def do_copy(self, new_ids=False, id_scope=None, id_remap=None):
+    def do_copy(self, new_ids=False, id_scope=None, id_remap=None,
+                shared=()):
         cp = DBOpmArtifactValue()
         if self._db_value is not None:
             cp._db_value = self._db_value.do_copy(new_ids, id_scope, id_remap)
@@ -3991,9 +4320,9 @@ class DBOpmArtifactValue(object):
         return children
     def db_deleted_children(self, remove=False):
         children = []
-        children.extend(self.db_deleted_value)
+        children.extend(getattr(self, '_db_deleted_value', ()))
         if remove:
-            self.db_deleted_value = []
+            del self.db_deleted_value
         return children
     def has_changes(self):
         if self.is_dirty:
@@ -4022,6 +4351,14 @@ class DBConfigStr(object):
 
     vtType = 'config_str'
 
+    __slots__ = (
+        '__dict__',
+        '__weakref__',
+        'is_dirty',
+        'is_new',
+        '_db_value',
+        )
+
     def __init__(self, value=None):
         self._db_value = value
         self.is_dirty = True
@@ -4030,7 +4367,8 @@ class DBConfigStr(object):
     def __copy__(self):
         return DBConfigStr.do_copy(self)
 
-    def do_copy(self, new_ids=False, id_scope=None, id_remap=None):
+    def do_copy(self, new_ids=False, id_scope=None, id_remap=None,
+                shared=()):
         cp = DBConfigStr(value=self._db_value)
         
         # set new ids
@@ -4092,13 +4430,27 @@ class DBStartup(object):
 
     vtType = 'startup'
 
+    __slots__ = (
+        '__dict__',
+        '__weakref__',
+        'is_dirty',
+        'is_new',
+        '_db_version',
+        '_db_configuration',
+        '_db_deleted_configuration',
+        '_db_enabled_packages',
+        '_db_deleted_enabled_packages',
+        '_db_disabled_packages',
+        '_db_deleted_disabled_packages',
+        )
+    db_deleted_configuration = LazyList('_db_deleted_configuration')
+    db_deleted_enabled_packages = LazyList('_db_deleted_enabled_packages')
+    db_deleted_disabled_packages = LazyList('_db_deleted_disabled_packages')
+
     def __init__(self, version=None, configuration=None, enabled_packages=None, disabled_packages=None):
         self._db_version = version
-        self.db_deleted_configuration = []
         self._db_configuration = configuration
-        self.db_deleted_enabled_packages = []
         self._db_enabled_packages = enabled_packages
-        self.db_deleted_disabled_packages = []
         self._db_disabled_packages = disabled_packages
         self.is_dirty = True
         self.is_new = True
@@ -4106,7 +4458,8 @@ class DBStartup(object):
     def __copy__(self):
         return DBStartup.do_copy(self)
 
-    def do_copy(self, new_ids=False, id_scope=None, id_remap=None):
+    def do_copy(self, new_ids=False, id_scope=None, id_remap=None,
+                shared=()):
         cp = DBStartup(version=self._db_version)
         if self._db_configuration is not None:
             cp._db_configuration = self._db_configuration.do_copy(new_ids, id_scope, id_remap)
@@ -4194,13 +4547,13 @@ class DBStartup(object):
         return children
     def db_deleted_children(self, remove=False):
         children = []
-        children.extend(self.db_deleted_configuration)
-        children.extend(self.db_deleted_enabled_packages)
-        children.extend(self.db_deleted_disabled_packages)
+        children.extend(getattr(self, '_db_deleted_configuration', ()))
+        children.extend(getattr(self, '_db_deleted_enabled_packages', ()))
+        children.extend(getattr(self, '_db_deleted_disabled_packages', ()))
         if remove:
-            self.db_deleted_configuration = []
-            self.db_deleted_enabled_packages = []
-            self.db_deleted_disabled_packages = []
+            del self.db_deleted_configuration
+            del self.db_deleted_enabled_packages
+            del self.db_deleted_disabled_packages
         return children
     def has_changes(self):
         if self.is_dirty:
@@ -4329,7 +4682,8 @@ class DBModule(object):
     def __copy__(self):
         return DBModule.do_copy(self)
 
-    def do_copy(self, new_ids=False, id_scope=None, id_remap=None):
+    def do_copy(self, new_ids=False, id_scope=None, id_remap=None,
+                shared=()):
         cp = DBModule(id=self._db_id,
                       cache=self._db_cache,
                       name=self._db_name,
@@ -4340,18 +4694,26 @@ class DBModule(object):
             cp._db_location = self._db_location.do_copy(new_ids, id_scope, id_remap)
         if self._db_functions is None:
             cp._db_functions = []
+        elif 'functions' in shared:
+            cp._db_functions = list(self._db_functions)
         else:
             cp._db_functions = [v.do_copy(new_ids, id_scope, id_remap) for v in self._db_functions]
         if self._db_annotations is None:
             cp._db_annotations = []
+        elif 'annotations' in shared:
+            cp._db_annotations = list(self._db_annotations)
         else:
             cp._db_annotations = [v.do_copy(new_ids, id_scope, id_remap) for v in self._db_annotations]
         if self._db_controlParameters is None:
             cp._db_controlParameters = []
+        elif 'controlParameters' in shared:
+            cp._db_controlParameters = list(self._db_controlParameters)
         else:
             cp._db_controlParameters = [v.do_copy(new_ids, id_scope, id_remap) for v in self._db_controlParameters]
         if self._db_portSpecs is None:
             cp._db_portSpecs = []
+        elif 'portSpecs' in shared:
+            cp._db_portSpecs = list(self._db_portSpecs)
         else:
             cp._db_portSpecs = [v.do_copy(new_ids, id_scope, id_remap) for v in self._db_portSpecs]
         
@@ -4829,6 +5191,19 @@ class DBPort(object):
 
     vtType = 'port'
 
+    __slots__ = (
+        '__dict__',
+        '__weakref__',
+        'is_dirty',
+        'is_new',
+        '_db_id',
+        '_db_type',
+        '_db_moduleId',
+        '_db_moduleName',
+        '_db_name',
+        '_db_signature',
+        )
+
     def __init__(self, id=None, type=None, moduleId=None, moduleName=None, name=None, signature=None):
         self._db_id = id
         self._db_type = type
@@ -4842,7 +5217,8 @@ class DBPort(object):
     def __copy__(self):
         return DBPort.do_copy(self)
 
-    def do_copy(self, new_ids=False, id_scope=None, id_remap=None):
+    def do_copy(self, new_ids=False, id_scope=None, id_remap=None,
+                shared=()):
         cp = DBPort(id=self._db_id,
                     type=self._db_type,
                     moduleId=self._db_moduleId,
@@ -5002,8 +5378,18 @@ class DBOpmAgents(object):
 
     vtType = 'opm_agents'
 
+    __slots__ = (
+        '__dict__',
+        '__weakref__',
+        'is_dirty',
+        'is_new',
+        '_db_agents',
+        '_db_deleted_agents',
+        'db_agents_id_index',
+        )
+    db_deleted_agents = LazyList('_db_deleted_agents')
+
     def __init__(self, agents=None):
-        self.db_deleted_agents = []
         self.db_agents_id_index = {}
         if agents is None:
             self._db_agents = []
@@ -5017,10 +5403,13 @@ class DBOpmAgents(object):
     def __copy__(self):
         return DBOpmAgents.do_copy(self)
 
-    def do_copy(self, new_ids=False, id_scope=None, id_remap=None):
+    def do_copy(self, new_ids=False, id_scope=None, id_remap=None,
+                shared=()):
         cp = DBOpmAgents()
         if self._db_agents is None:
             cp._db_agents = []
+        elif 'agents' in shared:
+            cp._db_agents = list(self._db_agents)
         else:
             cp._db_agents = [v.do_copy(new_ids, id_scope, id_remap) for v in self._db_agents]
         
@@ -5075,9 +5464,9 @@ class DBOpmAgents(object):
         return children
     def db_deleted_children(self, remove=False):
         children = []
-        children.extend(self.db_deleted_agents)
+        children.extend(getattr(self, '_db_deleted_agents', ()))
         if remove:
-            self.db_deleted_agents = []
+            del self.db_deleted_agents
         return children
     def has_changes(self):
         if self.is_dirty:
@@ -5134,8 +5523,17 @@ class DBOpmDependencies(object):
 
     vtType = 'opm_dependencies'
 
+    __slots__ = (
+        '__dict__',
+        '__weakref__',
+        'is_dirty',
+        'is_new',
+        '_db_dependencys',
+        '_db_deleted_dependencys',
+        )
+    db_deleted_dependencys = LazyList('_db_deleted_dependencys')
+
     def __init__(self, dependencys=None):
-        self.db_deleted_dependencys = []
         if dependencys is None:
             self._db_dependencys = []
         else:
@@ -5146,10 +5544,13 @@ class DBOpmDependencies(object):
     def __copy__(self):
         return DBOpmDependencies.do_copy(self)
 
-    def do_copy(self, new_ids=False, id_scope=None, id_remap=None):
+    def do_copy(self, new_ids=False, id_scope=None, id_remap=None,
+                shared=()):
         cp = DBOpmDependencies()
         if self._db_dependencys is None:
             cp._db_dependencys = []
+        elif 'dependencys' in shared:
+            cp._db_dependencys = list(self._db_dependencys)
         else:
             cp._db_dependencys = [v.do_copy(new_ids, id_scope, id_remap) for v in self._db_dependencys]
         
@@ -5225,9 +5626,9 @@ class DBOpmDependencies(object):
         return children
     def db_deleted_children(self, remove=False):
         children = []
-        children.extend(self.db_deleted_dependencys)
+        children.extend(getattr(self, '_db_deleted_dependencys', ()))
         if remove:
-            self.db_deleted_dependencys = []
+            del self.db_deleted_dependencys
         return children
     def has_changes(self):
         if self.is_dirty:
@@ -5262,12 +5663,26 @@ class DBPEFunction(object):
 
     vtType = 'pe_function'
 
+    __slots__ = (
+        '__dict__',
+        '__weakref__',
+        'is_dirty',
+        'is_new',
+        '_db_id',
+        '_db_module_id',
+        '_db_port_name',
+        '_db_is_alias',
+        '_db_parameters',
+        '_db_deleted_parameters',
+        'db_parameters_id_index',
+        )
+    db_deleted_parameters = LazyList('_db_deleted_parameters')
+
     def __init__(self, id=None, module_id=None, port_name=None, is_alias=None, parameters=None):
         self._db_id = id
         self._db_module_id = module_id
         self._db_port_name = port_name
         self._db_is_alias = is_alias
-        self.db_deleted_parameters = []
         self.db_parameters_id_index = {}
         if parameters is None:
             self._db_parameters = []
@@ -5281,13 +5696,16 @@ class DBPEFunction(object):
     def __copy__(self):
         return DBPEFunction.do_copy(self)
 
-    def do_copy(self, new_ids=False, id_scope=None, id_remap=None):
+    def do_copy(self, new_ids=False, id_scope=None, id_remap=None,
+                shared=()):
         cp = DBPEFunction(id=self._db_id,
                           module_id=self._db_module_id,
                           port_name=self._db_port_name,
                           is_alias=self._db_is_alias)
         if self._db_parameters is None:
             cp._db_parameters = []
+        elif 'parameters' in shared:
+            cp._db_parameters = list(self._db_parameters)
         else:
             cp._db_parameters = [v.do_copy(new_ids, id_scope, id_remap) for v in self._db_parameters]
         
@@ -5364,9 +5782,9 @@ class DBPEFunction(object):
         return children
     def db_deleted_children(self, remove=False):
         children = []
-        children.extend(self.db_deleted_parameters)
+        children.extend(getattr(self, '_db_deleted_parameters', ()))
         if remove:
-            self.db_deleted_parameters = []
+            del self.db_deleted_parameters
         return children
     def has_changes(self):
         if self.is_dirty:
@@ -5476,8 +5894,40 @@ class DBWorkflow(object):
 
     vtType = 'workflow'
 
+    __slots__ = (
+        '__dict__',
+        '__weakref__',
+        'is_dirty',
+        'is_new',
+        '_db_modules',
+        '_db_deleted_modules',
+        'db_modules_id_index',
+        '_db_id',
+        '_db_entity_type',
+        '_db_name',
+        '_db_version',
+        '_db_last_modified',
+        '_db_connections',
+        '_db_deleted_connections',
+        'db_connections_id_index',
+        '_db_annotations',
+        '_db_deleted_annotations',
+        'db_annotations_id_index',
+        '_db_plugin_datas',
+        '_db_deleted_plugin_datas',
+        'db_plugin_datas_id_index',
+        '_db_others',
+        '_db_deleted_others',
+        'db_others_id_index',
+        '_db_vistrail_id',
+        )
+    db_deleted_modules = LazyList('_db_deleted_modules')
+    db_deleted_connections = LazyList('_db_deleted_connections')
+    db_deleted_annotations = LazyList('_db_deleted_annotations')
+    db_deleted_plugin_datas = LazyList('_db_deleted_plugin_datas')
+    db_deleted_others = LazyList('_db_deleted_others')
+
     def __init__(self, modules=None, id=None, entity_type=None, name=None, version=None, last_modified=None, connections=None, annotations=None, plugin_datas=None, others=None, vistrail_id=None):
-        self.db_deleted_modules = []
         self.db_modules_id_index = {}
         if modules is None:
             self._db_modules = []
@@ -5490,7 +5940,6 @@ class DBWorkflow(object):
         self._db_name = name
         self._db_version = version
         self._db_last_modified = last_modified
-        self.db_deleted_connections = []
         self.db_connections_id_index = {}
         if connections is None:
             self._db_connections = []
@@ -5498,7 +5947,6 @@ class DBWorkflow(object):
             self._db_connections = connections
             for v in self._db_connections:
                 self.db_connections_id_index[v.db_id] = v
-        self.db_deleted_annotations = []
         self.db_annotations_id_index = {}
         if annotations is None:
             self._db_annotations = []
@@ -5506,7 +5954,6 @@ class DBWorkflow(object):
             self._db_annotations = annotations
             for v in self._db_annotations:
                 self.db_annotations_id_index[v.db_id] = v
-        self.db_deleted_plugin_datas = []
         self.db_plugin_datas_id_index = {}
         if plugin_datas is None:
             self._db_plugin_datas = []
@@ -5514,7 +5961,6 @@ class DBWorkflow(object):
             self._db_plugin_datas = plugin_datas
             for v in self._db_plugin_datas:
                 self.db_plugin_datas_id_index[v.db_id] = v
-        self.db_deleted_others = []
         self.db_others_id_index = {}
         if others is None:
             self._db_others = []
@@ -5529,7 +5975,8 @@ class DBWorkflow(object):
     def __copy__(self):
         return DBWorkflow.do_copy(self)
 
-    def do_copy(self, new_ids=False, id_scope=None, id_remap=None):
+    def do_copy(self, new_ids=False, id_scope=None, id_remap=None,
+                shared=()):
         cp = DBWorkflow(id=self._db_id,
                         entity_type=self._db_entity_type,
                         name=self._db_name,
@@ -5538,22 +5985,32 @@ class DBWorkflow(object):
                         vistrail_id=self._db_vistrail_id)
         if self._db_modules is None:
             cp._db_modules = []
+        elif 'modules' in shared:
+            cp._db_modules = list(self._db_modules)
         else:
             cp._db_modules = [v.do_copy(new_ids, id_scope, id_remap) for v in self._db_modules]
         if self._db_connections is None:
             cp._db_connections = []
+        elif 'connections' in shared:
+            cp._db_connections = list(self._db_connections)
         else:
             cp._db_connections = [v.do_copy(new_ids, id_scope, id_remap) for v in self._db_connections]
         if self._db_annotations is None:
             cp._db_annotations = []
+        elif 'annotations' in shared:
+            cp._db_annotations = list(self._db_annotations)
         else:
             cp._db_annotations = [v.do_copy(new_ids, id_scope, id_remap) for v in self._db_annotations]
         if self._db_plugin_datas is None:
             cp._db_plugin_datas = []
+        elif 'plugin_datas' in shared:
+            cp._db_plugin_datas = list(self._db_plugin_datas)
         else:
             cp._db_plugin_datas = [v.do_copy(new_ids, id_scope, id_remap) for v in self._db_plugin_datas]
         if self._db_others is None:
             cp._db_others = []
+        elif 'others' in shared:
+            cp._db_others = list(self._db_others)
         else:
             cp._db_others = [v.do_copy(new_ids, id_scope, id_remap) for v in self._db_others]
         
@@ -5728,17 +6185,17 @@ class DBWorkflow(object):
         return children
     def db_deleted_children(self, remove=False):
         children = []
-        children.extend(self.db_deleted_connections)
-        children.extend(self.db_deleted_annotations)
-        children.extend(self.db_deleted_plugin_datas)
-        children.extend(self.db_deleted_others)
-        children.extend(self.db_deleted_modules)
+        children.extend(getattr(self, '_db_deleted_connections', ()))
+        children.extend(getattr(self, '_db_deleted_annotations', ()))
+        children.extend(getattr(self, '_db_deleted_plugin_datas', ()))
+        children.extend(getattr(self, '_db_deleted_others', ()))
+        children.extend(getattr(self, '_db_deleted_modules', ()))
         if remove:
-            self.db_deleted_connections = []
-            self.db_deleted_annotations = []
-            self.db_deleted_plugin_datas = []
-            self.db_deleted_others = []
-            self.db_deleted_modules = []
+            del self.db_deleted_connections
+            del self.db_deleted_annotations
+            del self.db_deleted_plugin_datas
+            del self.db_deleted_others
+            del self.db_deleted_modules
         return children
     def has_changes(self):
         if self.is_dirty:
@@ -6067,7 +6524,8 @@ class DBMashupAction(object):
     def __copy__(self):
         return DBMashupAction.do_copy(self)
 
-    def do_copy(self, new_ids=False, id_scope=None, id_remap=None):
+    def do_copy(self, new_ids=False, id_scope=None, id_remap=None,
+                shared=()):
         cp = DBMashupAction(id=self._db_id,
                             prevId=self._db_prevId,
                             date=self._db_date,
@@ -6227,8 +6685,18 @@ class DBConfiguration(object):
 
     vtType = 'configuration'
 
+    __slots__ = (
+        '__dict__',
+        '__weakref__',
+        'is_dirty',
+        'is_new',
+        '_db_config_keys',
+        '_db_deleted_config_keys',
+        'db_config_keys_name_index',
+        )
+    db_deleted_config_keys = LazyList('_db_deleted_config_keys')
+
     def __init__(self, config_keys=None):
-        self.db_deleted_config_keys = []
         self.db_config_keys_name_index = {}
         if config_keys is None:
             self._db_config_keys = []
@@ -6242,10 +6710,13 @@ class DBConfiguration(object):
     def __copy__(self):
         return DBConfiguration.do_copy(self)
 
-    def do_copy(self, new_ids=False, id_scope=None, id_remap=None):
+    def do_copy(self, new_ids=False, id_scope=None, id_remap=None,
+                shared=()):
         cp = DBConfiguration()
         if self._db_config_keys is None:
             cp._db_config_keys = []
+        elif 'config_keys' in shared:
+            cp._db_config_keys = list(self._db_config_keys)
         else:
             cp._db_config_keys = [v.do_copy(new_ids, id_scope, id_remap) for v in self._db_config_keys]
         
@@ -6300,9 +6771,9 @@ class DBConfiguration(object):
         return children
     def db_deleted_children(self, remove=False):
         children = []
-        children.extend(self.db_deleted_config_keys)
+        children.extend(getattr(self, '_db_deleted_config_keys', ()))
         if remove:
-            self.db_deleted_config_keys = []
+            del self.db_deleted_config_keys
         return children
     def has_changes(self):
         if self.is_dirty:
@@ -6359,8 +6830,23 @@ class DBChange(object):
 
     vtType = 'change'
 
+    __slots__ = (
+        '__dict__',
+        '__weakref__',
+        'is_dirty',
+        'is_new',
+        '_db_data',
+        '_db_deleted_data',
+        '_db_id',
+        '_db_what',
+        '_db_oldObjId',
+        '_db_newObjId',
+        '_db_parentObjId',
+        '_db_parentObjType',
+        )
+    db_deleted_data = LazyList('_db_deleted_data')
+
     def __init__(self, data=None, id=None, what=None, oldObjId=None, newObjId=None, parentObjId=None, parentObjType=None):
-        self.db_deleted_data = []
         self._db_data = data
         self._db_id = id
         self._db_what = what
@@ -6374,7 +6860,8 @@ class DBChange(object):
     def __copy__(self):
         return DBChange.do_copy(self)
 
-    def do_copy(self, new_ids=False, id_scope=None, id_remap=None):
+    def do_copy(self, new_ids=False, id_scope=None, id_remap=None,
+                shared=()):
         cp = DBChange(id=self._db_id,
                       what=self._db_what,
                       oldObjId=self._db_oldObjId,
@@ -6528,9 +7015,9 @@ class DBChange(object):
         return children
     def db_deleted_children(self, remove=False):
         children = []
-        children.extend(self.db_deleted_data)
+        children.extend(getattr(self, '_db_deleted_data', ()))
         if remove:
-            self.db_deleted_data = []
+            del self.db_deleted_data
         return children
     def has_changes(self):
         if self.is_dirty:
@@ -6638,6 +7125,25 @@ class DBPackage(object):
 
     vtType = 'package'
 
+    __slots__ = (
+        '__dict__',
+        '__weakref__',
+        'is_dirty',
+        'is_new',
+        '_db_id',
+        '_db_name',
+        '_db_identifier',
+        '_db_codepath',
+        '_db_load_configuration',
+        '_db_version',
+        '_db_description',
+        '_db_module_descriptors',
+        '_db_deleted_module_descriptors',
+        'db_module_descriptors_id_index',
+        'db_module_descriptors_name_index',
+        )
+    db_deleted_module_descriptors = LazyList('_db_deleted_module_descriptors')
+
     def __init__(self, id=None, name=None, identifier=None, codepath=None, load_configuration=None, version=None, description=None, module_descriptors=None):
         self._db_id = id
         self._db_name = name
@@ -6646,7 +7152,6 @@ class DBPackage(object):
         self._db_load_configuration = load_configuration
         self._db_version = version
         self._db_description = description
-        self.db_deleted_module_descriptors = []
         self.db_module_descriptors_id_index = {}
         self.db_module_descriptors_name_index = {}
         if module_descriptors is None:
@@ -6662,7 +7167,8 @@ class DBPackage(object):
     def __copy__(self):
         return DBPackage.do_copy(self)
 
-    def do_copy(self, new_ids=False, id_scope=None, id_remap=None):
+    def do_copy(self, new_ids=False, id_scope=None, id_remap=None,
+                shared=()):
         cp = DBPackage(id=self._db_id,
                        name=self._db_name,
                        identifier=self._db_identifier,
@@ -6672,6 +7178,8 @@ class DBPackage(object):
                        description=self._db_description)
         if self._db_module_descriptors is None:
             cp._db_module_descriptors = []
+        elif 'module_descriptors' in shared:
+            cp._db_module_descriptors = list(self._db_module_descriptors)
         else:
             cp._db_module_descriptors = [v.do_copy(new_ids, id_scope, id_remap) for v in self._db_module_descriptors]
         
@@ -6762,9 +7270,9 @@ class DBPackage(object):
         return children
     def db_deleted_children(self, remove=False):
         children = []
-        children.extend(self.db_deleted_module_descriptors)
+        children.extend(getattr(self, '_db_deleted_module_descriptors', ()))
         if remove:
-            self.db_deleted_module_descriptors = []
+            del self.db_deleted_module_descriptors
         return children
     def has_changes(self):
         if self.is_dirty:
@@ -6920,11 +7428,24 @@ class DBLoopExec(object):
 
     vtType = 'loop_exec'
 
+    __slots__ = (
+        '__dict__',
+        '__weakref__',
+        'is_dirty',
+        'is_new',
+        '_db_id',
+        '_db_ts_start',
+        '_db_ts_end',
+        '_db_loop_iterations',
+        '_db_deleted_loop_iterations',
+        'db_loop_iterations_id_index',
+        )
+    db_deleted_loop_iterations = LazyList('_db_deleted_loop_iterations')
+
     def __init__(self, id=None, ts_start=None, ts_end=None, loop_iterations=None):
         self._db_id = id
         self._db_ts_start = ts_start
         self._db_ts_end = ts_end
-        self.db_deleted_loop_iterations = []
         self.db_loop_iterations_id_index = {}
         if loop_iterations is None:
             self._db_loop_iterations = []
@@ -6938,12 +7459,15 @@ class DBLoopExec(object):
     def __copy__(self):
         return DBLoopExec.do_copy(self)
 
-    def do_copy(self, new_ids=False, id_scope=None, id_remap=None):
+    def do_copy(self, new_ids=False, id_scope=None, id_remap=None,
+                shared=()):
         cp = DBLoopExec(id=self._db_id,
                         ts_start=self._db_ts_start,
                         ts_end=self._db_ts_end)
         if self._db_loop_iterations is None:
             cp._db_loop_iterations = []
+        elif 'loop_iterations' in shared:
+            cp._db_loop_iterations = list(self._db_loop_iterations)
         else:
             cp._db_loop_iterations = [v.do_copy(new_ids, id_scope, id_remap) for v in self._db_loop_iterations]
         
@@ -7013,9 +7537,9 @@ class DBLoopExec(object):
         return children
     def db_deleted_children(self, remove=False):
         children = []
-        children.extend(self.db_deleted_loop_iterations)
+        children.extend(getattr(self, '_db_deleted_loop_iterations', ()))
         if remove:
-            self.db_deleted_loop_iterations = []
+            del self.db_deleted_loop_iterations
         return children
     def has_changes(self):
         if self.is_dirty:
@@ -7112,9 +7636,21 @@ class DBConnection(object):
 
     vtType = 'connection'
 
+    __slots__ = (
+        '__dict__',
+        '__weakref__',
+        'is_dirty',
+        'is_new',
+        '_db_id',
+        '_db_ports',
+        '_db_deleted_ports',
+        'db_ports_id_index',
+        'db_ports_type_index',
+        )
+    db_deleted_ports = LazyList('_db_deleted_ports')
+
     def __init__(self, id=None, ports=None):
         self._db_id = id
-        self.db_deleted_ports = []
         self.db_ports_id_index = {}
         self.db_ports_type_index = {}
         if ports is None:
@@ -7130,10 +7666,13 @@ class DBConnection(object):
     def __copy__(self):
         return DBConnection.do_copy(self)
 
-    def do_copy(self, new_ids=False, id_scope=None, id_remap=None):
+    def do_copy(self, new_ids=False, id_scope=None, id_remap=None,
+                shared=()):
         cp = DBConnection(id=self._db_id)
         if self._db_ports is None:
             cp._db_ports = []
+        elif 'ports' in shared:
+            cp._db_ports = list(self._db_ports)
         else:
             cp._db_ports = [v.do_copy(new_ids, id_scope, id_remap) for v in self._db_ports]
         
@@ -7194,9 +7733,9 @@ class DBConnection(object):
         return children
     def db_deleted_children(self, remove=False):
         children = []
-        children.extend(self.db_deleted_ports)
+        children.extend(getattr(self, '_db_deleted_ports', ()))
         if remove:
-            self.db_deleted_ports = []
+            del self.db_deleted_ports
         return children
     def has_changes(self):
         if self.is_dirty:
@@ -7274,6 +7813,14 @@ class DBConfigBool(object):
 
     vtType = 'config_bool'
 
+    __slots__ = (
+        '__dict__',
+        '__weakref__',
+        'is_dirty',
+        'is_new',
+        '_db_value',
+        )
+
     def __init__(self, value=None):
         self._db_value = value
         self.is_dirty = True
@@ -7282,7 +7829,8 @@ class DBConfigBool(object):
     def __copy__(self):
         return DBConfigBool.do_copy(self)
 
-    def do_copy(self, new_ids=False, id_scope=None, id_remap=None):
+    def do_copy(self, new_ids=False, id_scope=None, id_remap=None,
+                shared=()):
         cp = DBConfigBool(value=self._db_value)
         
         # set new ids
@@ -7344,8 +7892,28 @@ class DBAction(object):
 
     vtType = 'action'
 
+    __slots__ = (
+        '__dict__',
+        '__weakref__',
+        'is_dirty',
+        'is_new',
+        '_db_operations',
+        '_db_deleted_operations',
+        'db_operations_id_index',
+        '_db_id',
+        '_db_prevId',
+        '_db_date',
+        '_db_session',
+        '_db_user',
+        '_db_annotations',
+        '_db_deleted_annotations',
+        'db_annotations_id_index',
+        'db_annotations_key_index',
+        )
+    db_deleted_operations = LazyList('_db_deleted_operations')
+    db_deleted_annotations = LazyList('_db_deleted_annotations')
+
     def __init__(self, operations=None, id=None, prevId=None, date=None, session=None, user=None, annotations=None):
-        self.db_deleted_operations = []
         self.db_operations_id_index = {}
         if operations is None:
             self._db_operations = []
@@ -7358,7 +7926,6 @@ class DBAction(object):
         self._db_date = date
         self._db_session = session
         self._db_user = user
-        self.db_deleted_annotations = []
         self.db_annotations_id_index = {}
         self.db_annotations_key_index = {}
         if annotations is None:
@@ -7374,7 +7941,8 @@ class DBAction(object):
     def __copy__(self):
         return DBAction.do_copy(self)
 
-    def do_copy(self, new_ids=False, id_scope=None, id_remap=None):
+    def do_copy(self, new_ids=False, id_scope=None, id_remap=None,
+                shared=()):
         cp = DBAction(id=self._db_id,
                       prevId=self._db_prevId,
                       date=self._db_date,
@@ -7382,10 +7950,14 @@ class DBAction(object):
                       user=self._db_user)
         if self._db_operations is None:
             cp._db_operations = []
+        elif 'operations' in shared:
+            cp._db_operations = list(self._db_operations)
         else:
             cp._db_operations = [v.do_copy(new_ids, id_scope, id_remap) for v in self._db_operations]
         if self._db_annotations is None:
             cp._db_annotations = []
+        elif 'annotations' in shared:
+            cp._db_annotations = list(self._db_annotations)
         else:
             cp._db_annotations = [v.do_copy(new_ids, id_scope, id_remap) for v in self._db_annotations]
         
@@ -7499,11 +8071,11 @@ class DBAction(object):
         return children
     def db_deleted_children(self, remove=False):
         children = []
-        children.extend(self.db_deleted_annotations)
-        children.extend(self.db_deleted_operations)
+        children.extend(getattr(self, '_db_deleted_annotations', ()))
+        children.extend(getattr(self, '_db_deleted_operations', ()))
         if remove:
-            self.db_deleted_annotations = []
-            self.db_deleted_operations = []
+            del self.db_deleted_annotations
+            del self.db_deleted_operations
         return children
     def has_changes(self):
         if self.is_dirty:
@@ -7678,9 +8250,19 @@ class DBStartupPackage(object):
 
     vtType = 'startup_package'
 
+    __slots__ = (
+        '__dict__',
+        '__weakref__',
+        'is_dirty',
+        'is_new',
+        '_db_name',
+        '_db_configuration',
+        '_db_deleted_configuration',
+        )
+    db_deleted_configuration = LazyList('_db_deleted_configuration')
+
     def __init__(self, name=None, configuration=None):
         self._db_name = name
-        self.db_deleted_configuration = []
         self._db_configuration = configuration
         self.is_dirty = True
         self.is_new = True
@@ -7688,7 +8270,8 @@ class DBStartupPackage(object):
     def __copy__(self):
         return DBStartupPackage.do_copy(self)
 
-    def do_copy(self, new_ids=False, id_scope=None, id_remap=None):
+    def do_copy(self, new_ids=False, id_scope=None, id_remap=None,
+                shared=()):
         cp = DBStartupPackage(name=self._db_name)
         if self._db_configuration is not None:
             cp._db_configuration = self._db_configuration.do_copy(new_ids, id_scope, id_remap)
@@ -7744,9 +8327,9 @@ class DBStartupPackage(object):
         return children
     def db_deleted_children(self, remove=False):
         children = []
-        children.extend(self.db_deleted_configuration)
+        children.extend(getattr(self, '_db_deleted_configuration', ()))
         if remove:
-            self.db_deleted_configuration = []
+            del self.db_deleted_configuration
         return children
     def has_changes(self):
         if self.is_dirty:
@@ -7788,6 +8371,14 @@ class DBConfigInt(object):
 
     vtType = 'config_int'
 
+    __slots__ = (
+        '__dict__',
+        '__weakref__',
+        'is_dirty',
+        'is_new',
+        '_db_value',
+        )
+
     def __init__(self, value=None):
         self._db_value = value
         self.is_dirty = True
@@ -7796,7 +8387,8 @@ class DBConfigInt(object):
     def __copy__(self):
         return DBConfigInt.do_copy(self)
 
-    def do_copy(self, new_ids=False, id_scope=None, id_remap=None):
+    def do_copy(self, new_ids=False, id_scope=None, id_remap=None,
+                shared=()):
         cp = DBConfigInt(value=self._db_value)
         
         # set new ids
@@ -7858,6 +8450,14 @@ class DBOpmProcessIdEffect(object):
 
     vtType = 'opm_process_id_effect'
 
+    __slots__ = (
+        '__dict__',
+        '__weakref__',
+        'is_dirty',
+        'is_new',
+        '_db_id',
+        )
+
     def __init__(self, id=None):
         self._db_id = id
         self.is_dirty = True
@@ -7866,7 +8466,8 @@ class DBOpmProcessIdEffect(object):
     def __copy__(self):
         return DBOpmProcessIdEffect.do_copy(self)
 
-    def do_copy(self, new_ids=False, id_scope=None, id_remap=None):
+    def do_copy(self, new_ids=False, id_scope=None, id_remap=None,
+                shared=()):
         cp = DBOpmProcessIdEffect(id=self._db_id)
         
         # set new ids
@@ -7930,6 +8531,14 @@ class DBRefProvPlan(object):
 
     vtType = 'ref_prov_plan'
 
+    __slots__ = (
+        '__dict__',
+        '__weakref__',
+        'is_dirty',
+        'is_new',
+        '_db_prov_ref',
+        )
+
     def __init__(self, prov_ref=None):
         self._db_prov_ref = prov_ref
         self.is_dirty = True
@@ -7938,7 +8547,8 @@ class DBRefProvPlan(object):
     def __copy__(self):
         return DBRefProvPlan.do_copy(self)
 
-    def do_copy(self, new_ids=False, id_scope=None, id_remap=None):
+    def do_copy(self, new_ids=False, id_scope=None, id_remap=None,
+                shared=()):
         cp = DBRefProvPlan(prov_ref=self._db_prov_ref)
         
         # set new ids
@@ -8002,8 +8612,21 @@ class DBOpmAccounts(object):
 
     vtType = 'opm_accounts'
 
+    __slots__ = (
+        '__dict__',
+        '__weakref__',
+        'is_dirty',
+        'is_new',
+        '_db_accounts',
+        '_db_deleted_accounts',
+        'db_accounts_id_index',
+        '_db_opm_overlapss',
+        '_db_deleted_opm_overlapss',
+        )
+    db_deleted_accounts = LazyList('_db_deleted_accounts')
+    db_deleted_opm_overlapss = LazyList('_db_deleted_opm_overlapss')
+
     def __init__(self, accounts=None, opm_overlapss=None):
-        self.db_deleted_accounts = []
         self.db_accounts_id_index = {}
         if accounts is None:
             self._db_accounts = []
@@ -8011,7 +8634,6 @@ class DBOpmAccounts(object):
             self._db_accounts = accounts
             for v in self._db_accounts:
                 self.db_accounts_id_index[v.db_id] = v
-        self.db_deleted_opm_overlapss = []
         if opm_overlapss is None:
             self._db_opm_overlapss = []
         else:
@@ -8022,14 +8644,19 @@ class DBOpmAccounts(object):
     def __copy__(self):
         return DBOpmAccounts.do_copy(self)
 
-    def do_copy(self, new_ids=False, id_scope=None, id_remap=None):
+    def do_copy(self, new_ids=False, id_scope=None, id_remap=None,
+                shared=()):
         cp = DBOpmAccounts()
         if self._db_accounts is None:
             cp._db_accounts = []
+        elif 'accounts' in shared:
+            cp._db_accounts = list(self._db_accounts)
         else:
             cp._db_accounts = [v.do_copy(new_ids, id_scope, id_remap) for v in self._db_accounts]
         if self._db_opm_overlapss is None:
             cp._db_opm_overlapss = []
+        elif 'opm_overlapss' in shared:
+            cp._db_opm_overlapss = list(self._db_opm_overlapss)
         else:
             cp._db_opm_overlapss = [v.do_copy(new_ids, id_scope, id_remap) for v in self._db_opm_overlapss]
         
@@ -8102,11 +8729,11 @@ class DBOpmAccounts(object):
         return children
     def db_deleted_children(self, remove=False):
         children = []
-        children.extend(self.db_deleted_accounts)
-        children.extend(self.db_deleted_opm_overlapss)
+        children.extend(getattr(self, '_db_deleted_accounts', ()))
+        children.extend(getattr(self, '_db_deleted_opm_overlapss', ()))
         if remove:
-            self.db_deleted_accounts = []
-            self.db_deleted_opm_overlapss = []
+            del self.db_deleted_accounts
+            del self.db_deleted_opm_overlapss
         return children
     def has_changes(self):
         if self.is_dirty:
@@ -8186,6 +8813,14 @@ class DBRefProvAgent(object):
 
     vtType = 'ref_prov_agent'
 
+    __slots__ = (
+        '__dict__',
+        '__weakref__',
+        'is_dirty',
+        'is_new',
+        '_db_prov_ref',
+        )
+
     def __init__(self, prov_ref=None):
         self._db_prov_ref = prov_ref
         self.is_dirty = True
@@ -8194,7 +8829,8 @@ class DBRefProvAgent(object):
     def __copy__(self):
         return DBRefProvAgent.do_copy(self)
 
-    def do_copy(self, new_ids=False, id_scope=None, id_remap=None):
+    def do_copy(self, new_ids=False, id_scope=None, id_remap=None,
+                shared=()):
         cp = DBRefProvAgent(prov_ref=self._db_prov_ref)
         
         # set new ids
@@ -8258,6 +8894,25 @@ class DBPortSpec(object):
 
     vtType = 'portSpec'
 
+    __slots__ = (
+        '__dict__',
+        '__weakref__',
+        'is_dirty',
+        'is_new',
+        '_db_id',
+        '_db_name',
+        '_db_type',
+        '_db_optional',
+        '_db_depth',
+        '_db_sort_key',
+        '_db_portSpecItems',
+        '_db_deleted_portSpecItems',
+        'db_portSpecItems_id_index',
+        '_db_min_conns',
+        '_db_max_conns',
+        )
+    db_deleted_portSpecItems = LazyList('_db_deleted_portSpecItems')
+
     def __init__(self, id=None, name=None, type=None, optional=None, depth=None, sort_key=None, portSpecItems=None, min_conns=None, max_conns=None):
         self._db_id = id
         self._db_name = name
@@ -8265,7 +8920,6 @@ class DBPortSpec(object):
         self._db_optional = optional
         self._db_depth = depth
         self._db_sort_key = sort_key
-        self.db_deleted_portSpecItems = []
         self.db_portSpecItems_id_index = {}
         if portSpecItems is None:
             self._db_portSpecItems = []
@@ -8281,7 +8935,8 @@ class DBPortSpec(object):
     def __copy__(self):
         return DBPortSpec.do_copy(self)
 
-    def do_copy(self, new_ids=False, id_scope=None, id_remap=None):
+    def do_copy(self, new_ids=False, id_scope=None, id_remap=None,
+                shared=()):
         cp = DBPortSpec(id=self._db_id,
                         name=self._db_name,
                         type=self._db_type,
@@ -8292,6 +8947,8 @@ class DBPortSpec(object):
                         max_conns=self._db_max_conns)
         if self._db_portSpecItems is None:
             cp._db_portSpecItems = []
+        elif 'portSpecItems' in shared:
+            cp._db_portSpecItems = list(self._db_portSpecItems)
         else:
             cp._db_portSpecItems = [v.do_copy(new_ids, id_scope, id_remap) for v in self._db_portSpecItems]
         
@@ -8382,9 +9039,9 @@ class DBPortSpec(object):
         return children
     def db_deleted_children(self, remove=False):
         children = []
-        children.extend(self.db_deleted_portSpecItems)
+        children.extend(getattr(self, '_db_deleted_portSpecItems', ()))
         if remove:
-            self.db_deleted_portSpecItems = []
+            del self.db_deleted_portSpecItems
         return children
     def has_changes(self):
         if self.is_dirty:
@@ -8546,8 +9203,18 @@ class DBEnabledPackages(object):
 
     vtType = 'enabled_packages'
 
+    __slots__ = (
+        '__dict__',
+        '__weakref__',
+        'is_dirty',
+        'is_new',
+        '_db_packages',
+        '_db_deleted_packages',
+        'db_packages_name_index',
+        )
+    db_deleted_packages = LazyList('_db_deleted_packages')
+
     def __init__(self, packages=None):
-        self.db_deleted_packages = []
         self.db_packages_name_index = {}
         if packages is None:
             self._db_packages = []
@@ -8561,10 +9228,13 @@ class DBEnabledPackages(object):
     def __copy__(self):
         return DBEnabledPackages.do_copy(self)
 
-    def do_copy(self, new_ids=False, id_scope=None, id_remap=None):
+    def do_copy(self, new_ids=False, id_scope=None, id_remap=None,
+                shared=()):
         cp = DBEnabledPackages()
         if self._db_packages is None:
             cp._db_packages = []
+        elif 'packages' in shared:
+            cp._db_packages = list(self._db_packages)
         else:
             cp._db_packages = [v.do_copy(new_ids, id_scope, id_remap) for v in self._db_packages]
         
@@ -8619,9 +9289,9 @@ class DBEnabledPackages(object):
         return children
     def db_deleted_children(self, remove=False):
         children = []
-        children.extend(self.db_deleted_packages)
+        children.extend(getattr(self, '_db_deleted_packages', ()))
         if remove:
-            self.db_deleted_packages = []
+            del self.db_deleted_packages
         return children
     def has_changes(self):
         if self.is_dirty:
@@ -8662,11 +9332,23 @@ class DBOpmArtifact(object):
 
     vtType = 'opm_artifact'
 
+    __slots__ = (
+        '__dict__',
+        '__weakref__',
+        'is_dirty',
+        'is_new',
+        '_db_id',
+        '_db_value',
+        '_db_deleted_value',
+        '_db_accounts',
+        '_db_deleted_accounts',
+        )
+    db_deleted_value = LazyList('_db_deleted_value')
+    db_deleted_accounts = LazyList('_db_deleted_accounts')
+
     def __init__(self, id=None, value=None, accounts=None):
         self._db_id = id
-        self.db_deleted_value = []
         self._db_value = value
-        self.db_deleted_accounts = []
         if accounts is None:
             self._db_accounts = []
         else:
@@ -8677,12 +9359,15 @@ class DBOpmArtifact(object):
     def __copy__(self):
         return DBOpmArtifact.do_copy(self)
 
-    def do_copy(self, new_ids=False, id_scope=None, id_remap=None):
+    def do_copy(self, new_ids=False, id_scope=None, id_remap=None,
+                shared=()):
         cp = DBOpmArtifact(id=self._db_id)
         if self._db_value is not None:
             cp._db_value = self._db_value.do_copy(new_ids, id_scope, id_remap)
         if self._db_accounts is None:
             cp._db_accounts = []
+        elif 'accounts' in shared:
+            cp._db_accounts = list(self._db_accounts)
         else:
             cp._db_accounts = [v.do_copy(new_ids, id_scope, id_remap) for v in self._db_accounts]
         
@@ -8755,11 +9440,11 @@ class DBOpmArtifact(object):
         return children
     def db_deleted_children(self, remove=False):
         children = []
-        children.extend(self.db_deleted_value)
-        children.extend(self.db_deleted_accounts)
+        children.extend(getattr(self, '_db_deleted_value', ()))
+        children.extend(getattr(self, '_db_deleted_accounts', ()))
         if remove:
-            self.db_deleted_value = []
-            self.db_deleted_accounts = []
+            del self.db_deleted_value
+            del self.db_deleted_accounts
         return children
     def has_changes(self):
         if self.is_dirty:
@@ -8825,13 +9510,29 @@ class DBLog(object):
 
     vtType = 'log'
 
+    __slots__ = (
+        '__dict__',
+        '__weakref__',
+        'is_dirty',
+        'is_new',
+        '_db_id',
+        '_db_entity_type',
+        '_db_version',
+        '_db_name',
+        '_db_last_modified',
+        '_db_workflow_execs',
+        '_db_deleted_workflow_execs',
+        'db_workflow_execs_id_index',
+        '_db_vistrail_id',
+        )
+    db_deleted_workflow_execs = LazyList('_db_deleted_workflow_execs')
+
     def __init__(self, id=None, entity_type=None, version=None, name=None, last_modified=None, workflow_execs=None, vistrail_id=None):
         self._db_id = id
         self._db_entity_type = entity_type
         self._db_version = version
         self._db_name = name
         self._db_last_modified = last_modified
-        self.db_deleted_workflow_execs = []
         self.db_workflow_execs_id_index = {}
         if workflow_execs is None:
             self._db_workflow_execs = []
@@ -8846,7 +9547,8 @@ class DBLog(object):
     def __copy__(self):
         return DBLog.do_copy(self)
 
-    def do_copy(self, new_ids=False, id_scope=None, id_remap=None):
+    def do_copy(self, new_ids=False, id_scope=None, id_remap=None,
+                shared=()):
         cp = DBLog(id=self._db_id,
                    entity_type=self._db_entity_type,
                    version=self._db_version,
@@ -8855,6 +9557,8 @@ class DBLog(object):
                    vistrail_id=self._db_vistrail_id)
         if self._db_workflow_execs is None:
             cp._db_workflow_execs = []
+        elif 'workflow_execs' in shared:
+            cp._db_workflow_execs = list(self._db_workflow_execs)
         else:
             cp._db_workflow_execs = [v.do_copy(new_ids, id_scope, id_remap) for v in self._db_workflow_execs]
         
@@ -8941,9 +9645,9 @@ class DBLog(object):
         return children
     def db_deleted_children(self, remove=False):
         children = []
-        children.extend(self.db_deleted_workflow_execs)
+        children.extend(getattr(self, '_db_deleted_workflow_execs', ()))
         if remove:
-            self.db_deleted_workflow_execs = []
+            del self.db_deleted_workflow_execs
         return children
     def has_changes(self):
         if self.is_dirty:
@@ -9079,8 +9783,24 @@ class DBLoopIteration(object):
 
     vtType = 'loop_iteration'
 
+    __slots__ = (
+        '__dict__',
+        '__weakref__',
+        'is_dirty',
+        'is_new',
+        '_db_item_execs',
+        '_db_deleted_item_execs',
+        'db_item_execs_id_index',
+        '_db_id',
+        '_db_ts_start',
+        '_db_ts_end',
+        '_db_iteration',
+        '_db_completed',
+        '_db_error',
+        )
+    db_deleted_item_execs = LazyList('_db_deleted_item_execs')
+
     def __init__(self, item_execs=None, id=None, ts_start=None, ts_end=None, iteration=None, completed=None, error=None):
-        self.db_deleted_item_execs = []
         self.db_item_execs_id_index = {}
         if item_execs is None:
             self._db_item_execs = []
@@ -9100,7 +9820,8 @@ class DBLoopIteration(object):
     def __copy__(self):
         return DBLoopIteration.do_copy(self)
 
-    def do_copy(self, new_ids=False, id_scope=None, id_remap=None):
+    def do_copy(self, new_ids=False, id_scope=None, id_remap=None,
+                shared=()):
         cp = DBLoopIteration(id=self._db_id,
                              ts_start=self._db_ts_start,
                              ts_end=self._db_ts_end,
@@ -9109,6 +9830,8 @@ class DBLoopIteration(object):
                              error=self._db_error)
         if self._db_item_execs is None:
             cp._db_item_execs = []
+        elif 'item_execs' in shared:
+            cp._db_item_execs = list(self._db_item_execs)
         else:
             cp._db_item_execs = [v.do_copy(new_ids, id_scope, id_remap) for v in self._db_item_execs]
         
@@ -9205,9 +9928,9 @@ class DBLoopIteration(object):
         return children
     def db_deleted_children(self, remove=False):
         children = []
-        children.extend(self.db_deleted_item_execs)
+        children.extend(getattr(self, '_db_deleted_item_execs', ()))
         if remove:
-            self.db_deleted_item_execs = []
+            del self.db_deleted_item_execs
         return children
     def has_changes(self):
         if self.is_dirty:
@@ -9343,6 +10066,14 @@ class DBOpmProcessIdCause(object):
 
     vtType = 'opm_process_id_cause'
 
+    __slots__ = (
+        '__dict__',
+        '__weakref__',
+        'is_dirty',
+        'is_new',
+        '_db_id',
+        )
+
     def __init__(self, id=None):
         self._db_id = id
         self.is_dirty = True
@@ -9351,7 +10082,8 @@ class DBOpmProcessIdCause(object):
     def __copy__(self):
         return DBOpmProcessIdCause.do_copy(self)
 
-    def do_copy(self, new_ids=False, id_scope=None, id_remap=None):
+    def do_copy(self, new_ids=False, id_scope=None, id_remap=None,
+                shared=()):
         cp = DBOpmProcessIdCause(id=self._db_id)
         
         # set new ids
@@ -9415,8 +10147,18 @@ class DBOpmArtifacts(object):
 
     vtType = 'opm_artifacts'
 
+    __slots__ = (
+        '__dict__',
+        '__weakref__',
+        'is_dirty',
+        'is_new',
+        '_db_artifacts',
+        '_db_deleted_artifacts',
+        'db_artifacts_id_index',
+        )
+    db_deleted_artifacts = LazyList('_db_deleted_artifacts')
+
     def __init__(self, artifacts=None):
-        self.db_deleted_artifacts = []
         self.db_artifacts_id_index = {}
         if artifacts is None:
             self._db_artifacts = []
@@ -9430,10 +10172,13 @@ class DBOpmArtifacts(object):
     def __copy__(self):
         return DBOpmArtifacts.do_copy(self)
 
-    def do_copy(self, new_ids=False, id_scope=None, id_remap=None):
+    def do_copy(self, new_ids=False, id_scope=None, id_remap=None,
+                shared=()):
         cp = DBOpmArtifacts()
         if self._db_artifacts is None:
             cp._db_artifacts = []
+        elif 'artifacts' in shared:
+            cp._db_artifacts = list(self._db_artifacts)
         else:
             cp._db_artifacts = [v.do_copy(new_ids, id_scope, id_remap) for v in self._db_artifacts]
         
@@ -9488,9 +10233,9 @@ class DBOpmArtifacts(object):
         return children
     def db_deleted_children(self, remove=False):
         children = []
-        children.extend(self.db_deleted_artifacts)
+        children.extend(getattr(self, '_db_deleted_artifacts', ()))
         if remove:
-            self.db_deleted_artifacts = []
+            del self.db_deleted_artifacts
         return children
     def has_changes(self):
         if self.is_dirty:
@@ -9547,6 +10292,18 @@ class DBPEParameter(object):
 
     vtType = 'pe_parameter'
 
+    __slots__ = (
+        '__dict__',
+        '__weakref__',
+        'is_dirty',
+        'is_new',
+        '_db_id',
+        '_db_pos',
+        '_db_interpolator',
+        '_db_value',
+        '_db_dimension',
+        )
+
     def __init__(self, id=None, pos=None, interpolator=None, value=None, dimension=None):
         self._db_id = id
         self._db_pos = pos
@@ -9559,7 +10316,8 @@ class DBPEParameter(object):
     def __copy__(self):
         return DBPEParameter.do_copy(self)
 
-    def do_copy(self, new_ids=False, id_scope=None, id_remap=None):
+    def do_copy(self, new_ids=False, id_scope=None, id_remap=None,
+                shared=()):
         cp = DBPEParameter(id=self._db_id,
                            pos=self._db_pos,
                            interpolator=self._db_interpolator,
@@ -9698,8 +10456,38 @@ class DBWorkflowExec(object):
 
     vtType = 'workflow_exec'
 
+    __slots__ = (
+        '__dict__',
+        '__weakref__',
+        'is_dirty',
+        'is_new',
+        '_db_item_execs',
+        '_db_deleted_item_execs',
+        'db_item_execs_id_index',
+        '_db_id',
+        '_db_user',
+        '_db_ip',
+        '_db_session',
+        '_db_vt_version',
+        '_db_ts_start',
+        '_db_ts_end',
+        '_db_parent_id',
+        '_db_parent_type',
+        '_db_parent_version',
+        '_db_completed',
+        '_db_name',
+        '_db_annotations',
+        '_db_deleted_annotations',
+        'db_annotations_id_index',
+        '_db_machines',
+        '_db_deleted_machines',
+        'db_machines_id_index',
+        )
+    db_deleted_item_execs = LazyList('_db_deleted_item_execs')
+    db_deleted_annotations = LazyList('_db_deleted_annotations')
+    db_deleted_machines = LazyList('_db_deleted_machines')
+
     def __init__(self, item_execs=None, id=None, user=None, ip=None, session=None, vt_version=None, ts_start=None, ts_end=None, parent_id=None, parent_type=None, parent_version=None, completed=None, name=None, annotations=None, machines=None):
-        self.db_deleted_item_execs = []
         self.db_item_execs_id_index = {}
         if item_execs is None:
             self._db_item_execs = []
@@ -9719,7 +10507,6 @@ class DBWorkflowExec(object):
         self._db_parent_version = parent_version
         self._db_completed = completed
         self._db_name = name
-        self.db_deleted_annotations = []
         self.db_annotations_id_index = {}
         if annotations is None:
             self._db_annotations = []
@@ -9727,7 +10514,6 @@ class DBWorkflowExec(object):
             self._db_annotations = annotations
             for v in self._db_annotations:
                 self.db_annotations_id_index[v.db_id] = v
-        self.db_deleted_machines = []
         self.db_machines_id_index = {}
         if machines is None:
             self._db_machines = []
@@ -9741,7 +10527,8 @@ class DBWorkflowExec(object):
     def __copy__(self):
         return DBWorkflowExec.do_copy(self)
 
-    def do_copy(self, new_ids=False, id_scope=None, id_remap=None):
+    def do_copy(self, new_ids=False, id_scope=None, id_remap=None,
+                shared=()):
         cp = DBWorkflowExec(id=self._db_id,
                             user=self._db_user,
                             ip=self._db_ip,
@@ -9756,14 +10543,20 @@ class DBWorkflowExec(object):
                             name=self._db_name)
         if self._db_item_execs is None:
             cp._db_item_execs = []
+        elif 'item_execs' in shared:
+            cp._db_item_execs = list(self._db_item_execs)
         else:
             cp._db_item_execs = [v.do_copy(new_ids, id_scope, id_remap) for v in self._db_item_execs]
         if self._db_annotations is None:
             cp._db_annotations = []
+        elif 'annotations' in shared:
+            cp._db_annotations = list(self._db_annotations)
         else:
             cp._db_annotations = [v.do_copy(new_ids, id_scope, id_remap) for v in self._db_annotations]
         if self._db_machines is None:
             cp._db_machines = []
+        elif 'machines' in shared:
+            cp._db_machines = list(self._db_machines)
         else:
             cp._db_machines = [v.do_copy(new_ids, id_scope, id_remap) for v in self._db_machines]
         
@@ -9928,13 +10721,13 @@ class DBWorkflowExec(object):
         return children
     def db_deleted_children(self, remove=False):
         children = []
-        children.extend(self.db_deleted_annotations)
-        children.extend(self.db_deleted_machines)
-        children.extend(self.db_deleted_item_execs)
+        children.extend(getattr(self, '_db_deleted_annotations', ()))
+        children.extend(getattr(self, '_db_deleted_machines', ()))
+        children.extend(getattr(self, '_db_deleted_item_execs', ()))
         if remove:
-            self.db_deleted_annotations = []
-            self.db_deleted_machines = []
-            self.db_deleted_item_execs = []
+            del self.db_deleted_annotations
+            del self.db_deleted_machines
+            del self.db_deleted_item_execs
         return children
     def has_changes(self):
         if self.is_dirty:
@@ -10238,6 +11031,16 @@ class DBLocation(object):
 
     vtType = 'location'
 
+    __slots__ = (
+        '__dict__',
+        '__weakref__',
+        'is_dirty',
+        'is_new',
+        '_db_id',
+        '_db_x',
+        '_db_y',
+        )
+
     def __init__(self, id=None, x=None, y=None):
         self._db_id = id
         self._db_x = x
@@ -10248,7 +11051,8 @@ class DBLocation(object):
     def __copy__(self):
         return DBLocation.do_copy(self)
 
-    def do_copy(self, new_ids=False, id_scope=None, id_remap=None):
+    def do_copy(self, new_ids=False, id_scope=None, id_remap=None,
+                shared=()):
         cp = DBLocation(id=self._db_id,
                         x=self._db_x,
                         y=self._db_y)
@@ -10349,11 +11153,24 @@ class DBFunction(object):
 
     vtType = 'function'
 
+    __slots__ = (
+        '__dict__',
+        '__weakref__',
+        'is_dirty',
+        'is_new',
+        '_db_id',
+        '_db_pos',
+        '_db_name',
+        '_db_parameters',
+        '_db_deleted_parameters',
+        'db_parameters_id_index',
+        )
+    db_deleted_parameters = LazyList('_db_deleted_parameters')
+
     def __init__(self, id=None, pos=None, name=None, parameters=None):
         self._db_id = id
         self._db_pos = pos
         self._db_name = name
-        self.db_deleted_parameters = []
         self.db_parameters_id_index = {}
         if parameters is None:
             self._db_parameters = []
@@ -10367,12 +11184,15 @@ class DBFunction(object):
     def __copy__(self):
         return DBFunction.do_copy(self)
 
-    def do_copy(self, new_ids=False, id_scope=None, id_remap=None):
+    def do_copy(self, new_ids=False, id_scope=None, id_remap=None,
+                shared=()):
         cp = DBFunction(id=self._db_id,
                         pos=self._db_pos,
                         name=self._db_name)
         if self._db_parameters is None:
             cp._db_parameters = []
+        elif 'parameters' in shared:
+            cp._db_parameters = list(self._db_parameters)
         else:
             cp._db_parameters = [v.do_copy(new_ids, id_scope, id_remap) for v in self._db_parameters]
         
@@ -10442,9 +11262,9 @@ class DBFunction(object):
         return children
     def db_deleted_children(self, remove=False):
         children = []
-        children.extend(self.db_deleted_parameters)
+        children.extend(getattr(self, '_db_deleted_parameters', ()))
         if remove:
-            self.db_deleted_parameters = []
+            del self.db_deleted_parameters
         return children
     def has_changes(self):
         if self.is_dirty:
@@ -10541,6 +11361,19 @@ class DBActionAnnotation(object):
 
     vtType = 'actionAnnotation'
 
+    __slots__ = (
+        '__dict__',
+        '__weakref__',
+        'is_dirty',
+        'is_new',
+        '_db_id',
+        '_db_key',
+        '_db_value',
+        '_db_action_id',
+        '_db_date',
+        '_db_user',
+        )
+
     def __init__(self, id=None, key=None, value=None, action_id=None, date=None, user=None):
         self._db_id = id
         self._db_key = key
@@ -10554,7 +11387,8 @@ class DBActionAnnotation(object):
     def __copy__(self):
         return DBActionAnnotation.do_copy(self)
 
-    def do_copy(self, new_ids=False, id_scope=None, id_remap=None):
+    def do_copy(self, new_ids=False, id_scope=None, id_remap=None,
+                shared=()):
         cp = DBActionAnnotation(id=self._db_id,
                                 key=self._db_key,
                                 value=self._db_value,
@@ -10714,6 +11548,25 @@ class DBProvActivity(object):
 
     vtType = 'prov_activity'
 
+    __slots__ = (
+        '__dict__',
+        '__weakref__',
+        'is_dirty',
+        'is_new',
+        '_db_id',
+        '_db_startTime',
+        '_db_endTime',
+        '_db_vt_id',
+        '_db_vt_type',
+        '_db_vt_cached',
+        '_db_vt_completed',
+        '_db_vt_machine_id',
+        '_db_vt_error',
+        '_db_is_part_of',
+        '_db_deleted_is_part_of',
+        )
+    db_deleted_is_part_of = LazyList('_db_deleted_is_part_of')
+
     def __init__(self, id=None, startTime=None, endTime=None, vt_id=None, vt_type=None, vt_cached=None, vt_completed=None, vt_machine_id=None, vt_error=None, is_part_of=None):
         self._db_id = id
         self._db_startTime = startTime
@@ -10724,7 +11577,6 @@ class DBProvActivity(object):
         self._db_vt_completed = vt_completed
         self._db_vt_machine_id = vt_machine_id
         self._db_vt_error = vt_error
-        self.db_deleted_is_part_of = []
         self._db_is_part_of = is_part_of
         self.is_dirty = True
         self.is_new = True
@@ -10732,7 +11584,8 @@ class DBProvActivity(object):
     def __copy__(self):
         return DBProvActivity.do_copy(self)
 
-    def do_copy(self, new_ids=False, id_scope=None, id_remap=None):
+    def do_copy(self, new_ids=False, id_scope=None, id_remap=None,
+                shared=()):
         cp = DBProvActivity(id=self._db_id,
                             startTime=self._db_startTime,
                             endTime=self._db_endTime,
@@ -10836,9 +11689,9 @@ class DBProvActivity(object):
         return children
     def db_deleted_children(self, remove=False):
         children = []
-        children.extend(self.db_deleted_is_part_of)
+        children.extend(getattr(self, '_db_deleted_is_part_of', ()))
         if remove:
-            self.db_deleted_is_part_of = []
+            del self.db_deleted_is_part_of
         return children
     def has_changes(self):
         if self.is_dirty:
@@ -10985,10 +11838,22 @@ class DBProvUsage(object):
 
     vtType = 'prov_usage'
 
+    __slots__ = (
+        '__dict__',
+        '__weakref__',
+        'is_dirty',
+        'is_new',
+        '_db_prov_activity',
+        '_db_deleted_prov_activity',
+        '_db_prov_entity',
+        '_db_deleted_prov_entity',
+        '_db_prov_role',
+        )
+    db_deleted_prov_activity = LazyList('_db_deleted_prov_activity')
+    db_deleted_prov_entity = LazyList('_db_deleted_prov_entity')
+
     def __init__(self, prov_activity=None, prov_entity=None, prov_role=None):
-        self.db_deleted_prov_activity = []
         self._db_prov_activity = prov_activity
-        self.db_deleted_prov_entity = []
         self._db_prov_entity = prov_entity
         self._db_prov_role = prov_role
         self.is_dirty = True
@@ -10997,7 +11862,8 @@ class DBProvUsage(object):
     def __copy__(self):
         return DBProvUsage.do_copy(self)
 
-    def do_copy(self, new_ids=False, id_scope=None, id_remap=None):
+    def do_copy(self, new_ids=False, id_scope=None, id_remap=None,
+                shared=()):
         cp = DBProvUsage(prov_role=self._db_prov_role)
         if self._db_prov_activity is not None:
             cp._db_prov_activity = self._db_prov_activity.do_copy(new_ids, id_scope, id_remap)
@@ -11069,11 +11935,11 @@ class DBProvUsage(object):
         return children
     def db_deleted_children(self, remove=False):
         children = []
-        children.extend(self.db_deleted_prov_activity)
-        children.extend(self.db_deleted_prov_entity)
+        children.extend(getattr(self, '_db_deleted_prov_activity', ()))
+        children.extend(getattr(self, '_db_deleted_prov_entity', ()))
         if remove:
-            self.db_deleted_prov_activity = []
-            self.db_deleted_prov_entity = []
+            del self.db_deleted_prov_activity
+            del self.db_deleted_prov_entity
         return children
     def has_changes(self):
         if self.is_dirty:
@@ -11132,6 +11998,14 @@ class DBOpmArtifactIdEffect(object):
 
     vtType = 'opm_artifact_id_effect'
 
+    __slots__ = (
+        '__dict__',
+        '__weakref__',
+        'is_dirty',
+        'is_new',
+        '_db_id',
+        )
+
     def __init__(self, id=None):
         self._db_id = id
         self.is_dirty = True
@@ -11140,7 +12014,8 @@ class DBOpmArtifactIdEffect(object):
     def __copy__(self):
         return DBOpmArtifactIdEffect.do_copy(self)
 
-    def do_copy(self, new_ids=False, id_scope=None, id_remap=None):
+    def do_copy(self, new_ids=False, id_scope=None, id_remap=None,
+                shared=()):
         cp = DBOpmArtifactIdEffect(id=self._db_id)
         
         # set new ids
@@ -11204,16 +12079,33 @@ class DBOpmGraph(object):
 
     vtType = 'opm_graph'
 
+    __slots__ = (
+        '__dict__',
+        '__weakref__',
+        'is_dirty',
+        'is_new',
+        '_db_accounts',
+        '_db_deleted_accounts',
+        '_db_processes',
+        '_db_deleted_processes',
+        '_db_artifacts',
+        '_db_deleted_artifacts',
+        '_db_agents',
+        '_db_deleted_agents',
+        '_db_dependencies',
+        '_db_deleted_dependencies',
+        )
+    db_deleted_accounts = LazyList('_db_deleted_accounts')
+    db_deleted_processes = LazyList('_db_deleted_processes')
+    db_deleted_artifacts = LazyList('_db_deleted_artifacts')
+    db_deleted_agents = LazyList('_db_deleted_agents')
+    db_deleted_dependencies = LazyList('_db_deleted_dependencies')
+
     def __init__(self, accounts=None, processes=None, artifacts=None, agents=None, dependencies=None):
-        self.db_deleted_accounts = []
         self._db_accounts = accounts
-        self.db_deleted_processes = []
         self._db_processes = processes
-        self.db_deleted_artifacts = []
         self._db_artifacts = artifacts
-        self.db_deleted_agents = []
         self._db_agents = agents
-        self.db_deleted_dependencies = []
         self._db_dependencies = dependencies
         self.is_dirty = True
         self.is_new = True
@@ -11221,7 +12113,8 @@ class DBOpmGraph(object):
     def __copy__(self):
         return DBOpmGraph.do_copy(self)
 
-    def do_copy(self, new_ids=False, id_scope=None, id_remap=None):
+    def do_copy(self, new_ids=False, id_scope=None, id_remap=None,
+                shared=()):
         cp = DBOpmGraph()
         if self._db_accounts is not None:
             cp._db_accounts = self._db_accounts.do_copy(new_ids, id_scope, id_remap)
@@ -11336,17 +12229,17 @@ class DBOpmGraph(object):
         return children
     def db_deleted_children(self, remove=False):
         children = []
-        children.extend(self.db_deleted_accounts)
-        children.extend(self.db_deleted_processes)
-        children.extend(self.db_deleted_artifacts)
-        children.extend(self.db_deleted_agents)
-        children.extend(self.db_deleted_dependencies)
+        children.extend(getattr(self, '_db_deleted_accounts', ()))
+        children.extend(getattr(self, '_db_deleted_processes', ()))
+        children.extend(getattr(self, '_db_deleted_artifacts', ()))
+        children.extend(getattr(self, '_db_deleted_agents', ()))
+        children.extend(getattr(self, '_db_deleted_dependencies', ()))
         if remove:
-            self.db_deleted_accounts = []
-            self.db_deleted_processes = []
-            self.db_deleted_artifacts = []
-            self.db_deleted_agents = []
-            self.db_deleted_dependencies = []
+            del self.db_deleted_accounts
+            del self.db_deleted_processes
+            del self.db_deleted_artifacts
+            del self.db_deleted_agents
+            del self.db_deleted_dependencies
         return children
     def has_changes(self):
         if self.is_dirty:
@@ -11443,6 +12336,14 @@ class DBIsPartOf(object):
 
     vtType = 'is_part_of'
 
+    __slots__ = (
+        '__dict__',
+        '__weakref__',
+        'is_dirty',
+        'is_new',
+        '_db_prov_ref',
+        )
+
     def __init__(self, prov_ref=None):
         self._db_prov_ref = prov_ref
         self.is_dirty = True
@@ -11451,7 +12352,8 @@ class DBIsPartOf(object):
     def __copy__(self):
         return DBIsPartOf.do_copy(self)
 
-    def do_copy(self, new_ids=False, id_scope=None, id_remap=None):
+    def do_copy(self, new_ids=False, id_scope=None, id_remap=None,
+                shared=()):
         cp = DBIsPartOf(prov_ref=self._db_prov_ref)
         
         # set new ids
@@ -11513,19 +12415,36 @@ class DBOpmWasDerivedFrom(object):
 
     vtType = 'opm_was_derived_from'
 
+    __slots__ = (
+        '__dict__',
+        '__weakref__',
+        'is_dirty',
+        'is_new',
+        '_db_effect',
+        '_db_deleted_effect',
+        '_db_role',
+        '_db_deleted_role',
+        '_db_cause',
+        '_db_deleted_cause',
+        '_db_accounts',
+        '_db_deleted_accounts',
+        '_db_opm_times',
+        '_db_deleted_opm_times',
+        )
+    db_deleted_effect = LazyList('_db_deleted_effect')
+    db_deleted_role = LazyList('_db_deleted_role')
+    db_deleted_cause = LazyList('_db_deleted_cause')
+    db_deleted_accounts = LazyList('_db_deleted_accounts')
+    db_deleted_opm_times = LazyList('_db_deleted_opm_times')
+
     def __init__(self, effect=None, role=None, cause=None, accounts=None, opm_times=None):
-        self.db_deleted_effect = []
         self._db_effect = effect
-        self.db_deleted_role = []
         self._db_role = role
-        self.db_deleted_cause = []
         self._db_cause = cause
-        self.db_deleted_accounts = []
         if accounts is None:
             self._db_accounts = []
         else:
             self._db_accounts = accounts
-        self.db_deleted_opm_times = []
         if opm_times is None:
             self._db_opm_times = []
         else:
@@ -11536,7 +12455,8 @@ class DBOpmWasDerivedFrom(object):
     def __copy__(self):
         return DBOpmWasDerivedFrom.do_copy(self)
 
-    def do_copy(self, new_ids=False, id_scope=None, id_remap=None):
+    def do_copy(self, new_ids=False, id_scope=None, id_remap=None,
+                shared=()):
         cp = DBOpmWasDerivedFrom()
         if self._db_effect is not None:
             cp._db_effect = self._db_effect.do_copy(new_ids, id_scope, id_remap)
@@ -11546,10 +12466,14 @@ class DBOpmWasDerivedFrom(object):
             cp._db_cause = self._db_cause.do_copy(new_ids, id_scope, id_remap)
         if self._db_accounts is None:
             cp._db_accounts = []
+        elif 'accounts' in shared:
+            cp._db_accounts = list(self._db_accounts)
         else:
             cp._db_accounts = [v.do_copy(new_ids, id_scope, id_remap) for v in self._db_accounts]
         if self._db_opm_times is None:
             cp._db_opm_times = []
+        elif 'opm_times' in shared:
+            cp._db_opm_times = list(self._db_opm_times)
         else:
             cp._db_opm_times = [v.do_copy(new_ids, id_scope, id_remap) for v in self._db_opm_times]
         
@@ -11663,17 +12587,17 @@ class DBOpmWasDerivedFrom(object):
         return children
     def db_deleted_children(self, remove=False):
         children = []
-        children.extend(self.db_deleted_effect)
-        children.extend(self.db_deleted_role)
-        children.extend(self.db_deleted_cause)
-        children.extend(self.db_deleted_accounts)
-        children.extend(self.db_deleted_opm_times)
+        children.extend(getattr(self, '_db_deleted_effect', ()))
+        children.extend(getattr(self, '_db_deleted_role', ()))
+        children.extend(getattr(self, '_db_deleted_cause', ()))
+        children.extend(getattr(self, '_db_deleted_accounts', ()))
+        children.extend(getattr(self, '_db_deleted_opm_times', ()))
         if remove:
-            self.db_deleted_effect = []
-            self.db_deleted_role = []
-            self.db_deleted_cause = []
-            self.db_deleted_accounts = []
-            self.db_deleted_opm_times = []
+            del self.db_deleted_effect
+            del self.db_deleted_role
+            del self.db_deleted_cause
+            del self.db_deleted_accounts
+            del self.db_deleted_opm_times
         return children
     def has_changes(self):
         if self.is_dirty:
@@ -11782,6 +12706,16 @@ class DBControlParameter(object):
 
     vtType = 'controlParameter'
 
+    __slots__ = (
+        '__dict__',
+        '__weakref__',
+        'is_dirty',
+        'is_new',
+        '_db_id',
+        '_db_name',
+        '_db_value',
+        )
+
     def __init__(self, id=None, name=None, value=None):
         self._db_id = id
         self._db_name = name
@@ -11792,7 +12726,8 @@ class DBControlParameter(object):
     def __copy__(self):
         return DBControlParameter.do_copy(self)
 
-    def do_copy(self, new_ids=False, id_scope=None, id_remap=None):
+    def do_copy(self, new_ids=False, id_scope=None, id_remap=None,
+                shared=()):
         cp = DBControlParameter(id=self._db_id,
                                 name=self._db_name,
                                 value=self._db_value)
@@ -11893,6 +12828,15 @@ class DBPluginData(object):
 
     vtType = 'plugin_data'
 
+    __slots__ = (
+        '__dict__',
+        '__weakref__',
+        'is_dirty',
+        'is_new',
+        '_db_id',
+        '_db_data',
+        )
+
     def __init__(self, id=None, data=None):
         self._db_id = id
         self._db_data = data
@@ -11902,7 +12846,8 @@ class DBPluginData(object):
     def __copy__(self):
         return DBPluginData.do_copy(self)
 
-    def do_copy(self, new_ids=False, id_scope=None, id_remap=None):
+    def do_copy(self, new_ids=False, id_scope=None, id_remap=None,
+                shared=()):
         cp = DBPluginData(id=self._db_id,
                           data=self._db_data)
         
@@ -11984,6 +12929,18 @@ class DBDelete(object):
 
     vtType = 'delete'
 
+    __slots__ = (
+        '__dict__',
+        '__weakref__',
+        'is_dirty',
+        'is_new',
+        '_db_id',
+        '_db_what',
+        '_db_objectId',
+        '_db_parentObjId',
+        '_db_parentObjType',
+        )
+
     def __init__(self, id=None, what=None, objectId=None, parentObjId=None, parentObjType=None):
         self._db_id = id
         self._db_what = what
@@ -11996,7 +12953,8 @@ class DBDelete(object):
     def __copy__(self):
         return DBDelete.do_copy(self)
 
-    def do_copy(self, new_ids=False, id_scope=None, id_remap=None):
+    def do_copy(self, new_ids=False, id_scope=None, id_remap=None,
+                shared=()):
         cp = DBDelete(id=self._db_id,
                       what=self._db_what,
                       objectId=self._db_objectId,
@@ -12139,6 +13097,19 @@ class DBVistrailVariable(object):
 
     vtType = 'vistrailVariable'
 
+    __slots__ = (
+        '__dict__',
+        '__weakref__',
+        'is_dirty',
+        'is_new',
+        '_db_name',
+        '_db_uuid',
+        '_db_package',
+        '_db_module',
+        '_db_namespace',
+        '_db_value',
+        )
+
     def __init__(self, name=None, uuid=None, package=None, module=None, namespace=None, value=None):
         self._db_name = name
         self._db_uuid = uuid
@@ -12152,7 +13123,8 @@ class DBVistrailVariable(object):
     def __copy__(self):
         return DBVistrailVariable.do_copy(self)
 
-    def do_copy(self, new_ids=False, id_scope=None, id_remap=None):
+    def do_copy(self, new_ids=False, id_scope=None, id_remap=None,
+                shared=()):
         cp = DBVistrailVariable(name=self._db_name,
                                 uuid=self._db_uuid,
                                 package=self._db_package,
@@ -12310,8 +13282,17 @@ class DBOpmOverlaps(object):
 
     vtType = 'opm_overlaps'
 
+    __slots__ = (
+        '__dict__',
+        '__weakref__',
+        'is_dirty',
+        'is_new',
+        '_db_opm_account_ids',
+        '_db_deleted_opm_account_ids',
+        )
+    db_deleted_opm_account_ids = LazyList('_db_deleted_opm_account_ids')
+
     def __init__(self, opm_account_ids=None):
-        self.db_deleted_opm_account_ids = []
         if opm_account_ids is None:
             self._db_opm_account_ids = []
         else:
@@ -12322,10 +13303,13 @@ class DBOpmOverlaps(object):
     def __copy__(self):
         return DBOpmOverlaps.do_copy(self)
 
-    def do_copy(self, new_ids=False, id_scope=None, id_remap=None):
+    def do_copy(self, new_ids=False, id_scope=None, id_remap=None,
+                shared=()):
         cp = DBOpmOverlaps()
         if self._db_opm_account_ids is None:
             cp._db_opm_account_ids = []
+        elif 'opm_account_ids' in shared:
+            cp._db_opm_account_ids = list(self._db_opm_account_ids)
         else:
             cp._db_opm_account_ids = [v.do_copy(new_ids, id_scope, id_remap) for v in self._db_opm_account_ids]
         
@@ -12379,9 +13363,9 @@ class DBOpmOverlaps(object):
         return children
     def db_deleted_children(self, remove=False):
         children = []
-        children.extend(self.db_deleted_opm_account_ids)
+        children.extend(getattr(self, '_db_deleted_opm_account_ids', ()))
         if remove:
-            self.db_deleted_opm_account_ids = []
+            del self.db_deleted_opm_account_ids
         return children
     def has_changes(self):
         if self.is_dirty:
@@ -12416,19 +13400,36 @@ class DBOpmWasTriggeredBy(object):
 
     vtType = 'opm_was_triggered_by'
 
+    __slots__ = (
+        '__dict__',
+        '__weakref__',
+        'is_dirty',
+        'is_new',
+        '_db_effect',
+        '_db_deleted_effect',
+        '_db_role',
+        '_db_deleted_role',
+        '_db_cause',
+        '_db_deleted_cause',
+        '_db_accounts',
+        '_db_deleted_accounts',
+        '_db_opm_times',
+        '_db_deleted_opm_times',
+        )
+    db_deleted_effect = LazyList('_db_deleted_effect')
+    db_deleted_role = LazyList('_db_deleted_role')
+    db_deleted_cause = LazyList('_db_deleted_cause')
+    db_deleted_accounts = LazyList('_db_deleted_accounts')
+    db_deleted_opm_times = LazyList('_db_deleted_opm_times')
+
     def __init__(self, effect=None, role=None, cause=None, accounts=None, opm_times=None):
-        self.db_deleted_effect = []
         self._db_effect = effect
-        self.db_deleted_role = []
         self._db_role = role
-        self.db_deleted_cause = []
         self._db_cause = cause
-        self.db_deleted_accounts = []
         if accounts is None:
             self._db_accounts = []
         else:
             self._db_accounts = accounts
-        self.db_deleted_opm_times = []
         if opm_times is None:
             self._db_opm_times = []
         else:
@@ -12439,7 +13440,8 @@ class DBOpmWasTriggeredBy(object):
     def __copy__(self):
         return DBOpmWasTriggeredBy.do_copy(self)
 
-    def do_copy(self, new_ids=False, id_scope=None, id_remap=None):
+    def do_copy(self, new_ids=False, id_scope=None, id_remap=None,
+                shared=()):
         cp = DBOpmWasTriggeredBy()
         if self._db_effect is not None:
             cp._db_effect = self._db_effect.do_copy(new_ids, id_scope, id_remap)
@@ -12449,10 +13451,14 @@ class DBOpmWasTriggeredBy(object):
             cp._db_cause = self._db_cause.do_copy(new_ids, id_scope, id_remap)
         if self._db_accounts is None:
             cp._db_accounts = []
+        elif 'accounts' in shared:
+            cp._db_accounts = list(self._db_accounts)
         else:
             cp._db_accounts = [v.do_copy(new_ids, id_scope, id_remap) for v in self._db_accounts]
         if self._db_opm_times is None:
             cp._db_opm_times = []
+        elif 'opm_times' in shared:
+            cp._db_opm_times = list(self._db_opm_times)
         else:
             cp._db_opm_times = [v.do_copy(new_ids, id_scope, id_remap) for v in self._db_opm_times]
         
@@ -12566,17 +13572,17 @@ class DBOpmWasTriggeredBy(object):
         return children
     def db_deleted_children(self, remove=False):
         children = []
-        children.extend(self.db_deleted_effect)
-        children.extend(self.db_deleted_role)
-        children.extend(self.db_deleted_cause)
-        children.extend(self.db_deleted_accounts)
-        children.extend(self.db_deleted_opm_times)
+        children.extend(getattr(self, '_db_deleted_effect', ()))
+        children.extend(getattr(self, '_db_deleted_role', ()))
+        children.extend(getattr(self, '_db_deleted_cause', ()))
+        children.extend(getattr(self, '_db_deleted_accounts', ()))
+        children.extend(getattr(self, '_db_deleted_opm_times', ()))
         if remove:
-            self.db_deleted_effect = []
-            self.db_deleted_role = []
-            self.db_deleted_cause = []
-            self.db_deleted_accounts = []
-            self.db_deleted_opm_times = []
+            del self.db_deleted_effect
+            del self.db_deleted_role
+            del self.db_deleted_cause
+            del self.db_deleted_accounts
+            del self.db_deleted_opm_times
         return children
     def has_changes(self):
         if self.is_dirty:
@@ -12685,6 +13691,25 @@ class DBModuleDescriptor(object):
 
     vtType = 'module_descriptor'
 
+    __slots__ = (
+        '__dict__',
+        '__weakref__',
+        'is_dirty',
+        'is_new',
+        '_db_id',
+        '_db_name',
+        '_db_package',
+        '_db_namespace',
+        '_db_package_version',
+        '_db_version',
+        '_db_base_descriptor_id',
+        '_db_portSpecs',
+        '_db_deleted_portSpecs',
+        'db_portSpecs_id_index',
+        'db_portSpecs_name_index',
+        )
+    db_deleted_portSpecs = LazyList('_db_deleted_portSpecs')
+
     def __init__(self, id=None, name=None, package=None, namespace=None, package_version=None, version=None, base_descriptor_id=None, portSpecs=None):
         self._db_id = id
         self._db_name = name
@@ -12693,7 +13718,6 @@ class DBModuleDescriptor(object):
         self._db_package_version = package_version
         self._db_version = version
         self._db_base_descriptor_id = base_descriptor_id
-        self.db_deleted_portSpecs = []
         self.db_portSpecs_id_index = {}
         self.db_portSpecs_name_index = {}
         if portSpecs is None:
@@ -12709,7 +13733,8 @@ class DBModuleDescriptor(object):
     def __copy__(self):
         return DBModuleDescriptor.do_copy(self)
 
-    def do_copy(self, new_ids=False, id_scope=None, id_remap=None):
+    def do_copy(self, new_ids=False, id_scope=None, id_remap=None,
+                shared=()):
         cp = DBModuleDescriptor(id=self._db_id,
                                 name=self._db_name,
                                 package=self._db_package,
@@ -12719,6 +13744,8 @@ class DBModuleDescriptor(object):
                                 base_descriptor_id=self._db_base_descriptor_id)
         if self._db_portSpecs is None:
             cp._db_portSpecs = []
+        elif 'portSpecs' in shared:
+            cp._db_portSpecs = list(self._db_portSpecs)
         else:
             cp._db_portSpecs = [v.do_copy(new_ids, id_scope, id_remap) for v in self._db_portSpecs]
         
@@ -12811,9 +13838,9 @@ class DBModuleDescriptor(object):
         return children
     def db_deleted_children(self, remove=False):
         children = []
-        children.extend(self.db_deleted_portSpecs)
+        children.extend(getattr(self, '_db_deleted_portSpecs', ()))
         if remove:
-            self.db_deleted_portSpecs = []
+            del self.db_deleted_portSpecs
         return children
     def has_changes(self):
         if self.is_dirty:
@@ -12969,6 +13996,15 @@ class DBTag(object):
 
     vtType = 'tag'
 
+    __slots__ = (
+        '__dict__',
+        '__weakref__',
+        'is_dirty',
+        'is_new',
+        '_db_id',
+        '_db_name',
+        )
+
     def __init__(self, id=None, name=None):
         self._db_id = id
         self._db_name = name
@@ -12978,7 +14014,8 @@ class DBTag(object):
     def __copy__(self):
         return DBTag.do_copy(self)
 
-    def do_copy(self, new_ids=False, id_scope=None, id_remap=None):
+    def do_copy(self, new_ids=False, id_scope=None, id_remap=None,
+                shared=()):
         cp = DBTag(id=self._db_id,
                    name=self._db_name)
         
@@ -13062,6 +14099,14 @@ class DBOpmRole(object):
 
     vtType = 'opm_role'
 
+    __slots__ = (
+        '__dict__',
+        '__weakref__',
+        'is_dirty',
+        'is_new',
+        '_db_value',
+        )
+
     def __init__(self, value=None):
         self._db_value = value
         self.is_dirty = True
@@ -13070,7 +14115,8 @@ class DBOpmRole(object):
     def __copy__(self):
         return DBOpmRole.do_copy(self)
 
-    def do_copy(self, new_ids=False, id_scope=None, id_remap=None):
+    def do_copy(self, new_ids=False, id_scope=None, id_remap=None,
+                shared=()):
         cp = DBOpmRole(value=self._db_value)
         
         # set new ids
@@ -13132,8 +14178,39 @@ class DBProvDocument(object):
 
     vtType = 'prov_document'
 
+    __slots__ = (
+        '__dict__',
+        '__weakref__',
+        'is_dirty',
+        'is_new',
+        '_db_prov_entitys',
+        '_db_deleted_prov_entitys',
+        'db_prov_entitys_id_index',
+        '_db_prov_activitys',
+        '_db_deleted_prov_activitys',
+        'db_prov_activitys_id_index',
+        '_db_prov_agents',
+        '_db_deleted_prov_agents',
+        'db_prov_agents_id_index',
+        '_db_vt_connections',
+        '_db_deleted_vt_connections',
+        'db_vt_connections_id_index',
+        '_db_prov_usages',
+        '_db_deleted_prov_usages',
+        '_db_prov_generations',
+        '_db_deleted_prov_generations',
+        '_db_prov_associations',
+        '_db_deleted_prov_associations',
+        )
+    db_deleted_prov_entitys = LazyList('_db_deleted_prov_entitys')
+    db_deleted_prov_activitys = LazyList('_db_deleted_prov_activitys')
+    db_deleted_prov_agents = LazyList('_db_deleted_prov_agents')
+    db_deleted_vt_connections = LazyList('_db_deleted_vt_connections')
+    db_deleted_prov_usages = LazyList('_db_deleted_prov_usages')
+    db_deleted_prov_generations = LazyList('_db_deleted_prov_generations')
+    db_deleted_prov_associations = LazyList('_db_deleted_prov_associations')
+
     def __init__(self, prov_entitys=None, prov_activitys=None, prov_agents=None, vt_connections=None, prov_usages=None, prov_generations=None, prov_associations=None):
-        self.db_deleted_prov_entitys = []
         self.db_prov_entitys_id_index = {}
         if prov_entitys is None:
             self._db_prov_entitys = []
@@ -13141,7 +14218,6 @@ class DBProvDocument(object):
             self._db_prov_entitys = prov_entitys
             for v in self._db_prov_entitys:
                 self.db_prov_entitys_id_index[v.db_id] = v
-        self.db_deleted_prov_activitys = []
         self.db_prov_activitys_id_index = {}
         if prov_activitys is None:
             self._db_prov_activitys = []
@@ -13149,7 +14225,6 @@ class DBProvDocument(object):
             self._db_prov_activitys = prov_activitys
             for v in self._db_prov_activitys:
                 self.db_prov_activitys_id_index[v.db_id] = v
-        self.db_deleted_prov_agents = []
         self.db_prov_agents_id_index = {}
         if prov_agents is None:
             self._db_prov_agents = []
@@ -13157,7 +14232,6 @@ class DBProvDocument(object):
             self._db_prov_agents = prov_agents
             for v in self._db_prov_agents:
                 self.db_prov_agents_id_index[v.db_id] = v
-        self.db_deleted_vt_connections = []
         self.db_vt_connections_id_index = {}
         if vt_connections is None:
             self._db_vt_connections = []
@@ -13165,17 +14239,14 @@ class DBProvDocument(object):
             self._db_vt_connections = vt_connections
             for v in self._db_vt_connections:
                 self.db_vt_connections_id_index[v.db_id] = v
-        self.db_deleted_prov_usages = []
         if prov_usages is None:
             self._db_prov_usages = []
         else:
             self._db_prov_usages = prov_usages
-        self.db_deleted_prov_generations = []
         if prov_generations is None:
             self._db_prov_generations = []
         else:
             self._db_prov_generations = prov_generations
-        self.db_deleted_prov_associations = []
         if prov_associations is None:
             self._db_prov_associations = []
         else:
@@ -13186,34 +14257,49 @@ class DBProvDocument(object):
     def __copy__(self):
         return DBProvDocument.do_copy(self)
 
-    def do_copy(self, new_ids=False, id_scope=None, id_remap=None):
+    def do_copy(self, new_ids=False, id_scope=None, id_remap=None,
+                shared=()):
         cp = DBProvDocument()
         if self._db_prov_entitys is None:
             cp._db_prov_entitys = []
+        elif 'prov_entitys' in shared:
+            cp._db_prov_entitys = list(self._db_prov_entitys)
         else:
             cp._db_prov_entitys = [v.do_copy(new_ids, id_scope, id_remap) for v in self._db_prov_entitys]
         if self._db_prov_activitys is None:
             cp._db_prov_activitys = []
+        elif 'prov_activitys' in shared:
+            cp._db_prov_activitys = list(self._db_prov_activitys)
         else:
             cp._db_prov_activitys = [v.do_copy(new_ids, id_scope, id_remap) for v in self._db_prov_activitys]
         if self._db_prov_agents is None:
             cp._db_prov_agents = []
+        elif 'prov_agents' in shared:
+            cp._db_prov_agents = list(self._db_prov_agents)
         else:
             cp._db_prov_agents = [v.do_copy(new_ids, id_scope, id_remap) for v in self._db_prov_agents]
         if self._db_vt_connections is None:
             cp._db_vt_connections = []
+        elif 'vt_connections' in shared:
+            cp._db_vt_connections = list(self._db_vt_connections)
         else:
             cp._db_vt_connections = [v.do_copy(new_ids, id_scope, id_remap) for v in self._db_vt_connections]
         if self._db_prov_usages is None:
             cp._db_prov_usages = []
+        elif 'prov_usages' in shared:
+            cp._db_prov_usages = list(self._db_prov_usages)
         else:
             cp._db_prov_usages = [v.do_copy(new_ids, id_scope, id_remap) for v in self._db_prov_usages]
         if self._db_prov_generations is None:
             cp._db_prov_generations = []
+        elif 'prov_generations' in shared:
+            cp._db_prov_generations = list(self._db_prov_generations)
         else:
             cp._db_prov_generations = [v.do_copy(new_ids, id_scope, id_remap) for v in self._db_prov_generations]
         if self._db_prov_associations is None:
             cp._db_prov_associations = []
+        elif 'prov_associations' in shared:
+            cp._db_prov_associations = list(self._db_prov_associations)
         else:
             cp._db_prov_associations = [v.do_copy(new_ids, id_scope, id_remap) for v in self._db_prov_associations]
         
@@ -13379,21 +14465,21 @@ class DBProvDocument(object):
         return children
     def db_deleted_children(self, remove=False):
         children = []
-        children.extend(self.db_deleted_prov_entitys)
-        children.extend(self.db_deleted_prov_activitys)
-        children.extend(self.db_deleted_prov_agents)
-        children.extend(self.db_deleted_vt_connections)
-        children.extend(self.db_deleted_prov_usages)
-        children.extend(self.db_deleted_prov_generations)
-        children.extend(self.db_deleted_prov_associations)
+        children.extend(getattr(self, '_db_deleted_prov_entitys', ()))
+        children.extend(getattr(self, '_db_deleted_prov_activitys', ()))
+        children.extend(getattr(self, '_db_deleted_prov_agents', ()))
+        children.extend(getattr(self, '_db_deleted_vt_connections', ()))
+        children.extend(getattr(self, '_db_deleted_prov_usages', ()))
+        children.extend(getattr(self, '_db_deleted_prov_generations', ()))
+        children.extend(getattr(self, '_db_deleted_prov_associations', ()))
         if remove:
-            self.db_deleted_prov_entitys = []
-            self.db_deleted_prov_activitys = []
-            self.db_deleted_prov_agents = []
-            self.db_deleted_vt_connections = []
-            self.db_deleted_prov_usages = []
-            self.db_deleted_prov_generations = []
-            self.db_deleted_prov_associations = []
+            del self.db_deleted_prov_entitys
+            del self.db_deleted_prov_activitys
+            del self.db_deleted_prov_agents
+            del self.db_deleted_vt_connections
+            del self.db_deleted_prov_usages
+            del self.db_deleted_prov_generations
+            del self.db_deleted_prov_associations
         return children
     def has_changes(self):
         if self.is_dirty:
@@ -13654,8 +14740,18 @@ class DBOpmProcesses(object):
 
     vtType = 'opm_processes'
 
+    __slots__ = (
+        '__dict__',
+        '__weakref__',
+        'is_dirty',
+        'is_new',
+        '_db_processs',
+        '_db_deleted_processs',
+        'db_processs_id_index',
+        )
+    db_deleted_processs = LazyList('_db_deleted_processs')
+
     def __init__(self, processs=None):
-        self.db_deleted_processs = []
         self.db_processs_id_index = {}
         if processs is None:
             self._db_processs = []
@@ -13669,10 +14765,13 @@ class DBOpmProcesses(object):
     def __copy__(self):
         return DBOpmProcesses.do_copy(self)
 
-    def do_copy(self, new_ids=False, id_scope=None, id_remap=None):
+    def do_copy(self, new_ids=False, id_scope=None, id_remap=None,
+                shared=()):
         cp = DBOpmProcesses()
         if self._db_processs is None:
             cp._db_processs = []
+        elif 'processs' in shared:
+            cp._db_processs = list(self._db_processs)
         else:
             cp._db_processs = [v.do_copy(new_ids, id_scope, id_remap) for v in self._db_processs]
         
@@ -13727,9 +14826,9 @@ class DBOpmProcesses(object):
         return children
     def db_deleted_children(self, remove=False):
         children = []
-        children.extend(self.db_deleted_processs)
+        children.extend(getattr(self, '_db_deleted_processs', ()))
         if remove:
-            self.db_deleted_processs = []
+            del self.db_deleted_processs
         return children
     def has_changes(self):
         if self.is_dirty:
@@ -13786,6 +14885,14 @@ class DBOpmAccountId(object):
 
     vtType = 'opm_account_id'
 
+    __slots__ = (
+        '__dict__',
+        '__weakref__',
+        'is_dirty',
+        'is_new',
+        '_db_id',
+        )
+
     def __init__(self, id=None):
         self._db_id = id
         self.is_dirty = True
@@ -13794,7 +14901,8 @@ class DBOpmAccountId(object):
     def __copy__(self):
         return DBOpmAccountId.do_copy(self)
 
-    def do_copy(self, new_ids=False, id_scope=None, id_remap=None):
+    def do_copy(self, new_ids=False, id_scope=None, id_remap=None,
+                shared=()):
         cp = DBOpmAccountId(id=self._db_id)
         
         # set new ids
@@ -13858,6 +14966,22 @@ class DBPortSpecItem(object):
 
     vtType = 'portSpecItem'
 
+    __slots__ = (
+        '__dict__',
+        '__weakref__',
+        'is_dirty',
+        'is_new',
+        '_db_id',
+        '_db_pos',
+        '_db_module',
+        '_db_package',
+        '_db_namespace',
+        '_db_label',
+        '_db_default',
+        '_db_values',
+        '_db_entry_type',
+        )
+
     def __init__(self, id=None, pos=None, module=None, package=None, namespace=None, label=None, default=None, values=None, entry_type=None):
         self._db_id = id
         self._db_pos = pos
@@ -13874,7 +14998,8 @@ class DBPortSpecItem(object):
     def __copy__(self):
         return DBPortSpecItem.do_copy(self)
 
-    def do_copy(self, new_ids=False, id_scope=None, id_remap=None):
+    def do_copy(self, new_ids=False, id_scope=None, id_remap=None,
+                shared=()):
         cp = DBPortSpecItem(id=self._db_id,
                             pos=self._db_pos,
                             module=self._db_module,
@@ -14113,7 +15238,8 @@ class DBMashupComponent(object):
     def __copy__(self):
         return DBMashupComponent.do_copy(self)
 
-    def do_copy(self, new_ids=False, id_scope=None, id_remap=None):
+    def do_copy(self, new_ids=False, id_scope=None, id_remap=None,
+                shared=()):
         cp = DBMashupComponent(id=self._db_id,
                                vtid=self._db_vtid,
                                vttype=self._db_vttype,
@@ -14503,7 +15629,8 @@ class DBMashup(object):
     def __copy__(self):
         return DBMashup.do_copy(self)
 
-    def do_copy(self, new_ids=False, id_scope=None, id_remap=None):
+    def do_copy(self, new_ids=False, id_scope=None, id_remap=None,
+                shared=()):
         cp = DBMashup(id=self._db_id,
                       name=self._db_name,
                       version=self._db_version,
@@ -14514,6 +15641,8 @@ class DBMashup(object):
                       has_seq=self._db_has_seq)
         if self._db_aliases is None:
             cp._db_aliases = []
+        elif 'aliases' in shared:
+            cp._db_aliases = list(self._db_aliases)
         else:
             cp._db_aliases = [v.do_copy(new_ids, id_scope, id_remap) for v in self._db_aliases]
         
@@ -14774,6 +15903,19 @@ class DBMachine(object):
 
     vtType = 'machine'
 
+    __slots__ = (
+        '__dict__',
+        '__weakref__',
+        'is_dirty',
+        'is_new',
+        '_db_id',
+        '_db_name',
+        '_db_os',
+        '_db_architecture',
+        '_db_processor',
+        '_db_ram',
+        )
+
     def __init__(self, id=None, name=None, os=None, architecture=None, processor=None, ram=None):
         self._db_id = id
         self._db_name = name
@@ -14787,7 +15929,8 @@ class DBMachine(object):
     def __copy__(self):
         return DBMachine.do_copy(self)
 
-    def do_copy(self, new_ids=False, id_scope=None, id_remap=None):
+    def do_copy(self, new_ids=False, id_scope=None, id_remap=None,
+                shared=()):
         cp = DBMachine(id=self._db_id,
                        name=self._db_name,
                        os=self._db_os,
@@ -14947,6 +16090,14 @@ class DBConfigFloat(object):
 
     vtType = 'config_float'
 
+    __slots__ = (
+        '__dict__',
+        '__weakref__',
+        'is_dirty',
+        'is_new',
+        '_db_value',
+        )
+
     def __init__(self, value=None):
         self._db_value = value
         self.is_dirty = True
@@ -14955,7 +16106,8 @@ class DBConfigFloat(object):
     def __copy__(self):
         return DBConfigFloat.do_copy(self)
 
-    def do_copy(self, new_ids=False, id_scope=None, id_remap=None):
+    def do_copy(self, new_ids=False, id_scope=None, id_remap=None,
+                shared=()):
         cp = DBConfigFloat(value=self._db_value)
         
         # set new ids
@@ -15017,6 +16169,16 @@ class DBOther(object):
 
     vtType = 'other'
 
+    __slots__ = (
+        '__dict__',
+        '__weakref__',
+        'is_dirty',
+        'is_new',
+        '_db_id',
+        '_db_key',
+        '_db_value',
+        )
+
     def __init__(self, id=None, key=None, value=None):
         self._db_id = id
         self._db_key = key
@@ -15027,7 +16189,8 @@ class DBOther(object):
     def __copy__(self):
         return DBOther.do_copy(self)
 
-    def do_copy(self, new_ids=False, id_scope=None, id_remap=None):
+    def do_copy(self, new_ids=False, id_scope=None, id_remap=None,
+                shared=()):
         cp = DBOther(id=self._db_id,
                      key=self._db_key,
                      value=self._db_value)
@@ -15128,6 +16291,14 @@ class DBRefProvActivity(object):
 
     vtType = 'ref_prov_activity'
 
+    __slots__ = (
+        '__dict__',
+        '__weakref__',
+        'is_dirty',
+        'is_new',
+        '_db_prov_ref',
+        )
+
     def __init__(self, prov_ref=None):
         self._db_prov_ref = prov_ref
         self.is_dirty = True
@@ -15136,7 +16307,8 @@ class DBRefProvActivity(object):
     def __copy__(self):
         return DBRefProvActivity.do_copy(self)
 
-    def do_copy(self, new_ids=False, id_scope=None, id_remap=None):
+    def do_copy(self, new_ids=False, id_scope=None, id_remap=None,
+                shared=()):
         cp = DBRefProvActivity(prov_ref=self._db_prov_ref)
         
         # set new ids
@@ -15200,6 +16372,37 @@ class DBAbstraction(object):
 
     vtType = 'abstraction'
 
+    __slots__ = (
+        '__dict__',
+        '__weakref__',
+        'is_dirty',
+        'is_new',
+        '_db_id',
+        '_db_cache',
+        '_db_name',
+        '_db_namespace',
+        '_db_package',
+        '_db_version',
+        '_db_internal_version',
+        '_db_location',
+        '_db_deleted_location',
+        '_db_functions',
+        '_db_deleted_functions',
+        'db_functions_id_index',
+        '_db_annotations',
+        '_db_deleted_annotations',
+        'db_annotations_id_index',
+        'db_annotations_key_index',
+        '_db_controlParameters',
+        '_db_deleted_controlParameters',
+        'db_controlParameters_id_index',
+        'db_controlParameters_name_index',
+        )
+    db_deleted_location = LazyList('_db_deleted_location')
+    db_deleted_functions = LazyList('_db_deleted_functions')
+    db_deleted_annotations = LazyList('_db_deleted_annotations')
+    db_deleted_controlParameters = LazyList('_db_deleted_controlParameters')
+
     def __init__(self, id=None, cache=None, name=None, namespace=None, package=None, version=None, internal_version=None, location=None, functions=None, annotations=None, controlParameters=None):
         self._db_id = id
         self._db_cache = cache
@@ -15208,9 +16411,7 @@ class DBAbstraction(object):
         self._db_package = package
         self._db_version = version
         self._db_internal_version = internal_version
-        self.db_deleted_location = []
         self._db_location = location
-        self.db_deleted_functions = []
         self.db_functions_id_index = {}
         if functions is None:
             self._db_functions = []
@@ -15218,7 +16419,6 @@ class DBAbstraction(object):
             self._db_functions = functions
             for v in self._db_functions:
                 self.db_functions_id_index[v.db_id] = v
-        self.db_deleted_annotations = []
         self.db_annotations_id_index = {}
         self.db_annotations_key_index = {}
         if annotations is None:
@@ -15228,7 +16428,6 @@ class DBAbstraction(object):
             for v in self._db_annotations:
                 self.db_annotations_id_index[v.db_id] = v
                 self.db_annotations_key_index[v.db_key] = v
-        self.db_deleted_controlParameters = []
         self.db_controlParameters_id_index = {}
         self.db_controlParameters_name_index = {}
         if controlParameters is None:
@@ -15244,7 +16443,8 @@ class DBAbstraction(object):
     def __copy__(self):
         return DBAbstraction.do_copy(self)
 
-    def do_copy(self, new_ids=False, id_scope=None, id_remap=None):
+    def do_copy(self, new_ids=False, id_scope=None, id_remap=None,
+                shared=()):
         cp = DBAbstraction(id=self._db_id,
                            cache=self._db_cache,
                            name=self._db_name,
@@ -15256,14 +16456,20 @@ class DBAbstraction(object):
             cp._db_location = self._db_location.do_copy(new_ids, id_scope, id_remap)
         if self._db_functions is None:
             cp._db_functions = []
+        elif 'functions' in shared:
+            cp._db_functions = list(self._db_functions)
         else:
             cp._db_functions = [v.do_copy(new_ids, id_scope, id_remap) for v in self._db_functions]
         if self._db_annotations is None:
             cp._db_annotations = []
+        elif 'annotations' in shared:
+            cp._db_annotations = list(self._db_annotations)
         else:
             cp._db_annotations = [v.do_copy(new_ids, id_scope, id_remap) for v in self._db_annotations]
         if self._db_controlParameters is None:
             cp._db_controlParameters = []
+        elif 'controlParameters' in shared:
+            cp._db_controlParameters = list(self._db_controlParameters)
         else:
             cp._db_controlParameters = [v.do_copy(new_ids, id_scope, id_remap) for v in self._db_controlParameters]
         
@@ -15407,15 +16613,15 @@ class DBAbstraction(object):
         return children
     def db_deleted_children(self, remove=False):
         children = []
-        children.extend(self.db_deleted_location)
-        children.extend(self.db_deleted_functions)
-        children.extend(self.db_deleted_annotations)
-        children.extend(self.db_deleted_controlParameters)
+        children.extend(getattr(self, '_db_deleted_location', ()))
+        children.extend(getattr(self, '_db_deleted_functions', ()))
+        children.extend(getattr(self, '_db_deleted_annotations', ()))
+        children.extend(getattr(self, '_db_deleted_controlParameters', ()))
         if remove:
-            self.db_deleted_location = []
-            self.db_deleted_functions = []
-            self.db_deleted_annotations = []
-            self.db_deleted_controlParameters = []
+            del self.db_deleted_location
+            del self.db_deleted_functions
+            del self.db_deleted_annotations
+            del self.db_deleted_controlParameters
         return children
     def has_changes(self):
         if self.is_dirty:
@@ -15685,6 +16891,21 @@ class DBProvAgent(object):
 
     vtType = 'prov_agent'
 
+    __slots__ = (
+        '__dict__',
+        '__weakref__',
+        'is_dirty',
+        'is_new',
+        '_db_id',
+        '_db_vt_id',
+        '_db_prov_type',
+        '_db_prov_label',
+        '_db_vt_machine_os',
+        '_db_vt_machine_architecture',
+        '_db_vt_machine_processor',
+        '_db_vt_machine_ram',
+        )
+
     def __init__(self, id=None, vt_id=None, prov_type=None, prov_label=None, vt_machine_os=None, vt_machine_architecture=None, vt_machine_processor=None, vt_machine_ram=None):
         self._db_id = id
         self._db_vt_id = vt_id
@@ -15700,7 +16921,8 @@ class DBProvAgent(object):
     def __copy__(self):
         return DBProvAgent.do_copy(self)
 
-    def do_copy(self, new_ids=False, id_scope=None, id_remap=None):
+    def do_copy(self, new_ids=False, id_scope=None, id_remap=None,
+                shared=()):
         cp = DBProvAgent(id=self._db_id,
                          vt_id=self._db_vt_id,
                          prov_type=self._db_prov_type,
@@ -15938,7 +17160,8 @@ class DBMashuptrail(object):
     def __copy__(self):
         return DBMashuptrail.do_copy(self)
 
-    def do_copy(self, new_ids=False, id_scope=None, id_remap=None):
+    def do_copy(self, new_ids=False, id_scope=None, id_remap=None,
+                shared=()):
         cp = DBMashuptrail(id=self._db_id,
                            name=self._db_name,
                            version=self._db_version,
@@ -15946,14 +17169,20 @@ class DBMashuptrail(object):
                            last_modified=self._db_last_modified)
         if self._db_actions is None:
             cp._db_actions = []
+        elif 'actions' in shared:
+            cp._db_actions = list(self._db_actions)
         else:
             cp._db_actions = [v.do_copy(new_ids, id_scope, id_remap) for v in self._db_actions]
         if self._db_annotations is None:
             cp._db_annotations = []
+        elif 'annotations' in shared:
+            cp._db_annotations = list(self._db_annotations)
         else:
             cp._db_annotations = [v.do_copy(new_ids, id_scope, id_remap) for v in self._db_annotations]
         if self._db_actionAnnotations is None:
             cp._db_actionAnnotations = []
+        elif 'actionAnnotations' in shared:
+            cp._db_actionAnnotations = list(self._db_actionAnnotations)
         else:
             cp._db_actionAnnotations = [v.do_copy(new_ids, id_scope, id_remap) for v in self._db_actionAnnotations]
         
@@ -16317,6 +17546,24 @@ class DBRegistry(object):
 
     vtType = 'registry'
 
+    __slots__ = (
+        '__dict__',
+        '__weakref__',
+        'is_dirty',
+        'is_new',
+        '_db_id',
+        '_db_entity_type',
+        '_db_version',
+        '_db_root_descriptor_id',
+        '_db_name',
+        '_db_last_modified',
+        '_db_packages',
+        '_db_deleted_packages',
+        'db_packages_id_index',
+        'db_packages_identifier_index',
+        )
+    db_deleted_packages = LazyList('_db_deleted_packages')
+
     def __init__(self, id=None, entity_type=None, version=None, root_descriptor_id=None, name=None, last_modified=None, packages=None):
         self._db_id = id
         self._db_entity_type = entity_type
@@ -16324,7 +17571,6 @@ class DBRegistry(object):
         self._db_root_descriptor_id = root_descriptor_id
         self._db_name = name
         self._db_last_modified = last_modified
-        self.db_deleted_packages = []
         self.db_packages_id_index = {}
         self.db_packages_identifier_index = {}
         if packages is None:
@@ -16340,7 +17586,8 @@ class DBRegistry(object):
     def __copy__(self):
         return DBRegistry.do_copy(self)
 
-    def do_copy(self, new_ids=False, id_scope=None, id_remap=None):
+    def do_copy(self, new_ids=False, id_scope=None, id_remap=None,
+                shared=()):
         cp = DBRegistry(id=self._db_id,
                         entity_type=self._db_entity_type,
                         version=self._db_version,
@@ -16349,6 +17596,8 @@ class DBRegistry(object):
                         last_modified=self._db_last_modified)
         if self._db_packages is None:
             cp._db_packages = []
+        elif 'packages' in shared:
+            cp._db_packages = list(self._db_packages)
         else:
             cp._db_packages = [v.do_copy(new_ids, id_scope, id_remap) for v in self._db_packages]
         
@@ -16436,9 +17685,9 @@ class DBRegistry(object):
         return children
     def db_deleted_children(self, remove=False):
         children = []
-        children.extend(self.db_deleted_packages)
+        children.extend(getattr(self, '_db_deleted_packages', ()))
         if remove:
-            self.db_deleted_packages = []
+            del self.db_deleted_packages
         return children
     def has_changes(self):
         if self.is_dirty:
@@ -16581,10 +17830,21 @@ class DBOpmAgent(object):
 
     vtType = 'opm_agent'
 
+    __slots__ = (
+        '__dict__',
+        '__weakref__',
+        'is_dirty',
+        'is_new',
+        '_db_id',
+        '_db_value',
+        '_db_accounts',
+        '_db_deleted_accounts',
+        )
+    db_deleted_accounts = LazyList('_db_deleted_accounts')
+
     def __init__(self, id=None, value=None, accounts=None):
         self._db_id = id
         self._db_value = value
-        self.db_deleted_accounts = []
         if accounts is None:
             self._db_accounts = []
         else:
@@ -16595,11 +17855,14 @@ class DBOpmAgent(object):
     def __copy__(self):
         return DBOpmAgent.do_copy(self)
 
-    def do_copy(self, new_ids=False, id_scope=None, id_remap=None):
+    def do_copy(self, new_ids=False, id_scope=None, id_remap=None,
+                shared=()):
         cp = DBOpmAgent(id=self._db_id,
                         value=self._db_value)
         if self._db_accounts is None:
             cp._db_accounts = []
+        elif 'accounts' in shared:
+            cp._db_accounts = list(self._db_accounts)
         else:
             cp._db_accounts = [v.do_copy(new_ids, id_scope, id_remap) for v in self._db_accounts]
         
@@ -16663,9 +17926,9 @@ class DBOpmAgent(object):
         return children
     def db_deleted_children(self, remove=False):
         children = []
-        children.extend(self.db_deleted_accounts)
+        children.extend(getattr(self, '_db_deleted_accounts', ()))
         if remove:
-            self.db_deleted_accounts = []
+            del self.db_deleted_accounts
         return children
     def has_changes(self):
         if self.is_dirty:
@@ -16727,6 +17990,28 @@ class DBProvEntity(object):
 
     vtType = 'prov_entity'
 
+    __slots__ = (
+        '__dict__',
+        '__weakref__',
+        'is_dirty',
+        'is_new',
+        '_db_id',
+        '_db_prov_type',
+        '_db_prov_label',
+        '_db_prov_value',
+        '_db_vt_id',
+        '_db_vt_type',
+        '_db_vt_desc',
+        '_db_vt_package',
+        '_db_vt_version',
+        '_db_vt_cache',
+        '_db_vt_location_x',
+        '_db_vt_location_y',
+        '_db_is_part_of',
+        '_db_deleted_is_part_of',
+        )
+    db_deleted_is_part_of = LazyList('_db_deleted_is_part_of')
+
     def __init__(self, id=None, prov_type=None, prov_label=None, prov_value=None, vt_id=None, vt_type=None, vt_desc=None, vt_package=None, vt_version=None, vt_cache=None, vt_location_x=None, vt_location_y=None, is_part_of=None):
         self._db_id = id
         self._db_prov_type = prov_type
@@ -16740,7 +18025,6 @@ class DBProvEntity(object):
         self._db_vt_cache = vt_cache
         self._db_vt_location_x = vt_location_x
         self._db_vt_location_y = vt_location_y
-        self.db_deleted_is_part_of = []
         self._db_is_part_of = is_part_of
         self.is_dirty = True
         self.is_new = True
@@ -16748,7 +18032,8 @@ class DBProvEntity(object):
     def __copy__(self):
         return DBProvEntity.do_copy(self)
 
-    def do_copy(self, new_ids=False, id_scope=None, id_remap=None):
+    def do_copy(self, new_ids=False, id_scope=None, id_remap=None,
+                shared=()):
         cp = DBProvEntity(id=self._db_id,
                           prov_type=self._db_prov_type,
                           prov_label=self._db_prov_label,
@@ -16870,9 +18155,9 @@ class DBProvEntity(object):
         return children
     def db_deleted_children(self, remove=False):
         children = []
-        children.extend(self.db_deleted_is_part_of)
+        children.extend(getattr(self, '_db_deleted_is_part_of', ()))
         if remove:
-            self.db_deleted_is_part_of = []
+            del self.db_deleted_is_part_of
         return children
     def has_changes(self):
         if self.is_dirty:
@@ -17068,7 +18353,8 @@ class DBAnnotation(object):
     def __copy__(self):
         return DBAnnotation.do_copy(self)
 
-    def do_copy(self, new_ids=False, id_scope=None, id_remap=None):
+    def do_copy(self, new_ids=False, id_scope=None, id_remap=None,
+                shared=()):
         cp = DBAnnotation(id=self._db_id,
                           key=self._db_key,
                           value=self._db_value)
@@ -17169,6 +18455,16 @@ class DBOpmTime(object):
 
     vtType = 'opm_time'
 
+    __slots__ = (
+        '__dict__',
+        '__weakref__',
+        'is_dirty',
+        'is_new',
+        '_db_no_later_than',
+        '_db_no_earlier_than',
+        '_db_clock_id',
+        )
+
     def __init__(self, no_later_than=None, no_earlier_than=None, clock_id=None):
         self._db_no_later_than = no_later_than
         self._db_no_earlier_than = no_earlier_than
@@ -17179,7 +18475,8 @@ class DBOpmTime(object):
     def __copy__(self):
         return DBOpmTime.do_copy(self)
 
-    def do_copy(self, new_ids=False, id_scope=None, id_remap=None):
+    def do_copy(self, new_ids=False, id_scope=None, id_remap=None,
+                shared=()):
         cp = DBOpmTime(no_later_than=self._db_no_later_than,
                        no_earlier_than=self._db_no_earlier_than,
                        clock_id=self._db_clock_id)
@@ -17279,6 +18576,24 @@ class DBParameterExploration(object):
 
     vtType = 'parameter_exploration'
 
+    __slots__ = (
+        '__dict__',
+        '__weakref__',
+        'is_dirty',
+        'is_new',
+        '_db_id',
+        '_db_action_id',
+        '_db_name',
+        '_db_date',
+        '_db_user',
+        '_db_dims',
+        '_db_layout',
+        '_db_functions',
+        '_db_deleted_functions',
+        'db_functions_id_index',
+        )
+    db_deleted_functions = LazyList('_db_deleted_functions')
+
     def __init__(self, id=None, action_id=None, name=None, date=None, user=None, dims=None, layout=None, functions=None):
         self._db_id = id
         self._db_action_id = action_id
@@ -17287,7 +18602,6 @@ class DBParameterExploration(object):
         self._db_user = user
         self._db_dims = dims
         self._db_layout = layout
-        self.db_deleted_functions = []
         self.db_functions_id_index = {}
         if functions is None:
             self._db_functions = []
@@ -17301,7 +18615,8 @@ class DBParameterExploration(object):
     def __copy__(self):
         return DBParameterExploration.do_copy(self)
 
-    def do_copy(self, new_ids=False, id_scope=None, id_remap=None):
+    def do_copy(self, new_ids=False, id_scope=None, id_remap=None,
+                shared=()):
         cp = DBParameterExploration(id=self._db_id,
                                     action_id=self._db_action_id,
                                     name=self._db_name,
@@ -17311,6 +18626,8 @@ class DBParameterExploration(object):
                                     layout=self._db_layout)
         if self._db_functions is None:
             cp._db_functions = []
+        elif 'functions' in shared:
+            cp._db_functions = list(self._db_functions)
         else:
             cp._db_functions = [v.do_copy(new_ids, id_scope, id_remap) for v in self._db_functions]
         
@@ -17402,9 +18719,9 @@ class DBParameterExploration(object):
         return children
     def db_deleted_children(self, remove=False):
         children = []
-        children.extend(self.db_deleted_functions)
+        children.extend(getattr(self, '_db_deleted_functions', ()))
         if remove:
-            self.db_deleted_functions = []
+            del self.db_deleted_functions
         return children
     def has_changes(self):
         if self.is_dirty:
@@ -17566,7 +18883,8 @@ class DBMashupActionAnnotation(object):
     def __copy__(self):
         return DBMashupActionAnnotation.do_copy(self)
 
-    def do_copy(self, new_ids=False, id_scope=None, id_remap=None):
+    def do_copy(self, new_ids=False, id_scope=None, id_remap=None,
+                shared=()):
         cp = DBMashupActionAnnotation(id=self._db_id,
                                       key=self._db_key,
                                       value=self._db_value,
@@ -17726,11 +19044,23 @@ class DBOpmProcess(object):
 
     vtType = 'opm_process'
 
+    __slots__ = (
+        '__dict__',
+        '__weakref__',
+        'is_dirty',
+        'is_new',
+        '_db_id',
+        '_db_value',
+        '_db_deleted_value',
+        '_db_accounts',
+        '_db_deleted_accounts',
+        )
+    db_deleted_value = LazyList('_db_deleted_value')
+    db_deleted_accounts = LazyList('_db_deleted_accounts')
+
     def __init__(self, id=None, value=None, accounts=None):
         self._db_id = id
-        self.db_deleted_value = []
         self._db_value = value
-        self.db_deleted_accounts = []
         if accounts is None:
             self._db_accounts = []
         else:
@@ -17741,12 +19071,15 @@ class DBOpmProcess(object):
     def __copy__(self):
         return DBOpmProcess.do_copy(self)
 
-    def do_copy(self, new_ids=False, id_scope=None, id_remap=None):
+    def do_copy(self, new_ids=False, id_scope=None, id_remap=None,
+                shared=()):
         cp = DBOpmProcess(id=self._db_id)
         if self._db_value is not None:
             cp._db_value = self._db_value.do_copy(new_ids, id_scope, id_remap)
         if self._db_accounts is None:
             cp._db_accounts = []
+        elif 'accounts' in shared:
+            cp._db_accounts = list(self._db_accounts)
         else:
             cp._db_accounts = [v.do_copy(new_ids, id_scope, id_remap) for v in self._db_accounts]
         
@@ -17819,11 +19152,11 @@ class DBOpmProcess(object):
         return children
     def db_deleted_children(self, remove=False):
         children = []
-        children.extend(self.db_deleted_value)
-        children.extend(self.db_deleted_accounts)
+        children.extend(getattr(self, '_db_deleted_value', ()))
+        children.extend(getattr(self, '_db_deleted_accounts', ()))
         if remove:
-            self.db_deleted_value = []
-            self.db_deleted_accounts = []
+            del self.db_deleted_value
+            del self.db_deleted_accounts
         return children
     def has_changes(self):
         if self.is_dirty:
@@ -17889,8 +19222,18 @@ class DBDisabledPackages(object):
 
     vtType = 'disabled_packages'
 
+    __slots__ = (
+        '__dict__',
+        '__weakref__',
+        'is_dirty',
+        'is_new',
+        '_db_packages',
+        '_db_deleted_packages',
+        'db_packages_name_index',
+        )
+    db_deleted_packages = LazyList('_db_deleted_packages')
+
     def __init__(self, packages=None):
-        self.db_deleted_packages = []
         self.db_packages_name_index = {}
         if packages is None:
             self._db_packages = []
@@ -17904,10 +19247,13 @@ class DBDisabledPackages(object):
     def __copy__(self):
         return DBDisabledPackages.do_copy(self)
 
-    def do_copy(self, new_ids=False, id_scope=None, id_remap=None):
+    def do_copy(self, new_ids=False, id_scope=None, id_remap=None,
+                shared=()):
         cp = DBDisabledPackages()
         if self._db_packages is None:
             cp._db_packages = []
+        elif 'packages' in shared:
+            cp._db_packages = list(self._db_packages)
         else:
             cp._db_packages = [v.do_copy(new_ids, id_scope, id_remap) for v in self._db_packages]
         
@@ -17962,9 +19308,9 @@ class DBDisabledPackages(object):
         return children
     def db_deleted_children(self, remove=False):
         children = []
-        children.extend(self.db_deleted_packages)
+        children.extend(getattr(self, '_db_deleted_packages', ()))
         if remove:
-            self.db_deleted_packages = []
+            del self.db_deleted_packages
         return children
     def has_changes(self):
         if self.is_dirty:
@@ -18005,6 +19351,30 @@ class DBModuleExec(object):
 
     vtType = 'module_exec'
 
+    __slots__ = (
+        '__dict__',
+        '__weakref__',
+        'is_dirty',
+        'is_new',
+        '_db_id',
+        '_db_ts_start',
+        '_db_ts_end',
+        '_db_cached',
+        '_db_module_id',
+        '_db_module_name',
+        '_db_completed',
+        '_db_error',
+        '_db_machine_id',
+        '_db_annotations',
+        '_db_deleted_annotations',
+        'db_annotations_id_index',
+        '_db_loop_execs',
+        '_db_deleted_loop_execs',
+        'db_loop_execs_id_index',
+        )
+    db_deleted_annotations = LazyList('_db_deleted_annotations')
+    db_deleted_loop_execs = LazyList('_db_deleted_loop_execs')
+
     def __init__(self, id=None, ts_start=None, ts_end=None, cached=None, module_id=None, module_name=None, completed=None, error=None, machine_id=None, annotations=None, loop_execs=None):
         self._db_id = id
         self._db_ts_start = ts_start
@@ -18015,7 +19385,6 @@ class DBModuleExec(object):
         self._db_completed = completed
         self._db_error = error
         self._db_machine_id = machine_id
-        self.db_deleted_annotations = []
         self.db_annotations_id_index = {}
         if annotations is None:
             self._db_annotations = []
@@ -18023,7 +19392,6 @@ class DBModuleExec(object):
             self._db_annotations = annotations
             for v in self._db_annotations:
                 self.db_annotations_id_index[v.db_id] = v
-        self.db_deleted_loop_execs = []
         self.db_loop_execs_id_index = {}
         if loop_execs is None:
             self._db_loop_execs = []
@@ -18037,7 +19405,8 @@ class DBModuleExec(object):
     def __copy__(self):
         return DBModuleExec.do_copy(self)
 
-    def do_copy(self, new_ids=False, id_scope=None, id_remap=None):
+    def do_copy(self, new_ids=False, id_scope=None, id_remap=None,
+                shared=()):
         cp = DBModuleExec(id=self._db_id,
                           ts_start=self._db_ts_start,
                           ts_end=self._db_ts_end,
@@ -18049,10 +19418,14 @@ class DBModuleExec(object):
                           machine_id=self._db_machine_id)
         if self._db_annotations is None:
             cp._db_annotations = []
+        elif 'annotations' in shared:
+            cp._db_annotations = list(self._db_annotations)
         else:
             cp._db_annotations = [v.do_copy(new_ids, id_scope, id_remap) for v in self._db_annotations]
         if self._db_loop_execs is None:
             cp._db_loop_execs = []
+        elif 'loop_execs' in shared:
+            cp._db_loop_execs = list(self._db_loop_execs)
         else:
             cp._db_loop_execs = [v.do_copy(new_ids, id_scope, id_remap) for v in self._db_loop_execs]
         
@@ -18175,11 +19548,11 @@ class DBModuleExec(object):
         return children
     def db_deleted_children(self, remove=False):
         children = []
-        children.extend(self.db_deleted_annotations)
-        children.extend(self.db_deleted_loop_execs)
+        children.extend(getattr(self, '_db_deleted_annotations', ()))
+        children.extend(getattr(self, '_db_deleted_loop_execs', ()))
         if remove:
-            self.db_deleted_annotations = []
-            self.db_deleted_loop_execs = []
+            del self.db_deleted_annotations
+            del self.db_deleted_loop_execs
         return children
     def has_changes(self):
         if self.is_dirty:
@@ -18399,12 +19772,26 @@ class DBProvAssociation(object):
 
     vtType = 'prov_association'
 
+    __slots__ = (
+        '__dict__',
+        '__weakref__',
+        'is_dirty',
+        'is_new',
+        '_db_prov_activity',
+        '_db_deleted_prov_activity',
+        '_db_prov_agent',
+        '_db_deleted_prov_agent',
+        '_db_prov_plan',
+        '_db_deleted_prov_plan',
+        '_db_prov_role',
+        )
+    db_deleted_prov_activity = LazyList('_db_deleted_prov_activity')
+    db_deleted_prov_agent = LazyList('_db_deleted_prov_agent')
+    db_deleted_prov_plan = LazyList('_db_deleted_prov_plan')
+
     def __init__(self, prov_activity=None, prov_agent=None, prov_plan=None, prov_role=None):
-        self.db_deleted_prov_activity = []
         self._db_prov_activity = prov_activity
-        self.db_deleted_prov_agent = []
         self._db_prov_agent = prov_agent
-        self.db_deleted_prov_plan = []
         self._db_prov_plan = prov_plan
         self._db_prov_role = prov_role
         self.is_dirty = True
@@ -18413,7 +19800,8 @@ class DBProvAssociation(object):
     def __copy__(self):
         return DBProvAssociation.do_copy(self)
 
-    def do_copy(self, new_ids=False, id_scope=None, id_remap=None):
+    def do_copy(self, new_ids=False, id_scope=None, id_remap=None,
+                shared=()):
         cp = DBProvAssociation(prov_role=self._db_prov_role)
         if self._db_prov_activity is not None:
             cp._db_prov_activity = self._db_prov_activity.do_copy(new_ids, id_scope, id_remap)
@@ -18501,13 +19889,13 @@ class DBProvAssociation(object):
         return children
     def db_deleted_children(self, remove=False):
         children = []
-        children.extend(self.db_deleted_prov_activity)
-        children.extend(self.db_deleted_prov_agent)
-        children.extend(self.db_deleted_prov_plan)
+        children.extend(getattr(self, '_db_deleted_prov_activity', ()))
+        children.extend(getattr(self, '_db_deleted_prov_agent', ()))
+        children.extend(getattr(self, '_db_deleted_prov_plan', ()))
         if remove:
-            self.db_deleted_prov_activity = []
-            self.db_deleted_prov_agent = []
-            self.db_deleted_prov_plan = []
+            del self.db_deleted_prov_activity
+            del self.db_deleted_prov_agent
+            del self.db_deleted_prov_plan
         return children
     def has_changes(self):
         if self.is_dirty:
@@ -18583,8 +19971,17 @@ class DBOpmProcessValue(object):
 
     vtType = 'opm_process_value'
 
+    __slots__ = (
+        '__dict__',
+        '__weakref__',
+        'is_dirty',
+        'is_new',
+        '_db_value',
+        '_db_deleted_value',
+        )
+    db_deleted_value = LazyList('_db_deleted_value')
+
     def __init__(self, value=None):
-        self.db_deleted_value = []
         self._db_value = value
         self.is_dirty = True
         self.is_new = True
@@ -18592,7 +19989,8 @@ class DBOpmProcessValue(object):
     def __copy__(self):
         return DBOpmProcessValue.do_copy(self)
 
-    def do_copy(self, new_ids=False, id_scope=None, id_remap=None):
+    def do_copy(self, new_ids=False, id_scope=None, id_remap=None,
+                shared=()):
         cp = DBOpmProcessValue()
         if self._db_value is not None:
             cp._db_value = self._db_value.do_copy(new_ids, id_scope, id_remap)
@@ -18655,9 +20053,9 @@ class DBOpmProcessValue(object):
         return children
     def db_deleted_children(self, remove=False):
         children = []
-        children.extend(self.db_deleted_value)
+        children.extend(getattr(self, '_db_deleted_value', ()))
         if remove:
-            self.db_deleted_value = []
+            del self.db_deleted_value
         return children
     def has_changes(self):
         if self.is_dirty:
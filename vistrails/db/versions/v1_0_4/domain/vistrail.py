@@ -59,6 +59,11 @@ class DBVistrail(_DBVistrail):
         self.db_log_filename = None
         self.log = None
 
+        # ids of the actions whose operations were not loaded yet
+        # (see vistrails.db.services.io.load_vistrail_operations)
+        self.db_unloaded_actions = set()
+        self.db_unloaded_filename = None
+
     def __copy__(self):
         return DBVistrail.do_copy(self)
 
@@ -69,6 +74,8 @@ class DBVistrail(_DBVistrail):
         cp.idScope = copy.copy(self.idScope)
         cp.db_objects = copy.copy(self.db_objects)
         cp.db_log_filename = self.db_log_filename
+        cp.db_unloaded_actions = copy.copy(self.db_unloaded_actions)
+        cp.db_unloaded_filename = self.db_unloaded_filename
         if self.log is not None:
             cp.log = copy.copy(self.log)
         else:
@@ -38,9 +38,17 @@ from auto_gen import DBAbstraction, DBModule, DBGroup
 from id_scope import IdScope
 
 import copy
+from itertools import chain, izip
 
 class DBWorkflow(_DBWorkflow):
 
+    # fields whose children copy-on-write copies share
+    _cow_fields = ('modules', 'connections')
+    # ids of the shared modules and connections, and the map from the
+    # objects they contain to their (type, id), built on first write
+    _cow_shared = frozenset()
+    _cow_owners = None
+
     def __init__(self, *args, **kwargs):
         _DBWorkflow.__init__(self, *args, **kwargs)
         self.objects = {}
@@ -51,11 +59,37 @@ class DBWorkflow(_DBWorkflow):
     def __copy__(self):
         return DBWorkflow.do_copy(self)
 
-    def do_copy(self, new_ids=False, id_scope=None, id_remap=None):
-        cp = _DBWorkflow.do_copy(self, new_ids, id_scope, id_remap)
+    def do_copy(self, new_ids=False, id_scope=None, id_remap=None,
+                cow=False):
+        """do_copy(new_ids: bool, id_scope: IdScope, id_remap: dict,
+                   cow: bool) -> DBWorkflow
+        With cow, the modules and connections are not copied but shared
+        between both workflows until they are modified through
+        db_add_object, db_change_object or db_delete_object (see
+        db_own_object). Objects changed directly must be owned first.
+
+        """
+        if cow and new_ids:
+            raise ValueError("copy-on-write copies cannot have new ids")
+        shared = self._cow_fields if cow else ()
+        cp = _DBWorkflow.do_copy(self, new_ids, id_scope, id_remap, shared)
         cp.__class__ = DBWorkflow
-        # need to go through and reset the index to the copied objects
-        cp.build_index()
+        if cow:
+            ids = set(id(o) for o in chain(self._db_modules,
+                                           self._db_connections))
+            self._cow_shared = ids
+            self._cow_owners = None
+            cp._cow_shared = set(ids)
+            # the shared objects are already indexed, only index the
+            # copied ones
+            cp.objects = dict(self.objects)
+            for child in chain(cp._db_annotations, cp._db_plugin_datas,
+                               cp._db_others):
+                for (o, _, _) in child.db_children():
+                    cp.add_to_index(o)
+        else:
+            # need to go through and reset the index to the copied objects
+            cp.build_index()
         cp.tmp_id = copy.copy(self.tmp_id)
         return cp        
 
@@ -94,6 +128,45 @@ class DBWorkflow(_DBWorkflow):
         for k,v in self.objects.iteritems():
             print '%s: %s' % (k, v)
 
+    def db_own_object(self, obj_type, obj_id):
+        """db_own_object(obj_type: str, obj_id) -> None
+        Makes sure the module or connection that contains the object is
+        not shared with a copy-on-write copy of this workflow, copying
+        it if it is, so that the object can be modified in place.
+
+        """
+        if not self._cow_shared:
+            return
+        if obj_type == DBModule.vtType or obj_type == 'connection':
+            key = (obj_type, obj_id)
+        else:
+            if self._cow_owners is None:
+                # keyed by object, ids are not always unique in the index
+                g = self._vtTypeMap.get
+                self._cow_owners = owners = {}
+                for top in chain(self._db_modules, self._db_connections):
+                    key = (g(top.vtType, top.vtType), top.db_id)
+                    for (o, _, _) in top.db_children():
+                        owners[id(o)] = key
+            key = self._cow_owners.get(id(self.objects.get((obj_type,
+                                                            obj_id))))
+            if key is None:
+                return
+        top = getattr(self, 'db_%ss_id_index' % key[0]).get(key[1])
+        if top is None or id(top) not in self._cow_shared:
+            return
+        self._cow_shared.discard(id(top))
+        top_copy = copy.copy(top)
+        is_dirty = self.is_dirty
+        getattr(self, 'db_change_' + key[0])(top_copy)
+        self.is_dirty = is_dirty
+        g = self._vtTypeMap.get
+        for ((o, _, _), (o_copy, _, _)) in izip(top.db_children(),
+                                                top_copy.db_children()):
+            o_key = (g(o.vtType, o.vtType), o.getPrimaryKey())
+            if self.objects.get(o_key) is o:
+                self.objects[o_key] = o_copy
+
     def db_has_object(self, type, id):
         return (type, id) in self.objects
 
@@ -109,6 +182,7 @@ class DBWorkflow(_DBWorkflow):
                 if parent_obj_type == DBAbstraction.vtType or \
                         parent_obj_type == DBGroup.vtType:
                     parent_obj_type = DBModule.vtType
+                self.db_own_object(parent_obj_type, parent_obj_id)
                 try:
                     parent_obj = self.objects[(parent_obj_type, parent_obj_id)]
                 except KeyError:
@@ -134,6 +208,7 @@ class DBWorkflow(_DBWorkflow):
                 if parent_obj_type == DBAbstraction.vtType or \
                         parent_obj_type == DBGroup.vtType:
                     parent_obj_type = DBModule.vtType
+                self.db_own_object(parent_obj_type, parent_obj_id)
                 try:
                     parent_obj = self.objects[(parent_obj_type, parent_obj_id)]
                 except KeyError:
@@ -153,6 +228,7 @@ class DBWorkflow(_DBWorkflow):
                 if parent_obj_type == DBAbstraction.vtType or \
                         parent_obj_type == DBGroup.vtType:
                     parent_obj_type = DBModule.vtType
+                self.db_own_object(parent_obj_type, parent_obj_id)
                 try:
                     parent_obj = self.objects[(parent_obj_type, parent_obj_id)]
                 except KeyError:
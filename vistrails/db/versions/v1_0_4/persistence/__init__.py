@@ -34,6 +34,8 @@
 ###############################################################################
 from xml.auto_gen import XMLDAOListBase
 from sql.auto_gen import SQLDAOListBase
+from bin.auto_gen import BINDAOListBase
+from bin.bin_dao import BINReader, BINWriter
 from vistrails.core.system import get_elementtree_library
 
 from vistrails.db import VistrailsDBException
@@ -51,6 +53,7 @@ class DAOList(dict):
     def __init__(self):
         self['xml'] = XMLDAOListBase()
         self['sql'] = SQLDAOListBase()
+        self['bin'] = BINDAOListBase()
 
     def parse_xml_file(self, filename):
         return ElementTree.parse(filename)
@@ -101,6 +104,34 @@ class DAOList(dict):
         tree = ElementTree.ElementTree(root)
         self.write_xml_file(filename, tree)
 
+    def read_bin_object(self, vtType, reader):
+        return self['bin'][vtType].fromBin(reader)
+
+    def write_bin_object(self, obj, writer):
+        self['bin'][obj.vtType].toBin(obj, writer)
+
+    def open_from_bin(self, data, vtType, pos=0):
+        """open_from_bin(data: str, vtType: str, pos: int) -> DBVistrail
+        Reads an object of type vtType from the binary encoded string data,
+        starting at offset pos.
+
+        """
+        reader = BINReader(data, pos)
+        obj = self.read_bin_object(vtType, reader)
+        if not reader.at_end():
+            raise VistrailsDBException("Trailing data after binary %s" % \
+                                           vtType)
+        return obj
+
+    def save_to_bin(self, obj, file):
+        """save_to_bin(obj: object, file: file) -> None
+        Writes the binary encoding of obj to the open file.
+
+        """
+        writer = BINWriter(file)
+        self.write_bin_object(obj, writer)
+        writer.flush()
+
     def open_from_db(self, db_connection, vtType, id=None, lock=False, 
                      global_props=None):
         all_objects = {}
@@ -179,6 +210,8 @@ class DAOList(dict):
     def open_many_from_db(self, db_connection, vtType, ids, lock=False):
         """ Loads multiple objects. They need to be loaded as one single
             multiple select statement command for performance reasons.
+            The children of all objects are read with a single SELECT per
+            table, selecting the rows of every parent at once.
         """
 
         log_dao = self['sql'][vtType]
@@ -190,15 +223,10 @@ class DAOList(dict):
 
         # list of final objects
         objects = []
-        # list of selects
-        selects = []
         # list of children id:all_objects_dict
         all_objects_dict = {}
-        # process each result and extract child SELECTS
-        # daoList should contain (id, dao_type, dao, result) values
-        daoList = []
-        # selects should contain dbCommand values
-        selects = []
+        # entity ids as stored in the database
+        entity_ids = []
         global_props = {}
         for id, data in zip(ids, results):
             res_objects = log_dao.process_sql_columns(data, global_props)
@@ -211,58 +239,90 @@ class DAOList(dict):
                                            "id '%s' exist in the database" % \
                                                (vtType, id))
             all_objects = {}
-            all_objects_dict[id] = all_objects
+            all_objects_dict[long(id)] = all_objects
             all_objects.update(res_objects)
             objects.append(res_objects.values()[0])
-            # collect all commands so that they can be executed together
-        
-            # generate SELECT statements for children
-            for dao_type, dao in self['sql'].iteritems():
-                if dao_type in root_set:
-                    continue
-    
-                daoList.append([id, dao_type, dao, None])
-                dbCommand = dao.get_sql_select(db_connection, global_props, lock)
-                selects.append(dbCommand)
+            entity_ids.append(global_props['entity_id'])
+        if not objects:
+            return objects
+        global_props = {'entity_type': global_props['entity_type'],
+                        'entity_id': entity_ids}
+
+        # generate SELECT statements for children
+        # daoList should contain (dao_type, dao, result) values
+        daoList = []
+        selects = []
+        for dao_type, dao in self['sql'].iteritems():
+            if dao_type in root_set:
+                continue
+            daoList.append([dao_type, dao, None])
+            selects.append(dao.get_sql_select(db_connection, global_props,
+                                              lock))
 
         # Execute all child select statements
         results = self['sql'][vtType].executeSQLGroup(db_connection,
                                                       selects, True)
         for i in xrange(len(daoList)):
-            daoList[i][3] = results[i]
-
-        # process results
-        for id, dao_type, dao, data in daoList:
-            all_objects = all_objects_dict[id]
-            current_objs = dao.process_sql_columns(data, global_props)
-            all_objects.update(current_objs)
+            daoList[i][2] = results[i]
 
-            if dao_type == DBGroup.vtType:
+        # process results, row by row since ids are only unique within
+        # each parent
+        for dao_type, dao, data in daoList:
+            for row in data:
+                current_objs = dao.process_sql_columns([row], global_props)
                 for key, obj in current_objs.iteritems():
-                    new_props = {'parent_id': key[1],
-                                 'entity_id': global_props['entity_id'],
-                                 'entity_type': global_props['entity_type']}
-                    res_obj = self.open_from_db(db_connection, 
-                                                DBWorkflow.vtType, 
-                                                None, lock, new_props)
-                    res_dict = {}
-                    res_dict[(res_obj.vtType, res_obj.db_id)] = res_obj
-                    all_objects.update(res_dict)
+                    all_objects = all_objects_dict[long(obj.db_entity_id)]
+                    all_objects[key] = obj
+                    if dao_type == DBGroup.vtType:
+                        new_props = {'parent_id': key[1],
+                                     'entity_id': obj.db_entity_id,
+                                     'entity_type': obj.db_entity_type}
+                        res_obj = self.open_from_db(db_connection,
+                                                    DBWorkflow.vtType,
+                                                    None, lock, new_props)
+                        all_objects[(res_obj.vtType, res_obj.db_id)] = res_obj
 
-        
         for id, all_objects in all_objects_dict.iteritems():
             for key, obj in all_objects.iteritems():
                 if key[0] == vtType and key[1] == id:
                     continue
                 self['sql'][obj.vtType].from_sql_fast(obj, all_objects)
-        for id, dao_type, dao, data in daoList:
-            all_objects = all_objects_dict[id]
             for obj in all_objects.itervalues():
                 obj.is_dirty = False
                 obj.is_new = False
-    
+
         return objects
 
+    def execute_sql_commands(self, db_connection, dbCommandList, objList):
+        """execute_sql_commands(db_connection, dbCommandList: list,
+                                objList: list) -> dict
+        Executes the insert/update statements of the objects in objList and
+        returns the lastrowid of each object's statement. Objects that
+        still need an id from the database are written one at a time;
+        the rest are batched per table.
+
+        """
+        if not dbCommandList:
+            return {}
+        dao = self['sql'][objList[0].vtType]
+        single = []
+        batched = []
+        for obj, dbCommand in zip(objList, dbCommandList):
+            if getattr(obj, 'db_id', 0) is None:
+                single.append((obj, dbCommand))
+            else:
+                batched.append((obj, dbCommand))
+        resultDict = {}
+        if single:
+            results = dao.executeSQLGroup(db_connection,
+                                          [c for _, c in single], False)
+            resultDict.update(zip([o for o, _ in single], results))
+        if batched:
+            results = dao.executeSQLBatch(db_connection,
+                                          [c for _, c in batched])
+            resultDict.update(zip([o for o, _ in batched], results))
+        return resultDict
+
     def save_to_db(self, db_connection, obj, do_copy=False, global_props=None):
         if do_copy == 'with_ids':
             do_copy = True
@@ -315,10 +375,8 @@ class DAOList(dict):
         #                      db_connection, c, False) for c in dbCommandList]
 
         # Execute all insert/update statements
-        results = self['sql'][children[0][0].vtType].executeSQLGroup(
-                                                    db_connection,
-                                                    dbCommandList, False)
-        resultDict = dict(zip(writtenChildren, results))
+        resultDict = self.execute_sql_commands(db_connection, dbCommandList,
+                                               writtenChildren)
         # process remaining children
         for (child, _, _) in children:
             if child in resultDict:
@@ -406,10 +464,8 @@ class DAOList(dict):
                 self['sql'][child.vtType].to_sql_fast(child, do_copy)
     
         # Execute all child insert/update statements
-        results = self['sql'][children[0][0].vtType].executeSQLGroup(
-                                                        db_connection,
-                                                        dbCommandList, False)
-        resultDict = dict(zip(writtenChildren, results))
+        resultDict = self.execute_sql_commands(db_connection, dbCommandList,
+                                               writtenChildren)
 
         for child, children in childrenDict.iteritems():
             global_props = global_propsDict[child]
@@ -470,3 +526,201 @@ class DAOList(dict):
             msg = "Invalid VisTrails serialized object %s" % str
             raise VistrailsDBException(msg)
             return None
+
+################################################################################
+
+import unittest
+
+from vistrails.db.versions.v1_0_4.domain import DBAnnotation
+
+class _FakeCursor(object):
+    """MySQLdb-like cursor over a sqlite3 connection."""
+    def __init__(self, connection):
+        self.connection = connection
+        self.results = []
+        self.lastrowid = None
+
+    def _run(self, command, values=()):
+        cur = self.connection.db.execute(command.replace('%s', '?'), values)
+        self.lastrowid = cur.lastrowid
+        return cur.fetchall()
+
+    def execute(self, command, values=None):
+        if values is not None:
+            self.results = [self._run(command, values)]
+        else:
+            # several statements, as sent by executeSQLGroup
+            self.results = [self._run(c) for c in command.split(';')
+                            if c.strip()]
+
+    def executemany(self, command, values_list):
+        values_list = list(values_list)
+        self.connection.batches.append(len(values_list))
+        self.connection.db.executemany(command.replace('%s', '?'),
+                                       values_list)
+
+    def fetchall(self):
+        return self.results[0]
+
+    def nextset(self):
+        self.results.pop(0)
+        return bool(self.results) or None
+
+    def close(self):
+        pass
+
+class _FakeConnection(object):
+    """MySQLdb-like connection to an in-memory sqlite3 database with the
+    1.0.4 schema; records the size of each executemany call."""
+    def __init__(self):
+        import os
+        import re
+        import sqlite3
+        self.db = sqlite3.connect(':memory:',
+                                  detect_types=sqlite3.PARSE_DECLTYPES)
+        self.batches = []
+        f = open(os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                              os.pardir, 'schemas', 'sql', 'vistrails.sql'))
+        try:
+            schema = f.read()
+        finally:
+            f.close()
+        schema = re.sub(r'--.*', '', schema)
+        schema = schema.replace('int not null auto_increment primary key',
+                                'integer primary key')
+        schema = schema.replace('engine=InnoDB', '')
+        # sqlite3 converts 'timestamp' columns back to datetime objects
+        schema = re.sub(r'\bdatetime\b', 'timestamp', schema)
+        self.db.executescript(schema)
+
+    def cursor(self):
+        return _FakeCursor(self)
+
+    def escape(self, values, conversions):
+        return tuple("'%s'" % str(v).replace("'", "''") for v in values)
+
+class _FakeDBLib(object):
+    class converters(object):
+        conversions = None
+
+class TestSQLBatch(unittest.TestCase):
+    def setUp(self):
+        import vistrails.db.services.io
+        self.old_db_lib = vistrails.db.services.io._db_lib
+        vistrails.db.services.io.set_db_lib(_FakeDBLib)
+        self.daos = DAOList()
+
+    def tearDown(self):
+        import vistrails.db.services.io
+        vistrails.db.services.io.set_db_lib(self.old_db_lib)
+
+    def create_log(self, name):
+        from datetime import datetime
+        from vistrails.db.versions.v1_0_4.domain import DBWorkflowExec, \
+            DBModuleExec
+
+        ts = datetime(2014, 1, 1)
+        log = DBLog(entity_type=DBLog.vtType, version=my_version, name=name)
+        for i in xrange(3):
+            workflow_exec = DBWorkflowExec(
+                id=i + 1, user='user', ip='127.0.0.1', session=i,
+                vt_version='2.1', ts_start=ts, ts_end=ts, parent_id=1,
+                parent_type=DBVistrail.vtType, parent_version=i,
+                completed=1, name='exec %d' % i)
+            for j in xrange(2):
+                workflow_exec.db_add_item_exec(DBModuleExec(
+                        id=10 * i + j + 1, ts_start=ts, ts_end=ts, cached=0,
+                        module_id=j, module_name='Module', completed=1,
+                        machine_id=1))
+            log.db_add_workflow_exec(workflow_exec)
+        return log
+
+    def canonical(self, obj):
+        """canonical(obj) -> tuple
+        The XML serialization of obj, with children in a fixed order.
+
+        """
+        def walk(node):
+            return (node.tag, sorted(node.attrib.items()),
+                    sorted(walk(child) for child in node))
+        return walk(self.daos.write_xml_object(obj))
+
+    def annotation_commands(self, annotations):
+        dao = self.daos['sql'][DBAnnotation.vtType]
+        return [dao.createSQLInsert(dao.table,
+                                    {'id': a.db_id, 'akey': a.db_key,
+                                     'value': a.db_value})
+                for a in annotations]
+
+    def test_batch(self):
+        annotations = [DBAnnotation(id=i, key='k%d' % i, value=str(i))
+                       for i in xrange(5)]
+        commands = self.annotation_commands(annotations)
+        dao = self.daos['sql'][DBAnnotation.vtType]
+        batched = _FakeConnection()
+        self.assertEqual(dao.executeSQLBatch(batched, commands), [None] * 5)
+        self.assertEqual(batched.batches, [5])
+        single = _FakeConnection()
+        dao.executeSQLGroup(single, commands, False)
+        query = 'SELECT id, akey, value FROM annotation ORDER BY id'
+        self.assertEqual(batched.db.execute(query).fetchall(),
+                         single.db.execute(query).fetchall())
+
+    def test_batch_empty(self):
+        connection = _FakeConnection()
+        dao = self.daos['sql'][DBAnnotation.vtType]
+        self.assertEqual(dao.executeSQLBatch(connection, []), [])
+        self.assertEqual(self.daos.execute_sql_commands(connection, [], []),
+                         {})
+        self.assertEqual(self.daos.open_many_from_db(connection,
+                                                     DBLog.vtType, []),
+                         [])
+        self.assertEqual(connection.batches, [])
+
+    def test_batch_size(self):
+        connection = _FakeConnection()
+        annotations = [DBAnnotation(id=i, key='k', value=str(i))
+                       for i in xrange(2500)]
+        commands = self.annotation_commands(annotations)
+        dao = self.daos['sql'][DBAnnotation.vtType]
+        self.assertEqual(dao.executeSQLBatch(connection, commands),
+                         [None] * 2500)
+        self.assertEqual(connection.batches, [1000, 1000, 500])
+        self.assertEqual(connection.db.execute(
+                'SELECT COUNT(*), MAX(id) FROM annotation').fetchall(),
+                         [(2500, 2499)])
+
+    def test_execute_sql_commands(self):
+        connection = _FakeConnection()
+        # objects without an id are written alone to get their row id
+        annotations = [DBAnnotation(id=i, key='k', value=str(i))
+                       for i in xrange(3)]
+        annotations.insert(1, DBAnnotation(key='new', value='new'))
+        commands = self.annotation_commands(annotations)
+        results = self.daos.execute_sql_commands(connection, commands,
+                                                 annotations)
+        self.assertEqual(connection.batches, [3])
+        self.assertIsNotNone(results[annotations[1]])
+        self.assertEqual([results[a] for a in annotations
+                          if a.db_id is not None],
+                         [None] * 3)
+        self.assertEqual(connection.db.execute(
+                'SELECT COUNT(*) FROM annotation').fetchall(), [(4,)])
+
+    def test_open_many(self):
+        connection = _FakeConnection()
+        logs = [self.create_log('log %d' % i) for i in xrange(3)]
+        for log in logs:
+            self.daos.save_to_db(connection, log, True)
+        # child rows are inserted with executemany
+        self.assertTrue(connection.batches)
+        ids = [log.db_id for log in logs]
+        many = self.daos.open_many_from_db(connection, DBLog.vtType, ids)
+        single = [self.daos.open_from_db(connection, DBLog.vtType, id)
+                  for id in ids]
+        self.assertEqual([log.db_id for log in many], ids)
+        # the children of each log have the same ids in every log
+        self.assertEqual([self.canonical(log) for log in many],
+                         [self.canonical(log) for log in single])
+        self.assertEqual([len(log.db_workflow_execs) for log in many],
+                         [3, 3, 3])
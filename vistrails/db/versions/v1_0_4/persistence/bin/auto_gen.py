@@ -0,0 +1,4244 @@
+###############################################################################
+##
+## Copyright (C) 2011-2014, NYU-Poly.
+## Copyright (C) 2006-2011, University of Utah. 
+## All rights reserved.
+## Contact: contact@vistrails.org
+##
+## This file is part of VisTrails.
+##
+## "Redistribution and use in source and binary forms, with or without 
+## modification, are permitted provided that the following conditions are met:
+##
+##  - Redistributions of source code must retain the above copyright notice, 
+##    this list of conditions and the following disclaimer.
+##  - Redistributions in binary form must reproduce the above copyright 
+##    notice, this list of conditions and the following disclaimer in the 
+##    documentation and/or other materials provided with the distribution.
+##  - Neither the name of the University of Utah nor the names of its 
+##    contributors may be used to endorse or promote products derived from 
+##    this software without specific prior written permission.
+##
+## THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" 
+## AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, 
+## THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR 
+## PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR 
+## CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, 
+## EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, 
+## PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; 
+## OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, 
+## WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR 
+## OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF 
+## ADVISED OF THE POSSIBILITY OF SUCH DAMAGE."
+##
+###############################################################################
+
+"""generated automatically by auto_dao.py"""
+
+from bin_dao import BINDAO
+from vistrails.db.versions.v1_0_4.domain import *
+
+class DBOpmWasGeneratedByBINDAOBase(BINDAO):
+
+    def __init__(self, daoList):
+        self.daoList = daoList
+
+    def getDao(self, dao):
+        return self.daoList[dao]
+
+    def fromBin(self, reader):
+        # read children
+        effect = None
+        if reader.read_count():
+            effect = self.getDao('opm_artifact_id_effect').fromBin(reader)
+        role = None
+        if reader.read_count():
+            role = self.getDao('opm_role').fromBin(reader)
+        cause = None
+        if reader.read_count():
+            cause = self.getDao('opm_process_id_cause').fromBin(reader)
+        accounts = []
+        for i in xrange(reader.read_count()):
+            _data = self.getDao('opm_account_id').fromBin(reader)
+            accounts.append(_data)
+        opm_times = []
+        for i in xrange(reader.read_count()):
+            _data = self.getDao('opm_time').fromBin(reader)
+            opm_times.append(_data)
+
+        obj = DBOpmWasGeneratedBy(effect=effect, role=role, cause=cause, accounts=accounts, opm_times=opm_times)
+        obj.is_dirty = False
+        return obj
+
+    def toBin(self, opm_was_generated_by, writer):
+        # write children
+        effect = opm_was_generated_by.db_effect
+        if effect is not None:
+            writer.write_count(1)
+            self.getDao('opm_artifact_id_effect').toBin(effect, writer)
+        else:
+            writer.write_count(0)
+        role = opm_was_generated_by.db_role
+        if role is not None:
+            writer.write_count(1)
+            self.getDao('opm_role').toBin(role, writer)
+        else:
+            writer.write_count(0)
+        cause = opm_was_generated_by.db_cause
+        if cause is not None:
+            writer.write_count(1)
+            self.getDao('opm_process_id_cause').toBin(cause, writer)
+        else:
+            writer.write_count(0)
+        accounts = opm_was_generated_by.db_accounts
+        writer.write_count(len(accounts))
+        for account in accounts:
+            self.getDao('opm_account_id').toBin(account, writer)
+        opm_times = opm_was_generated_by.db_opm_times
+        writer.write_count(len(opm_times))
+        for opm_time in opm_times:
+            self.getDao('opm_time').toBin(opm_time, writer)
+
+class DBConfigKeyBINDAOBase(BINDAO):
+
+    def __init__(self, daoList):
+        self.daoList = daoList
+
+    def getDao(self, dao):
+        return self.daoList[dao]
+
+    def fromBin(self, reader):
+        read_value = reader.read_value
+
+        # read attributes
+        name = read_value()
+
+        # read children
+        value = None
+        _tag = reader.read_count()
+        if _tag == 1:
+            value = self.getDao('config_str').fromBin(reader)
+        elif _tag == 2:
+            value = self.getDao('config_int').fromBin(reader)
+        elif _tag == 3:
+            value = self.getDao('config_float').fromBin(reader)
+        elif _tag == 4:
+            value = self.getDao('config_bool').fromBin(reader)
+        elif _tag == 5:
+            value = self.getDao('configuration').fromBin(reader)
+
+        obj = DBConfigKey(value=value, name=name)
+        obj.is_dirty = False
+        return obj
+
+    def toBin(self, config_key, writer):
+        write_value = writer.write_value
+
+        # write attributes
+        write_value(config_key.db_name)
+
+        # write children
+        value = config_key.db_value
+        if value is not None and value.vtType == 'config_str':
+            writer.write_count(1)
+            self.getDao('config_str').toBin(value, writer)
+        elif value is not None and value.vtType == 'config_int':
+            writer.write_count(2)
+            self.getDao('config_int').toBin(value, writer)
+        elif value is not None and value.vtType == 'config_float':
+            writer.write_count(3)
+            self.getDao('config_float').toBin(value, writer)
+        elif value is not None and value.vtType == 'config_bool':
+            writer.write_count(4)
+            self.getDao('config_bool').toBin(value, writer)
+        elif value is not None and value.vtType == 'configuration':
+            writer.write_count(5)
+            self.getDao('configuration').toBin(value, writer)
+        else:
+            writer.write_count(0)
+
+class DBMashupAliasBINDAOBase(BINDAO):
+
+    def __init__(self, daoList):
+        self.daoList = daoList
+
+    def getDao(self, dao):
+        return self.daoList[dao]
+
+    def fromBin(self, reader):
+        read_value = reader.read_value
+
+        # read attributes
+        id = read_value()
+        name = read_value()
+
+        # read children
+        component = None
+        if reader.read_count():
+            component = self.getDao('mashup_component').fromBin(reader)
+
+        obj = DBMashupAlias(id=id, name=name, component=component)
+        obj.is_dirty = False
+        return obj
+
+    def toBin(self, mashup_alias, writer):
+        write_value = writer.write_value
+
+        # write attributes
+        write_value(mashup_alias.db_id)
+        write_value(mashup_alias.db_name)
+
+        # write children
+        component = mashup_alias.db_component
+        if component is not None:
+            writer.write_count(1)
+            self.getDao('mashup_component').toBin(component, writer)
+        else:
+            writer.write_count(0)
+
+class DBGroupBINDAOBase(BINDAO):
+
+    def __init__(self, daoList):
+        self.daoList = daoList
+
+    def getDao(self, dao):
+        return self.daoList[dao]
+
+    def fromBin(self, reader):
+        read_value = reader.read_value
+
+        # read attributes
+        id = read_value()
+        cache = read_value()
+        name = read_value()
+        namespace = read_value()
+        package = read_value()
+        version = read_value()
+
+        # read children
+        workflow = None
+        if reader.read_count():
+            workflow = self.getDao('workflow').fromBin(reader)
+        location = None
+        if reader.read_count():
+            location = self.getDao('location').fromBin(reader)
+        functions = []
+        for i in xrange(reader.read_count()):
+            _data = self.getDao('function').fromBin(reader)
+            functions.append(_data)
+        annotations = []
+        for i in xrange(reader.read_count()):
+            _data = self.getDao('annotation').fromBin(reader)
+            annotations.append(_data)
+        controlParameters = []
+        for i in xrange(reader.read_count()):
+            _data = self.getDao('controlParameter').fromBin(reader)
+            controlParameters.append(_data)
+
+        obj = DBGroup(id=id, workflow=workflow, cache=cache, name=name, namespace=namespace, package=package, version=version, location=location, functions=functions, annotations=annotations, controlParameters=controlParameters)
+        obj.is_dirty = False
+        return obj
+
+    def toBin(self, group, writer):
+        write_value = writer.write_value
+
+        # write attributes
+        write_value(group.db_id)
+        write_value(group.db_cache)
+        write_value(group.db_name)
+        write_value(group.db_namespace)
+        write_value(group.db_package)
+        write_value(group.db_version)
+
+        # write children
+        workflow = group.db_workflow
+        if workflow is not None:
+            writer.write_count(1)
+            self.getDao('workflow').toBin(workflow, writer)
+        else:
+            writer.write_count(0)
+        location = group.db_location
+        if location is not None:
+            writer.write_count(1)
+            self.getDao('location').toBin(location, writer)
+        else:
+            writer.write_count(0)
+        functions = group.db_functions
+        writer.write_count(len(functions))
+        for function in functions:
+            self.getDao('function').toBin(function, writer)
+        annotations = group.db_annotations
+        writer.write_count(len(annotations))
+        for annotation in annotations:
+            self.getDao('annotation').toBin(annotation, writer)
+        controlParameters = group.db_controlParameters
+        writer.write_count(len(controlParameters))
+        for controlParameter in controlParameters:
+            self.getDao('controlParameter').toBin(controlParameter, writer)
+
+class DBOpmWasControlledByBINDAOBase(BINDAO):
+
+    def __init__(self, daoList):
+        self.daoList = daoList
+
+    def getDao(self, dao):
+        return self.daoList[dao]
+
+    def fromBin(self, reader):
+        # read children
+        effect = None
+        if reader.read_count():
+            effect = self.getDao('opm_process_id_effect').fromBin(reader)
+        role = None
+        if reader.read_count():
+            role = self.getDao('opm_role').fromBin(reader)
+        cause = None
+        if reader.read_count():
+            cause = self.getDao('opm_agent_id').fromBin(reader)
+        accounts = []
+        for i in xrange(reader.read_count()):
+            _data = self.getDao('opm_account_id').fromBin(reader)
+            accounts.append(_data)
+        starts = []
+        for i in xrange(reader.read_count()):
+            _data = self.getDao('opm_time').fromBin(reader)
+            starts.append(_data)
+        ends = []
+        for i in xrange(reader.read_count()):
+            _data = self.getDao('opm_time').fromBin(reader)
+            ends.append(_data)
+
+        obj = DBOpmWasControlledBy(effect=effect, role=role, cause=cause, accounts=accounts, starts=starts, ends=ends)
+        obj.is_dirty = False
+        return obj
+
+    def toBin(self, opm_was_controlled_by, writer):
+        # write children
+        effect = opm_was_controlled_by.db_effect
+        if effect is not None:
+            writer.write_count(1)
+            self.getDao('opm_process_id_effect').toBin(effect, writer)
+        else:
+            writer.write_count(0)
+        role = opm_was_controlled_by.db_role
+        if role is not None:
+            writer.write_count(1)
+            self.getDao('opm_role').toBin(role, writer)
+        else:
+            writer.write_count(0)
+        cause = opm_was_controlled_by.db_cause
+        if cause is not None:
+            writer.write_count(1)
+            self.getDao('opm_agent_id').toBin(cause, writer)
+        else:
+            writer.write_count(0)
+        accounts = opm_was_controlled_by.db_accounts
+        writer.write_count(len(accounts))
+        for account in accounts:
+            self.getDao('opm_account_id').toBin(account, writer)
+        starts = opm_was_controlled_by.db_starts
+        writer.write_count(len(starts))
+        for start in starts:
+            self.getDao('opm_time').toBin(start, writer)
+        ends = opm_was_controlled_by.db_ends
+        writer.write_count(len(ends))
+        for end in ends:
+            self.getDao('opm_time').toBin(end, writer)
+
+class DBAddBINDAOBase(BINDAO):
+
+    def __init__(self, daoList):
+        self.daoList = daoList
+
+    def getDao(self, dao):
+        return self.daoList[dao]
+
+    def fromBin(self, reader):
+        read_value = reader.read_value
+
+        # read attributes
+        id = read_value()
+        what = read_value()
+        objectId = read_value()
+        parentObjId = read_value()
+        parentObjType = read_value()
+
+        # read children
+        data = None
+        _tag = reader.read_count()
+        if _tag == 1:
+            data = self.getDao('module').fromBin(reader)
+        elif _tag == 2:
+            data = self.getDao('location').fromBin(reader)
+        elif _tag == 3:
+            data = self.getDao('annotation').fromBin(reader)
+        elif _tag == 4:
+            data = self.getDao('controlParameter').fromBin(reader)
+        elif _tag == 5:
+            data = self.getDao('function').fromBin(reader)
+        elif _tag == 6:
+            data = self.getDao('connection').fromBin(reader)
+        elif _tag == 7:
+            data = self.getDao('port').fromBin(reader)
+        elif _tag == 8:
+            data = self.getDao('parameter').fromBin(reader)
+        elif _tag == 9:
+            data = self.getDao('portSpec').fromBin(reader)
+        elif _tag == 10:
+            data = self.getDao('abstraction').fromBin(reader)
+        elif _tag == 11:
+            data = self.getDao('group').fromBin(reader)
+        elif _tag == 12:
+            data = self.getDao('other').fromBin(reader)
+        elif _tag == 13:
+            data = self.getDao('plugin_data').fromBin(reader)
+
+        obj = DBAdd(data=data, id=id, what=what, objectId=objectId, parentObjId=parentObjId, parentObjType=parentObjType)
+        obj.is_dirty = False
+        return obj
+
+    def toBin(self, add, writer):
+        write_value = writer.write_value
+
+        # write attributes
+        write_value(add.db_id)
+        write_value(add.db_what)
+        write_value(add.db_objectId)
+        write_value(add.db_parentObjId)
+        write_value(add.db_parentObjType)
+
+        # write children
+        data = add.db_data
+        if data is not None and data.vtType == 'module':
+            writer.write_count(1)
+            self.getDao('module').toBin(data, writer)
+        elif data is not None and data.vtType == 'location':
+            writer.write_count(2)
+            self.getDao('location').toBin(data, writer)
+        elif data is not None and data.vtType == 'annotation':
+            writer.write_count(3)
+            self.getDao('annotation').toBin(data, writer)
+        elif data is not None and data.vtType == 'controlParameter':
+            writer.write_count(4)
+            self.getDao('controlParameter').toBin(data, writer)
+        elif data is not None and data.vtType == 'function':
+            writer.write_count(5)
+            self.getDao('function').toBin(data, writer)
+        elif data is not None and data.vtType == 'connection':
+            writer.write_count(6)
+            self.getDao('connection').toBin(data, writer)
+        elif data is not None and data.vtType == 'port':
+            writer.write_count(7)
+            self.getDao('port').toBin(data, writer)
+        elif data is not None and data.vtType == 'parameter':
+            writer.write_count(8)
+            self.getDao('parameter').toBin(data, writer)
+        elif data is not None and data.vtType == 'portSpec':
+            writer.write_count(9)
+            self.getDao('portSpec').toBin(data, writer)
+        elif data is not None and data.vtType == 'abstraction':
+            writer.write_count(10)
+            self.getDao('abstraction').toBin(data, writer)
+        elif data is not None and data.vtType == 'group':
+            writer.write_count(11)
+            self.getDao('group').toBin(data, writer)
+        elif data is not None and data.vtType == 'other':
+            writer.write_count(12)
+            self.getDao('other').toBin(data, writer)
+        elif data is not None and data.vtType == 'plugin_data':
+            writer.write_count(13)
+            self.getDao('plugin_data').toBin(data, writer)
+        else:
+            writer.write_count(0)
+
+class DBProvGenerationBINDAOBase(BINDAO):
+
+    def __init__(self, daoList):
+        self.daoList = daoList
+
+    def getDao(self, dao):
+        return self.daoList[dao]
+
+    def fromBin(self, reader):
+        # read children
+        prov_entity = None
+        if reader.read_count():
+            prov_entity = self.getDao('ref_prov_entity').fromBin(reader)
+        prov_activity = None
+        if reader.read_count():
+            prov_activity = self.getDao('ref_prov_activity').fromBin(reader)
+        prov_role = reader.read_value()
+
+        obj = DBProvGeneration(prov_entity=prov_entity, prov_activity=prov_activity, prov_role=prov_role)
+        obj.is_dirty = False
+        return obj
+
+    def toBin(self, prov_generation, writer):
+        # write children
+        prov_entity = prov_generation.db_prov_entity
+        if prov_entity is not None:
+            writer.write_count(1)
+            self.getDao('ref_prov_entity').toBin(prov_entity, writer)
+        else:
+            writer.write_count(0)
+        prov_activity = prov_generation.db_prov_activity
+        if prov_activity is not None:
+            writer.write_count(1)
+            self.getDao('ref_prov_activity').toBin(prov_activity, writer)
+        else:
+            writer.write_count(0)
+        prov_role = prov_generation.db_prov_role
+        writer.write_value(prov_role)
+
+class DBOpmUsedBINDAOBase(BINDAO):
+
+    def __init__(self, daoList):
+        self.daoList = daoList
+
+    def getDao(self, dao):
+        return self.daoList[dao]
+
+    def fromBin(self, reader):
+        # read children
+        effect = None
+        if reader.read_count():
+            effect = self.getDao('opm_process_id_effect').fromBin(reader)
+        role = None
+        if reader.read_count():
+            role = self.getDao('opm_role').fromBin(reader)
+        cause = None
+        if reader.read_count():
+            cause = self.getDao('opm_artifact_id_cause').fromBin(reader)
+        accounts = []
+        for i in xrange(reader.read_count()):
+            _data = self.getDao('opm_account_id').fromBin(reader)
+            accounts.append(_data)
+        opm_times = []
+        for i in xrange(reader.read_count()):
+            _data = self.getDao('opm_time').fromBin(reader)
+            opm_times.append(_data)
+
+        obj = DBOpmUsed(effect=effect, role=role, cause=cause, accounts=accounts, opm_times=opm_times)
+        obj.is_dirty = False
+        return obj
+
+    def toBin(self, opm_used, writer):
+        # write children
+        effect = opm_used.db_effect
+        if effect is not None:
+            writer.write_count(1)
+            self.getDao('opm_process_id_effect').toBin(effect, writer)
+        else:
+            writer.write_count(0)
+        role = opm_used.db_role
+        if role is not None:
+            writer.write_count(1)
+            self.getDao('opm_role').toBin(role, writer)
+        else:
+            writer.write_count(0)
+        cause = opm_used.db_cause
+        if cause is not None:
+            writer.write_count(1)
+            self.getDao('opm_artifact_id_cause').toBin(cause, writer)
+        else:
+            writer.write_count(0)
+        accounts = opm_used.db_accounts
+        writer.write_count(len(accounts))
+        for account in accounts:
+            self.getDao('opm_account_id').toBin(account, writer)
+        opm_times = opm_used.db_opm_times
+        writer.write_count(len(opm_times))
+        for opm_time in opm_times:
+            self.getDao('opm_time').toBin(opm_time, writer)
+
+class DBOpmArtifactIdCauseBINDAOBase(BINDAO):
+
+    def __init__(self, daoList):
+        self.daoList = daoList
+
+    def getDao(self, dao):
+        return self.daoList[dao]
+
+    def fromBin(self, reader):
+        read_value = reader.read_value
+
+        # read attributes
+        id = read_value()
+
+        obj = DBOpmArtifactIdCause(id=id)
+        obj.is_dirty = False
+        return obj
+
+    def toBin(self, opm_artifact_id_cause, writer):
+        write_value = writer.write_value
+
+        # write attributes
+        write_value(opm_artifact_id_cause.db_id)
+
+class DBRefProvEntityBINDAOBase(BINDAO):
+
+    def __init__(self, daoList):
+        self.daoList = daoList
+
+    def getDao(self, dao):
+        return self.daoList[dao]
+
+    def fromBin(self, reader):
+        read_value = reader.read_value
+
+        # read attributes
+        prov_ref = read_value()
+
+        obj = DBRefProvEntity(prov_ref=prov_ref)
+        obj.is_dirty = False
+        return obj
+
+    def toBin(self, ref_prov_entity, writer):
+        write_value = writer.write_value
+
+        # write attributes
+        write_value(ref_prov_entity.db_prov_ref)
+
+class DBVtConnectionBINDAOBase(BINDAO):
+
+    def __init__(self, daoList):
+        self.daoList = daoList
+
+    def getDao(self, dao):
+        return self.daoList[dao]
+
+    def fromBin(self, reader):
+        read_value = reader.read_value
+
+        # read attributes
+        id = read_value()
+
+        # read children
+        vt_source = reader.read_value()
+        vt_dest = reader.read_value()
+        vt_source_port = reader.read_value()
+        vt_dest_port = reader.read_value()
+        vt_source_signature = reader.read_value()
+        vt_dest_signature = reader.read_value()
+
+        obj = DBVtConnection(id=id, vt_source=vt_source, vt_dest=vt_dest, vt_source_port=vt_source_port, vt_dest_port=vt_dest_port, vt_source_signature=vt_source_signature, vt_dest_signature=vt_dest_signature)
+        obj.is_dirty = False
+        return obj
+
+    def toBin(self, vt_connection, writer):
+        write_value = writer.write_value
+
+        # write attributes
+        write_value(vt_connection.db_id)
+
+        # write children
+        vt_source = vt_connection.db_vt_source
+        writer.write_value(vt_source)
+        vt_dest = vt_connection.db_vt_dest
+        writer.write_value(vt_dest)
+        vt_source_port = vt_connection.db_vt_source_port
+        writer.write_value(vt_source_port)
+        vt_dest_port = vt_connection.db_vt_dest_port
+        writer.write_value(vt_dest_port)
+        vt_source_signature = vt_connection.db_vt_source_signature
+        writer.write_value(vt_source_signature)
+        vt_dest_signature = vt_connection.db_vt_dest_signature
+        writer.write_value(vt_dest_signature)
+
+class DBOpmAccountBINDAOBase(BINDAO):
+
+    def __init__(self, daoList):
+        self.daoList = daoList
+
+    def getDao(self, dao):
+        return self.daoList[dao]
+
+    def fromBin(self, reader):
+        read_value = reader.read_value
+
+        # read attributes
+        id = read_value()
+
+        # read children
+        value = reader.read_value()
+
+        obj = DBOpmAccount(id=id, value=value)
+        obj.is_dirty = False
+        return obj
+
+    def toBin(self, opm_account, writer):
+        write_value = writer.write_value
+
+        # write attributes
+        write_value(opm_account.db_id)
+
+        # write children
+        value = opm_account.db_value
+        writer.write_value(value)
+
+class DBGroupExecBINDAOBase(BINDAO):
+
+    def __init__(self, daoList):
+        self.daoList = daoList
+
+    def getDao(self, dao):
+        return self.daoList[dao]
+
+    def fromBin(self, reader):
+        read_value = reader.read_value
+
+        # read attributes
+        id = read_value()
+        ts_start = read_value()
+        ts_end = read_value()
+        cached = read_value()
+        module_id = read_value()
+        group_name = read_value()
+        group_type = read_value()
+        completed = read_value()
+        error = read_value()
+        machine_id = read_value()
+
+        # read children
+        annotations = []
+        for i in xrange(reader.read_count()):
+            _data = self.getDao('annotation').fromBin(reader)
+            annotations.append(_data)
+        item_execs = []
+        for i in xrange(reader.read_count()):
+            _tag = reader.read_count()
+            if _tag == 1:
+                _data = self.getDao('module_exec').fromBin(reader)
+            elif _tag == 2:
+                _data = self.getDao('group_exec').fromBin(reader)
+            elif _tag == 3:
+                _data = self.getDao('loop_exec').fromBin(reader)
+            else:
+                continue
+            item_execs.append(_data)
+
+        obj = DBGroupExec(item_execs=item_execs, id=id, ts_start=ts_start, ts_end=ts_end, cached=cached, module_id=module_id, group_name=group_name, group_type=group_type, completed=completed, error=error, machine_id=machine_id, annotations=annotations)
+        obj.is_dirty = False
+        return obj
+
+    def toBin(self, group_exec, writer):
+        write_value = writer.write_value
+
+        # write attributes
+        write_value(group_exec.db_id)
+        write_value(group_exec.db_ts_start)
+        write_value(group_exec.db_ts_end)
+        write_value(group_exec.db_cached)
+        write_value(group_exec.db_module_id)
+        write_value(group_exec.db_group_name)
+        write_value(group_exec.db_group_type)
+        write_value(group_exec.db_completed)
+        write_value(group_exec.db_error)
+        write_value(group_exec.db_machine_id)
+
+        # write children
+        annotations = group_exec.db_annotations
+        writer.write_count(len(annotations))
+        for annotation in annotations:
+            self.getDao('annotation').toBin(annotation, writer)
+        item_execs = group_exec.db_item_execs
+        writer.write_count(len(item_execs))
+        for item_exec in item_execs:
+            if item_exec.vtType == 'module_exec':
+                writer.write_count(1)
+                self.getDao('module_exec').toBin(item_exec, writer)
+            elif item_exec.vtType == 'group_exec':
+                writer.write_count(2)
+                self.getDao('group_exec').toBin(item_exec, writer)
+            elif item_exec.vtType == 'loop_exec':
+                writer.write_count(3)
+                self.getDao('loop_exec').toBin(item_exec, writer)
+            else:
+                writer.write_count(0)
+
+class DBOpmAgentIdBINDAOBase(BINDAO):
+
+    def __init__(self, daoList):
+        self.daoList = daoList
+
+    def getDao(self, dao):
+        return self.daoList[dao]
+
+    def fromBin(self, reader):
+        read_value = reader.read_value
+
+        # read attributes
+        id = read_value()
+
+        obj = DBOpmAgentId(id=id)
+        obj.is_dirty = False
+        return obj
+
+    def toBin(self, opm_agent_id, writer):
+        write_value = writer.write_value
+
+        # write attributes
+        write_value(opm_agent_id.db_id)
+
+class DBParameterBINDAOBase(BINDAO):
+
+    def __init__(self, daoList):
+        self.daoList = daoList
+
+    def getDao(self, dao):
+        return self.daoList[dao]
+
+    def fromBin(self, reader):
+        read_value = reader.read_value
+
+        # read attributes
+        id = read_value()
+        pos = read_value()
+        name = read_value()
+        type = read_value()
+        val = read_value()
+        alias = read_value()
+
+        obj = DBParameter(id=id, pos=pos, name=name, type=type, val=val, alias=alias)
+        obj.is_dirty = False
+        return obj
+
+    def toBin(self, parameter, writer):
+        write_value = writer.write_value
+
+        # write attributes
+        write_value(parameter.db_id)
+        write_value(parameter.db_pos)
+        write_value(parameter.db_name)
+        write_value(parameter.db_type)
+        write_value(parameter.db_val)
+        write_value(parameter.db_alias)
+
+class DBVistrailBINDAOBase(BINDAO):
+
+    def __init__(self, daoList):
+        self.daoList = daoList
+
+    def getDao(self, dao):
+        return self.daoList[dao]
+
+    def fromBin(self, reader):
+        read_value = reader.read_value
+
+        # read attributes
+        id = read_value()
+        version = read_value()
+        name = read_value()
+
+        # read children
+        actions = []
+        for i in xrange(reader.read_count()):
+            _data = self.getDao('action').fromBin(reader)
+            actions.append(_data)
+        tags = []
+        for i in xrange(reader.read_count()):
+            _data = self.getDao('tag').fromBin(reader)
+            tags.append(_data)
+        annotations = []
+        for i in xrange(reader.read_count()):
+            _data = self.getDao('annotation').fromBin(reader)
+            annotations.append(_data)
+        controlParameters = []
+        for i in xrange(reader.read_count()):
+            _data = self.getDao('controlParameter').fromBin(reader)
+            controlParameters.append(_data)
+        vistrailVariables = []
+        for i in xrange(reader.read_count()):
+            _data = self.getDao('vistrailVariable').fromBin(reader)
+            vistrailVariables.append(_data)
+        parameter_explorations = []
+        for i in xrange(reader.read_count()):
+            _data = self.getDao('parameter_exploration').fromBin(reader)
+            parameter_explorations.append(_data)
+        actionAnnotations = []
+        for i in xrange(reader.read_count()):
+            _data = self.getDao('actionAnnotation').fromBin(reader)
+            actionAnnotations.append(_data)
+
+        obj = DBVistrail(id=id, version=version, name=name, actions=actions, tags=tags, annotations=annotations, controlParameters=controlParameters, vistrailVariables=vistrailVariables, parameter_explorations=parameter_explorations, actionAnnotations=actionAnnotations)
+        obj.is_dirty = False
+        return obj
+
+    def toBin(self, vistrail, writer):
+        write_value = writer.write_value
+
+        # write attributes
+        write_value(vistrail.db_id)
+        write_value(vistrail.db_version)
+        write_value(vistrail.db_name)
+
+        # write children
+        actions = vistrail.db_actions
+        writer.write_count(len(actions))
+        for action in actions:
+            self.getDao('action').toBin(action, writer)
+        tags = vistrail.db_tags
+        writer.write_count(len(tags))
+        for tag in tags:
+            self.getDao('tag').toBin(tag, writer)
+        annotations = vistrail.db_annotations
+        writer.write_count(len(annotations))
+        for annotation in annotations:
+            self.getDao('annotation').toBin(annotation, writer)
+        controlParameters = vistrail.db_controlParameters
+        writer.write_count(len(controlParameters))
+        for controlParameter in controlParameters:
+            self.getDao('controlParameter').toBin(controlParameter, writer)
+        vistrailVariables = vistrail.db_vistrailVariables
+        writer.write_count(len(vistrailVariables))
+        for vistrailVariable in vistrailVariables:
+            self.getDao('vistrailVariable').toBin(vistrailVariable, writer)
+        parameter_explorations = vistrail.db_parameter_explorations
+        writer.write_count(len(parameter_explorations))
+        for parameter_exploration in parameter_explorations:
+            self.getDao('parameter_exploration').toBin(parameter_exploration, writer)
+        actionAnnotations = vistrail.db_actionAnnotations
+        writer.write_count(len(actionAnnotations))
+        for actionAnnotation in actionAnnotations:
+            self.getDao('actionAnnotation').toBin(actionAnnotation, writer)
+
+class DBOpmArtifactValueBINDAOBase(BINDAO):
+
+    def __init__(self, daoList):
+        self.daoList = daoList
+
+    def getDao(self, dao):
+        return self.daoList[dao]
+
+    def fromBin(self, reader):
+        # read children
+        value = None
+        _tag = reader.read_count()
+        if _tag == 1:
+            value = self.getDao('portSpec').fromBin(reader)
+        elif _tag == 2:
+            value = self.getDao('function').fromBin(reader)
+
+        obj = DBOpmArtifactValue(value=value)
+        obj.is_dirty = False
+        return obj
+
+    def toBin(self, opm_artifact_value, writer):
+        # write children
+        value = opm_artifact_value.db_value
+        if value is not None and value.vtType == 'portSpec':
+            writer.write_count(1)
+            self.getDao('portSpec').toBin(value, writer)
+        elif value is not None and value.vtType == 'function':
+            writer.write_count(2)
+            self.getDao('function').toBin(value, writer)
+        else:
+            writer.write_count(0)
+
+class DBConfigStrBINDAOBase(BINDAO):
+
+    def __init__(self, daoList):
+        self.daoList = daoList
+
+    def getDao(self, dao):
+        return self.daoList[dao]
+
+    def fromBin(self, reader):
+        read_value = reader.read_value
+
+        # read attributes
+        value = read_value()
+
+        obj = DBConfigStr(value=value)
+        obj.is_dirty = False
+        return obj
+
+    def toBin(self, config_str, writer):
+        write_value = writer.write_value
+
+        # write attributes
+        write_value(config_str.db_value)
+
+class DBStartupBINDAOBase(BINDAO):
+
+    def __init__(self, daoList):
+        self.daoList = daoList
+
+    def getDao(self, dao):
+        return self.daoList[dao]
+
+    def fromBin(self, reader):
+        read_value = reader.read_value
+
+        # read attributes
+        version = read_value()
+
+        # read children
+        configuration = None
+        if reader.read_count():
+            configuration = self.getDao('configuration').fromBin(reader)
+        enabled_packages = None
+        if reader.read_count():
+            enabled_packages = self.getDao('enabled_packages').fromBin(reader)
+        disabled_packages = None
+        if reader.read_count():
+            disabled_packages = self.getDao('disabled_packages').fromBin(reader)
+
+        obj = DBStartup(version=version, configuration=configuration, enabled_packages=enabled_packages, disabled_packages=disabled_packages)
+        obj.is_dirty = False
+        return obj
+
+    def toBin(self, startup, writer):
+        write_value = writer.write_value
+
+        # write attributes
+        write_value(startup.db_version)
+
+        # write children
+        configuration = startup.db_configuration
+        if configuration is not None:
+            writer.write_count(1)
+            self.getDao('configuration').toBin(configuration, writer)
+        else:
+            writer.write_count(0)
+        enabled_packages = startup.db_enabled_packages
+        if enabled_packages is not None:
+            writer.write_count(1)
+            self.getDao('enabled_packages').toBin(enabled_packages, writer)
+        else:
+            writer.write_count(0)
+        disabled_packages = startup.db_disabled_packages
+        if disabled_packages is not None:
+            writer.write_count(1)
+            self.getDao('disabled_packages').toBin(disabled_packages, writer)
+        else:
+            writer.write_count(0)
+
+class DBModuleBINDAOBase(BINDAO):
+
+    def __init__(self, daoList):
+        self.daoList = daoList
+
+    def getDao(self, dao):
+        return self.daoList[dao]
+
+    def fromBin(self, reader):
+        read_value = reader.read_value
+
+        # read attributes
+        id = read_value()
+        cache = read_value()
+        name = read_value()
+        namespace = read_value()
+        package = read_value()
+        version = read_value()
+
+        # read children
+        location = None
+        if reader.read_count():
+            location = self.getDao('location').fromBin(reader)
+        functions = []
+        for i in xrange(reader.read_count()):
+            _data = self.getDao('function').fromBin(reader)
+            functions.append(_data)
+        annotations = []
+        for i in xrange(reader.read_count()):
+            _data = self.getDao('annotation').fromBin(reader)
+            annotations.append(_data)
+        controlParameters = []
+        for i in xrange(reader.read_count()):
+            _data = self.getDao('controlParameter').fromBin(reader)
+            controlParameters.append(_data)
+        portSpecs = []
+        for i in xrange(reader.read_count()):
+            _data = self.getDao('portSpec').fromBin(reader)
+            portSpecs.append(_data)
+
+        obj = DBModule(id=id, cache=cache, name=name, namespace=namespace, package=package, version=version, location=location, functions=functions, annotations=annotations, controlParameters=controlParameters, portSpecs=portSpecs)
+        obj.is_dirty = False
+        return obj
+
+    def toBin(self, module, writer):
+        write_value = writer.write_value
+
+        # write attributes
+        write_value(module.db_id)
+        write_value(module.db_cache)
+        write_value(module.db_name)
+        write_value(module.db_namespace)
+        write_value(module.db_package)
+        write_value(module.db_version)
+
+        # write children
+        location = module.db_location
+        if location is not None:
+            writer.write_count(1)
+            self.getDao('location').toBin(location, writer)
+        else:
+            writer.write_count(0)
+        functions = module.db_functions
+        writer.write_count(len(functions))
+        for function in functions:
+            self.getDao('function').toBin(function, writer)
+        annotations = module.db_annotations
+        writer.write_count(len(annotations))
+        for annotation in annotations:
+            self.getDao('annotation').toBin(annotation, writer)
+        controlParameters = module.db_controlParameters
+        writer.write_count(len(controlParameters))
+        for controlParameter in controlParameters:
+            self.getDao('controlParameter').toBin(controlParameter, writer)
+        portSpecs = module.db_portSpecs
+        writer.write_count(len(portSpecs))
+        for portSpec in portSpecs:
+            self.getDao('portSpec').toBin(portSpec, writer)
+
+class DBPortBINDAOBase(BINDAO):
+
+    def __init__(self, daoList):
+        self.daoList = daoList
+
+    def getDao(self, dao):
+        return self.daoList[dao]
+
+    def fromBin(self, reader):
+        read_value = reader.read_value
+
+        # read attributes
+        id = read_value()
+        type = read_value()
+        moduleId = read_value()
+        moduleName = read_value()
+        name = read_value()
+        signature = read_value()
+
+        obj = DBPort(id=id, type=type, moduleId=moduleId, moduleName=moduleName, name=name, signature=signature)
+        obj.is_dirty = False
+        return obj
+
+    def toBin(self, port, writer):
+        write_value = writer.write_value
+
+        # write attributes
+        write_value(port.db_id)
+        write_value(port.db_type)
+        write_value(port.db_moduleId)
+        write_value(port.db_moduleName)
+        write_value(port.db_name)
+        write_value(port.db_signature)
+
+class DBOpmAgentsBINDAOBase(BINDAO):
+
+    def __init__(self, daoList):
+        self.daoList = daoList
+
+    def getDao(self, dao):
+        return self.daoList[dao]
+
+    def fromBin(self, reader):
+        # read children
+        agents = []
+        for i in xrange(reader.read_count()):
+            _data = self.getDao('opm_agent').fromBin(reader)
+            agents.append(_data)
+
+        obj = DBOpmAgents(agents=agents)
+        obj.is_dirty = False
+        return obj
+
+    def toBin(self, opm_agents, writer):
+        # write children
+        agents = opm_agents.db_agents
+        writer.write_count(len(agents))
+        for agent in agents:
+            self.getDao('opm_agent').toBin(agent, writer)
+
+class DBOpmDependenciesBINDAOBase(BINDAO):
+
+    def __init__(self, daoList):
+        self.daoList = daoList
+
+    def getDao(self, dao):
+        return self.daoList[dao]
+
+    def fromBin(self, reader):
+        # read children
+        dependencys = []
+        for i in xrange(reader.read_count()):
+            _tag = reader.read_count()
+            if _tag == 1:
+                _data = self.getDao('opm_used').fromBin(reader)
+            elif _tag == 2:
+                _data = self.getDao('opm_was_generated_by').fromBin(reader)
+            elif _tag == 3:
+                _data = self.getDao('opm_was_triggered_by').fromBin(reader)
+            elif _tag == 4:
+                _data = self.getDao('opm_was_derived_from').fromBin(reader)
+            elif _tag == 5:
+                _data = self.getDao('opm_was_controlled_by').fromBin(reader)
+            else:
+                continue
+            dependencys.append(_data)
+
+        obj = DBOpmDependencies(dependencys=dependencys)
+        obj.is_dirty = False
+        return obj
+
+    def toBin(self, opm_dependencies, writer):
+        # write children
+        dependencys = opm_dependencies.db_dependencys
+        writer.write_count(len(dependencys))
+        for dependency in dependencys:
+            if dependency.vtType == 'opm_used':
+                writer.write_count(1)
+                self.getDao('opm_used').toBin(dependency, writer)
+            elif dependency.vtType == 'opm_was_generated_by':
+                writer.write_count(2)
+                self.getDao('opm_was_generated_by').toBin(dependency, writer)
+            elif dependency.vtType == 'opm_was_triggered_by':
+                writer.write_count(3)
+                self.getDao('opm_was_triggered_by').toBin(dependency, writer)
+            elif dependency.vtType == 'opm_was_derived_from':
+                writer.write_count(4)
+                self.getDao('opm_was_derived_from').toBin(dependency, writer)
+            elif dependency.vtType == 'opm_was_controlled_by':
+                writer.write_count(5)
+                self.getDao('opm_was_controlled_by').toBin(dependency, writer)
+            else:
+                writer.write_count(0)
+
+class DBPEFunctionBINDAOBase(BINDAO):
+
+    def __init__(self, daoList):
+        self.daoList = daoList
+
+    def getDao(self, dao):
+        return self.daoList[dao]
+
+    def fromBin(self, reader):
+        read_value = reader.read_value
+
+        # read attributes
+        id = read_value()
+        module_id = read_value()
+        port_name = read_value()
+        is_alias = read_value()
+
+        # read children
+        parameters = []
+        for i in xrange(reader.read_count()):
+            _data = self.getDao('pe_parameter').fromBin(reader)
+            parameters.append(_data)
+
+        obj = DBPEFunction(id=id, module_id=module_id, port_name=port_name, is_alias=is_alias, parameters=parameters)
+        obj.is_dirty = False
+        return obj
+
+    def toBin(self, pe_function, writer):
+        write_value = writer.write_value
+
+        # write attributes
+        write_value(pe_function.db_id)
+        write_value(pe_function.db_module_id)
+        write_value(pe_function.db_port_name)
+        write_value(pe_function.db_is_alias)
+
+        # write children
+        parameters = pe_function.db_parameters
+        writer.write_count(len(parameters))
+        for parameter in parameters:
+            self.getDao('pe_parameter').toBin(parameter, writer)
+
+class DBWorkflowBINDAOBase(BINDAO):
+
+    def __init__(self, daoList):
+        self.daoList = daoList
+
+    def getDao(self, dao):
+        return self.daoList[dao]
+
+    def fromBin(self, reader):
+        read_value = reader.read_value
+
+        # read attributes
+        id = read_value()
+        name = read_value()
+        version = read_value()
+        vistrail_id = read_value()
+
+        # read children
+        connections = []
+        for i in xrange(reader.read_count()):
+            _data = self.getDao('connection').fromBin(reader)
+            connections.append(_data)
+        annotations = []
+        for i in xrange(reader.read_count()):
+            _data = self.getDao('annotation').fromBin(reader)
+            annotations.append(_data)
+        plugin_datas = []
+        for i in xrange(reader.read_count()):
+            _data = self.getDao('plugin_data').fromBin(reader)
+            plugin_datas.append(_data)
+        others = []
+        for i in xrange(reader.read_count()):
+            _data = self.getDao('other').fromBin(reader)
+            others.append(_data)
+        modules = []
+        for i in xrange(reader.read_count()):
+            _tag = reader.read_count()
+            if _tag == 1:
+                _data = self.getDao('module').fromBin(reader)
+            elif _tag == 2:
+                _data = self.getDao('abstraction').fromBin(reader)
+            elif _tag == 3:
+                _data = self.getDao('group').fromBin(reader)
+            else:
+                continue
+            modules.append(_data)
+
+        obj = DBWorkflow(modules=modules, id=id, name=name, version=version, connections=connections, annotations=annotations, plugin_datas=plugin_datas, others=others, vistrail_id=vistrail_id)
+        obj.is_dirty = False
+        return obj
+
+    def toBin(self, workflow, writer):
+        write_value = writer.write_value
+
+        # write attributes
+        write_value(workflow.db_id)
+        write_value(workflow.db_name)
+        write_value(workflow.db_version)
+        write_value(workflow.db_vistrail_id)
+
+        # write children
+        connections = workflow.db_connections
+        writer.write_count(len(connections))
+        for connection in connections:
+            self.getDao('connection').toBin(connection, writer)
+        annotations = workflow.db_annotations
+        writer.write_count(len(annotations))
+        for annotation in annotations:
+            self.getDao('annotation').toBin(annotation, writer)
+        plugin_datas = workflow.db_plugin_datas
+        writer.write_count(len(plugin_datas))
+        for plugin_data in plugin_datas:
+            self.getDao('plugin_data').toBin(plugin_data, writer)
+        others = workflow.db_others
+        writer.write_count(len(others))
+        for other in others:
+            self.getDao('other').toBin(other, writer)
+        modules = workflow.db_modules
+        writer.write_count(len(modules))
+        for module in modules:
+            if module.vtType == 'module':
+                writer.write_count(1)
+                self.getDao('module').toBin(module, writer)
+            elif module.vtType == 'abstraction':
+                writer.write_count(2)
+                self.getDao('abstraction').toBin(module, writer)
+            elif module.vtType == 'group':
+                writer.write_count(3)
+                self.getDao('group').toBin(module, writer)
+            else:
+                writer.write_count(0)
+
+class DBMashupActionBINDAOBase(BINDAO):
+
+    def __init__(self, daoList):
+        self.daoList = daoList
+
+    def getDao(self, dao):
+        return self.daoList[dao]
+
+    def fromBin(self, reader):
+        read_value = reader.read_value
+
+        # read attributes
+        id = read_value()
+        prevId = read_value()
+        date = read_value()
+        user = read_value()
+
+        # read children
+        mashup = None
+        if reader.read_count():
+            mashup = self.getDao('mashup').fromBin(reader)
+
+        obj = DBMashupAction(id=id, prevId=prevId, date=date, user=user, mashup=mashup)
+        obj.is_dirty = False
+        return obj
+
+    def toBin(self, mashup_action, writer):
+        write_value = writer.write_value
+
+        # write attributes
+        write_value(mashup_action.db_id)
+        write_value(mashup_action.db_prevId)
+        write_value(mashup_action.db_date)
+        write_value(mashup_action.db_user)
+
+        # write children
+        mashup = mashup_action.db_mashup
+        if mashup is not None:
+            writer.write_count(1)
+            self.getDao('mashup').toBin(mashup, writer)
+        else:
+            writer.write_count(0)
+
+class DBConfigurationBINDAOBase(BINDAO):
+
+    def __init__(self, daoList):
+        self.daoList = daoList
+
+    def getDao(self, dao):
+        return self.daoList[dao]
+
+    def fromBin(self, reader):
+        # read children
+        config_keys = []
+        for i in xrange(reader.read_count()):
+            _data = self.getDao('config_key').fromBin(reader)
+            config_keys.append(_data)
+
+        obj = DBConfiguration(config_keys=config_keys)
+        obj.is_dirty = False
+        return obj
+
+    def toBin(self, configuration, writer):
+        # write children
+        config_keys = configuration.db_config_keys
+        writer.write_count(len(config_keys))
+        for config_key in config_keys:
+            self.getDao('config_key').toBin(config_key, writer)
+
+class DBChangeBINDAOBase(BINDAO):
+
+    def __init__(self, daoList):
+        self.daoList = daoList
+
+    def getDao(self, dao):
+        return self.daoList[dao]
+
+    def fromBin(self, reader):
+        read_value = reader.read_value
+
+        # read attributes
+        id = read_value()
+        what = read_value()
+        oldObjId = read_value()
+        newObjId = read_value()
+        parentObjId = read_value()
+        parentObjType = read_value()
+
+        # read children
+        data = None
+        _tag = reader.read_count()
+        if _tag == 1:
+            data = self.getDao('module').fromBin(reader)
+        elif _tag == 2:
+            data = self.getDao('location').fromBin(reader)
+        elif _tag == 3:
+            data = self.getDao('annotation').fromBin(reader)
+        elif _tag == 4:
+            data = self.getDao('controlParameter').fromBin(reader)
+        elif _tag == 5:
+            data = self.getDao('function').fromBin(reader)
+        elif _tag == 6:
+            data = self.getDao('connection').fromBin(reader)
+        elif _tag == 7:
+            data = self.getDao('port').fromBin(reader)
+        elif _tag == 8:
+            data = self.getDao('parameter').fromBin(reader)
+        elif _tag == 9:
+            data = self.getDao('portSpec').fromBin(reader)
+        elif _tag == 10:
+            data = self.getDao('abstraction').fromBin(reader)
+        elif _tag == 11:
+            data = self.getDao('group').fromBin(reader)
+        elif _tag == 12:
+            data = self.getDao('other').fromBin(reader)
+        elif _tag == 13:
+            data = self.getDao('plugin_data').fromBin(reader)
+
+        obj = DBChange(data=data, id=id, what=what, oldObjId=oldObjId, newObjId=newObjId, parentObjId=parentObjId, parentObjType=parentObjType)
+        obj.is_dirty = False
+        return obj
+
+    def toBin(self, change, writer):
+        write_value = writer.write_value
+
+        # write attributes
+        write_value(change.db_id)
+        write_value(change.db_what)
+        write_value(change.db_oldObjId)
+        write_value(change.db_newObjId)
+        write_value(change.db_parentObjId)
+        write_value(change.db_parentObjType)
+
+        # write children
+        data = change.db_data
+        if data is not None and data.vtType == 'module':
+            writer.write_count(1)
+            self.getDao('module').toBin(data, writer)
+        elif data is not None and data.vtType == 'location':
+            writer.write_count(2)
+            self.getDao('location').toBin(data, writer)
+        elif data is not None and data.vtType == 'annotation':
+            writer.write_count(3)
+            self.getDao('annotation').toBin(data, writer)
+        elif data is not None and data.vtType == 'controlParameter':
+            writer.write_count(4)
+            self.getDao('controlParameter').toBin(data, writer)
+        elif data is not None and data.vtType == 'function':
+            writer.write_count(5)
+            self.getDao('function').toBin(data, writer)
+        elif data is not None and data.vtType == 'connection':
+            writer.write_count(6)
+            self.getDao('connection').toBin(data, writer)
+        elif data is not None and data.vtType == 'port':
+            writer.write_count(7)
+            self.getDao('port').toBin(data, writer)
+        elif data is not None and data.vtType == 'parameter':
+            writer.write_count(8)
+            self.getDao('parameter').toBin(data, writer)
+        elif data is not None and data.vtType == 'portSpec':
+            writer.write_count(9)
+            self.getDao('portSpec').toBin(data, writer)
+        elif data is not None and data.vtType == 'abstraction':
+            writer.write_count(10)
+            self.getDao('abstraction').toBin(data, writer)
+        elif data is not None and data.vtType == 'group':
+            writer.write_count(11)
+            self.getDao('group').toBin(data, writer)
+        elif data is not None and data.vtType == 'other':
+            writer.write_count(12)
+            self.getDao('other').toBin(data, writer)
+        elif data is not None and data.vtType == 'plugin_data':
+            writer.write_count(13)
+            self.getDao('plugin_data').toBin(data, writer)
+        else:
+            writer.write_count(0)
+
+class DBPackageBINDAOBase(BINDAO):
+
+    def __init__(self, daoList):
+        self.daoList = daoList
+
+    def getDao(self, dao):
+        return self.daoList[dao]
+
+    def fromBin(self, reader):
+        read_value = reader.read_value
+
+        # read attributes
+        id = read_value()
+        name = read_value()
+        identifier = read_value()
+        codepath = read_value()
+        load_configuration = read_value()
+        version = read_value()
+        description = read_value()
+
+        # read children
+        module_descriptors = []
+        for i in xrange(reader.read_count()):
+            _data = self.getDao('module_descriptor').fromBin(reader)
+            module_descriptors.append(_data)
+
+        obj = DBPackage(id=id, name=name, identifier=identifier, codepath=codepath, load_configuration=load_configuration, version=version, description=description, module_descriptors=module_descriptors)
+        obj.is_dirty = False
+        return obj
+
+    def toBin(self, package, writer):
+        write_value = writer.write_value
+
+        # write attributes
+        write_value(package.db_id)
+        write_value(package.db_name)
+        write_value(package.db_identifier)
+        write_value(package.db_codepath)
+        write_value(package.db_load_configuration)
+        write_value(package.db_version)
+        write_value(package.db_description)
+
+        # write children
+        module_descriptors = package.db_module_descriptors
+        writer.write_count(len(module_descriptors))
+        for module_descriptor in module_descriptors:
+            self.getDao('module_descriptor').toBin(module_descriptor, writer)
+
+class DBLoopExecBINDAOBase(BINDAO):
+
+    def __init__(self, daoList):
+        self.daoList = daoList
+
+    def getDao(self, dao):
+        return self.daoList[dao]
+
+    def fromBin(self, reader):
+        read_value = reader.read_value
+
+        # read attributes
+        id = read_value()
+        ts_start = read_value()
+        ts_end = read_value()
+
+        # read children
+        loop_iterations = []
+        for i in xrange(reader.read_count()):
+            _data = self.getDao('loop_iteration').fromBin(reader)
+            loop_iterations.append(_data)
+
+        obj = DBLoopExec(id=id, ts_start=ts_start, ts_end=ts_end, loop_iterations=loop_iterations)
+        obj.is_dirty = False
+        return obj
+
+    def toBin(self, loop_exec, writer):
+        write_value = writer.write_value
+
+        # write attributes
+        write_value(loop_exec.db_id)
+        write_value(loop_exec.db_ts_start)
+        write_value(loop_exec.db_ts_end)
+
+        # write children
+        loop_iterations = loop_exec.db_loop_iterations
+        writer.write_count(len(loop_iterations))
+        for loop_iteration in loop_iterations:
+            self.getDao('loop_iteration').toBin(loop_iteration, writer)
+
+class DBConnectionBINDAOBase(BINDAO):
+
+    def __init__(self, daoList):
+        self.daoList = daoList
+
+    def getDao(self, dao):
+        return self.daoList[dao]
+
+    def fromBin(self, reader):
+        read_value = reader.read_value
+
+        # read attributes
+        id = read_value()
+
+        # read children
+        ports = []
+        for i in xrange(reader.read_count()):
+            _data = self.getDao('port').fromBin(reader)
+            ports.append(_data)
+
+        obj = DBConnection(id=id, ports=ports)
+        obj.is_dirty = False
+        return obj
+
+    def toBin(self, connection, writer):
+        write_value = writer.write_value
+
+        # write attributes
+        write_value(connection.db_id)
+
+        # write children
+        ports = connection.db_ports
+        writer.write_count(len(ports))
+        for port in ports:
+            self.getDao('port').toBin(port, writer)
+
+class DBConfigBoolBINDAOBase(BINDAO):
+
+    def __init__(self, daoList):
+        self.daoList = daoList
+
+    def getDao(self, dao):
+        return self.daoList[dao]
+
+    def fromBin(self, reader):
+        read_value = reader.read_value
+
+        # read attributes
+        value = read_value()
+
+        obj = DBConfigBool(value=value)
+        obj.is_dirty = False
+        return obj
+
+    def toBin(self, config_bool, writer):
+        write_value = writer.write_value
+
+        # write attributes
+        write_value(config_bool.db_value)
+
+class DBActionBINDAOBase(BINDAO):
+
+    def __init__(self, daoList):
+        self.daoList = daoList
+
+    def getDao(self, dao):
+        return self.daoList[dao]
+
+    def fromBin(self, reader):
+        read_value = reader.read_value
+
+        # read attributes
+        id = read_value()
+        prevId = read_value()
+        date = read_value()
+        session = read_value()
+        user = read_value()
+
+        # read children
+        annotations = []
+        for i in xrange(reader.read_count()):
+            _data = self.getDao('annotation').fromBin(reader)
+            annotations.append(_data)
+        operations = []
+        for i in xrange(reader.read_count()):
+            _tag = reader.read_count()
+            if _tag == 1:
+                _data = self.getDao('add').fromBin(reader)
+            elif _tag == 2:
+                _data = self.getDao('delete').fromBin(reader)
+            elif _tag == 3:
+                _data = self.getDao('change').fromBin(reader)
+            else:
+                continue
+            operations.append(_data)
+
+        obj = DBAction(operations=operations, id=id, prevId=prevId, date=date, session=session, user=user, annotations=annotations)
+        obj.is_dirty = False
+        return obj
+
+    def toBin(self, action, writer):
+        write_value = writer.write_value
+
+        # write attributes
+        write_value(action.db_id)
+        write_value(action.db_prevId)
+        write_value(action.db_date)
+        write_value(action.db_session)
+        write_value(action.db_user)
+
+        # write children
+        annotations = action.db_annotations
+        writer.write_count(len(annotations))
+        for annotation in annotations:
+            self.getDao('annotation').toBin(annotation, writer)
+        operations = action.db_operations
+        writer.write_count(len(operations))
+        for operation in operations:
+            if operation.vtType == 'add':
+                writer.write_count(1)
+                self.getDao('add').toBin(operation, writer)
+            elif operation.vtType == 'delete':
+                writer.write_count(2)
+                self.getDao('delete').toBin(operation, writer)
+            elif operation.vtType == 'change':
+                writer.write_count(3)
+                self.getDao('change').toBin(operation, writer)
+            else:
+                writer.write_count(0)
+
+class DBStartupPackageBINDAOBase(BINDAO):
+
+    def __init__(self, daoList):
+        self.daoList = daoList
+
+    def getDao(self, dao):
+        return self.daoList[dao]
+
+    def fromBin(self, reader):
+        read_value = reader.read_value
+
+        # read attributes
+        name = read_value()
+
+        # read children
+        configuration = None
+        if reader.read_count():
+            configuration = self.getDao('configuration').fromBin(reader)
+
+        obj = DBStartupPackage(name=name, configuration=configuration)
+        obj.is_dirty = False
+        return obj
+
+    def toBin(self, startup_package, writer):
+        write_value = writer.write_value
+
+        # write attributes
+        write_value(startup_package.db_name)
+
+        # write children
+        configuration = startup_package.db_configuration
+        if configuration is not None:
+            writer.write_count(1)
+            self.getDao('configuration').toBin(configuration, writer)
+        else:
+            writer.write_count(0)
+
+class DBConfigIntBINDAOBase(BINDAO):
+
+    def __init__(self, daoList):
+        self.daoList = daoList
+
+    def getDao(self, dao):
+        return self.daoList[dao]
+
+    def fromBin(self, reader):
+        read_value = reader.read_value
+
+        # read attributes
+        value = read_value()
+
+        obj = DBConfigInt(value=value)
+        obj.is_dirty = False
+        return obj
+
+    def toBin(self, config_int, writer):
+        write_value = writer.write_value
+
+        # write attributes
+        write_value(config_int.db_value)
+
+class DBOpmProcessIdEffectBINDAOBase(BINDAO):
+
+    def __init__(self, daoList):
+        self.daoList = daoList
+
+    def getDao(self, dao):
+        return self.daoList[dao]
+
+    def fromBin(self, reader):
+        read_value = reader.read_value
+
+        # read attributes
+        id = read_value()
+
+        obj = DBOpmProcessIdEffect(id=id)
+        obj.is_dirty = False
+        return obj
+
+    def toBin(self, opm_process_id_effect, writer):
+        write_value = writer.write_value
+
+        # write attributes
+        write_value(opm_process_id_effect.db_id)
+
+class DBRefProvPlanBINDAOBase(BINDAO):
+
+    def __init__(self, daoList):
+        self.daoList = daoList
+
+    def getDao(self, dao):
+        return self.daoList[dao]
+
+    def fromBin(self, reader):
+        read_value = reader.read_value
+
+        # read attributes
+        prov_ref = read_value()
+
+        obj = DBRefProvPlan(prov_ref=prov_ref)
+        obj.is_dirty = False
+        return obj
+
+    def toBin(self, ref_prov_plan, writer):
+        write_value = writer.write_value
+
+        # write attributes
+        write_value(ref_prov_plan.db_prov_ref)
+
+class DBOpmAccountsBINDAOBase(BINDAO):
+
+    def __init__(self, daoList):
+        self.daoList = daoList
+
+    def getDao(self, dao):
+        return self.daoList[dao]
+
+    def fromBin(self, reader):
+        # read children
+        accounts = []
+        for i in xrange(reader.read_count()):
+            _data = self.getDao('opm_account').fromBin(reader)
+            accounts.append(_data)
+        opm_overlapss = []
+        for i in xrange(reader.read_count()):
+            _data = self.getDao('opm_overlaps').fromBin(reader)
+            opm_overlapss.append(_data)
+
+        obj = DBOpmAccounts(accounts=accounts, opm_overlapss=opm_overlapss)
+        obj.is_dirty = False
+        return obj
+
+    def toBin(self, opm_accounts, writer):
+        # write children
+        accounts = opm_accounts.db_accounts
+        writer.write_count(len(accounts))
+        for account in accounts:
+            self.getDao('opm_account').toBin(account, writer)
+        opm_overlapss = opm_accounts.db_opm_overlapss
+        writer.write_count(len(opm_overlapss))
+        for opm_overlaps in opm_overlapss:
+            self.getDao('opm_overlaps').toBin(opm_overlaps, writer)
+
+class DBRefProvAgentBINDAOBase(BINDAO):
+
+    def __init__(self, daoList):
+        self.daoList = daoList
+
+    def getDao(self, dao):
+        return self.daoList[dao]
+
+    def fromBin(self, reader):
+        read_value = reader.read_value
+
+        # read attributes
+        prov_ref = read_value()
+
+        obj = DBRefProvAgent(prov_ref=prov_ref)
+        obj.is_dirty = False
+        return obj
+
+    def toBin(self, ref_prov_agent, writer):
+        write_value = writer.write_value
+
+        # write attributes
+        write_value(ref_prov_agent.db_prov_ref)
+
+class DBPortSpecBINDAOBase(BINDAO):
+
+    def __init__(self, daoList):
+        self.daoList = daoList
+
+    def getDao(self, dao):
+        return self.daoList[dao]
+
+    def fromBin(self, reader):
+        read_value = reader.read_value
+
+        # read attributes
+        id = read_value()
+        name = read_value()
+        type = read_value()
+        optional = read_value()
+        depth = read_value()
+        sort_key = read_value()
+        min_conns = read_value()
+        max_conns = read_value()
+
+        # read children
+        portSpecItems = []
+        for i in xrange(reader.read_count()):
+            _data = self.getDao('portSpecItem').fromBin(reader)
+            portSpecItems.append(_data)
+
+        obj = DBPortSpec(id=id, name=name, type=type, optional=optional, depth=depth, sort_key=sort_key, portSpecItems=portSpecItems, min_conns=min_conns, max_conns=max_conns)
+        obj.is_dirty = False
+        return obj
+
+    def toBin(self, portSpec, writer):
+        write_value = writer.write_value
+
+        # write attributes
+        write_value(portSpec.db_id)
+        write_value(portSpec.db_name)
+        write_value(portSpec.db_type)
+        write_value(portSpec.db_optional)
+        write_value(portSpec.db_depth)
+        write_value(portSpec.db_sort_key)
+        write_value(portSpec.db_min_conns)
+        write_value(portSpec.db_max_conns)
+
+        # write children
+        portSpecItems = portSpec.db_portSpecItems
+        writer.write_count(len(portSpecItems))
+        for portSpecItem in portSpecItems:
+            self.getDao('portSpecItem').toBin(portSpecItem, writer)
+
+class DBEnabledPackagesBINDAOBase(BINDAO):
+
+    def __init__(self, daoList):
+        self.daoList = daoList
+
+    def getDao(self, dao):
+        return self.daoList[dao]
+
+    def fromBin(self, reader):
+        # read children
+        packages = []
+        for i in xrange(reader.read_count()):
+            _data = self.getDao('startup_package').fromBin(reader)
+            packages.append(_data)
+
+        obj = DBEnabledPackages(packages=packages)
+        obj.is_dirty = False
+        return obj
+
+    def toBin(self, enabled_packages, writer):
+        # write children
+        packages = enabled_packages.db_packages
+        writer.write_count(len(packages))
+        for package in packages:
+            self.getDao('startup_package').toBin(package, writer)
+
+class DBOpmArtifactBINDAOBase(BINDAO):
+
+    def __init__(self, daoList):
+        self.daoList = daoList
+
+    def getDao(self, dao):
+        return self.daoList[dao]
+
+    def fromBin(self, reader):
+        read_value = reader.read_value
+
+        # read attributes
+        id = read_value()
+
+        # read children
+        value = None
+        if reader.read_count():
+            value = self.getDao('opm_artifact_value').fromBin(reader)
+        accounts = []
+        for i in xrange(reader.read_count()):
+            _data = self.getDao('opm_account_id').fromBin(reader)
+            accounts.append(_data)
+
+        obj = DBOpmArtifact(id=id, value=value, accounts=accounts)
+        obj.is_dirty = False
+        return obj
+
+    def toBin(self, opm_artifact, writer):
+        write_value = writer.write_value
+
+        # write attributes
+        write_value(opm_artifact.db_id)
+
+        # write children
+        value = opm_artifact.db_value
+        if value is not None:
+            writer.write_count(1)
+            self.getDao('opm_artifact_value').toBin(value, writer)
+        else:
+            writer.write_count(0)
+        accounts = opm_artifact.db_accounts
+        writer.write_count(len(accounts))
+        for account in accounts:
+            self.getDao('opm_account_id').toBin(account, writer)
+
+class DBLogBINDAOBase(BINDAO):
+
+    def __init__(self, daoList):
+        self.daoList = daoList
+
+    def getDao(self, dao):
+        return self.daoList[dao]
+
+    def fromBin(self, reader):
+        read_value = reader.read_value
+
+        # read attributes
+        id = read_value()
+        version = read_value()
+        name = read_value()
+        vistrail_id = read_value()
+
+        # read children
+        workflow_execs = []
+        for i in xrange(reader.read_count()):
+            _data = self.getDao('workflow_exec').fromBin(reader)
+            workflow_execs.append(_data)
+
+        obj = DBLog(id=id, version=version, name=name, workflow_execs=workflow_execs, vistrail_id=vistrail_id)
+        obj.is_dirty = False
+        return obj
+
+    def toBin(self, log, writer):
+        write_value = writer.write_value
+
+        # write attributes
+        write_value(log.db_id)
+        write_value(log.db_version)
+        write_value(log.db_name)
+        write_value(log.db_vistrail_id)
+
+        # write children
+        workflow_execs = log.db_workflow_execs
+        writer.write_count(len(workflow_execs))
+        for workflow_exec in workflow_execs:
+            self.getDao('workflow_exec').toBin(workflow_exec, writer)
+
+class DBLoopIterationBINDAOBase(BINDAO):
+
+    def __init__(self, daoList):
+        self.daoList = daoList
+
+    def getDao(self, dao):
+        return self.daoList[dao]
+
+    def fromBin(self, reader):
+        read_value = reader.read_value
+
+        # read attributes
+        id = read_value()
+        ts_start = read_value()
+        ts_end = read_value()
+        iteration = read_value()
+        completed = read_value()
+        error = read_value()
+
+        # read children
+        item_execs = []
+        for i in xrange(reader.read_count()):
+            _tag = reader.read_count()
+            if _tag == 1:
+                _data = self.getDao('module_exec').fromBin(reader)
+            elif _tag == 2:
+                _data = self.getDao('group_exec').fromBin(reader)
+            elif _tag == 3:
+                _data = self.getDao('loop_exec').fromBin(reader)
+            else:
+                continue
+            item_execs.append(_data)
+
+        obj = DBLoopIteration(item_execs=item_execs, id=id, ts_start=ts_start, ts_end=ts_end, iteration=iteration, completed=completed, error=error)
+        obj.is_dirty = False
+        return obj
+
+    def toBin(self, loop_iteration, writer):
+        write_value = writer.write_value
+
+        # write attributes
+        write_value(loop_iteration.db_id)
+        write_value(loop_iteration.db_ts_start)
+        write_value(loop_iteration.db_ts_end)
+        write_value(loop_iteration.db_iteration)
+        write_value(loop_iteration.db_completed)
+        write_value(loop_iteration.db_error)
+
+        # write children
+        item_execs = loop_iteration.db_item_execs
+        writer.write_count(len(item_execs))
+        for item_exec in item_execs:
+            if item_exec.vtType == 'module_exec':
+                writer.write_count(1)
+                self.getDao('module_exec').toBin(item_exec, writer)
+            elif item_exec.vtType == 'group_exec':
+                writer.write_count(2)
+                self.getDao('group_exec').toBin(item_exec, writer)
+            elif item_exec.vtType == 'loop_exec':
+                writer.write_count(3)
+                self.getDao('loop_exec').toBin(item_exec, writer)
+            else:
+                writer.write_count(0)
+
+class DBOpmProcessIdCauseBINDAOBase(BINDAO):
+
+    def __init__(self, daoList):
+        self.daoList = daoList
+
+    def getDao(self, dao):
+        return self.daoList[dao]
+
+    def fromBin(self, reader):
+        read_value = reader.read_value
+
+        # read attributes
+        id = read_value()
+
+        obj = DBOpmProcessIdCause(id=id)
+        obj.is_dirty = False
+        return obj
+
+    def toBin(self, opm_process_id_cause, writer):
+        write_value = writer.write_value
+
+        # write attributes
+        write_value(opm_process_id_cause.db_id)
+
+class DBOpmArtifactsBINDAOBase(BINDAO):
+
+    def __init__(self, daoList):
+        self.daoList = daoList
+
+    def getDao(self, dao):
+        return self.daoList[dao]
+
+    def fromBin(self, reader):
+        # read children
+        artifacts = []
+        for i in xrange(reader.read_count()):
+            _data = self.getDao('opm_artifact').fromBin(reader)
+            artifacts.append(_data)
+
+        obj = DBOpmArtifacts(artifacts=artifacts)
+        obj.is_dirty = False
+        return obj
+
+    def toBin(self, opm_artifacts, writer):
+        # write children
+        artifacts = opm_artifacts.db_artifacts
+        writer.write_count(len(artifacts))
+        for artifact in artifacts:
+            self.getDao('opm_artifact').toBin(artifact, writer)
+
+class DBPEParameterBINDAOBase(BINDAO):
+
+    def __init__(self, daoList):
+        self.daoList = daoList
+
+    def getDao(self, dao):
+        return self.daoList[dao]
+
+    def fromBin(self, reader):
+        read_value = reader.read_value
+
+        # read attributes
+        id = read_value()
+        pos = read_value()
+        interpolator = read_value()
+        value = read_value()
+        dimension = read_value()
+
+        obj = DBPEParameter(id=id, pos=pos, interpolator=interpolator, value=value, dimension=dimension)
+        obj.is_dirty = False
+        return obj
+
+    def toBin(self, pe_parameter, writer):
+        write_value = writer.write_value
+
+        # write attributes
+        write_value(pe_parameter.db_id)
+        write_value(pe_parameter.db_pos)
+        write_value(pe_parameter.db_interpolator)
+        write_value(pe_parameter.db_value)
+        write_value(pe_parameter.db_dimension)
+
+class DBWorkflowExecBINDAOBase(BINDAO):
+
+    def __init__(self, daoList):
+        self.daoList = daoList
+
+    def getDao(self, dao):
+        return self.daoList[dao]
+
+    def fromBin(self, reader):
+        read_value = reader.read_value
+
+        # read attributes
+        id = read_value()
+        user = read_value()
+        ip = read_value()
+        session = read_value()
+        vt_version = read_value()
+        ts_start = read_value()
+        ts_end = read_value()
+        parent_id = read_value()
+        parent_type = read_value()
+        parent_version = read_value()
+        completed = read_value()
+        name = read_value()
+
+        # read children
+        annotations = []
+        for i in xrange(reader.read_count()):
+            _data = self.getDao('annotation').fromBin(reader)
+            annotations.append(_data)
+        machines = []
+        for i in xrange(reader.read_count()):
+            _data = self.getDao('machine').fromBin(reader)
+            machines.append(_data)
+        item_execs = []
+        for i in xrange(reader.read_count()):
+            _tag = reader.read_count()
+            if _tag == 1:
+                _data = self.getDao('module_exec').fromBin(reader)
+            elif _tag == 2:
+                _data = self.getDao('group_exec').fromBin(reader)
+            elif _tag == 3:
+                _data = self.getDao('loop_exec').fromBin(reader)
+            else:
+                continue
+            item_execs.append(_data)
+
+        obj = DBWorkflowExec(item_execs=item_execs, id=id, user=user, ip=ip, session=session, vt_version=vt_version, ts_start=ts_start, ts_end=ts_end, parent_id=parent_id, parent_type=parent_type, parent_version=parent_version, completed=completed, name=name, annotations=annotations, machines=machines)
+        obj.is_dirty = False
+        return obj
+
+    def toBin(self, workflow_exec, writer):
+        write_value = writer.write_value
+
+        # write attributes
+        write_value(workflow_exec.db_id)
+        write_value(workflow_exec.db_user)
+        write_value(workflow_exec.db_ip)
+        write_value(workflow_exec.db_session)
+        write_value(workflow_exec.db_vt_version)
+        write_value(workflow_exec.db_ts_start)
+        write_value(workflow_exec.db_ts_end)
+        write_value(workflow_exec.db_parent_id)
+        write_value(workflow_exec.db_parent_type)
+        write_value(workflow_exec.db_parent_version)
+        write_value(workflow_exec.db_completed)
+        write_value(workflow_exec.db_name)
+
+        # write children
+        annotations = workflow_exec.db_annotations
+        writer.write_count(len(annotations))
+        for annotation in annotations:
+            self.getDao('annotation').toBin(annotation, writer)
+        machines = workflow_exec.db_machines
+        writer.write_count(len(machines))
+        for machine in machines:
+            self.getDao('machine').toBin(machine, writer)
+        item_execs = workflow_exec.db_item_execs
+        writer.write_count(len(item_execs))
+        for item_exec in item_execs:
+            if item_exec.vtType == 'module_exec':
+                writer.write_count(1)
+                self.getDao('module_exec').toBin(item_exec, writer)
+            elif item_exec.vtType == 'group_exec':
+                writer.write_count(2)
+                self.getDao('group_exec').toBin(item_exec, writer)
+            elif item_exec.vtType == 'loop_exec':
+                writer.write_count(3)
+                self.getDao('loop_exec').toBin(item_exec, writer)
+            else:
+                writer.write_count(0)
+
+class DBLocationBINDAOBase(BINDAO):
+
+    def __init__(self, daoList):
+        self.daoList = daoList
+
+    def getDao(self, dao):
+        return self.daoList[dao]
+
+    def fromBin(self, reader):
+        read_value = reader.read_value
+
+        # read attributes
+        id = read_value()
+        x = read_value()
+        y = read_value()
+
+        obj = DBLocation(id=id, x=x, y=y)
+        obj.is_dirty = False
+        return obj
+
+    def toBin(self, location, writer):
+        write_value = writer.write_value
+
+        # write attributes
+        write_value(location.db_id)
+        write_value(location.db_x)
+        write_value(location.db_y)
+
+class DBFunctionBINDAOBase(BINDAO):
+
+    def __init__(self, daoList):
+        self.daoList = daoList
+
+    def getDao(self, dao):
+        return self.daoList[dao]
+
+    def fromBin(self, reader):
+        read_value = reader.read_value
+
+        # read attributes
+        id = read_value()
+        pos = read_value()
+        name = read_value()
+
+        # read children
+        parameters = []
+        for i in xrange(reader.read_count()):
+            _data = self.getDao('parameter').fromBin(reader)
+            parameters.append(_data)
+
+        obj = DBFunction(id=id, pos=pos, name=name, parameters=parameters)
+        obj.is_dirty = False
+        return obj
+
+    def toBin(self, function, writer):
+        write_value = writer.write_value
+
+        # write attributes
+        write_value(function.db_id)
+        write_value(function.db_pos)
+        write_value(function.db_name)
+
+        # write children
+        parameters = function.db_parameters
+        writer.write_count(len(parameters))
+        for parameter in parameters:
+            self.getDao('parameter').toBin(parameter, writer)
+
+class DBActionAnnotationBINDAOBase(BINDAO):
+
+    def __init__(self, daoList):
+        self.daoList = daoList
+
+    def getDao(self, dao):
+        return self.daoList[dao]
+
+    def fromBin(self, reader):
+        read_value = reader.read_value
+
+        # read attributes
+        id = read_value()
+        key = read_value()
+        value = read_value()
+        action_id = read_value()
+        date = read_value()
+        user = read_value()
+
+        obj = DBActionAnnotation(id=id, key=key, value=value, action_id=action_id, date=date, user=user)
+        obj.is_dirty = False
+        return obj
+
+    def toBin(self, actionAnnotation, writer):
+        write_value = writer.write_value
+
+        # write attributes
+        write_value(actionAnnotation.db_id)
+        write_value(actionAnnotation.db_key)
+        write_value(actionAnnotation.db_value)
+        write_value(actionAnnotation.db_action_id)
+        write_value(actionAnnotation.db_date)
+        write_value(actionAnnotation.db_user)
+
+class DBProvActivityBINDAOBase(BINDAO):
+
+    def __init__(self, daoList):
+        self.daoList = daoList
+
+    def getDao(self, dao):
+        return self.daoList[dao]
+
+    def fromBin(self, reader):
+        read_value = reader.read_value
+
+        # read attributes
+        id = read_value()
+
+        # read children
+        startTime = reader.read_value()
+        endTime = reader.read_value()
+        vt_id = reader.read_value()
+        vt_type = reader.read_value()
+        vt_cached = reader.read_value()
+        vt_completed = reader.read_value()
+        vt_machine_id = reader.read_value()
+        vt_error = reader.read_value()
+        is_part_of = None
+        if reader.read_count():
+            is_part_of = self.getDao('is_part_of').fromBin(reader)
+
+        obj = DBProvActivity(id=id, startTime=startTime, endTime=endTime, vt_id=vt_id, vt_type=vt_type, vt_cached=vt_cached, vt_completed=vt_completed, vt_machine_id=vt_machine_id, vt_error=vt_error, is_part_of=is_part_of)
+        obj.is_dirty = False
+        return obj
+
+    def toBin(self, prov_activity, writer):
+        write_value = writer.write_value
+
+        # write attributes
+        write_value(prov_activity.db_id)
+
+        # write children
+        startTime = prov_activity.db_startTime
+        writer.write_value(startTime)
+        endTime = prov_activity.db_endTime
+        writer.write_value(endTime)
+        vt_id = prov_activity.db_vt_id
+        writer.write_value(vt_id)
+        vt_type = prov_activity.db_vt_type
+        writer.write_value(vt_type)
+        vt_cached = prov_activity.db_vt_cached
+        writer.write_value(vt_cached)
+        vt_completed = prov_activity.db_vt_completed
+        writer.write_value(vt_completed)
+        vt_machine_id = prov_activity.db_vt_machine_id
+        writer.write_value(vt_machine_id)
+        vt_error = prov_activity.db_vt_error
+        writer.write_value(vt_error)
+        is_part_of = prov_activity.db_is_part_of
+        if is_part_of is not None:
+            writer.write_count(1)
+            self.getDao('is_part_of').toBin(is_part_of, writer)
+        else:
+            writer.write_count(0)
+
+class DBProvUsageBINDAOBase(BINDAO):
+
+    def __init__(self, daoList):
+        self.daoList = daoList
+
+    def getDao(self, dao):
+        return self.daoList[dao]
+
+    def fromBin(self, reader):
+        # read children
+        prov_activity = None
+        if reader.read_count():
+            prov_activity = self.getDao('ref_prov_activity').fromBin(reader)
+        prov_entity = None
+        if reader.read_count():
+            prov_entity = self.getDao('ref_prov_entity').fromBin(reader)
+        prov_role = reader.read_value()
+
+        obj = DBProvUsage(prov_activity=prov_activity, prov_entity=prov_entity, prov_role=prov_role)
+        obj.is_dirty = False
+        return obj
+
+    def toBin(self, prov_usage, writer):
+        # write children
+        prov_activity = prov_usage.db_prov_activity
+        if prov_activity is not None:
+            writer.write_count(1)
+            self.getDao('ref_prov_activity').toBin(prov_activity, writer)
+        else:
+            writer.write_count(0)
+        prov_entity = prov_usage.db_prov_entity
+        if prov_entity is not None:
+            writer.write_count(1)
+            self.getDao('ref_prov_entity').toBin(prov_entity, writer)
+        else:
+            writer.write_count(0)
+        prov_role = prov_usage.db_prov_role
+        writer.write_value(prov_role)
+
+class DBOpmArtifactIdEffectBINDAOBase(BINDAO):
+
+    def __init__(self, daoList):
+        self.daoList = daoList
+
+    def getDao(self, dao):
+        return self.daoList[dao]
+
+    def fromBin(self, reader):
+        read_value = reader.read_value
+
+        # read attributes
+        id = read_value()
+
+        obj = DBOpmArtifactIdEffect(id=id)
+        obj.is_dirty = False
+        return obj
+
+    def toBin(self, opm_artifact_id_effect, writer):
+        write_value = writer.write_value
+
+        # write attributes
+        write_value(opm_artifact_id_effect.db_id)
+
+class DBOpmGraphBINDAOBase(BINDAO):
+
+    def __init__(self, daoList):
+        self.daoList = daoList
+
+    def getDao(self, dao):
+        return self.daoList[dao]
+
+    def fromBin(self, reader):
+        # read children
+        accounts = None
+        if reader.read_count():
+            accounts = self.getDao('opm_accounts').fromBin(reader)
+        processes = None
+        if reader.read_count():
+            processes = self.getDao('opm_processes').fromBin(reader)
+        artifacts = None
+        if reader.read_count():
+            artifacts = self.getDao('opm_artifacts').fromBin(reader)
+        agents = None
+        if reader.read_count():
+            agents = self.getDao('opm_agents').fromBin(reader)
+        dependencies = None
+        if reader.read_count():
+            dependencies = self.getDao('opm_dependencies').fromBin(reader)
+
+        obj = DBOpmGraph(accounts=accounts, processes=processes, artifacts=artifacts, agents=agents, dependencies=dependencies)
+        obj.is_dirty = False
+        return obj
+
+    def toBin(self, opm_graph, writer):
+        # write children
+        accounts = opm_graph.db_accounts
+        if accounts is not None:
+            writer.write_count(1)
+            self.getDao('opm_accounts').toBin(accounts, writer)
+        else:
+            writer.write_count(0)
+        processes = opm_graph.db_processes
+        if processes is not None:
+            writer.write_count(1)
+            self.getDao('opm_processes').toBin(processes, writer)
+        else:
+            writer.write_count(0)
+        artifacts = opm_graph.db_artifacts
+        if artifacts is not None:
+            writer.write_count(1)
+            self.getDao('opm_artifacts').toBin(artifacts, writer)
+        else:
+            writer.write_count(0)
+        agents = opm_graph.db_agents
+        if agents is not None:
+            writer.write_count(1)
+            self.getDao('opm_agents').toBin(agents, writer)
+        else:
+            writer.write_count(0)
+        dependencies = opm_graph.db_dependencies
+        if dependencies is not None:
+            writer.write_count(1)
+            self.getDao('opm_dependencies').toBin(dependencies, writer)
+        else:
+            writer.write_count(0)
+
+class DBIsPartOfBINDAOBase(BINDAO):
+
+    def __init__(self, daoList):
+        self.daoList = daoList
+
+    def getDao(self, dao):
+        return self.daoList[dao]
+
+    def fromBin(self, reader):
+        read_value = reader.read_value
+
+        # read attributes
+        prov_ref = read_value()
+
+        obj = DBIsPartOf(prov_ref=prov_ref)
+        obj.is_dirty = False
+        return obj
+
+    def toBin(self, is_part_of, writer):
+        write_value = writer.write_value
+
+        # write attributes
+        write_value(is_part_of.db_prov_ref)
+
+class DBOpmWasDerivedFromBINDAOBase(BINDAO):
+
+    def __init__(self, daoList):
+        self.daoList = daoList
+
+    def getDao(self, dao):
+        return self.daoList[dao]
+
+    def fromBin(self, reader):
+        # read children
+        effect = None
+        if reader.read_count():
+            effect = self.getDao('opm_artifact_id_effect').fromBin(reader)
+        role = None
+        if reader.read_count():
+            role = self.getDao('opm_role').fromBin(reader)
+        cause = None
+        if reader.read_count():
+            cause = self.getDao('opm_artifact_id_cause').fromBin(reader)
+        accounts = []
+        for i in xrange(reader.read_count()):
+            _data = self.getDao('opm_account_id').fromBin(reader)
+            accounts.append(_data)
+        opm_times = []
+        for i in xrange(reader.read_count()):
+            _data = self.getDao('opm_time').fromBin(reader)
+            opm_times.append(_data)
+
+        obj = DBOpmWasDerivedFrom(effect=effect, role=role, cause=cause, accounts=accounts, opm_times=opm_times)
+        obj.is_dirty = False
+        return obj
+
+    def toBin(self, opm_was_derived_from, writer):
+        # write children
+        effect = opm_was_derived_from.db_effect
+        if effect is not None:
+            writer.write_count(1)
+            self.getDao('opm_artifact_id_effect').toBin(effect, writer)
+        else:
+            writer.write_count(0)
+        role = opm_was_derived_from.db_role
+        if role is not None:
+            writer.write_count(1)
+            self.getDao('opm_role').toBin(role, writer)
+        else:
+            writer.write_count(0)
+        cause = opm_was_derived_from.db_cause
+        if cause is not None:
+            writer.write_count(1)
+            self.getDao('opm_artifact_id_cause').toBin(cause, writer)
+        else:
+            writer.write_count(0)
+        accounts = opm_was_derived_from.db_accounts
+        writer.write_count(len(accounts))
+        for account in accounts:
+            self.getDao('opm_account_id').toBin(account, writer)
+        opm_times = opm_was_derived_from.db_opm_times
+        writer.write_count(len(opm_times))
+        for opm_time in opm_times:
+            self.getDao('opm_time').toBin(opm_time, writer)
+
+class DBControlParameterBINDAOBase(BINDAO):
+
+    def __init__(self, daoList):
+        self.daoList = daoList
+
+    def getDao(self, dao):
+        return self.daoList[dao]
+
+    def fromBin(self, reader):
+        read_value = reader.read_value
+
+        # read attributes
+        id = read_value()
+        name = read_value()
+        value = read_value()
+
+        obj = DBControlParameter(id=id, name=name, value=value)
+        obj.is_dirty = False
+        return obj
+
+    def toBin(self, controlParameter, writer):
+        write_value = writer.write_value
+
+        # write attributes
+        write_value(controlParameter.db_id)
+        write_value(controlParameter.db_name)
+        write_value(controlParameter.db_value)
+
+class DBPluginDataBINDAOBase(BINDAO):
+
+    def __init__(self, daoList):
+        self.daoList = daoList
+
+    def getDao(self, dao):
+        return self.daoList[dao]
+
+    def fromBin(self, reader):
+        read_value = reader.read_value
+
+        # read attributes
+        id = read_value()
+        data = read_value()
+
+        obj = DBPluginData(id=id, data=data)
+        obj.is_dirty = False
+        return obj
+
+    def toBin(self, plugin_data, writer):
+        write_value = writer.write_value
+
+        # write attributes
+        write_value(plugin_data.db_id)
+        write_value(plugin_data.db_data)
+
+class DBDeleteBINDAOBase(BINDAO):
+
+    def __init__(self, daoList):
+        self.daoList = daoList
+
+    def getDao(self, dao):
+        return self.daoList[dao]
+
+    def fromBin(self, reader):
+        read_value = reader.read_value
+
+        # read attributes
+        id = read_value()
+        what = read_value()
+        objectId = read_value()
+        parentObjId = read_value()
+        parentObjType = read_value()
+
+        obj = DBDelete(id=id, what=what, objectId=objectId, parentObjId=parentObjId, parentObjType=parentObjType)
+        obj.is_dirty = False
+        return obj
+
+    def toBin(self, delete, writer):
+        write_value = writer.write_value
+
+        # write attributes
+        write_value(delete.db_id)
+        write_value(delete.db_what)
+        write_value(delete.db_objectId)
+        write_value(delete.db_parentObjId)
+        write_value(delete.db_parentObjType)
+
+class DBVistrailVariableBINDAOBase(BINDAO):
+
+    def __init__(self, daoList):
+        self.daoList = daoList
+
+    def getDao(self, dao):
+        return self.daoList[dao]
+
+    def fromBin(self, reader):
+        read_value = reader.read_value
+
+        # read attributes
+        name = read_value()
+        uuid = read_value()
+        package = read_value()
+        module = read_value()
+        namespace = read_value()
+        value = read_value()
+
+        obj = DBVistrailVariable(name=name, uuid=uuid, package=package, module=module, namespace=namespace, value=value)
+        obj.is_dirty = False
+        return obj
+
+    def toBin(self, vistrailVariable, writer):
+        write_value = writer.write_value
+
+        # write attributes
+        write_value(vistrailVariable.db_name)
+        write_value(vistrailVariable.db_uuid)
+        write_value(vistrailVariable.db_package)
+        write_value(vistrailVariable.db_module)
+        write_value(vistrailVariable.db_namespace)
+        write_value(vistrailVariable.db_value)
+
+class DBOpmOverlapsBINDAOBase(BINDAO):
+
+    def __init__(self, daoList):
+        self.daoList = daoList
+
+    def getDao(self, dao):
+        return self.daoList[dao]
+
+    def fromBin(self, reader):
+        # read children
+        opm_account_ids = []
+        for i in xrange(reader.read_count()):
+            _data = self.getDao('opm_account_id').fromBin(reader)
+            opm_account_ids.append(_data)
+
+        obj = DBOpmOverlaps(opm_account_ids=opm_account_ids)
+        obj.is_dirty = False
+        return obj
+
+    def toBin(self, opm_overlaps, writer):
+        # write children
+        opm_account_ids = opm_overlaps.db_opm_account_ids
+        writer.write_count(len(opm_account_ids))
+        for opm_account_id in opm_account_ids:
+            self.getDao('opm_account_id').toBin(opm_account_id, writer)
+
+class DBOpmWasTriggeredByBINDAOBase(BINDAO):
+
+    def __init__(self, daoList):
+        self.daoList = daoList
+
+    def getDao(self, dao):
+        return self.daoList[dao]
+
+    def fromBin(self, reader):
+        # read children
+        effect = None
+        if reader.read_count():
+            effect = self.getDao('opm_process_id_effect').fromBin(reader)
+        role = None
+        if reader.read_count():
+            role = self.getDao('opm_role').fromBin(reader)
+        cause = None
+        if reader.read_count():
+            cause = self.getDao('opm_process_id_cause').fromBin(reader)
+        accounts = []
+        for i in xrange(reader.read_count()):
+            _data = self.getDao('opm_account_id').fromBin(reader)
+            accounts.append(_data)
+        opm_times = []
+        for i in xrange(reader.read_count()):
+            _data = self.getDao('opm_time').fromBin(reader)
+            opm_times.append(_data)
+
+        obj = DBOpmWasTriggeredBy(effect=effect, role=role, cause=cause, accounts=accounts, opm_times=opm_times)
+        obj.is_dirty = False
+        return obj
+
+    def toBin(self, opm_was_triggered_by, writer):
+        # write children
+        effect = opm_was_triggered_by.db_effect
+        if effect is not None:
+            writer.write_count(1)
+            self.getDao('opm_process_id_effect').toBin(effect, writer)
+        else:
+            writer.write_count(0)
+        role = opm_was_triggered_by.db_role
+        if role is not None:
+            writer.write_count(1)
+            self.getDao('opm_role').toBin(role, writer)
+        else:
+            writer.write_count(0)
+        cause = opm_was_triggered_by.db_cause
+        if cause is not None:
+            writer.write_count(1)
+            self.getDao('opm_process_id_cause').toBin(cause, writer)
+        else:
+            writer.write_count(0)
+        accounts = opm_was_triggered_by.db_accounts
+        writer.write_count(len(accounts))
+        for account in accounts:
+            self.getDao('opm_account_id').toBin(account, writer)
+        opm_times = opm_was_triggered_by.db_opm_times
+        writer.write_count(len(opm_times))
+        for opm_time in opm_times:
+            self.getDao('opm_time').toBin(opm_time, writer)
+
+class DBModuleDescriptorBINDAOBase(BINDAO):
+
+    def __init__(self, daoList):
+        self.daoList = daoList
+
+    def getDao(self, dao):
+        return self.daoList[dao]
+
+    def fromBin(self, reader):
+        read_value = reader.read_value
+
+        # read attributes
+        id = read_value()
+        name = read_value()
+        package = read_value()
+        namespace = read_value()
+        package_version = read_value()
+        version = read_value()
+        base_descriptor_id = read_value()
+
+        # read children
+        portSpecs = []
+        for i in xrange(reader.read_count()):
+            _data = self.getDao('portSpec').fromBin(reader)
+            portSpecs.append(_data)
+
+        obj = DBModuleDescriptor(id=id, name=name, package=package, namespace=namespace, package_version=package_version, version=version, base_descriptor_id=base_descriptor_id, portSpecs=portSpecs)
+        obj.is_dirty = False
+        return obj
+
+    def toBin(self, module_descriptor, writer):
+        write_value = writer.write_value
+
+        # write attributes
+        write_value(module_descriptor.db_id)
+        write_value(module_descriptor.db_name)
+        write_value(module_descriptor.db_package)
+        write_value(module_descriptor.db_namespace)
+        write_value(module_descriptor.db_package_version)
+        write_value(module_descriptor.db_version)
+        write_value(module_descriptor.db_base_descriptor_id)
+
+        # write children
+        portSpecs = module_descriptor.db_portSpecs
+        writer.write_count(len(portSpecs))
+        for portSpec in portSpecs:
+            self.getDao('portSpec').toBin(portSpec, writer)
+
+class DBTagBINDAOBase(BINDAO):
+
+    def __init__(self, daoList):
+        self.daoList = daoList
+
+    def getDao(self, dao):
+        return self.daoList[dao]
+
+    def fromBin(self, reader):
+        read_value = reader.read_value
+
+        # read attributes
+        id = read_value()
+        name = read_value()
+
+        obj = DBTag(id=id, name=name)
+        obj.is_dirty = False
+        return obj
+
+    def toBin(self, tag, writer):
+        write_value = writer.write_value
+
+        # write attributes
+        write_value(tag.db_id)
+        write_value(tag.db_name)
+
+class DBOpmRoleBINDAOBase(BINDAO):
+
+    def __init__(self, daoList):
+        self.daoList = daoList
+
+    def getDao(self, dao):
+        return self.daoList[dao]
+
+    def fromBin(self, reader):
+        read_value = reader.read_value
+
+        # read attributes
+        value = read_value()
+
+        obj = DBOpmRole(value=value)
+        obj.is_dirty = False
+        return obj
+
+    def toBin(self, opm_role, writer):
+        write_value = writer.write_value
+
+        # write attributes
+        write_value(opm_role.db_value)
+
+class DBProvDocumentBINDAOBase(BINDAO):
+
+    def __init__(self, daoList):
+        self.daoList = daoList
+
+    def getDao(self, dao):
+        return self.daoList[dao]
+
+    def fromBin(self, reader):
+        # read children
+        prov_entitys = []
+        for i in xrange(reader.read_count()):
+            _data = self.getDao('prov_entity').fromBin(reader)
+            prov_entitys.append(_data)
+        prov_activitys = []
+        for i in xrange(reader.read_count()):
+            _data = self.getDao('prov_activity').fromBin(reader)
+            prov_activitys.append(_data)
+        prov_agents = []
+        for i in xrange(reader.read_count()):
+            _data = self.getDao('prov_agent').fromBin(reader)
+            prov_agents.append(_data)
+        vt_connections = []
+        for i in xrange(reader.read_count()):
+            _data = self.getDao('vt_connection').fromBin(reader)
+            vt_connections.append(_data)
+        prov_usages = []
+        for i in xrange(reader.read_count()):
+            _data = self.getDao('prov_usage').fromBin(reader)
+            prov_usages.append(_data)
+        prov_generations = []
+        for i in xrange(reader.read_count()):
+            _data = self.getDao('prov_generation').fromBin(reader)
+            prov_generations.append(_data)
+        prov_associations = []
+        for i in xrange(reader.read_count()):
+            _data = self.getDao('prov_association').fromBin(reader)
+            prov_associations.append(_data)
+
+        obj = DBProvDocument(prov_entitys=prov_entitys, prov_activitys=prov_activitys, prov_agents=prov_agents, vt_connections=vt_connections, prov_usages=prov_usages, prov_generations=prov_generations, prov_associations=prov_associations)
+        obj.is_dirty = False
+        return obj
+
+    def toBin(self, prov_document, writer):
+        # write children
+        prov_entitys = prov_document.db_prov_entitys
+        writer.write_count(len(prov_entitys))
+        for prov_entity in prov_entitys:
+            self.getDao('prov_entity').toBin(prov_entity, writer)
+        prov_activitys = prov_document.db_prov_activitys
+        writer.write_count(len(prov_activitys))
+        for prov_activity in prov_activitys:
+            self.getDao('prov_activity').toBin(prov_activity, writer)
+        prov_agents = prov_document.db_prov_agents
+        writer.write_count(len(prov_agents))
+        for prov_agent in prov_agents:
+            self.getDao('prov_agent').toBin(prov_agent, writer)
+        vt_connections = prov_document.db_vt_connections
+        writer.write_count(len(vt_connections))
+        for vt_connection in vt_connections:
+            self.getDao('vt_connection').toBin(vt_connection, writer)
+        prov_usages = prov_document.db_prov_usages
+        writer.write_count(len(prov_usages))
+        for prov_usage in prov_usages:
+            self.getDao('prov_usage').toBin(prov_usage, writer)
+        prov_generations = prov_document.db_prov_generations
+        writer.write_count(len(prov_generations))
+        for prov_generation in prov_generations:
+            self.getDao('prov_generation').toBin(prov_generation, writer)
+        prov_associations = prov_document.db_prov_associations
+        writer.write_count(len(prov_associations))
+        for prov_association in prov_associations:
+            self.getDao('prov_association').toBin(prov_association, writer)
+
+class DBOpmProcessesBINDAOBase(BINDAO):
+
+    def __init__(self, daoList):
+        self.daoList = daoList
+
+    def getDao(self, dao):
+        return self.daoList[dao]
+
+    def fromBin(self, reader):
+        # read children
+        processs = []
+        for i in xrange(reader.read_count()):
+            _data = self.getDao('opm_process').fromBin(reader)
+            processs.append(_data)
+
+        obj = DBOpmProcesses(processs=processs)
+        obj.is_dirty = False
+        return obj
+
+    def toBin(self, opm_processes, writer):
+        # write children
+        processs = opm_processes.db_processs
+        writer.write_count(len(processs))
+        for process in processs:
+            self.getDao('opm_process').toBin(process, writer)
+
+class DBOpmAccountIdBINDAOBase(BINDAO):
+
+    def __init__(self, daoList):
+        self.daoList = daoList
+
+    def getDao(self, dao):
+        return self.daoList[dao]
+
+    def fromBin(self, reader):
+        read_value = reader.read_value
+
+        # read attributes
+        id = read_value()
+
+        obj = DBOpmAccountId(id=id)
+        obj.is_dirty = False
+        return obj
+
+    def toBin(self, opm_account_id, writer):
+        write_value = writer.write_value
+
+        # write attributes
+        write_value(opm_account_id.db_id)
+
+class DBPortSpecItemBINDAOBase(BINDAO):
+
+    def __init__(self, daoList):
+        self.daoList = daoList
+
+    def getDao(self, dao):
+        return self.daoList[dao]
+
+    def fromBin(self, reader):
+        read_value = reader.read_value
+
+        # read attributes
+        id = read_value()
+        pos = read_value()
+        module = read_value()
+        package = read_value()
+        namespace = read_value()
+        label = read_value()
+        default = read_value()
+        values = read_value()
+        entry_type = read_value()
+
+        obj = DBPortSpecItem(id=id, pos=pos, module=module, package=package, namespace=namespace, label=label, default=default, values=values, entry_type=entry_type)
+        obj.is_dirty = False
+        return obj
+
+    def toBin(self, portSpecItem, writer):
+        write_value = writer.write_value
+
+        # write attributes
+        write_value(portSpecItem.db_id)
+        write_value(portSpecItem.db_pos)
+        write_value(portSpecItem.db_module)
+        write_value(portSpecItem.db_package)
+        write_value(portSpecItem.db_namespace)
+        write_value(portSpecItem.db_label)
+        write_value(portSpecItem.db_default)
+        write_value(portSpecItem.db_values)
+        write_value(portSpecItem.db_entry_type)
+
+class DBMashupComponentBINDAOBase(BINDAO):
+
+    def __init__(self, daoList):
+        self.daoList = daoList
+
+    def getDao(self, dao):
+        return self.daoList[dao]
+
+    def fromBin(self, reader):
+        read_value = reader.read_value
+
+        # read attributes
+        id = read_value()
+        vtid = read_value()
+        vttype = read_value()
+        vtparent_type = read_value()
+        vtparent_id = read_value()
+        vtpos = read_value()
+        vtmid = read_value()
+        pos = read_value()
+        type = read_value()
+        val = read_value()
+        minVal = read_value()
+        maxVal = read_value()
+        stepSize = read_value()
+        strvaluelist = read_value()
+        widget = read_value()
+        seq = read_value()
+        parent = read_value()
+
+        obj = DBMashupComponent(id=id, vtid=vtid, vttype=vttype, vtparent_type=vtparent_type, vtparent_id=vtparent_id, vtpos=vtpos, vtmid=vtmid, pos=pos, type=type, val=val, minVal=minVal, maxVal=maxVal, stepSize=stepSize, strvaluelist=strvaluelist, widget=widget, seq=seq, parent=parent)
+        obj.is_dirty = False
+        return obj
+
+    def toBin(self, mashup_component, writer):
+        write_value = writer.write_value
+
+        # write attributes
+        write_value(mashup_component.db_id)
+        write_value(mashup_component.db_vtid)
+        write_value(mashup_component.db_vttype)
+        write_value(mashup_component.db_vtparent_type)
+        write_value(mashup_component.db_vtparent_id)
+        write_value(mashup_component.db_vtpos)
+        write_value(mashup_component.db_vtmid)
+        write_value(mashup_component.db_pos)
+        write_value(mashup_component.db_type)
+        write_value(mashup_component.db_val)
+        write_value(mashup_component.db_minVal)
+        write_value(mashup_component.db_maxVal)
+        write_value(mashup_component.db_stepSize)
+        write_value(mashup_component.db_strvaluelist)
+        write_value(mashup_component.db_widget)
+        write_value(mashup_component.db_seq)
+        write_value(mashup_component.db_parent)
+
+class DBMashupBINDAOBase(BINDAO):
+
+    def __init__(self, daoList):
+        self.daoList = daoList
+
+    def getDao(self, dao):
+        return self.daoList[dao]
+
+    def fromBin(self, reader):
+        read_value = reader.read_value
+
+        # read attributes
+        id = read_value()
+        name = read_value()
+        version = read_value()
+        type = read_value()
+        vtid = read_value()
+        has_seq = read_value()
+
+        # read children
+        aliases = []
+        for i in xrange(reader.read_count()):
+            _data = self.getDao('mashup_alias').fromBin(reader)
+            aliases.append(_data)
+        layout = reader.read_value()
+        geometry = reader.read_value()
+
+        obj = DBMashup(id=id, name=name, version=version, aliases=aliases, type=type, vtid=vtid, layout=layout, geometry=geometry, has_seq=has_seq)
+        obj.is_dirty = False
+        return obj
+
+    def toBin(self, mashup, writer):
+        write_value = writer.write_value
+
+        # write attributes
+        write_value(mashup.db_id)
+        write_value(mashup.db_name)
+        write_value(mashup.db_version)
+        write_value(mashup.db_type)
+        write_value(mashup.db_vtid)
+        write_value(mashup.db_has_seq)
+
+        # write children
+        aliases = mashup.db_aliases
+        writer.write_count(len(aliases))
+        for alias in aliases:
+            self.getDao('mashup_alias').toBin(alias, writer)
+        layout = mashup.db_layout
+        writer.write_value(layout)
+        geometry = mashup.db_geometry
+        writer.write_value(geometry)
+
+class DBMachineBINDAOBase(BINDAO):
+
+    def __init__(self, daoList):
+        self.daoList = daoList
+
+    def getDao(self, dao):
+        return self.daoList[dao]
+
+    def fromBin(self, reader):
+        read_value = reader.read_value
+
+        # read attributes
+        id = read_value()
+        name = read_value()
+        os = read_value()
+        architecture = read_value()
+        processor = read_value()
+        ram = read_value()
+
+        obj = DBMachine(id=id, name=name, os=os, architecture=architecture, processor=processor, ram=ram)
+        obj.is_dirty = False
+        return obj
+
+    def toBin(self, machine, writer):
+        write_value = writer.write_value
+
+        # write attributes
+        write_value(machine.db_id)
+        write_value(machine.db_name)
+        write_value(machine.db_os)
+        write_value(machine.db_architecture)
+        write_value(machine.db_processor)
+        write_value(machine.db_ram)
+
+class DBConfigFloatBINDAOBase(BINDAO):
+
+    def __init__(self, daoList):
+        self.daoList = daoList
+
+    def getDao(self, dao):
+        return self.daoList[dao]
+
+    def fromBin(self, reader):
+        read_value = reader.read_value
+
+        # read attributes
+        value = read_value()
+
+        obj = DBConfigFloat(value=value)
+        obj.is_dirty = False
+        return obj
+
+    def toBin(self, config_float, writer):
+        write_value = writer.write_value
+
+        # write attributes
+        write_value(config_float.db_value)
+
+class DBOtherBINDAOBase(BINDAO):
+
+    def __init__(self, daoList):
+        self.daoList = daoList
+
+    def getDao(self, dao):
+        return self.daoList[dao]
+
+    def fromBin(self, reader):
+        read_value = reader.read_value
+
+        # read attributes
+        id = read_value()
+        key = read_value()
+
+        # read children
+        value = reader.read_value()
+
+        obj = DBOther(id=id, key=key, value=value)
+        obj.is_dirty = False
+        return obj
+
+    def toBin(self, other, writer):
+        write_value = writer.write_value
+
+        # write attributes
+        write_value(other.db_id)
+        write_value(other.db_key)
+
+        # write children
+        value = other.db_value
+        writer.write_value(value)
+
+class DBRefProvActivityBINDAOBase(BINDAO):
+
+    def __init__(self, daoList):
+        self.daoList = daoList
+
+    def getDao(self, dao):
+        return self.daoList[dao]
+
+    def fromBin(self, reader):
+        read_value = reader.read_value
+
+        # read attributes
+        prov_ref = read_value()
+
+        obj = DBRefProvActivity(prov_ref=prov_ref)
+        obj.is_dirty = False
+        return obj
+
+    def toBin(self, ref_prov_activity, writer):
+        write_value = writer.write_value
+
+        # write attributes
+        write_value(ref_prov_activity.db_prov_ref)
+
+class DBAbstractionBINDAOBase(BINDAO):
+
+    def __init__(self, daoList):
+        self.daoList = daoList
+
+    def getDao(self, dao):
+        return self.daoList[dao]
+
+    def fromBin(self, reader):
+        read_value = reader.read_value
+
+        # read attributes
+        id = read_value()
+        cache = read_value()
+        name = read_value()
+        namespace = read_value()
+        package = read_value()
+        version = read_value()
+        internal_version = read_value()
+
+        # read children
+        location = None
+        if reader.read_count():
+            location = self.getDao('location').fromBin(reader)
+        functions = []
+        for i in xrange(reader.read_count()):
+            _data = self.getDao('function').fromBin(reader)
+            functions.append(_data)
+        annotations = []
+        for i in xrange(reader.read_count()):
+            _data = self.getDao('annotation').fromBin(reader)
+            annotations.append(_data)
+        controlParameters = []
+        for i in xrange(reader.read_count()):
+            _data = self.getDao('controlParameter').fromBin(reader)
+            controlParameters.append(_data)
+
+        obj = DBAbstraction(id=id, cache=cache, name=name, namespace=namespace, package=package, version=version, internal_version=internal_version, location=location, functions=functions, annotations=annotations, controlParameters=controlParameters)
+        obj.is_dirty = False
+        return obj
+
+    def toBin(self, abstraction, writer):
+        write_value = writer.write_value
+
+        # write attributes
+        write_value(abstraction.db_id)
+        write_value(abstraction.db_cache)
+        write_value(abstraction.db_name)
+        write_value(abstraction.db_namespace)
+        write_value(abstraction.db_package)
+        write_value(abstraction.db_version)
+        write_value(abstraction.db_internal_version)
+
+        # write children
+        location = abstraction.db_location
+        if location is not None:
+            writer.write_count(1)
+            self.getDao('location').toBin(location, writer)
+        else:
+            writer.write_count(0)
+        functions = abstraction.db_functions
+        writer.write_count(len(functions))
+        for function in functions:
+            self.getDao('function').toBin(function, writer)
+        annotations = abstraction.db_annotations
+        writer.write_count(len(annotations))
+        for annotation in annotations:
+            self.getDao('annotation').toBin(annotation, writer)
+        controlParameters = abstraction.db_controlParameters
+        writer.write_count(len(controlParameters))
+        for controlParameter in controlParameters:
+            self.getDao('controlParameter').toBin(controlParameter, writer)
+
+class DBProvAgentBINDAOBase(BINDAO):
+
+    def __init__(self, daoList):
+        self.daoList = daoList
+
+    def getDao(self, dao):
+        return self.daoList[dao]
+
+    def fromBin(self, reader):
+        read_value = reader.read_value
+
+        # read attributes
+        id = read_value()
+
+        # read children
+        vt_id = reader.read_value()
+        prov_type = reader.read_value()
+        prov_label = reader.read_value()
+        vt_machine_os = reader.read_value()
+        vt_machine_architecture = reader.read_value()
+        vt_machine_processor = reader.read_value()
+        vt_machine_ram = reader.read_value()
+
+        obj = DBProvAgent(id=id, vt_id=vt_id, prov_type=prov_type, prov_label=prov_label, vt_machine_os=vt_machine_os, vt_machine_architecture=vt_machine_architecture, vt_machine_processor=vt_machine_processor, vt_machine_ram=vt_machine_ram)
+        obj.is_dirty = False
+        return obj
+
+    def toBin(self, prov_agent, writer):
+        write_value = writer.write_value
+
+        # write attributes
+        write_value(prov_agent.db_id)
+
+        # write children
+        vt_id = prov_agent.db_vt_id
+        writer.write_value(vt_id)
+        prov_type = prov_agent.db_prov_type
+        writer.write_value(prov_type)
+        prov_label = prov_agent.db_prov_label
+        writer.write_value(prov_label)
+        vt_machine_os = prov_agent.db_vt_machine_os
+        writer.write_value(vt_machine_os)
+        vt_machine_architecture = prov_agent.db_vt_machine_architecture
+        writer.write_value(vt_machine_architecture)
+        vt_machine_processor = prov_agent.db_vt_machine_processor
+        writer.write_value(vt_machine_processor)
+        vt_machine_ram = prov_agent.db_vt_machine_ram
+        writer.write_value(vt_machine_ram)
+
+class DBMashuptrailBINDAOBase(BINDAO):
+
+    def __init__(self, daoList):
+        self.daoList = daoList
+
+    def getDao(self, dao):
+        return self.daoList[dao]
+
+    def fromBin(self, reader):
+        read_value = reader.read_value
+
+        # read attributes
+        name = read_value()
+        version = read_value()
+        vtVersion = read_value()
+
+        # read children
+        actions = []
+        for i in xrange(reader.read_count()):
+            _data = self.getDao('mashup_action').fromBin(reader)
+            actions.append(_data)
+        annotations = []
+        for i in xrange(reader.read_count()):
+            _data = self.getDao('annotation').fromBin(reader)
+            annotations.append(_data)
+        actionAnnotations = []
+        for i in xrange(reader.read_count()):
+            _data = self.getDao('mashup_actionAnnotation').fromBin(reader)
+            actionAnnotations.append(_data)
+
+        obj = DBMashuptrail(name=name, version=version, vtVersion=vtVersion, actions=actions, annotations=annotations, actionAnnotations=actionAnnotations)
+        obj.is_dirty = False
+        return obj
+
+    def toBin(self, mashuptrail, writer):
+        write_value = writer.write_value
+
+        # write attributes
+        write_value(mashuptrail.db_name)
+        write_value(mashuptrail.db_version)
+        write_value(mashuptrail.db_vtVersion)
+
+        # write children
+        actions = mashuptrail.db_actions
+        writer.write_count(len(actions))
+        for action in actions:
+            self.getDao('mashup_action').toBin(action, writer)
+        annotations = mashuptrail.db_annotations
+        writer.write_count(len(annotations))
+        for annotation in annotations:
+            self.getDao('annotation').toBin(annotation, writer)
+        actionAnnotations = mashuptrail.db_actionAnnotations
+        writer.write_count(len(actionAnnotations))
+        for actionAnnotation in actionAnnotations:
+            self.getDao('mashup_actionAnnotation').toBin(actionAnnotation, writer)
+
+class DBRegistryBINDAOBase(BINDAO):
+
+    def __init__(self, daoList):
+        self.daoList = daoList
+
+    def getDao(self, dao):
+        return self.daoList[dao]
+
+    def fromBin(self, reader):
+        read_value = reader.read_value
+
+        # read attributes
+        id = read_value()
+        version = read_value()
+        root_descriptor_id = read_value()
+
+        # read children
+        packages = []
+        for i in xrange(reader.read_count()):
+            _data = self.getDao('package').fromBin(reader)
+            packages.append(_data)
+
+        obj = DBRegistry(id=id, version=version, root_descriptor_id=root_descriptor_id, packages=packages)
+        obj.is_dirty = False
+        return obj
+
+    def toBin(self, registry, writer):
+        write_value = writer.write_value
+
+        # write attributes
+        write_value(registry.db_id)
+        write_value(registry.db_version)
+        write_value(registry.db_root_descriptor_id)
+
+        # write children
+        packages = registry.db_packages
+        writer.write_count(len(packages))
+        for package in packages:
+            self.getDao('package').toBin(package, writer)
+
+class DBOpmAgentBINDAOBase(BINDAO):
+
+    def __init__(self, daoList):
+        self.daoList = daoList
+
+    def getDao(self, dao):
+        return self.daoList[dao]
+
+    def fromBin(self, reader):
+        read_value = reader.read_value
+
+        # read attributes
+        id = read_value()
+
+        # read children
+        value = reader.read_value()
+        accounts = []
+        for i in xrange(reader.read_count()):
+            _data = self.getDao('opm_account_id').fromBin(reader)
+            accounts.append(_data)
+
+        obj = DBOpmAgent(id=id, value=value, accounts=accounts)
+        obj.is_dirty = False
+        return obj
+
+    def toBin(self, opm_agent, writer):
+        write_value = writer.write_value
+
+        # write attributes
+        write_value(opm_agent.db_id)
+
+        # write children
+        value = opm_agent.db_value
+        writer.write_value(value)
+        accounts = opm_agent.db_accounts
+        writer.write_count(len(accounts))
+        for account in accounts:
+            self.getDao('opm_account_id').toBin(account, writer)
+
+class DBProvEntityBINDAOBase(BINDAO):
+
+    def __init__(self, daoList):
+        self.daoList = daoList
+
+    def getDao(self, dao):
+        return self.daoList[dao]
+
+    def fromBin(self, reader):
+        read_value = reader.read_value
+
+        # read attributes
+        id = read_value()
+
+        # read children
+        prov_type = reader.read_value()
+        prov_label = reader.read_value()
+        prov_value = reader.read_value()
+        vt_id = reader.read_value()
+        vt_type = reader.read_value()
+        vt_desc = reader.read_value()
+        vt_package = reader.read_value()
+        vt_version = reader.read_value()
+        vt_cache = reader.read_value()
+        vt_location_x = reader.read_value()
+        vt_location_y = reader.read_value()
+        is_part_of = None
+        if reader.read_count():
+            is_part_of = self.getDao('is_part_of').fromBin(reader)
+
+        obj = DBProvEntity(id=id, prov_type=prov_type, prov_label=prov_label, prov_value=prov_value, vt_id=vt_id, vt_type=vt_type, vt_desc=vt_desc, vt_package=vt_package, vt_version=vt_version, vt_cache=vt_cache, vt_location_x=vt_location_x, vt_location_y=vt_location_y, is_part_of=is_part_of)
+        obj.is_dirty = False
+        return obj
+
+    def toBin(self, prov_entity, writer):
+        write_value = writer.write_value
+
+        # write attributes
+        write_value(prov_entity.db_id)
+
+        # write children
+        prov_type = prov_entity.db_prov_type
+        writer.write_value(prov_type)
+        prov_label = prov_entity.db_prov_label
+        writer.write_value(prov_label)
+        prov_value = prov_entity.db_prov_value
+        writer.write_value(prov_value)
+        vt_id = prov_entity.db_vt_id
+        writer.write_value(vt_id)
+        vt_type = prov_entity.db_vt_type
+        writer.write_value(vt_type)
+        vt_desc = prov_entity.db_vt_desc
+        writer.write_value(vt_desc)
+        vt_package = prov_entity.db_vt_package
+        writer.write_value(vt_package)
+        vt_version = prov_entity.db_vt_version
+        writer.write_value(vt_version)
+        vt_cache = prov_entity.db_vt_cache
+        writer.write_value(vt_cache)
+        vt_location_x = prov_entity.db_vt_location_x
+        writer.write_value(vt_location_x)
+        vt_location_y = prov_entity.db_vt_location_y
+        writer.write_value(vt_location_y)
+        is_part_of = prov_entity.db_is_part_of
+        if is_part_of is not None:
+            writer.write_count(1)
+            self.getDao('is_part_of').toBin(is_part_of, writer)
+        else:
+            writer.write_count(0)
+
+class DBAnnotationBINDAOBase(BINDAO):
+
+    def __init__(self, daoList):
+        self.daoList = daoList
+
+    def getDao(self, dao):
+        return self.daoList[dao]
+
+    def fromBin(self, reader):
+        read_value = reader.read_value
+
+        # read attributes
+        id = read_value()
+        key = read_value()
+        value = read_value()
+
+        obj = DBAnnotation(id=id, key=key, value=value)
+        obj.is_dirty = False
+        return obj
+
+    def toBin(self, annotation, writer):
+        write_value = writer.write_value
+
+        # write attributes
+        write_value(annotation.db_id)
+        write_value(annotation.db_key)
+        write_value(annotation.db_value)
+
+class DBOpmTimeBINDAOBase(BINDAO):
+
+    def __init__(self, daoList):
+        self.daoList = daoList
+
+    def getDao(self, dao):
+        return self.daoList[dao]
+
+    def fromBin(self, reader):
+        read_value = reader.read_value
+
+        # read attributes
+        no_later_than = read_value()
+        no_earlier_than = read_value()
+        clock_id = read_value()
+
+        obj = DBOpmTime(no_later_than=no_later_than, no_earlier_than=no_earlier_than, clock_id=clock_id)
+        obj.is_dirty = False
+        return obj
+
+    def toBin(self, opm_time, writer):
+        write_value = writer.write_value
+
+        # write attributes
+        write_value(opm_time.db_no_later_than)
+        write_value(opm_time.db_no_earlier_than)
+        write_value(opm_time.db_clock_id)
+
+class DBParameterExplorationBINDAOBase(BINDAO):
+
+    def __init__(self, daoList):
+        self.daoList = daoList
+
+    def getDao(self, dao):
+        return self.daoList[dao]
+
+    def fromBin(self, reader):
+        read_value = reader.read_value
+
+        # read attributes
+        id = read_value()
+        action_id = read_value()
+        name = read_value()
+        date = read_value()
+        user = read_value()
+        dims = read_value()
+        layout = read_value()
+
+        # read children
+        functions = []
+        for i in xrange(reader.read_count()):
+            _data = self.getDao('pe_function').fromBin(reader)
+            functions.append(_data)
+
+        obj = DBParameterExploration(id=id, action_id=action_id, name=name, date=date, user=user, dims=dims, layout=layout, functions=functions)
+        obj.is_dirty = False
+        return obj
+
+    def toBin(self, parameter_exploration, writer):
+        write_value = writer.write_value
+
+        # write attributes
+        write_value(parameter_exploration.db_id)
+        write_value(parameter_exploration.db_action_id)
+        write_value(parameter_exploration.db_name)
+        write_value(parameter_exploration.db_date)
+        write_value(parameter_exploration.db_user)
+        write_value(parameter_exploration.db_dims)
+        write_value(parameter_exploration.db_layout)
+
+        # write children
+        functions = parameter_exploration.db_functions
+        writer.write_count(len(functions))
+        for function in functions:
+            self.getDao('pe_function').toBin(function, writer)
+
+class DBMashupActionAnnotationBINDAOBase(BINDAO):
+
+    def __init__(self, daoList):
+        self.daoList = daoList
+
+    def getDao(self, dao):
+        return self.daoList[dao]
+
+    def fromBin(self, reader):
+        read_value = reader.read_value
+
+        # read attributes
+        id = read_value()
+        key = read_value()
+        value = read_value()
+        action_id = read_value()
+        date = read_value()
+        user = read_value()
+
+        obj = DBMashupActionAnnotation(id=id, key=key, value=value, action_id=action_id, date=date, user=user)
+        obj.is_dirty = False
+        return obj
+
+    def toBin(self, mashup_actionAnnotation, writer):
+        write_value = writer.write_value
+
+        # write attributes
+        write_value(mashup_actionAnnotation.db_id)
+        write_value(mashup_actionAnnotation.db_key)
+        write_value(mashup_actionAnnotation.db_value)
+        write_value(mashup_actionAnnotation.db_action_id)
+        write_value(mashup_actionAnnotation.db_date)
+        write_value(mashup_actionAnnotation.db_user)
+
+class DBOpmProcessBINDAOBase(BINDAO):
+
+    def __init__(self, daoList):
+        self.daoList = daoList
+
+    def getDao(self, dao):
+        return self.daoList[dao]
+
+    def fromBin(self, reader):
+        read_value = reader.read_value
+
+        # read attributes
+        id = read_value()
+
+        # read children
+        value = None
+        if reader.read_count():
+            value = self.getDao('opm_process_value').fromBin(reader)
+        accounts = []
+        for i in xrange(reader.read_count()):
+            _data = self.getDao('opm_account_id').fromBin(reader)
+            accounts.append(_data)
+
+        obj = DBOpmProcess(id=id, value=value, accounts=accounts)
+        obj.is_dirty = False
+        return obj
+
+    def toBin(self, opm_process, writer):
+        write_value = writer.write_value
+
+        # write attributes
+        write_value(opm_process.db_id)
+
+        # write children
+        value = opm_process.db_value
+        if value is not None:
+            writer.write_count(1)
+            self.getDao('opm_process_value').toBin(value, writer)
+        else:
+            writer.write_count(0)
+        accounts = opm_process.db_accounts
+        writer.write_count(len(accounts))
+        for account in accounts:
+            self.getDao('opm_account_id').toBin(account, writer)
+
+class DBDisabledPackagesBINDAOBase(BINDAO):
+
+    def __init__(self, daoList):
+        self.daoList = daoList
+
+    def getDao(self, dao):
+        return self.daoList[dao]
+
+    def fromBin(self, reader):
+        # read children
+        packages = []
+        for i in xrange(reader.read_count()):
+            _data = self.getDao('startup_package').fromBin(reader)
+            packages.append(_data)
+
+        obj = DBDisabledPackages(packages=packages)
+        obj.is_dirty = False
+        return obj
+
+    def toBin(self, disabled_packages, writer):
+        # write children
+        packages = disabled_packages.db_packages
+        writer.write_count(len(packages))
+        for package in packages:
+            self.getDao('startup_package').toBin(package, writer)
+
+class DBModuleExecBINDAOBase(BINDAO):
+
+    def __init__(self, daoList):
+        self.daoList = daoList
+
+    def getDao(self, dao):
+        return self.daoList[dao]
+
+    def fromBin(self, reader):
+        read_value = reader.read_value
+
+        # read attributes
+        id = read_value()
+        ts_start = read_value()
+        ts_end = read_value()
+        cached = read_value()
+        module_id = read_value()
+        module_name = read_value()
+        completed = read_value()
+        error = read_value()
+        machine_id = read_value()
+
+        # read children
+        annotations = []
+        for i in xrange(reader.read_count()):
+            _data = self.getDao('annotation').fromBin(reader)
+            annotations.append(_data)
+        loop_execs = []
+        for i in xrange(reader.read_count()):
+            _data = self.getDao('loop_exec').fromBin(reader)
+            loop_execs.append(_data)
+
+        obj = DBModuleExec(id=id, ts_start=ts_start, ts_end=ts_end, cached=cached, module_id=module_id, module_name=module_name, completed=completed, error=error, machine_id=machine_id, annotations=annotations, loop_execs=loop_execs)
+        obj.is_dirty = False
+        return obj
+
+    def toBin(self, module_exec, writer):
+        write_value = writer.write_value
+
+        # write attributes
+        write_value(module_exec.db_id)
+        write_value(module_exec.db_ts_start)
+        write_value(module_exec.db_ts_end)
+        write_value(module_exec.db_cached)
+        write_value(module_exec.db_module_id)
+        write_value(module_exec.db_module_name)
+        write_value(module_exec.db_completed)
+        write_value(module_exec.db_error)
+        write_value(module_exec.db_machine_id)
+
+        # write children
+        annotations = module_exec.db_annotations
+        writer.write_count(len(annotations))
+        for annotation in annotations:
+            self.getDao('annotation').toBin(annotation, writer)
+        loop_execs = module_exec.db_loop_execs
+        writer.write_count(len(loop_execs))
+        for loop_exec in loop_execs:
+            self.getDao('loop_exec').toBin(loop_exec, writer)
+
+class DBProvAssociationBINDAOBase(BINDAO):
+
+    def __init__(self, daoList):
+        self.daoList = daoList
+
+    def getDao(self, dao):
+        return self.daoList[dao]
+
+    def fromBin(self, reader):
+        # read children
+        prov_activity = None
+        if reader.read_count():
+            prov_activity = self.getDao('ref_prov_activity').fromBin(reader)
+        prov_agent = None
+        if reader.read_count():
+            prov_agent = self.getDao('ref_prov_agent').fromBin(reader)
+        prov_plan = None
+        if reader.read_count():
+            prov_plan = self.getDao('ref_prov_plan').fromBin(reader)
+        prov_role = reader.read_value()
+
+        obj = DBProvAssociation(prov_activity=prov_activity, prov_agent=prov_agent, prov_plan=prov_plan, prov_role=prov_role)
+        obj.is_dirty = False
+        return obj
+
+    def toBin(self, prov_association, writer):
+        # write children
+        prov_activity = prov_association.db_prov_activity
+        if prov_activity is not None:
+            writer.write_count(1)
+            self.getDao('ref_prov_activity').toBin(prov_activity, writer)
+        else:
+            writer.write_count(0)
+        prov_agent = prov_association.db_prov_agent
+        if prov_agent is not None:
+            writer.write_count(1)
+            self.getDao('ref_prov_agent').toBin(prov_agent, writer)
+        else:
+            writer.write_count(0)
+        prov_plan = prov_association.db_prov_plan
+        if prov_plan is not None:
+            writer.write_count(1)
+            self.getDao('ref_prov_plan').toBin(prov_plan, writer)
+        else:
+            writer.write_count(0)
+        prov_role = prov_association.db_prov_role
+        writer.write_value(prov_role)
+
+class DBOpmProcessValueBINDAOBase(BINDAO):
+
+    def __init__(self, daoList):
+        self.daoList = daoList
+
+    def getDao(self, dao):
+        return self.daoList[dao]
+
+    def fromBin(self, reader):
+        # read children
+        value = None
+        _tag = reader.read_count()
+        if _tag == 1:
+            value = self.getDao('module_exec').fromBin(reader)
+        elif _tag == 2:
+            value = self.getDao('group_exec').fromBin(reader)
+        elif _tag == 3:
+            value = self.getDao('loop_exec').fromBin(reader)
+
+        obj = DBOpmProcessValue(value=value)
+        obj.is_dirty = False
+        return obj
+
+    def toBin(self, opm_process_value, writer):
+        # write children
+        value = opm_process_value.db_value
+        if value is not None and value.vtType == 'module_exec':
+            writer.write_count(1)
+            self.getDao('module_exec').toBin(value, writer)
+        elif value is not None and value.vtType == 'group_exec':
+            writer.write_count(2)
+            self.getDao('group_exec').toBin(value, writer)
+        elif value is not None and value.vtType == 'loop_exec':
+            writer.write_count(3)
+            self.getDao('loop_exec').toBin(value, writer)
+        else:
+            writer.write_count(0)
+
+"""generated automatically by auto_dao.py"""
+
+class BINDAOListBase(dict):
+
+    def __init__(self, daos=None):
+        if daos is not None:
+            dict.update(self, daos)
+
+        if 'opm_was_generated_by' not in self:
+            self['opm_was_generated_by'] = DBOpmWasGeneratedByBINDAOBase(self)
+        if 'config_key' not in self:
+            self['config_key'] = DBConfigKeyBINDAOBase(self)
+        if 'mashup_alias' not in self:
+            self['mashup_alias'] = DBMashupAliasBINDAOBase(self)
+        if 'group' not in self:
+            self['group'] = DBGroupBINDAOBase(self)
+        if 'opm_was_controlled_by' not in self:
+            self['opm_was_controlled_by'] = DBOpmWasControlledByBINDAOBase(self)
+        if 'add' not in self:
+            self['add'] = DBAddBINDAOBase(self)
+        if 'prov_generation' not in self:
+            self['prov_generation'] = DBProvGenerationBINDAOBase(self)
+        if 'opm_used' not in self:
+            self['opm_used'] = DBOpmUsedBINDAOBase(self)
+        if 'opm_artifact_id_cause' not in self:
+            self['opm_artifact_id_cause'] = DBOpmArtifactIdCauseBINDAOBase(self)
+        if 'ref_prov_entity' not in self:
+            self['ref_prov_entity'] = DBRefProvEntityBINDAOBase(self)
+        if 'vt_connection' not in self:
+            self['vt_connection'] = DBVtConnectionBINDAOBase(self)
+        if 'opm_account' not in self:
+            self['opm_account'] = DBOpmAccountBINDAOBase(self)
+        if 'group_exec' not in self:
+            self['group_exec'] = DBGroupExecBINDAOBase(self)
+        if 'opm_agent_id' not in self:
+            self['opm_agent_id'] = DBOpmAgentIdBINDAOBase(self)
+        if 'parameter' not in self:
+            self['parameter'] = DBParameterBINDAOBase(self)
+        if 'vistrail' not in self:
+            self['vistrail'] = DBVistrailBINDAOBase(self)
+        if 'opm_artifact_value' not in self:
+            self['opm_artifact_value'] = DBOpmArtifactValueBINDAOBase(self)
+        if 'config_str' not in self:
+            self['config_str'] = DBConfigStrBINDAOBase(self)
+        if 'startup' not in self:
+            self['startup'] = DBStartupBINDAOBase(self)
+        if 'module' not in self:
+            self['module'] = DBModuleBINDAOBase(self)
+        if 'port' not in self:
+            self['port'] = DBPortBINDAOBase(self)
+        if 'opm_agents' not in self:
+            self['opm_agents'] = DBOpmAgentsBINDAOBase(self)
+        if 'opm_dependencies' not in self:
+            self['opm_dependencies'] = DBOpmDependenciesBINDAOBase(self)
+        if 'pe_function' not in self:
+            self['pe_function'] = DBPEFunctionBINDAOBase(self)
+        if 'workflow' not in self:
+            self['workflow'] = DBWorkflowBINDAOBase(self)
+        if 'mashup_action' not in self:
+            self['mashup_action'] = DBMashupActionBINDAOBase(self)
+        if 'configuration' not in self:
+            self['configuration'] = DBConfigurationBINDAOBase(self)
+        if 'change' not in self:
+            self['change'] = DBChangeBINDAOBase(self)
+        if 'package' not in self:
+            self['package'] = DBPackageBINDAOBase(self)
+        if 'loop_exec' not in self:
+            self['loop_exec'] = DBLoopExecBINDAOBase(self)
+        if 'connection' not in self:
+            self['connection'] = DBConnectionBINDAOBase(self)
+        if 'config_bool' not in self:
+            self['config_bool'] = DBConfigBoolBINDAOBase(self)
+        if 'action' not in self:
+            self['action'] = DBActionBINDAOBase(self)
+        if 'startup_package' not in self:
+            self['startup_package'] = DBStartupPackageBINDAOBase(self)
+        if 'config_int' not in self:
+            self['config_int'] = DBConfigIntBINDAOBase(self)
+        if 'opm_process_id_effect' not in self:
+            self['opm_process_id_effect'] = DBOpmProcessIdEffectBINDAOBase(self)
+        if 'ref_prov_plan' not in self:
+            self['ref_prov_plan'] = DBRefProvPlanBINDAOBase(self)
+        if 'opm_accounts' not in self:
+            self['opm_accounts'] = DBOpmAccountsBINDAOBase(self)
+        if 'ref_prov_agent' not in self:
+            self['ref_prov_agent'] = DBRefProvAgentBINDAOBase(self)
+        if 'portSpec' not in self:
+            self['portSpec'] = DBPortSpecBINDAOBase(self)
+        if 'enabled_packages' not in self:
+            self['enabled_packages'] = DBEnabledPackagesBINDAOBase(self)
+        if 'opm_artifact' not in self:
+            self['opm_artifact'] = DBOpmArtifactBINDAOBase(self)
+        if 'log' not in self:
+            self['log'] = DBLogBINDAOBase(self)
+        if 'loop_iteration' not in self:
+            self['loop_iteration'] = DBLoopIterationBINDAOBase(self)
+        if 'opm_process_id_cause' not in self:
+            self['opm_process_id_cause'] = DBOpmProcessIdCauseBINDAOBase(self)
+        if 'opm_artifacts' not in self:
+            self['opm_artifacts'] = DBOpmArtifactsBINDAOBase(self)
+        if 'pe_parameter' not in self:
+            self['pe_parameter'] = DBPEParameterBINDAOBase(self)
+        if 'workflow_exec' not in self:
+            self['workflow_exec'] = DBWorkflowExecBINDAOBase(self)
+        if 'location' not in self:
+            self['location'] = DBLocationBINDAOBase(self)
+        if 'function' not in self:
+            self['function'] = DBFunctionBINDAOBase(self)
+        if 'actionAnnotation' not in self:
+            self['actionAnnotation'] = DBActionAnnotationBINDAOBase(self)
+        if 'prov_activity' not in self:
+            self['prov_activity'] = DBProvActivityBINDAOBase(self)
+        if 'prov_usage' not in self:
+            self['prov_usage'] = DBProvUsageBINDAOBase(self)
+        if 'opm_artifact_id_effect' not in self:
+            self['opm_artifact_id_effect'] = DBOpmArtifactIdEffectBINDAOBase(self)
+        if 'opm_graph' not in self:
+            self['opm_graph'] = DBOpmGraphBINDAOBase(self)
+        if 'is_part_of' not in self:
+            self['is_part_of'] = DBIsPartOfBINDAOBase(self)
+        if 'opm_was_derived_from' not in self:
+            self['opm_was_derived_from'] = DBOpmWasDerivedFromBINDAOBase(self)
+        if 'controlParameter' not in self:
+            self['controlParameter'] = DBControlParameterBINDAOBase(self)
+        if 'plugin_data' not in self:
+            self['plugin_data'] = DBPluginDataBINDAOBase(self)
+        if 'delete' not in self:
+            self['delete'] = DBDeleteBINDAOBase(self)
+        if 'vistrailVariable' not in self:
+            self['vistrailVariable'] = DBVistrailVariableBINDAOBase(self)
+        if 'opm_overlaps' not in self:
+            self['opm_overlaps'] = DBOpmOverlapsBINDAOBase(self)
+        if 'opm_was_triggered_by' not in self:
+            self['opm_was_triggered_by'] = DBOpmWasTriggeredByBINDAOBase(self)
+        if 'module_descriptor' not in self:
+            self['module_descriptor'] = DBModuleDescriptorBINDAOBase(self)
+        if 'tag' not in self:
+            self['tag'] = DBTagBINDAOBase(self)
+        if 'opm_role' not in self:
+            self['opm_role'] = DBOpmRoleBINDAOBase(self)
+        if 'prov_document' not in self:
+            self['prov_document'] = DBProvDocumentBINDAOBase(self)
+        if 'opm_processes' not in self:
+            self['opm_processes'] = DBOpmProcessesBINDAOBase(self)
+        if 'opm_account_id' not in self:
+            self['opm_account_id'] = DBOpmAccountIdBINDAOBase(self)
+        if 'portSpecItem' not in self:
+            self['portSpecItem'] = DBPortSpecItemBINDAOBase(self)
+        if 'mashup_component' not in self:
+            self['mashup_component'] = DBMashupComponentBINDAOBase(self)
+        if 'mashup' not in self:
+            self['mashup'] = DBMashupBINDAOBase(self)
+        if 'machine' not in self:
+            self['machine'] = DBMachineBINDAOBase(self)
+        if 'config_float' not in self:
+            self['config_float'] = DBConfigFloatBINDAOBase(self)
+        if 'other' not in self:
+            self['other'] = DBOtherBINDAOBase(self)
+        if 'ref_prov_activity' not in self:
+            self['ref_prov_activity'] = DBRefProvActivityBINDAOBase(self)
+        if 'abstraction' not in self:
+            self['abstraction'] = DBAbstractionBINDAOBase(self)
+        if 'prov_agent' not in self:
+            self['prov_agent'] = DBProvAgentBINDAOBase(self)
+        if 'mashuptrail' not in self:
+            self['mashuptrail'] = DBMashuptrailBINDAOBase(self)
+        if 'registry' not in self:
+            self['registry'] = DBRegistryBINDAOBase(self)
+        if 'opm_agent' not in self:
+            self['opm_agent'] = DBOpmAgentBINDAOBase(self)
+        if 'prov_entity' not in self:
+            self['prov_entity'] = DBProvEntityBINDAOBase(self)
+        if 'annotation' not in self:
+            self['annotation'] = DBAnnotationBINDAOBase(self)
+        if 'opm_time' not in self:
+            self['opm_time'] = DBOpmTimeBINDAOBase(self)
+        if 'parameter_exploration' not in self:
+            self['parameter_exploration'] = DBParameterExplorationBINDAOBase(self)
+        if 'mashup_actionAnnotation' not in self:
+            self['mashup_actionAnnotation'] = DBMashupActionAnnotationBINDAOBase(self)
+        if 'opm_process' not in self:
+            self['opm_process'] = DBOpmProcessBINDAOBase(self)
+        if 'disabled_packages' not in self:
+            self['disabled_packages'] = DBDisabledPackagesBINDAOBase(self)
+        if 'module_exec' not in self:
+            self['module_exec'] = DBModuleExecBINDAOBase(self)
+        if 'prov_association' not in self:
+            self['prov_association'] = DBProvAssociationBINDAOBase(self)
+        if 'opm_process_value' not in self:
+            self['opm_process_value'] = DBOpmProcessValueBINDAOBase(self)
@@ -0,0 +1,214 @@
+###############################################################################
+##
+## Copyright (C) 2011-2014, NYU-Poly.
+## Copyright (C) 2006-2011, University of Utah. 
+## All rights reserved.
+## Contact: contact@vistrails.org
+##
+## This file is part of VisTrails.
+##
+## "Redistribution and use in source and binary forms, with or without 
+## modification, are permitted provided that the following conditions are met:
+##
+##  - Redistributions of source code must retain the above copyright notice, 
+##    this list of conditions and the following disclaimer.
+##  - Redistributions in binary form must reproduce the above copyright 
+##    notice, this list of conditions and the following disclaimer in the 
+##    documentation and/or other materials provided with the distribution.
+##  - Neither the name of the University of Utah nor the names of its 
+##    contributors may be used to endorse or promote products derived from 
+##    this software without specific prior written permission.
+##
+## THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" 
+## AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, 
+## THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR 
+## PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR 
+## CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, 
+## EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, 
+## PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; 
+## OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, 
+## WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR 
+## OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF 
+## ADVISED OF THE POSSIBILITY OF SUCH DAMAGE."
+##
+###############################################################################
+
+"""Compact binary encoding used by the generated BIN DAOs.
+
+Values are written with a one-byte tag followed by their payload, a bit
+like msgpack: small non-negative integers fit in the tag itself, larger
+integers are zigzag varints, strings are length-prefixed. Counts (list
+lengths, choice tags and presence flags) are plain varints since the DAOs
+know where to expect them.
+
+"""
+
+from datetime import date, datetime
+import struct
+
+T_NONE = 0x00
+T_FALSE = 0x01
+T_TRUE = 0x02
+T_INT = 0x03
+T_FLOAT = 0x04
+T_STR = 0x05
+T_UNICODE = 0x06
+T_DATETIME = 0x07
+T_DATE = 0x08
+# tags 0x80-0xff hold the integers 0-127
+T_FIXINT = 0x80
+
+_double = struct.Struct('>d')
+_datetime = struct.Struct('>HBBBBBI')
+_date = struct.Struct('>HBB')
+
+class BINDAO(object):
+    def __init__(self):
+        pass
+
+class BINWriter(object):
+    """BINWriter(file) encodes values into file. The output is buffered
+    and only written out on flush()."""
+
+    BUFFER_SIZE = 4096
+
+    def __init__(self, file):
+        self._file = file
+        self._chunks = []
+
+    def flush(self):
+        self._file.write(''.join(self._chunks))
+        self._chunks = []
+
+    def _append(self, data):
+        self._chunks.append(data)
+        if len(self._chunks) >= self.BUFFER_SIZE:
+            self.flush()
+
+    def write_count(self, n):
+        if n < 0x80:
+            self._append(chr(n))
+            return
+        out = []
+        while n >= 0x80:
+            out.append(chr((n & 0x7f) | 0x80))
+            n >>= 7
+        out.append(chr(n))
+        self._append(''.join(out))
+
+    def write_bytes(self, data):
+        self.write_count(len(data))
+        self._append(data)
+
+    def write_value(self, value):
+        # bool is tested before int since it is a subclass
+        if value is None:
+            self._append(chr(T_NONE))
+        elif value is True:
+            self._append(chr(T_TRUE))
+        elif value is False:
+            self._append(chr(T_FALSE))
+        elif isinstance(value, (int, long)):
+            if 0 <= value < 0x80:
+                self._append(chr(T_FIXINT | value))
+            else:
+                self._append(chr(T_INT))
+                if value >= 0:
+                    self.write_count(value << 1)
+                else:
+                    self.write_count(((-value) << 1) - 1)
+        elif isinstance(value, str):
+            self._append(chr(T_STR))
+            self.write_bytes(value)
+        elif isinstance(value, unicode):
+            self._append(chr(T_UNICODE))
+            self.write_bytes(value.encode('utf-8'))
+        elif isinstance(value, float):
+            self._append(chr(T_FLOAT))
+            self._append(_double.pack(value))
+        elif isinstance(value, datetime):
+            self._append(chr(T_DATETIME))
+            self._append(_datetime.pack(value.year, value.month, value.day,
+                                        value.hour, value.minute,
+                                        value.second, value.microsecond))
+        elif isinstance(value, date):
+            self._append(chr(T_DATE))
+            self._append(_date.pack(value.year, value.month, value.day))
+        else:
+            # same as what the xml DAOs would store
+            self._append(chr(T_STR))
+            self.write_bytes(str(value))
+
+class BINReader(object):
+    """BINReader(data) decodes the values written by BINWriter from the
+    string data. Reading past the end raises IndexError or struct.error.
+    """
+
+    def __init__(self, data, pos=0):
+        self._data = data
+        self._pos = pos
+
+    def at_end(self):
+        return self._pos >= len(self._data)
+
+    def read_count(self):
+        data = self._data
+        pos = self._pos
+        b = ord(data[pos])
+        pos += 1
+        if b < 0x80:
+            self._pos = pos
+            return b
+        n = b & 0x7f
+        shift = 7
+        while True:
+            b = ord(data[pos])
+            pos += 1
+            n |= (b & 0x7f) << shift
+            if b < 0x80:
+                break
+            shift += 7
+        self._pos = pos
+        return n
+
+    def read_bytes(self):
+        n = self.read_count()
+        pos = self._pos
+        if pos + n > len(self._data):
+            raise IndexError("string extends past end of data")
+        self._pos = pos + n
+        return self._data[pos:pos + n]
+
+    def read_value(self):
+        tag = ord(self._data[self._pos])
+        self._pos += 1
+        if tag >= T_FIXINT:
+            return tag & 0x7f
+        elif tag == T_STR:
+            return self.read_bytes()
+        elif tag == T_NONE:
+            return None
+        elif tag == T_INT:
+            n = self.read_count()
+            if n & 1:
+                return -((n + 1) >> 1)
+            return n >> 1
+        elif tag == T_UNICODE:
+            return self.read_bytes().decode('utf-8')
+        elif tag == T_TRUE:
+            return True
+        elif tag == T_FALSE:
+            return False
+        elif tag == T_FLOAT:
+            value, = _double.unpack_from(self._data, self._pos)
+            self._pos += _double.size
+            return value
+        elif tag == T_DATETIME:
+            value = datetime(*_datetime.unpack_from(self._data, self._pos))
+            self._pos += _datetime.size
+            return value
+        elif tag == T_DATE:
+            value = date(*_date.unpack_from(self._data, self._pos))
+            self._pos += _date.size
+            return value
+        raise ValueError("unknown value tag %d" % tag)
@@ -134,9 +134,15 @@ class SQLDAO:
         whereClause = ''
         values = []
         for column, value in whereMap.iteritems():
-            whereStr += '%s%s = %%s' % \
-                        (whereClause, column)
-            values.append(value)
+            if isinstance(value, (list, tuple)):
+                # select the rows of several parents at once
+                whereStr += '%s%s IN (%s)' % \
+                            (whereClause, column, ','.join(['%s'] * len(value)))
+                values.extend(value)
+            else:
+                whereStr += '%s%s = %%s' % \
+                            (whereClause, column)
+                values.append(value)
             whereClause = ' AND '
         dbCommand = """SELECT %s FROM %s WHERE %s""" % \
                     (columnStr, table, whereStr)
@@ -249,6 +255,43 @@ class SQLDAO:
             n += BUNDLE_SIZE
         return data
 
+    def executeSQLBatch(self, db, dbCommandList):
+        """ Executes INSERT and UPDATE statements, grouping the ones that
+            share the same prepared statement into executemany calls so
+            that the rows of a table are sent together.
+            It returns a list with the lastrowid of each statement, or None
+            for the statements that were executed as part of a batch.
+        """
+        BATCH_SIZE = 1000
+        groups = {}
+        order = []
+        for i, (prepared, values) in enumerate(dbCommandList):
+            if prepared not in groups:
+                groups[prepared] = []
+                order.append(prepared)
+            groups[prepared].append(i)
+
+        data = [None] * len(dbCommandList)
+        cur = db.cursor()
+        try:
+            for prepared in order:
+                indices = groups[prepared]
+                if len(indices) == 1:
+                    values = dbCommandList[indices[0]][1]
+                    cur.execute(prepared, values)
+                    data[indices[0]] = cur.lastrowid
+                    continue
+                for n in xrange(0, len(indices), BATCH_SIZE):
+                    values = [dbCommandList[i][1]
+                              for i in indices[n:n + BATCH_SIZE]]
+                    cur.executemany(prepared, values)
+        except Exception, e:
+            raise VistrailsDBException('Command "%s" failed: %s' %
+                                       (prepared, e))
+        finally:
+            cur.close()
+        return data
+
     def start_transaction(self, db):
         db.begin()
 
@@ -555,6 +555,17 @@ class VistrailsApplicationSingleton(VistrailsApplicationInterface,
                 errs.extend(
                     vistrails.core.console_mode.run_parameter_explorations(
                         w_list, extra_info=extra_info))
+            elif (self.temp_configuration.check('jobs') > 1 or
+                  self.temp_configuration.check('batchReport')):
+                errs.extend(vistrails.core.console_mode.run_batch(
+                        w_list,
+                        self.temp_configuration.check('parameters')
+                            or '',
+                        output_dir, update_vistrail=True,
+                        extra_info=extra_info,
+                        jobs=self.temp_configuration.check('jobs') or 1,
+                        report=self.temp_configuration.check('batchReport')
+                            or None))
             else:
                 errs.extend(vistrails.core.console_mode.run(
                         w_list,
@@ -75,6 +75,7 @@ import gc
 
 import vistrails.core.requirements
 import vistrails.core.console_mode
+from vistrails.core.worker_pool import WorkerPool, run_workflows
 
 from vistrails.db.versions import currentVersion
 
@@ -118,9 +119,10 @@ class RequestHandler(object):
     """This class will handle all the requests sent to the server.
     Add new methods here and they will be exposed through the XML-RPC interface
     """
-    def __init__(self, logger, instances):
+    def __init__(self, logger, instances, worker_pool=None):
         self.server_logger = logger
         self.instances = instances
+        self.worker_pool = worker_pool
         self.proxies_queue = None
         self.instantiate_proxies()
 
@@ -179,6 +181,31 @@ class RequestHandler(object):
     def try_ping(self):
         return 1
 
+    def get_worker_pool_status(self):
+        """get_worker_pool_status() -> (dict, int)
+        Returns the number of workers, queued and running workflow
+        executions, and the latency statistics of the worker pool.
+        """
+        if self.worker_pool is None:
+            return ("This server has no worker pool", 0)
+        return (self.worker_pool.status(), 1)
+
+    def _run_and_get_results(self, w_list, parameters='', **kwargs):
+        """_run_and_get_results(w_list: list of (locator, version),
+                                parameters: str, **kwargs) -> list
+        Executes the workflows on the worker pool if the server has one,
+        in this process otherwise. The leading underscore keeps it out of
+        the XML-RPC interface.
+        """
+        if self.worker_pool is not None:
+            self.server_logger.info("Queueing execution, pool status: %s" %
+                                    self.worker_pool.status())
+            return self.worker_pool.run(run_workflows, (w_list, parameters),
+                                        kwargs)
+        return vistrails.core.console_mode.run_and_get_results(w_list,
+                                                               parameters,
+                                                               **kwargs)
+
     #crowdlabs
     def get_wf_modules(self, host, port, db_name, vt_id, version):
         """get_wf_modules(host:str, port:int, db_name:str, vt_id:int,
@@ -784,7 +811,7 @@ class RequestHandler(object):
                                 try:
                                     gc.collect()
                                     results = \
-                                      vistrails.core.console_mode.run_and_get_results(
+                                      self._run_and_get_results(
                                                     [(locator,int(workflow))],
                                                     s_alias,
                                                     update_vistrail=False,
@@ -831,7 +858,7 @@ class RequestHandler(object):
                             self.server_logger.info("Not sequence aliases: %s"% s_alias)
                         try:
                             results = \
-                               vistrails.core.console_mode.run_and_get_results(
+                               self._run_and_get_results(
                                                 [(locator,int(workflow))],
                                                     s_alias,
                                                     extra_info=extra_info)
@@ -975,7 +1002,7 @@ class RequestHandler(object):
                 self.server_logger.info("run_and_get_results(%s,%s,%s,%s,%s)" % \
                             (locator, version, parameters, True, extra_info))
                 try:
-                    results = vistrails.core.console_mode.run_and_get_results(
+                    results = self._run_and_get_results(
                             [(locator, int(version))],
                             parameters,
                             update_vistrail=True,
@@ -2089,6 +2116,7 @@ class VistrailsServerSingleton(VistrailsApplicationInterface,
 
         self.rpcserver = None
         self.pingserver = None
+        self.worker_pool = None
         self.images_url = "http://vistrails.sci.utah.edu/medleys/images/"
         qt.allowQObjects()
 
@@ -2249,6 +2277,8 @@ class VistrailsServerSingleton(VistrailsApplicationInterface,
                                               self.temp_configuration.check('rpcPort'))
         self.load_config(self.temp_configuration.check('rpcConfig'))
         self.start_other_instances(self.temp_configuration.check('rpcInstances'))
+        self.start_worker_pool(self.temp_configuration.check('rpcWorkers'),
+                               self.temp_configuration.check('rpcTimeout'))
         self._initialized = True
         return True
 
@@ -2271,6 +2301,19 @@ class VistrailsServerSingleton(VistrailsApplicationInterface,
                                           "%s port: %s") % (virtual_display, port))
                 self.server_logger.error(str(e))
 
+    def start_worker_pool(self, number, timeout):
+        """start_worker_pool(number: int, timeout: int) -> None
+        Forks the worker processes executing workflows for this server.
+        They are started now, with the packages loaded, so requests don't
+        pay for the initialization. timeout is the number of seconds an
+        execution may take, 0 meaning no limit.
+        """
+        if not number:
+            return
+        self.worker_pool = WorkerPool(number, timeout or None)
+        self.worker_pool.start()
+        self.server_logger.info("Started %d worker processes" % number)
+
     def stop_other_instances(self):
         script = os.path.join(system.vistrails_root_directory(), "stop_vistrails_server.py")
         for o in self.others:
@@ -2311,10 +2354,12 @@ class VistrailsServerSingleton(VistrailsApplicationInterface,
             self.server_logger.info("    singlethreaded instance")
         #self.rpcserver.register_introspection_functions()
         self.rpcserver.register_instance(RequestHandler(self.server_logger,
-                                                        self.others))
+                                                        self.others,
+                                                        self.worker_pool))
         if self.pingserver:
             self.pingserver.register_instance(RequestHandler(
-                                                      self.server_logger, []))
+                                                      self.server_logger, [],
+                                                      self.worker_pool))
             self.server_logger.info(
                        "Status XML RPC Server is listening on http://%s:%s"% \
                             (self.temp_configuration.check('rpcServer'),
@@ -2335,6 +2380,8 @@ class VistrailsServerSingleton(VistrailsApplicationInterface,
     def quit_server(self):
         result = "Vistrails XML RPC Server is quitting."
         self.stop_other_instances()
+        if self.worker_pool is not None:
+            self.worker_pool.shutdown()
         self.server_logger.info(result)
         self.rpcserver.stop = True
         return result
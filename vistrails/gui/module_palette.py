@@ -43,6 +43,7 @@ from PyQt4 import QtCore, QtGui
 from vistrails.core import get_vistrails_application
 from vistrails.core import debug
 from vistrails.core.modules.module_registry import get_module_registry
+from vistrails.core.packagemanager import get_package_manager
 from vistrails.core.system import systemType
 from vistrails.core.utils import VistrailsInternalError
 from vistrails.gui.common_widgets import (QSearchTreeWindow,
@@ -276,6 +277,14 @@ class QModuleTreeWidget(QSearchTreeWidget):
         
         """
         if item and item.parent() == None:
+            if not self.isItemExpanded(item):
+                # a package registered from the registry cache is
+                # initialized when its modules are first shown
+                identifiers = [i for i, j in self.parent().packages.iteritems()
+                               if j == weakref.ref(item)]
+                if identifiers:
+                    pm = get_package_manager()
+                    pm.initialize_deferred_packages(identifiers)
             self.setItemExpanded(item, not self.isItemExpanded(item))
 
     def contextMenuEvent(self, event):
@@ -34,6 +34,7 @@
 ###############################################################################
 from PyQt4 import QtCore, QtGui
 from vistrails.core.utils import VistrailsInternalError
+from vistrails.core.vistrail.module import Module
 from vistrails.core.vistrail.port import PortEndPoint
 from vistrails.gui.utils import show_question, SAVE_BUTTON, DISCARD_BUTTON
 from vistrails.gui.common_widgets import QPromptWidget
@@ -211,6 +212,11 @@ class _DefaultModuleConfigurationWidget(StandardModuleConfigurationWidget):
         return QtCore.QSize(384, 512)
         
     def saveTriggered(self, checked = False):
+        pipeline = self.controller.current_pipeline
+        if pipeline.modules.get(self.module.id) is self.module:
+            # the module may be shared with a copy-on-write copy
+            pipeline.db_own_object(Module.vtType, self.module.id)
+            self.module = pipeline.modules[self.module.id]
         for port in self.inputPorts:
             if (port.optional and
                 self.inputDict[port.name].checkState()==QtCore.Qt.Checked):
@@ -3072,13 +3072,17 @@ class QPipelineScene(QInteractiveGraphicsScene):
         Toggles the breakpoint attribute for the module with given id
         """
         if self.controller:
-            module = self.controller.current_pipeline.modules[id]
+            pipeline = self.controller.current_pipeline
+            pipeline.db_own_object(Module.vtType, id)
+            module = pipeline.modules[id]
             module.toggle_breakpoint()
             self.recreate_module(self.controller.current_pipeline, id)
 
     def toggle_watched(self, id):
         if self.controller:
-            module = self.controller.current_pipeline.modules[id]
+            pipeline = self.controller.current_pipeline
+            pipeline.db_own_object(Module.vtType, id)
+            module = pipeline.modules[id]
             module.toggle_watched()
 
     def print_error(self, id):
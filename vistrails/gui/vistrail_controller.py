@@ -52,7 +52,7 @@ from vistrails.core.log.opm_graph import OpmGraph
 from vistrails.core.log.prov_document import ProvDocument
 from vistrails.core.modules.abstraction import identifier as abstraction_pkg
 from vistrails.core.modules.module_registry import get_module_registry
-from vistrails.core.param_explore import ActionBasedParameterExploration
+from vistrails.core.param_explore import ParameterExplorationRunner
 from vistrails.core.query.version import TrueSearch
 from vistrails.core.query.visual import VisualQuery
 from vistrails.core.utils import DummyView, VistrailsInternalError, InvalidPipeline
@@ -1479,8 +1479,8 @@ class VistrailController(QtCore.QObject, BaseController):
 
         if self.current_pipeline and actions:
             pe_log_id = uuid.uuid1()
-            explorer = ActionBasedParameterExploration()
-            (pipelines, performedActions) = explorer.explore(
+            runner = ParameterExplorationRunner()
+            (pipelines, performedActions) = runner.explore(
                 self.current_pipeline, actions, pre_actions)
             
             dim = [max(1, len(a)) for a in actions]
@@ -1497,16 +1497,9 @@ class VistrailController(QtCore.QObject, BaseController):
                 pipelinePositions = _pipelinePositions(
                     dim[2], dim[1], dim[0], pipelines)
 
-            mCount = []
-            for p in modifiedPipelines:
-                if len(mCount)==0:
-                    mCount.append(0)
-                else:
-                    mCount.append(len(p.modules)+mCount[len(mCount)-1])
-                
             # Now execute the pipelines
             if showProgress:
-                totalProgress = sum([len(p.modules) for p in modifiedPipelines])
+                totalProgress = len(modifiedPipelines)
                 progress = QtGui.QProgressDialog('Performing Parameter '
                                                  'Exploration...',
                                                  '&Cancel',
@@ -1514,52 +1507,53 @@ class VistrailController(QtCore.QObject, BaseController):
                 progress.setWindowTitle('Parameter Exploration')
                 progress.setWindowModality(QtCore.Qt.WindowModal)
                 progress.show()
+                def pipelineExecuted(done, total):
+                    if not progress.wasCanceled():
+                        progress.setValue(done)
+                        QtCore.QCoreApplication.processEvents()
+            else:
+                pipelineExecuted = None
+
+            kwargs = {'locator': self.locator,
+                      'current_version': self.current_version,
+                      'logger': self.get_logger(),
+                      }
+            if view:
+                kwargs['view'] = view
+            if self.get_vistrail_variables():
+                # remove vars used in pe
+                vars = dict([(v.uuid, v) for v in self.get_vistrail_variables()
+                        if v.uuid not in vistrail_vars])
+                kwargs['vistrail_variables'] = lambda x: vars.get(x, None)
 
-            interpreter = get_default_interpreter()
-            
             images = {}
-            errors = []
-            for pi in xrange(len(modifiedPipelines)):
-                if showProgress:
-                    progress.setValue(mCount[pi])
-                    QtCore.QCoreApplication.processEvents()
-                    if progress.wasCanceled():
-                        break
-                    def moduleExecuted(objId):
-                        if not progress.wasCanceled():
-                            progress.setValue(progress.value()+1)
-                            QtCore.QCoreApplication.processEvents()
+            def variant_kwargs(pi):
+                pipeline_extra_info = dict(extra_info)
                 if use_spreadsheet:
                     name = os.path.splitext(self.name)[0] + \
                                          ("_%s_%s_%s" % pipelinePositions[pi])
-                    extra_info['nameDumpCells'] = name
+                    pipeline_extra_info['nameDumpCells'] = name
                     if 'pathDumpCells' in extra_info:
                         images[pipelinePositions[pi]] = \
                                    os.path.join(extra_info['pathDumpCells'], name)
                 pe_cell_id = (pe_log_id,) + pipelinePositions[pi]
-                kwargs = {'locator': self.locator,
-                          'current_version': self.current_version,
-                          'reason': 'Parameter Exploration %s %s_%s_%s' % pe_cell_id,
-                          'logger': self.get_logger(),
-                          'actions': performedActions[pi],
-                          'extra_info': extra_info
-                          }
-                if view:
-                    kwargs['view'] = view
-                if showProgress:
-                    kwargs['module_executed_hook'] = [moduleExecuted]
-                if self.get_vistrail_variables():
-                    # remove vars used in pe
-                    vars = dict([(v.uuid, v) for v in self.get_vistrail_variables()
-                            if v.uuid not in vistrail_vars])
-                    kwargs['vistrail_variables'] = lambda x: vars.get(x, None)
-                result = interpreter.execute(modifiedPipelines[pi], **kwargs)
+                return {'reason': 'Parameter Exploration %s %s_%s_%s' % pe_cell_id,
+                        'actions': performedActions[pi],
+                        'extra_info': pipeline_extra_info}
+
+            errors = []
+            results = runner.execute(modifiedPipelines, variant_kwargs,
+                                     pipelineExecuted, **kwargs)
+            for pi, result in results:
                 for error in result.errors.itervalues():
                     if use_spreadsheet:
                         pp = pipelinePositions[pi]
                         errors.append(((pp[1], pp[0], pp[2]), error))
                     else:
                         errors.append(((0,0,0), error))
+                if showProgress and progress.wasCanceled():
+                    results.close()
+                    break
 
             if showProgress:
                 progress.setValue(totalProgress)
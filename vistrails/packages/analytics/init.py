@@ -52,7 +52,8 @@ class ReadVistrail(Module):
 
     def read_vistrail(self, fname):
         # open the .vt bundle specified by the filename "fname"
-        bundle = vistrails.db.services.io.open_vistrail_bundle_from_zip_xml(fname)[0]
+        bundle = vistrails.db.services.io.open_vistrail_bundle_from_zip_xml(
+            fname, lazy=True)[0]
 
         # access the vistrail from the bundle
         vistrail = bundle.vistrail
@@ -64,24 +65,20 @@ class ReadVistrail(Module):
 
     def read_log(self, fname):
         # open the .vt bundle specified by the filename "fname"
-        bundle = vistrails.db.services.io.open_vistrail_bundle_from_zip_xml(fname)[0]
-       
-        # get the log filename
-        log_fname = bundle.vistrail.db_log_filename
-  
-        if log_fname is not None:
-            # open the log
-            log = vistrails.db.services.io.open_log_from_xml(log_fname, True)
+        bundle = vistrails.db.services.io.open_vistrail_bundle_from_zip_xml(
+            fname, lazy=True)[0]
 
+        # the log is read from the bundle on first access
+        log = bundle.log
+
+        if log is not None:
             # convert the log from a db object
             vistrails.core.log.log.Log.convert(log)
             return log
-        if log_fname is None:
+        else:
             # throw error message
             raise ModuleError(self, "No log file accessible")
 
-        return None
-
     def compute(self):
         fname = self.get_input('file').name
         vistrail = self.read_vistrail(fname)
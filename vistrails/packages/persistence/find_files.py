@@ -52,11 +52,10 @@ persistence_pkg_ids.add(persistence_pkg)
     
 def find_files(filename, version=None):
     save_bundle, save_dir = \
-        vistrails.db.services.io.open_vistrail_bundle_from_zip_xml(filename)
+        vistrails.db.services.io.open_vistrail_bundle_from_zip_xml(filename,
+                                                                   lazy=True)
     vistrail = save_bundle.vistrail
-    # FIXME hack for now, should change in the future
-    log_fname = vistrail.db_log_filename
-    log = vistrails.db.services.io.open_log_from_xml(log_fname, True)
+    log = save_bundle.log
 
     if version:
         if isinstance(version, basestring):
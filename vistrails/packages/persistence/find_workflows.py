@@ -67,10 +67,10 @@ def find_workflows(path_name, vistrail_dir):
     vt_finds = {}
     for filename in vt_files:
         save_bundle, save_dir = \
-            vistrails.db.services.io.open_vistrail_bundle_from_zip_xml(filename)
+            vistrails.db.services.io.open_vistrail_bundle_from_zip_xml(
+                filename, lazy=True)
         vistrail = save_bundle.vistrail
-        log_fname = vistrail.db_log_filename
-        log = vistrails.db.services.io.open_log_from_xml(log_fname, True)
+        log = save_bundle.log
         
         persistent_module_ids = set()
         for action in vistrail.db_actions:
@@ -1,7 +1,9 @@
+from itertools import count, izip, repeat
 try:
     import numpy
 except ImportError: # pragma: no cover
     numpy = None
+import operator
 import re
 
 from vistrails.core.modules.vistrails_module import ModuleError
@@ -20,7 +22,90 @@ def utf8(obj):
         return bytes(obj)
 
 
-class JoinedTables(TableObject):
+def _row_indexes(indexes):
+    if numpy is not None:
+        return numpy.asarray(indexes, dtype=numpy.intp)
+    else:
+        return list(indexes)
+
+
+def _reduce_groups(ufunc, values, group_ids, first_rows):
+    """Reduces the values of each group with a binary ufunc.
+
+    ufunc.at only exists in numpy 1.8 and later; with older versions, the
+    rows are sorted by group and reduced with ufunc.reduceat.
+    """
+    if hasattr(ufunc, 'at'):
+        result = values[first_rows]
+        ufunc.at(result, group_ids, values)
+        return result
+    order = numpy.argsort(group_ids, kind='mergesort')
+    starts = numpy.searchsorted(group_ids[order],
+                                numpy.arange(len(first_rows)))
+    return ufunc.reduceat(values[order], starts)
+
+
+def _take_rows(rows, selected):
+    """Selects rows from a selection of rows (None meaning all the rows).
+    """
+    if rows is None:
+        return selected
+    elif numpy is not None:
+        return rows[selected]
+    else:
+        return [rows[i] for i in selected]
+
+
+class TableView(TableObject):
+    """A table whose columns are rows selected from columns of other tables.
+
+    Column i is column sources[i][1] of table sources[i][0], restricted to
+    the rows sources[i][2] (a sequence of row indexes, or None for all the
+    rows). A view built on another view refers to the other view's sources
+    directly, so chaining operations only composes row indexes; no data is
+    read until get_column() is called, and no intermediate table is built.
+    """
+    def __init__(self, sources, nb_rows, names):
+        self.sources = sources
+        self.columns = len(sources)
+        self.rows = nb_rows
+        self.names = names
+        self.column_cache = {}
+
+    @staticmethod
+    def column_source(table, index, rows=None):
+        """Gets the source of a column of table, restricted to rows.
+        """
+        if isinstance(table, TableView):
+            (table, index, table_rows) = table.sources[index]
+            if rows is not None:
+                rows = _take_rows(table_rows, rows)
+            else:
+                rows = table_rows
+        return (table, index, rows)
+
+    def get_column(self, index, numeric=False):
+        if (index, numeric) in self.column_cache:
+            return self.column_cache[(index, numeric)]
+
+        (table, col, rows) = self.sources[index]
+        result = table.get_column(col, numeric)
+        if rows is not None:
+            if numpy is not None and isinstance(result, numpy.ndarray):
+                result = result[rows]
+            else:
+                if numpy is not None:
+                    rows = rows.tolist()
+                result = map(result.__getitem__, rows)
+        if (numeric and numpy is not None and
+                not isinstance(result, numpy.ndarray)):
+            result = numpy.array(result, dtype=numpy.float32)
+
+        self.column_cache[(index, numeric)] = result
+        return result
+
+
+class JoinedTables(TableView):
     def __init__(self, left_t, right_t, left_key_col, right_key_col,
                  case_sensitive=False, always_prefix=False):
         self.left_t = left_t
@@ -31,9 +116,12 @@ class JoinedTables(TableObject):
         self.always_prefix = always_prefix
 
         self.build_column_names()
-        self.compute_row_map()
-        self.column_cache = {}
-        self.rows = len(self.row_map)
+        (left_rows, right_rows) = self.compute_row_map()
+        sources = ([self.column_source(left_t, i, left_rows)
+                    for i in xrange(left_t.columns)] +
+                   [self.column_source(right_t, i, right_rows)
+                    for i in xrange(right_t.columns)])
+        TableView.__init__(self, sources, len(left_rows), self.names)
 
     def build_column_names(self):
         left_name = self.left_t.name
@@ -63,50 +151,44 @@ class JoinedTables(TableObject):
                       get_col_names(self.right_t, self.left_t, right_name))
         self.columns = len(self.names)
 
-    def get_column(self, index, numeric=False):
-        if (index, numeric) in self.column_cache:
-            return self.column_cache[(index, numeric)]
-
-        result = []
-        if index < self.left_t.columns:
-            column = self.left_t.get_column(index, numeric)
-            for i in xrange(self.left_t.rows):
-                if i in self.row_map:
-                    result.append(column[i])
-        else:
-            column = self.right_t.get_column(index - self.left_t.columns,
-                                             numeric)
-            for i in xrange(self.left_t.rows):
-                if i in self.row_map:
-                    j = self.row_map[i]
-                    result.append(column[j])
-
-        if numeric and numpy is not None:
-            result = numpy.array(result, dtype=numpy.float32)
-        self.column_cache[(index, numeric)] = result
-        return result
-
     def compute_row_map(self):
-        def build_key_dict(table, key_col):
-            column = table.get_column(key_col)
-            if self.case_sensitive:
-                key_dict = dict((utf8(val).strip(), i)
-                                for i, val in enumerate(column))
-            else:
-                key_dict = dict((utf8(val).strip().upper(), i)
-                                for i, val in enumerate(column))
-            return key_dict
-
-        right_keys = build_key_dict(self.right_t, self.right_key_col)
+        """Matches the rows of the two tables (hash join).
 
-        self.row_map = {}
-        for left_row_idx, key in enumerate(
-                self.left_t.get_column(self.left_key_col)):
-            key = utf8(key).strip()
+        Returns the indexes of the left rows that have a match, and of the
+        matching right rows. If several right rows have the same key, the
+        last one is used.
+        """
+        def get_keys(table, key_col):
+            column = table.get_column(key_col)
+            try:
+                # same as utf8() unless there is non-ASCII unicode
+                keys = map(bytes, column)
+            except UnicodeEncodeError:
+                keys = map(utf8, column)
+            keys = map(bytes.strip, keys)
             if not self.case_sensitive:
-                key = key.upper()
-            if key in right_keys:
-                self.row_map[left_row_idx] = right_keys[key]
+                keys = map(bytes.upper, keys)
+            return keys
+
+        right_keys = dict(izip(get_keys(self.right_t, self.right_key_col),
+                               count()))
+        left_keys = get_keys(self.left_t, self.left_key_col)
+
+        if numpy is not None:
+            matches = numpy.fromiter(map(right_keys.get, left_keys,
+                                         repeat(-1, len(left_keys))),
+                                     dtype=numpy.intp,
+                                     count=len(left_keys))
+            left_rows = numpy.flatnonzero(matches >= 0)
+            return left_rows, matches[left_rows]
+        else:
+            left_rows = []
+            right_rows = []
+            for left_row_idx, key in enumerate(left_keys):
+                if key in right_keys:
+                    left_rows.append(left_row_idx)
+                    right_rows.append(right_keys[key])
+            return left_rows, right_rows
 
 
 class JoinTables(Table):
@@ -158,20 +240,13 @@ class JoinTables(Table):
         self.set_output('value', table)
 
 
-class ProjectedTable(TableObject):
+class ProjectedTable(TableView):
     def __init__(self, table, col_idxs, col_names):
         self.table = table
-        self.col_map = dict(enumerate(col_idxs))
-        self.columns = len(self.col_map)
-        self.names = col_names
-
-    def get_column(self, index, numeric=False):
-        mapped_idx = self.col_map[index]
-        return self.table.get_column(mapped_idx, numeric)
-
-    @property
-    def rows(self):
-        return self.table.rows
+        TableView.__init__(self,
+                           [self.column_source(table, i) for i in col_idxs],
+                           table.rows,
+                           col_names)
 
 
 class ProjectTable(Table):
@@ -235,6 +310,13 @@ class SelectFromTable(Table):
                       'values': "[[], ['==', '!=', '<', '>', '<=', '>='], []]"})]
     _output_ports = [('value', Table)]
 
+    comparison_ops = {'==': operator.eq,
+                      '!=': operator.ne,
+                      '<': operator.lt,
+                      '>': operator.gt,
+                      '<=': operator.le,
+                      '>=': operator.ge}
+
     @staticmethod
     def make_condition(comparand, comparer):
         if isinstance(comparand, float):
@@ -259,6 +341,23 @@ class SelectFromTable(Table):
         else:
             raise ValueError("Invalid comparison operator %r" % comparer)
 
+    @classmethod
+    def match_rows(cls, column, comparand, comparer):
+        """Returns the indexes of the values in column matching a condition.
+        """
+        op = cls.comparison_ops.get(comparer)
+        if numpy is None or op is None:
+            condition = cls.make_condition(comparand, comparer)
+            return _row_indexes([i
+                                 for i, col_val in enumerate(column)
+                                 if condition(col_val)])
+        if isinstance(comparand, float):
+            values = numpy.asarray(column, dtype=numpy.float64)
+        else:
+            values = numpy.empty(len(column), dtype=object)
+            values[:] = column
+        return numpy.flatnonzero(op(values, comparand))
+
     def compute(self):
         table = self.get_input('table')
 
@@ -282,17 +381,17 @@ class SelectFromTable(Table):
                                   "No column %d, table only has %d columns" % (
                                   idx, table.columns))
 
-        condition = self.make_condition(comparand, comparer)
         numeric = isinstance(comparand, float)
         column = table.get_column(idx, numeric)
-        matched_rows = [i
-                        for i, col_val in enumerate(column)
-                        if condition(col_val)]
-        columns = []
-        for col in xrange(table.columns):
-            column = table.get_column(col)
-            columns.append([column[row] for row in matched_rows])
-        selected_table = TableObject(columns, len(matched_rows), table.names)
+        try:
+            matched_rows = self.match_rows(column, comparand, comparer)
+        except ValueError, e:
+            raise ModuleError(self, e.message)
+        selected_table = TableView(
+                [TableView.column_source(table, col, matched_rows)
+                 for col in xrange(table.columns)],
+                len(matched_rows),
+                table.names)
         self.set_output('value', selected_table)
 
 
@@ -306,44 +405,71 @@ class AggregatedTable(TableObject):
         self.build_map()
 
     def build_map(self):
-        agg_map = {}
+        """Numbers the groups in the order of their first row.
+
+        group_ids holds the group of each row of the table, and first_rows
+        the first row of each group.
+        """
+        groups = {}
+        first_rows = []
+        group_ids = []
         for i, val in enumerate(self.table.get_column(self.group_col)):
-            if val in agg_map:
-                agg_map[val].append(i)
-            else:
-                agg_map[val] = [i]
-        self.agg_rows = [(min(rows), rows) for rows in agg_map.itervalues()]
-        self.agg_rows.sort()
-        self.rows = len(self.agg_rows)
+            group = groups.get(val)
+            if group is None:
+                group = groups[val] = len(first_rows)
+                first_rows.append(i)
+            group_ids.append(group)
+        self.group_ids = _row_indexes(group_ids)
+        self.first_rows = first_rows
+        self.rows = len(first_rows)
         self.columns = 2
         if self.table.names is not None:
             self.names = [self.table.names[self.group_col],
                           self.table.names[self.col]]
 
     def get_column(self, index, numeric=False):
-        def average(value_iter):
-            # value_iter can only be used once
-            sum = 0
-            count = 0
-            for count, v in enumerate(value_iter):
-                sum += v
-            return sum / (count+1)
-        op_map = {'sum': sum,
-                  'average': average,
-                  'min': min,
-                  'max': max}
         if index == 0:
             col = self.table.get_column(self.group_col, numeric)
-            return [col[x[0]] for x in self.agg_rows]
+            return [col[i] for i in self.first_rows]
+        elif self.op not in ('count', 'sum', 'average', 'min', 'max'):
+            raise ValueError('Unknown operation: "%s"' % self.op)
+        elif numpy is None:
+            return self.aggregate_lists()
+
+        if self.op == 'count':
+            return numpy.bincount(self.group_ids,
+                                  minlength=self.rows).tolist()
+        values = numpy.asarray(self.table.get_column(self.col, True),
+                               dtype=numpy.float64)
+        if self.op in ('sum', 'average'):
+            result = numpy.bincount(self.group_ids, values, self.rows)
+            if self.op == 'average':
+                result /= numpy.bincount(self.group_ids, minlength=self.rows)
         else:
-            if self.op == 'count':
-                return [len(x[1]) for x in self.agg_rows]
-            elif self.op in op_map:
-                col = self.table.get_column(self.col, True)
-                return [op_map[self.op](col[idx] for idx in x[1])
-                        for x in self.agg_rows]
+            if self.op == 'min':
+                ufunc = numpy.minimum
             else:
-                raise ValueError('Unknown operation: "%s"' % self.op)
+                ufunc = numpy.maximum
+            result = _reduce_groups(ufunc, values, self.group_ids,
+                                    self.first_rows)
+        return result.tolist()
+
+    def aggregate_lists(self):
+        """Computes the aggregated column without numpy.
+        """
+        rows = [[] for i in xrange(self.rows)]
+        for i, group in enumerate(self.group_ids):
+            rows[group].append(i)
+        if self.op == 'count':
+            return [len(r) for r in rows]
+        col = self.table.get_column(self.col, True)
+        values = [[col[i] for i in r] for r in rows]
+        if self.op == 'average':
+            return [sum(v) / len(v) for v in values]
+        op_map = {'sum': sum,
+                  'min': min,
+                  'max': max}
+        return [op_map[self.op](v) for v in values]
 
 
 class AggregateColumn(Table):
@@ -695,3 +821,67 @@ class TestAggregate(unittest.TestCase):
                                    ('group_by_index', [('Integer', '2')])])
         self.assertEqual(table.get_column(0, False), ['T', 'F'])
         self.assertEqual(table.get_column(1, True), [-7, 21])
+
+    def test_aggregate_count_max(self):
+        table = self.do_aggregate([('op', [('String', 'count')]),
+                                   ('column_index', [('Integer', '3')]),
+                                   ('group_by_index', [('Integer', '1')])])
+        self.assertEqual(table.get_column(1, False), [3, 2, 1, 1])
+        table = self.do_aggregate([('op', [('String', 'max')]),
+                                   ('column_index', [('Integer', '3')]),
+                                   ('group_by_index', [('Integer', '1')])])
+        self.assertEqual(table.get_column(1, True), [100, 23, 41, 21])
+
+    @unittest.skipIf(numpy is None, "numpy is not available")
+    def test_reduce_groups(self):
+        class NoAt(object):
+            # ufunc of a numpy version older than 1.8
+            reduceat = staticmethod(numpy.maximum.reduceat)
+
+        values = numpy.array([100, 3, 41, 21, 1, 23, 41], dtype=numpy.float64)
+        group_ids = _row_indexes([0, 1, 2, 3, 0, 1, 0])
+        first_rows = [0, 1, 2, 3]
+        self.assertEqual(
+                _reduce_groups(numpy.maximum, values, group_ids,
+                               first_rows).tolist(),
+                [100, 23, 41, 21])
+        self.assertEqual(
+                _reduce_groups(NoAt, values, group_ids, first_rows).tolist(),
+                [100, 23, 41, 21])
+
+
+class TestTableView(unittest.TestCase):
+    def test_chained(self):
+        """Chains operations without materializing intermediate tables.
+        """
+        left = TableObject([[1, 2, 3, 4, 5], ['a', 'b', 'c', 'd', 'e']],
+                           5, ['id', 'letter'])
+        right = TableObject([['5', '3', '1', '3'], [50, 30, 10, 31]],
+                            4, ['id', 'value'])
+        joined = JoinedTables(left, right, 0, 0)
+        self.assertEqual(joined.rows, 3)
+        self.assertEqual(joined.get_column(1), ['a', 'c', 'e'])
+        self.assertEqual(list(joined.get_column(3, True)), [10, 31, 50])
+
+        selected = TableView(
+                [TableView.column_source(joined, i,
+                                         SelectFromTable.match_rows(
+                                                 joined.get_column(3, True),
+                                                 20.0, '>'))
+                 for i in xrange(joined.columns)],
+                2, joined.names)
+        projected = ProjectedTable(selected, [3, 1], ['value', 'letter'])
+        self.assertIs(projected.sources[0][0], right)
+        self.assertIs(projected.sources[1][0], left)
+        self.assertEqual(projected.rows, 2)
+        self.assertEqual(projected.get_column(1), ['c', 'e'])
+        self.assertEqual(projected.get_column(0), [31, 50])
+
+    def test_join_unicode(self):
+        """Joins on keys that are not all ASCII.
+        """
+        left = TableObject([[u'\xe9t\xe9', 'hiver ']], 2, ['key'])
+        right = TableObject([['HIVER', u'\xe9t\xe9'.encode('utf-8')]],
+                            2, ['key'])
+        joined = JoinedTables(left, right, 0, 0)
+        self.assertEqual(joined.get_column(1), ['\xc3\xa9t\xc3\xa9', 'HIVER'])
@@ -1,4 +1,8 @@
 import csv
+import hashlib
+from itertools import islice
+import os
+import tempfile
 try:
     import numpy
 except ImportError: # pragma: no cover
@@ -14,17 +18,37 @@ def count_lines(fp):
     return lines
 
 
-# FIXME : test coverage for CSVTable
 class CSVTable(TableObject):
+    """A table read from a CSV file.
+
+    The file is parsed the first time a column or the number of rows is
+    requested. During that pass, every column that only holds numbers is
+    converted chunk by chunk to an int64 array, or a float64 array if it
+    holds any non-integer value, so any number of numeric
+    columns can then be extracted without parsing the file again. Columns
+    are only kept as strings once requested as such, which takes another
+    pass if they weren't requested the first time. iter_chunks() can be
+    used instead to stream files that don't fit in memory.
+
+    If cache_dir is set, numeric columns are also saved there as .npy files
+    and memory-mapped from there the next time the same file is read, so
+    that it doesn't need to be parsed again.
+    """
+    chunk_rows = 65536
+
     def __init__(self, csv_file, header_present, delimiter,
-                 skip_lines=0, dialect=None, use_sniffer=True):
+                 skip_lines=0, dialect=None, use_sniffer=True,
+                 cache_dir=None):
         self._rows = None
+        self._numeric_columns = None
+        self._string_columns = {}
 
         self.header_present = header_present
         self.delimiter = delimiter
         self.filename = csv_file
         self.skip_lines = skip_lines
         self.dialect = dialect
+        self.cache_dir = cache_dir
 
         (self.columns, self.names, self.delimiter,
          self.header_present, self.dialect) = \
@@ -87,44 +111,153 @@ class CSVTable(TableObject):
 
         return column_count, column_names, delimiter, header_present, dialect
 
+    def _reader(self, fp):
+        for i in xrange(self.skip_lines):
+            line = fp.readline()
+            if not line:
+                raise InternalModuleError("skip_lines greater than "
+                                          "the number of lines in the "
+                                          "file")
+        if self.dialect is not None:
+            return csv.reader(fp, dialect=self.dialect)
+        else:
+            return csv.reader(fp, delimiter=self.delimiter)
+
+    def iter_chunks(self, chunk_rows=None):
+        """Reads the file in chunks of at most chunk_rows rows.
+
+        Each chunk is yielded as a list of columns (lists of strings). The
+        rows are not kept, so this can be used on files of any size. Blank
+        lines are skipped.
+        """
+        if chunk_rows is None:
+            chunk_rows = self.chunk_rows
+        try:
+            fp = open(self.filename, 'rb')
+        except IOError:
+            raise InternalModuleError("File does not exist")
+        try:
+            reader = self._reader(fp)
+            row_nb = 0
+            while True:
+                rows = list(islice(reader, chunk_rows))
+                if not rows:
+                    break
+                for i, row in enumerate(rows):
+                    if row and len(row) != self.columns:
+                        raise InternalModuleError(
+                                "Row %d has %d columns instead of %d" % (
+                                row_nb + i + 1, len(row), self.columns))
+                row_nb += len(rows)
+                rows = [row for row in rows if row]
+                if rows:
+                    yield [list(column) for column in zip(*rows)]
+        finally:
+            fp.close()
+
+    @staticmethod
+    def _to_numeric(values):
+        if numpy is None:
+            return [float(e) for e in values]
+        try:
+            return numpy.array(values, dtype=numpy.int64)
+        except (ValueError, OverflowError):
+            return numpy.array(values, dtype=numpy.float64)
+
+    @staticmethod
+    def _concatenate(chunks):
+        if numpy is None:
+            return [e for chunk in chunks for e in chunk]
+        elif not chunks:
+            return numpy.zeros((0,), dtype=numpy.float64)
+        # a column with both integer and float chunks becomes float64
+        return numpy.concatenate(chunks)
+
+    def _read_columns(self, string_indexes=()):
+        """Parses the file, keeping the given columns as lists of strings.
+
+        On the first pass, the numeric columns are converted as well; the
+        others are set to None in self._numeric_columns.
+        """
+        strings = dict((i, []) for i in string_indexes
+                       if i not in self._string_columns)
+        convert = self._numeric_columns is None
+        if not strings and not convert:
+            return
+        numeric_chunks = [[] for i in xrange(self.columns)]
+        rows = 0
+        for chunk in self.iter_chunks():
+            rows += len(chunk[0])
+            for i, column in strings.iteritems():
+                column.extend(chunk[i])
+            if not convert:
+                continue
+            for i, values in enumerate(chunk):
+                if numeric_chunks[i] is not None:
+                    try:
+                        numeric_chunks[i].append(self._to_numeric(values))
+                    except ValueError:
+                        numeric_chunks[i] = None
+        if convert:
+            self._numeric_columns = [
+                    self._concatenate(chunks) if chunks is not None else None
+                    for chunks in numeric_chunks]
+            self._rows = rows
+        self._string_columns.update(strings)
+
+    def _cache_filename(self, index):
+        if isinstance(self.dialect, basestring) or self.dialect is None:
+            dialect = self.dialect
+        else:
+            dialect = (self.dialect.delimiter, self.dialect.quotechar,
+                       self.dialect.doublequote, self.dialect.escapechar,
+                       self.dialect.skipinitialspace)
+        stat = os.stat(self.filename)
+        key = repr((os.path.abspath(self.filename), stat.st_size,
+                    stat.st_mtime, self.delimiter, dialect, self.skip_lines,
+                    index))
+        return os.path.join(self.cache_dir,
+                            'csv_%s.npy' % hashlib.sha1(key).hexdigest())
+
+    def _numeric_column(self, index):
+        cache_file = None
+        if self.cache_dir is not None and numpy is not None:
+            cache_file = self._cache_filename(index)
+            if os.path.exists(cache_file):
+                return numpy.load(cache_file, mmap_mode='r')
+
+        self._read_columns()
+        result = self._numeric_columns[index]
+        if result is None:
+            raise ValueError("Column %d is not numeric" % index)
+        if cache_file is not None:
+            fd, tmp = tempfile.mkstemp(suffix='.npy', dir=self.cache_dir)
+            try:
+                with os.fdopen(fd, 'wb') as fp:
+                    numpy.save(fp, result)
+                os.rename(tmp, cache_file)
+            except OSError:
+                if os.path.exists(tmp):
+                    os.remove(tmp)
+        return result
+
     def get_column(self, index, numeric=False):
         if (index, numeric) in self.column_cache:
             return self.column_cache[(index, numeric)]
 
-        if numeric and numpy is not None:
-            result = numpy.loadtxt(
-                    self.filename,
-                    dtype=numpy.float32,
-                    delimiter=self.delimiter,
-                    skiprows=self.skip_lines,
-                    usecols=[index])
+        if numeric:
+            result = self._numeric_column(index)
         else:
-            with open(self.filename, 'rb') as fp:
-                for i in xrange(self.skip_lines):
-                    line = fp.readline()
-                    if not line:
-                        raise InternalModuleError("skip_lines greater than "
-                                                  "the number of lines in the "
-                                                  "file")
-                if self.dialect is not None:
-                    reader = csv.reader(fp, dialect=self.dialect)
-                else:
-                    reader = csv.reader(fp, delimiter=self.delimiter)
-
-                result = [row[index] for row in reader]
-            if numeric:
-                result = [float(e) for e in result]
+            self._read_columns((index,))
+            result = self._string_columns[index]
 
         self.column_cache[(index, numeric)] = result
         return result
 
     @property
     def rows(self):
-        if self._rows is not None:
-            return self._rows
-        with open(self.filename, 'rb') as fp:
-            self._rows = count_lines(fp)
-        self._rows -= self.skip_lines
+        if self._rows is None:
+            self._read_columns()
         return self._rows
 
 
@@ -135,6 +268,10 @@ class CSVFile(Table):
     able to guess the actual format of the file in most cases, or you can use
     the 'delimiter', 'header_present' and 'skip_lines' ports to force how the
     file will be read.
+
+    The file is only parsed once, whatever the number of columns extracted
+    from the table. If 'cache_directory' is set, numeric columns are cached
+    there in binary form and reused as long as the file doesn't change.
     """
     _input_ports = [
             ('file', '(org.vistrails.vistrails.basic:File)'),
@@ -147,6 +284,8 @@ class CSVFile(Table):
             ('skip_lines', '(org.vistrails.vistrails.basic:Integer)',
              {'optional': True, 'defaults': "['0']"}),
             ('dialect', '(org.vistrails.vistrails.basic:String)',
+             {'optional': True}),
+            ('cache_directory', '(org.vistrails.vistrails.basic:Directory)',
              {'optional': True})]
     _output_ports = [
             ('column_count', '(org.vistrails.vistrails.basic:Integer)'),
@@ -160,10 +299,14 @@ class CSVFile(Table):
         skip_lines = self.get_input('skip_lines')
         dialect = self.force_get_input('dialect', None)
         sniff_header = self.get_input('sniff_header')
+        if self.has_input('cache_directory'):
+            cache_dir = self.get_input('cache_directory').name
+        else:
+            cache_dir = None
 
         try:
             table = CSVTable(csv_file, header_present, delimiter, skip_lines,
-                             dialect, sniff_header)
+                             dialect, sniff_header, cache_dir)
         except InternalModuleError, e:
             e.raise_module_error(self)
 
@@ -277,6 +420,69 @@ class CSVTestCase(unittest.TestCase):
         self.assertEqual(results[0],
                          ['col moutarde', '4', 'not a number', '7'])
 
+    def test_csvtable(self):
+        """Reads columns and chunks from a CSVTable.
+        """
+        table = CSVTable(self._test_dir + '/test.csv', True, None)
+        self.assertEqual((table.columns, table.rows), (3, 3))
+        self.assertEqual(table.get_column(2), ['4', 'not a number', '7'])
+        self.assertEqual(list(table.get_column(1, True)), [2.0, 3.0, 14.5])
+        self.assertRaises(ValueError, table.get_column, 2, True)
+        # only the column requested as strings is kept as strings
+        self.assertEqual(table._string_columns.keys(), [2])
+        self.assertEqual([c is not None for c in table._numeric_columns],
+                         [True, True, False])
+
+        chunks = list(table.iter_chunks(2))
+        self.assertEqual(chunks, [[['-1', '2'], ['2', '3'],
+                                   ['4', 'not a number']],
+                                  [['6'], ['14.5'], ['7']]])
+
+    @unittest.skipIf(numpy is None, "numpy is not available")
+    def test_csv_cache(self):
+        """Reuses the binary cache of a numeric column.
+        """
+        import shutil
+        cache_dir = tempfile.mkdtemp(prefix='vt_csv_')
+        try:
+            filename = self._test_dir + '/test.csv'
+            table = CSVTable(filename, True, None, cache_dir=cache_dir)
+            self.assertEqual(list(table.get_column(0, True)), [-1.0, 2.0, 6.0])
+            self.assertEqual(len(os.listdir(cache_dir)), 1)
+
+            table = CSVTable(filename, True, None, cache_dir=cache_dir)
+            column = table.get_column(0, True)
+            self.assertIsInstance(column, numpy.memmap)
+            self.assertEqual(list(column), [-1.0, 2.0, 6.0])
+            self.assertIsNone(table._numeric_columns)
+        finally:
+            shutil.rmtree(cache_dir)
+
+
+    @unittest.skipIf(numpy is None, "numpy is not available")
+    def test_csv_dtypes(self):
+        """Keeps integer columns exact and uses float64 for the others.
+        """
+        fd, filename = tempfile.mkstemp(suffix='.csv', prefix='vt_csv_')
+        try:
+            with os.fdopen(fd, 'wb') as fp:
+                fp.write('id,x,y\n'
+                         '16777217,1,0.5\n'
+                         '9007199254740993,2,0.25\n'
+                         '3,3.5,1\n')
+            table = CSVTable(filename, True, None)
+            # x is only seen to be a float column in the second chunk
+            table.chunk_rows = 2
+            ids = table.get_column(0, True)
+            self.assertEqual(ids.dtype, numpy.int64)
+            self.assertEqual(list(ids), [16777217, 9007199254740993, 3])
+            x = table.get_column(1, True)
+            self.assertEqual(x.dtype, numpy.float64)
+            self.assertEqual(list(x), [1.0, 2.0, 3.5])
+            self.assertEqual(table.get_column(2, True).dtype, numpy.float64)
+        finally:
+            os.remove(filename)
+
 
 class TestCountlines(unittest.TestCase):
     def test_countlines(self):
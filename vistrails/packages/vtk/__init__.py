@@ -59,3 +59,8 @@ def package_requirements():
         from vistrails.core import debug
         debug.warning('PyQt4 is not available. There will be no interaction '
                       'between VTK and the spreadsheet.')
+
+def package_library_versions():
+    # the modules are generated from the classes of the installed VTK
+    import vtk
+    return {'vtk': vtk.vtkVersion.GetVTKVersion()}